@@ -90,6 +90,8 @@ class dataset:
         verbose: bool = True,
         access_method: str = "stream",
         reset: bool = False,
+        cache_shards: int = 0,
+        use_mmap: bool = False,
     ):
         """Returns a :class:`~deeplake.core.dataset.Dataset` object referencing either a new or existing dataset.
 
@@ -125,6 +127,9 @@ class dataset:
             public (bool): Defines if the dataset will have public access. Applicable only if Deep Lake cloud storage is used and a new Dataset is being created. Defaults to ``True``.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            cache_shards (int): If positive, the caches of the dataset are split into this many separately locked shards,
+                so that the dataset can be read from multiple threads at once. Defaults to 0, for caches that are not thread safe.
+            use_mmap (bool): If ``True``, the chunks of a local dataset, and those in the local cache, are memory mapped instead of read into memory. Defaults to ``False``.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -204,6 +209,8 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                cache_shards=cache_shards,
+                use_mmap=use_mmap,
             )
 
             feature_report_path(path, "dataset", {"Overwrite": overwrite}, token=token)
@@ -249,6 +256,8 @@ class dataset:
                     "access_method": access_method,
                     "memory_cache_size": memory_cache_size,
                     "local_cache_size": local_cache_size,
+                    "cache_shards": cache_shards,
+                    "use_mmap": use_mmap,
                     "creds": creds,
                     "ds_exists": ds_exists,
                     "num_workers": num_workers,
@@ -337,6 +346,8 @@ class dataset:
         token: Optional[str] = None,
         org_id: Optional[str] = None,
         verbose: bool = True,
+        cache_shards: int = 0,
+        use_mmap: bool = False,
     ) -> Dataset:
         """Creates an empty dataset
 
@@ -351,6 +362,9 @@ class dataset:
             public (bool): Defines if the dataset will have public access. Applicable only if Deep Lake cloud storage is used and a new Dataset is being created. Defaults to ``False``.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            cache_shards (int): If positive, the caches of the dataset are split into this many separately locked shards,
+                so that the dataset can be read from multiple threads at once. Defaults to 0, for caches that are not thread safe.
+            use_mmap (bool): If ``True``, the chunks of a local dataset, and those in the local cache, are memory mapped instead of read into memory. Defaults to ``False``.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -394,6 +408,8 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                cache_shards=cache_shards,
+                use_mmap=use_mmap,
             )
 
             feature_report_path(path, "empty", {"Overwrite": overwrite}, token=token)
@@ -436,6 +452,8 @@ class dataset:
         verbose: bool = True,
         access_method: str = "stream",
         reset: bool = False,
+        cache_shards: int = 0,
+        use_mmap: bool = False,
     ) -> Dataset:
         """Loads an existing dataset
 
@@ -468,6 +486,9 @@ class dataset:
                 Datasets stored on Deep Lake cloud that your account does not have write access to will automatically open in read mode.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            cache_shards (int): If positive, the caches of the dataset are split into this many separately locked shards,
+                so that the dataset can be read from multiple threads at once. Defaults to 0, for caches that are not thread safe.
+            use_mmap (bool): If ``True``, the chunks of a local dataset, and those in the local cache, are memory mapped instead of read into memory. Defaults to ``False``.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -540,6 +561,8 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                cache_shards=cache_shards,
+                use_mmap=use_mmap,
             )
             feature_report_path(path, "load", {}, token=token)
         except Exception as e:
@@ -572,6 +595,8 @@ class dataset:
                     "access_method": access_method,
                     "memory_cache_size": memory_cache_size,
                     "local_cache_size": local_cache_size,
+                    "cache_shards": cache_shards,
+                    "use_mmap": use_mmap,
                     "creds": creds,
                     "ds_exists": True,
                     "num_workers": num_workers,
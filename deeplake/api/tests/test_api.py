@@ -44,7 +44,7 @@ from deeplake.util.exceptions import (
 from deeplake.util.path import convert_string_to_pathlib_if_needed, verify_dataset_name
 from deeplake.util.testing import assert_array_equal
 from deeplake.util.pretty_print import summary_tensor, summary_dataset
-from deeplake.constants import GDRIVE_OPT, MB
+from deeplake.constants import GDRIVE_OPT, KB, MB
 from deeplake.client.config import REPORTING_CONFIG_FILE_PATH
 
 from click.testing import CliRunner
@@ -336,6 +336,46 @@ def test_indexed_tensor(local_ds: Dataset):
     assert_array_equal(tensor[0, 0::2].numpy(), np.array([[1, 2, 3], [7, 8, 9]]))
 
 
+@pytest.mark.parametrize(
+    "args",
+    [
+        {},
+        {"sample_compression": "png"},
+        {"chunk_compression": "lz4"},
+    ],
+)
+def test_batched_list_index_read(local_ds, args):
+    with local_ds as ds:
+        ds.create_tensor("fixed", max_chunk_size=2000, **args)
+        ds.create_tensor("dynamic", max_chunk_size=2000, tiling_threshold=1000, **args)
+        fixed = np.random.randint(0, 255, (100, 8, 8, 3), dtype=np.uint8)
+        dynamic = [
+            np.random.randint(0, 255, (i % 5 + 1, 8, 3), dtype=np.uint8)
+            for i in range(100)
+        ]
+        # tiled sample in between regular samples
+        dynamic[50] = np.random.randint(0, 255, (40, 40, 3), dtype=np.uint8)
+        ds.fixed.extend(fixed)
+        ds.dynamic.extend(dynamic)
+
+    indices = [5, 90, 91, 3, 50, 5, -1, 49, 51, 0]
+    assert ds.fixed.chunk_engine.num_chunks > 1
+    assert ds.dynamic.chunk_engine._is_tiled_sample(50)
+
+    np.testing.assert_array_equal(ds.fixed[indices].numpy(), fixed[indices])
+    np.testing.assert_array_equal(
+        ds.fixed[indices, 2:5, 1].numpy(), fixed[indices, 2:5, 1]
+    )
+    np.testing.assert_array_equal(ds.fixed[10:70:3].numpy(), fixed[10:70:3])
+    assert_array_lists_equal(ds.fixed[indices].numpy(aslist=True), list(fixed[indices]))
+    assert_array_lists_equal(
+        ds.dynamic[indices].numpy(aslist=True), [dynamic[i] for i in indices]
+    )
+    assert_array_lists_equal(
+        ds.dynamic[indices, 0].numpy(aslist=True), [dynamic[i][0] for i in indices]
+    )
+
+
 def test_safe_downcasting(local_ds):
     int_tensor = local_ds.create_tensor("int", dtype="uint8")
     int_tensor.append(0)
@@ -574,6 +614,42 @@ def test_shape_property(memory_ds):
     assert not fixed.is_dynamic
 
 
+def test_shape_index(local_ds_generator):
+    with local_ds_generator() as ds:
+        ds.create_tensor("x")
+        ds.x.extend([np.ones((i % 4, 3)) for i in range(40)])
+        assert ds.x.shape == (40, None, 3)
+        ds.x[5] = np.ones((7, 3))
+        ds.x.pop(0)
+        ds.x.append(np.ones((9, 3)))
+
+    ds = local_ds_generator()
+    shape_index = ds.x.chunk_engine.shape_index
+    assert shape_index.num_samples == 40
+
+    def no_chunk_reads(*args, **kwargs):
+        raise AssertionError("chunk read")
+
+    # shapes are looked up in the index, without reading the sample shape tensor or the chunks
+    sample_shape_engine = ds._x_shape.chunk_engine
+    sample_shape_engine.get_chunk_from_chunk_id = no_chunk_reads
+    ds.x.chunk_engine.get_chunk_from_chunk_id = no_chunk_reads
+    assert ds.x[[4, 5, 6]].shape == (3, None, 3)
+    assert ds.x[[3, 7]].shape == (2, 0, 3)
+    assert ds.x[39].shape == (9, 3)
+    assert ds.x[[0, 4, 39]].shape_interval.astuple() == (3, None, 3)
+    assert ds.x[[2, 6]].shape_interval.lower == (2, 3, 3)
+    assert ds.x[[2, 6]].shape_interval.upper == (2, 3, 3)
+    assert ds.x[4].shape == (7, 3)
+    assert ds.x.ndim == 3
+
+    # an index that doesn't match the sample shape tensor is rebuilt
+    ds.x.chunk_engine.shape_index = None
+    del sample_shape_engine.get_chunk_from_chunk_id
+    assert ds.x[[4, 39]].shape == (2, None, 3)
+    assert ds.x.chunk_engine.shape_index.num_samples == 40
+
+
 def test_htype(memory_ds: Dataset):
     image = memory_ds.create_tensor("image", htype="image", sample_compression="png")
     bbox = memory_ds.create_tensor("bbox", htype="bbox")
@@ -1035,6 +1111,7 @@ def test_compressions_list():
         "webp",
         "wmf",
         "xbm",
+        "zstd",
         None,
     ]
 
@@ -1430,6 +1507,67 @@ def test_ds_extend():
     assert_array_equal(ds1.y, ds2.y)
 
 
+@pytest.mark.parametrize("htype", ["generic", "sequence"])
+def test_ds_extend_rollback(memory_ds, htype):
+    ds = memory_ds
+    with ds:
+        ds.create_tensor("x", htype=htype, max_chunk_size=2 * KB)
+        ds.create_tensor("y", htype=htype, dtype="uint8")
+        ds.extend({"x": [np.ones(2)] * 3, "y": [np.ones(3, dtype="uint8")] * 3})
+        lengths = {
+            k: t.num_samples for k, t in ds._tensors(include_hidden=True).items()
+        }
+        x = [np.arange(i, i + 100) for i in range(100)]
+        with pytest.raises(SampleAppendError):
+            ds.extend({"x": x, "y": [np.ones(3, dtype="uint8")] * 99 + [np.zeros(3)]})
+        assert len(ds) == len(ds.x) == len(ds.y) == 3
+        for k, tensor in ds._tensors(include_hidden=True).items():
+            assert tensor.num_samples == lengths[k]
+        ds.extend({"x": x, "y": [np.ones(3, dtype="uint8")] * 100})
+    assert len(ds) == 103
+    expected = {k: 103 for k in lengths}
+    if htype == "sequence":
+        # shapes are linked to the items of the sequences
+        expected["_x_shape"] = 3 * 2 + 100 * 100
+        expected["_y_shape"] = 3 * 3 + 100 * 3
+    for k, tensor in ds._tensors(include_hidden=True).items():
+        assert tensor.num_samples == expected[k]
+    assert ds.x.chunk_engine.commit_diff.num_samples_added == 103
+    for i, sample in enumerate(ds.x[3:].numpy(aslist=True)):
+        assert_array_equal(np.reshape(sample, -1), x[i])
+
+
+def test_ds_extend_rollback_indices(memory_ds):
+    ds = memory_ds
+    with ds:
+        ds.create_tensor("x")
+        ds.create_tensor("emb", dtype="float32")
+        ds.create_tensor("y", dtype="uint8")
+        ds.extend(
+            {
+                "x": [np.ones(i + 1) for i in range(3)],
+                "emb": np.eye(3, dtype="float32"),
+                "y": [1] * 3,
+            }
+        )
+        ds.emb.create_vector_index()
+        assert ds.x[:2].shape == (2, None)
+        with pytest.raises(SampleAppendError):
+            ds.extend(
+                {
+                    "x": [np.ones(i + 1) for i in range(10)],
+                    "emb": np.zeros((10, 3), dtype="float32"),
+                    "y": [1] * 9 + [-1],
+                }
+            )
+    # the samples are popped with their links and indices
+    assert ds.x.chunk_engine.shape_index.num_samples == 3
+    assert ds.x[1:].shape == (2, None)
+    assert ds._x_id.num_samples == ds._emb_id.num_samples == 3
+    assert ds.emb.search([0, 0, 0.9], k=1).emb.numpy().tolist() == [[0, 0, 1]]
+    assert ds.emb.chunk_engine.vector_index.num_samples == 3
+
+
 @pytest.mark.parametrize(
     "src_args", [{}, {"sample_compression": "png"}, {"chunk_compression": "png"}]
 )
@@ -2470,3 +2608,36 @@ def test_iterate_with_groups(memory_ds):
 
     for i, sample in enumerate(ds):
         assert sample["x/y/z"].is_iteration == True
+
+
+def test_cache_shards(local_path):
+    import pickle
+    from concurrent.futures import ThreadPoolExecutor
+    from deeplake.core.io import SampleStreaming
+    from deeplake.core.storage import LRUCache, ShardedLRUCache
+
+    with deeplake.empty(local_path, overwrite=True, cache_shards=4) as ds:
+        assert isinstance(ds.storage, ShardedLRUCache)
+        ds.create_tensor("x", max_chunk_size=2 * KB)
+        ds.x.extend(np.arange(1000).reshape(100, 10))
+
+    assert not isinstance(deeplake.load(local_path).storage, ShardedLRUCache)
+    ds = deeplake.load(local_path, read_only=True, cache_shards=4)
+    assert isinstance(ds.storage, ShardedLRUCache) and ds.storage.num_shards == 4
+    assert pickle.loads(pickle.dumps(ds)).storage.num_shards == 4
+
+    def read(i):
+        return ds.x[i].numpy()
+
+    with ThreadPoolExecutor(8) as executor:
+        samples = list(executor.map(read, range(100)))
+    np.testing.assert_array_equal(np.stack(samples), np.arange(1000).reshape(100, 10))
+
+    # caches of the streaming readers are sharded like the caches of the dataset
+    engines = SampleStreaming(ds, ["x"]).chunk_engines
+    assert isinstance(engines["x"].cache, ShardedLRUCache)
+    ds = deeplake.load(local_path, read_only=True)
+    engines = SampleStreaming(ds, ["x"]).chunk_engines
+    assert type(engines["x"].cache) == LRUCache
+    engines = SampleStreaming(ds, ["x"], decode_threads=2).chunk_engines
+    assert isinstance(engines["x"].cache, ShardedLRUCache)
@@ -3,6 +3,7 @@ import sys
 from deeplake.constants import KB, MB
 from deeplake.util.exceptions import (
     SampleAppendError,
+    TensorMetaInvalidHtypeOverwriteValue,
     TensorMetaMissingRequiredValue,
     TensorMetaMutuallyExclusiveKeysError,
     UnsupportedCompressionError,
@@ -116,6 +117,59 @@ def test_byte_sample_compression(memory_ds):
         np.testing.assert_array_equal(ds.xyz[i].numpy(), i * np.ones((100, 100, 100)))
 
 
+@pytest.mark.parametrize(
+    "args",
+    [
+        {"chunk_compression": "zstd"},
+        {"chunk_compression": "zstd", "compression_args": {"shuffle": "byte"}},
+        {"sample_compression": "zstd", "compression_args": {"level": 9}},
+        {"sample_compression": "zstd", "compression_args": {"shuffle": "bit"}},
+    ],
+)
+def test_zstd_compression(local_ds, args, monkeypatch):
+    tile_args = []
+    compress_array = deeplake.core.tiling.sample_tiles.compress_array
+
+    def recording_compress_array(array, compression, compression_args=None):
+        tile_args.append(compression_args)
+        return compress_array(array, compression, compression_args)
+
+    monkeypatch.setattr(
+        deeplake.core.tiling.sample_tiles, "compress_array", recording_compress_array
+    )
+    arr = np.random.randn(50, 32).astype("float32")
+    tiled = np.random.randn(100, 100).astype("float32")
+    with local_ds as ds:
+        ds.create_tensor("xyz", htype="embedding", **args)
+        ds.xyz.extend(arr)
+        ds.xyz[3] = arr[5]
+        ds.xyz.append(np.ones((10,), dtype="float32"))
+        ds.create_tensor(
+            "tiled", max_chunk_size=16 * KB, tiling_threshold=8 * KB, **args
+        )
+        ds.tiled.append(tiled)
+        ds.tiled.append(np.ones((4, 4), dtype="float32"))
+
+    arr[3] = arr[5]
+    ds = deeplake.load(local_ds.path)
+    assert ds.xyz.meta.compression_args == args.get("compression_args")
+    np.testing.assert_array_equal(ds.xyz[:50].numpy(), arr)
+    np.testing.assert_array_equal(ds.xyz[50].numpy(), np.ones((10,)))
+    # the tiles of tiled samples are compressed with the same arguments
+    assert 0 in ds.tiled.chunk_engine.tile_encoder
+    assert len(tile_args) == ds.tiled.chunk_engine.num_chunks - 1 > 1
+    assert all(tile_arg == args.get("compression_args") for tile_arg in tile_args)
+    np.testing.assert_array_equal(ds.tiled[0].numpy(), tiled)
+    np.testing.assert_array_equal(ds.tiled[1].numpy(), np.ones((4, 4)))
+
+    with pytest.raises(TensorMetaInvalidHtypeOverwriteValue):
+        ds.create_tensor("abc", chunk_compression="lz4", compression_args={"level": 1})
+    with pytest.raises(TensorMetaInvalidHtypeOverwriteValue):
+        ds.create_tensor(
+            "abc", chunk_compression="zstd", compression_args={"shuffle": "none"}
+        )
+
+
 @pytest.mark.xfail(raises=SampleAppendError, strict=True)
 @pytest.mark.parametrize(
     "bad_shape",
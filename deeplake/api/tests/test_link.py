@@ -2,6 +2,7 @@ import numpy as np
 import os
 import sys
 import pickle
+import threading
 import deeplake
 import pytest
 from deeplake.client.client import DeepLakeBackendClient
@@ -663,3 +664,49 @@ def test_creds(hub_cloud_ds_generator, cat_path):
     ds = hub_cloud_ds_generator()
     assert ds.get_managed_creds_keys() == ["my_s3_creds"]
     assert set(ds.get_creds_keys()) == {"my_s3_creds", "ENV"}
+
+
+def test_prefetched_link_reads(local_ds_generator, cat_path, flower_path, monkeypatch):
+    from deeplake.core.sample import Sample
+
+    paths = {
+        f"https://example.com/{i}.png": [cat_path, flower_path][i % 2]
+        for i in range(40)
+    }
+    reads = []
+    threads = set()
+
+    def read_from_http(self):
+        reads.append(self.path)
+        threads.add(threading.get_ident())
+        with open(paths[self.path], "rb") as f:
+            return f.read()
+
+    monkeypatch.setattr(Sample, "_read_from_http", read_from_http)
+    with local_ds_generator() as ds:
+        ds.create_tensor(
+            "linked_images",
+            htype="link[image]",
+            sample_compression="png",
+            verify=False,
+            create_shape_tensor=False,
+            create_sample_info_tensor=False,
+        )
+        ds.linked_images.extend([deeplake.link(path) for path in paths])
+
+    ds = local_ds_generator()
+    expected = {
+        path: deeplake.read(local_path).array for path, local_path in paths.items()
+    }
+    samples = ds.linked_images.numpy(aslist=True)
+    assert len(samples) == 40
+    for sample, path in zip(samples, paths):
+        np.testing.assert_array_equal(sample, expected[path])
+    # each link is fetched once, ahead of its read, by the threads of the fetcher
+    assert sorted(reads) == sorted(paths)
+    assert threading.get_ident() not in threads
+    assert not ds.link_creds.fetcher._prefetched
+
+    reads.clear()
+    np.testing.assert_array_equal(ds.linked_images[3].numpy(), expected[list(paths)[3]])
+    assert len(reads) == 1
@@ -1,8 +1,9 @@
-from deeplake.constants import MB
+from deeplake.constants import KB, MB
 import numpy as np
 import random
 import deeplake
 import json
+import pytest
 
 
 def test_rechunk(local_ds):
@@ -57,6 +58,44 @@ def test_rechunk(local_ds):
         assert len(ds.compr) == 100
 
 
+@pytest.mark.parametrize("args", [{}, {"chunk_compression": "lz4"}])
+def test_incremental_rechunk(local_ds_generator, args):
+    with local_ds_generator() as ds:
+        ds.create_tensor("x", dtype="uint8", max_chunk_size=2 * KB, **args)
+        data = np.random.randint(0, 255, (100, 100), dtype="uint8")
+        ds.x.extend(data)
+        ds.commit()
+        expected = list(ds.x.numpy())
+        for i in range(20, 60):
+            ds.x[i] = expected[i] = np.ones(1, dtype="uint8")
+        for i in range(80, 90):
+            ds.x[i] = expected[i] = np.random.randint(0, 255, 300, dtype="uint8")
+
+        engine = ds.x.chunk_engine
+        ids_before = list(engine.chunk_id_encoder.array[:, 0])
+        bytes_moved = ds.rechunk(num_workers=2)
+        assert bytes_moved["x"] > 0
+        ids_after = list(engine.chunk_id_encoder.array[:, 0])
+        if not args:
+            # the chunks with sizes in bounds are kept
+            for row in [0, 1, 6, 7, 9]:
+                assert ids_before[row] in ids_after
+            for row in [2, 3, 4, 5, 8]:
+                assert ids_before[row] not in ids_after
+        for chunk_id in ids_after:
+            key = engine.get_chunk_key_for_id(chunk_id)
+            assert engine.cache.get_object_size(key) <= 2.5 * KB
+        for actual, expected_sample in zip(ds.x.numpy(aslist=True), expected):
+            np.testing.assert_array_equal(actual, expected_sample)
+        assert ds.rechunk() == {"x": 0}
+
+    ds = local_ds_generator()
+    for actual, expected_sample in zip(ds.x.numpy(aslist=True), expected):
+        np.testing.assert_array_equal(actual, expected_sample)
+    ds.checkout(ds.commits[0]["commit"])
+    np.testing.assert_array_equal(ds.x.numpy(), data)
+
+
 def test_rechunk_2(local_ds):
     with local_ds as ds:
         ds.create_tensor("compr", dtype="int64")
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from deeplake.util.exceptions import EmptyTensorError, VectorSearchError
+
+
+def _nearest(vectors, query, k):
+    return np.argsort(((vectors - query) ** 2).sum(1), kind="stable")[:k]
+
+
+def test_search(local_ds_generator):
+    rng = np.random.default_rng(0)
+    vectors = rng.random((300, 8), dtype=np.float32)
+    with local_ds_generator() as ds:
+        ds.create_tensor("embeddings", htype="embedding")
+        ds.create_tensor("labels")
+        ds.embeddings.extend(vectors)
+        ds.labels.extend(np.arange(300))
+
+    ds = local_ds_generator()
+    query = vectors[10] + 0.01
+    view = ds.embeddings.search(query, k=5)
+    assert len(view) == 5
+    np.testing.assert_array_equal(
+        view.labels.numpy().reshape(-1), _nearest(vectors, query, 5)
+    )
+    views = ds.embeddings.search(vectors[[1, 2]], k=1)
+    assert [v.labels.numpy().item() for v in views] == [1, 2]
+
+    # only the samples of a view are searched
+    view = ds[100:200].embeddings.search(query, k=3)
+    np.testing.assert_array_equal(
+        view.labels.numpy().reshape(-1), _nearest(vectors[100:200], query, 3) + 100
+    )
+
+    # the index is persisted, and extended with appended samples
+    ds = local_ds_generator()
+    assert ds.embeddings.chunk_engine.vector_index.num_samples == 300
+    ds.embeddings.append(query)
+    ds.labels.append(300)
+    assert ds.embeddings.search(query, k=1).labels.numpy().item() == 300
+    assert ds.embeddings.chunk_engine.vector_index.num_samples == 301
+
+    # updates and pops remove the index
+    ds.embeddings[300] = vectors[0]
+    assert ds.embeddings.chunk_engine.vector_index is None
+    ds.embeddings.create_vector_index("cosine")
+    ds.embeddings.pop()
+    assert ds.embeddings.chunk_engine.vector_index is None
+
+
+def test_search_version_control(local_ds):
+    vectors = np.eye(4, dtype=np.float32)
+    with local_ds as ds:
+        ds.create_tensor("embeddings", htype="embedding")
+        ds.embeddings.extend(vectors)
+        ds.embeddings.create_vector_index(index_type="ivf", nlist=2)
+        first = ds.commit()
+        ds.embeddings[0] = -vectors[0]
+        assert ds.embeddings.search(vectors[0], k=1).index.values[0].value == (1,)
+
+        ds.checkout(first)
+        index = ds.embeddings.chunk_engine.vector_index
+        assert index.index_type == "ivf"
+        assert ds.embeddings.search(vectors[0], k=1).index.values[0].value == (0,)
+
+
+def test_search_errors(memory_ds):
+    with memory_ds as ds:
+        ds.create_tensor("embeddings", htype="embedding")
+        ds.create_tensor("images")
+        ds.images.extend(np.zeros((2, 4, 4)))
+    with pytest.raises(EmptyTensorError):
+        ds.embeddings.search(np.zeros(4))
+    with pytest.raises(VectorSearchError):
+        ds.images.search(np.zeros(4))
+    ds.embeddings.extend([np.zeros(4), np.zeros(5)])
+    with pytest.raises(VectorSearchError):
+        ds.embeddings.search(np.zeros(4))
+    ds.embeddings.pop()
+    with pytest.raises(ValueError):
+        ds.embeddings.search(np.zeros(5))
+    with pytest.raises(ValueError):
+        ds.embeddings.search(np.zeros(4), k=0)
+    with pytest.raises(ValueError):
+        ds.embeddings.search(np.zeros(4), metric="hamming")
@@ -255,3 +255,72 @@ def test_coco_ingestion_with_incomplete_data(local_path, coco_ingestion_data):
     assert "images" in ds.tensors
     assert len(ds.tensors) == 1
     assert ds.images.num_samples == 10
+
+
+def test_coco_ingestion_annotations(local_path, tmp_path):
+    from PIL import Image  # type: ignore
+    import numpy as np
+    import json
+
+    images_directory = tmp_path / "images"
+    images_directory.mkdir()
+    images, annotations = [], []
+    for i in range(70):
+        file_name = f"{i}.png"
+        Image.fromarray(np.full((10 + i, 10, 3), i, dtype=np.uint8)).save(
+            images_directory / file_name
+        )
+        images.append({"id": 100 + i, "file_name": file_name})
+        # image i has i % 3 annotations
+        for j in range(i % 3):
+            annotations.append(
+                {
+                    "id": len(annotations),
+                    "image_id": 100 + i,
+                    "category_id": 1 + j,
+                    "bbox": [i, j, 5, 5],
+                    "segmentation": [[0, 0, i, 0, i, j]],
+                    "area": 25,
+                    "iscrowd": 0,
+                }
+            )
+    annotation_file = tmp_path / "annotations.json"
+    annotation_file.write_text(
+        json.dumps(
+            {
+                "images": images,
+                "annotations": annotations[::-1],
+                "categories": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+            }
+        )
+    )
+
+    ds = deeplake.ingest_coco(
+        images_directory,
+        [annotation_file],
+        dest=local_path,
+        ignore_one_group=True,
+        ignore_keys=["area", "iscrowd", "id", "image_id"],
+        progressbar=False,
+    )
+
+    assert len(ds) == 70
+    class_names = ds.category_id.info.class_names
+    for image, info, bbox, category, segmentation in zip(
+        ds.images.numpy(aslist=True),
+        ds.images.sample_info,
+        ds.bbox.numpy(aslist=True),
+        ds.category_id.numpy(aslist=True),
+        ds.segmentation.numpy(aslist=True),
+    ):
+        i = int(image[0, 0, 0])
+        assert image.shape == (10 + i, 10, 3)
+        assert info["filename"] == str(images_directory / f"{i}.png")
+        assert info["format"] == "png"
+        num_annotations = i % 3
+        assert len(bbox) == len(category) == len(segmentation) == num_annotations
+        # annotations of an image keep the order of the annotation file
+        for j, k in enumerate(reversed(range(num_annotations))):
+            np.testing.assert_array_equal(bbox[j], [i, k, 5, 5])
+            assert class_names[category[j]] == "ab"[k]
+            np.testing.assert_array_equal(segmentation[j], [[0, 0], [i, 0], [i, k]])
@@ -11,11 +11,12 @@ from deeplake.util.exceptions import IngestionError
 from ..base import UnstructuredDataset
 from ..util import DatasetStructure, GroupStructure, TensorStructure
 from .utils import CocoAnnotation, CocoImages
-from .convert import coco_to_deeplake
+from .convert import coco_column_to_deeplake
 
 from random import shuffle as rshuffle
 
 from .constants import (
+    COCO_INGESTION_BATCH_SIZE,
     DEFAULT_GENERIC_TENSOR_PARAMS,
     DEFAULT_COCO_TENSOR_PARAMS,
     DEFAULT_IMAGE_TENSOR_PARAMS,
@@ -152,14 +153,16 @@ class CocoDataset(UnstructuredDataset):
 
         @deeplake.compute
         def append_samples(
-            image: str,
+            images: List[str],
             ds: Dataset,
             tensors: Dict[str, Tensor],
         ):
             images_tensor_name = self._images_tensor_name
-            full_sample: Dict[str, List] = {key: [] for key in self._structure.all_keys}
-            full_sample[images_tensor_name] = self.images.get_image(
-                image,
+            columns: Dict[str, List] = {
+                key: [[] for _ in images] for key in self._structure.all_keys
+            }
+            columns[images_tensor_name] = self.images.get_images(
+                images,
                 tensors[images_tensor_name].is_link,
                 creds_key=self._image_creds_key,
             )
@@ -167,26 +170,32 @@ class CocoDataset(UnstructuredDataset):
             for coco_file in self.annotation_files:
                 file_name = coco_file.file_name
                 id_to_label = coco_file.id_to_label_mapping
-                matching_annotations = coco_file.get_annotations_for_image(image)
+                matching_annotations = [
+                    coco_file.get_annotations_for_image(image) for image in images
+                ]
                 group_prefix = self.file_to_group.get(file_name, file_name)
 
-                for annotation in matching_annotations:
-                    for tensor_name in self.tensor_to_key:
-                        full_name = self._get_full_tensor_name(
-                            group_prefix, tensor_name
-                        )
-
-                        coco_key = self.tensor_to_key.get(tensor_name, tensor_name)
-                        value = coco_to_deeplake(
-                            coco_key,
-                            annotation[coco_key],
-                            tensors[full_name],
-                            category_lookup=id_to_label,
-                        )
-                        full_sample[full_name].append(value)
-
-            ds.append(full_sample)
-
+                for tensor_name in self.tensor_to_key:
+                    full_name = self._get_full_tensor_name(group_prefix, tensor_name)
+
+                    coco_key = self.tensor_to_key.get(tensor_name, tensor_name)
+                    columns[full_name] = coco_column_to_deeplake(
+                        coco_key,
+                        [
+                            [annotation[coco_key] for annotation in annotations]
+                            for annotations in matching_annotations
+                        ],
+                        tensors[full_name],
+                        category_lookup=id_to_label,
+                    )
+
+            for tensor_name, column in columns.items():
+                ds[tensor_name].extend(column)
+
+        batches = [
+            image_files[i : i + COCO_INGESTION_BATCH_SIZE]
+            for i in range(0, len(image_files), COCO_INGESTION_BATCH_SIZE)
+        ]
         append_samples(tensors).eval(
-            image_files, ds, num_workers=num_workers, progressbar=progressbar
+            batches, ds, num_workers=num_workers, progressbar=progressbar
         )
@@ -1,6 +1,9 @@
 from typing import Dict
 from deeplake.constants import UNSPECIFIED
 
+# Number of images converted and added to the dataset together during ingestion
+COCO_INGESTION_BATCH_SIZE = 64
+
 DEFAULT_GENERIC_TENSOR_PARAMS = {"htype": UNSPECIFIED, "sample_compression": None}
 DEFAULT_IMAGE_TENSOR_PARAMS = {
     "name": "images",
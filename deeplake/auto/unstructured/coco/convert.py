@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from deeplake.core.tensor import Tensor
 from deeplake.util.exceptions import IngestionError
@@ -52,3 +52,56 @@ def coco_to_deeplake(
         return np.array(value, dtype=dtype)
 
     return value
+
+
+def coco_column_to_deeplake(
+    coco_key: str,
+    values: List[List[Any]],
+    destination_tensor: Tensor,
+    category_lookup: Optional[Dict] = None,
+) -> List:
+    """Converts the values of a coco key for a batch of images to Deep Lake samples, one sample per image.
+
+    Args:
+        coco_key (str): The coco key of the values.
+        values (List[List[Any]]): For each image, the values of the key in the annotations of the image.
+        destination_tensor (Tensor): The tensor the samples are added to.
+        category_lookup (Dict, Optional): Mapping from category ids to labels.
+
+    Returns:
+        List: For each image, the list of the converted values or a single array holding all of them.
+
+    Raises:
+        IngestionError: If a bbox doesn't have 4 values.
+    """
+    if coco_key == "bbox":
+        dtype = destination_tensor.meta.dtype
+        samples: List = []
+        for image_values in values:
+            if not image_values:
+                samples.append([])
+                continue
+            try:
+                sample = np.array(image_values, dtype=dtype)
+            except ValueError:
+                sample = None
+            if sample is None or sample.ndim != 2 or sample.shape[1] != 4:
+                raise IngestionError(
+                    f"Invalid bbox encountered in key {coco_key}. Bbox must have 4 values."
+                )
+            samples.append(sample)
+        return samples
+    elif coco_key == "category_id" and category_lookup is not None:
+        return [
+            [category_lookup[str(value)] for value in image_values]
+            for image_values in values
+        ]
+    elif coco_key in ("segmentation", "keypoints"):
+        return [
+            [
+                coco_to_deeplake(coco_key, value, destination_tensor, category_lookup)
+                for value in image_values
+            ]
+            for image_values in values
+        ]
+    return [list(image_values) for image_values in values]
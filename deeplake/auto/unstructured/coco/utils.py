@@ -4,9 +4,11 @@ import json
 import pathlib
 
 from collections import defaultdict
-from typing import Tuple, List, Union, Optional, DefaultDict
+from typing import Any, Dict, Tuple, List, Union, Optional, DefaultDict
 
 import deeplake
+from deeplake.core.compression import get_compression
+from deeplake.core.sample import Sample
 from deeplake.htype import HTYPE_SUPPORTED_COMPRESSIONS
 from deeplake.util.exceptions import IngestionError
 from deeplake.client.log import logger
@@ -38,6 +40,7 @@ class CocoAnnotation:
         self.data = self._load_annotation_data()
         self.id_to_label_mapping = self._get_id_to_label_mapping()
         self.image_name_to_id_mapping = self._get_image_name_to_id_mapping()
+        self.image_id_to_annotations = self._get_image_id_to_annotations_mapping()
 
     def _load_annotation_data(self):
         """Validates and loads the COCO annotation file."""
@@ -62,6 +65,13 @@ class CocoAnnotation:
     def _get_image_name_to_id_mapping(self):
         return {i["file_name"]: i["id"] for i in self.images}
 
+    def _get_image_id_to_annotations_mapping(self) -> Dict[Any, List[Dict]]:
+        """Groups the annotations by image id in a single pass, so that the annotations of an image are looked up in constant time."""
+        mapping: DefaultDict[Any, List[Dict]] = defaultdict(list)
+        for annotation in self.annotations:
+            mapping[annotation["image_id"]].append(annotation)
+        return dict(mapping)
+
     @property
     def file_name(self):
         return pathlib.Path(self.file_path).stem
@@ -85,12 +95,7 @@ class CocoAnnotation:
             raise IngestionError(
                 f"Could not find corresponding image_id for {image} in {self.file_name} file."
             )
-        return list(
-            filter(
-                lambda item: item["image_id"] == image_id,
-                self.annotations,
-            )
-        )
+        return self.image_id_to_annotations.get(image_id, [])
 
 
 class CocoImages:
@@ -152,3 +157,24 @@ class CocoImages:
             return deeplake.link(self.get_full_path(image), creds_key=creds_key)
 
         return deeplake.read(self.get_full_path(image), storage=self.provider)
+
+    def get_images(
+        self, images: List[str], linked: bool, creds_key: Optional[str] = None
+    ) -> List:
+        """Gets multiple images. Unless they are linked, the files are read concurrently from the provider
+        and the samples keep their paths along with the prefetched buffers."""
+        if linked:
+            return [self.get_image(image, linked, creds_key) for image in images]
+
+        buffers = self.provider.get_items(images)
+        return [
+            Sample(
+                path=self.get_full_path(image),
+                buffer=buffers[image],
+                compression=get_compression(
+                    header=bytes(buffers[image][:32]), path=image
+                ),
+                storage=self.provider,
+            )
+            for image in images
+        ]
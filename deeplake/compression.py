@@ -4,8 +4,18 @@ from PIL import Image  # type: ignore
 
 BYTE_COMPRESSIONS = [
     "lz4",
+    "zstd",
 ]
 
+# keys of `compression_args` that are supported by each byte compression
+BYTE_COMPRESSION_ARGS = {
+    "lz4": [],
+    "zstd": ["level", "shuffle"],
+}
+
+# filters applied to the items of numeric samples before compression
+SHUFFLE_FILTERS = ["byte", "bit"]
+
 
 IMAGE_COMPRESSIONS = [
     "bmp",
@@ -34,12 +34,21 @@ DEFAULT_MAX_CHUNK_SIZE = 16 * MB
 
 DEFAULT_TILING_THRESHOLD = 16 * MB  # Note: set to -1 to disable tiling
 
+# used for zstd compression if no level is given in `compression_args`
+DEFAULT_ZSTD_LEVEL = 3
+
 MIN_FIRST_CACHE_SIZE = 32 * MB
 MIN_SECOND_CACHE_SIZE = 160 * MB
 
 # without MB multiplication, meant for the dataset API that takes cache size in MBs
 DEFAULT_MEMORY_CACHE_SIZE = 256
 DEFAULT_LOCAL_CACHE_SIZE = 0
+# Number of lock striped shards of a cache shared between threads
+DEFAULT_CACHE_NUM_SHARDS = 8
+# Eviction policy of the persistent local cache, either "lru" or "lfu"
+DEFAULT_CACHE_EVICTION_POLICY = "lru"
+# Number of cache hits recorded in memory before they are written to the index of the persistent local cache
+PERSISTENT_CACHE_ACCESS_BATCH_SIZE = 64
 
 # maximum allowable size before `large_ok` must be passed to dataset delete methods
 DELETE_SAFETY_SIZE = 1 * GB
@@ -72,6 +81,8 @@ ENCODED_CREDS_FOLDER = "creds_index"
 ENCODED_CHUNK_NAMES_FOLDER = "chunks_index"
 ENCODED_SEQUENCE_NAMES_FOLDER = "sequence_index"
 ENCODED_PAD_NAMES_FOLDER = "pad_index"
+ENCODED_SHAPES_FOLDER = "shapes_index"
+VECTOR_INDEX_FOLDER = "vector_index"
 
 # unsharded naming will help with backwards compatibility
 UNSHARDED_ENCODER_FILENAME = "unsharded"
@@ -182,10 +193,41 @@ LOCK_LOCAL_DATASETS = not PYTEST_ENABLED
 # this fraction of min chunk size
 TRANSFORM_RECHUNK_AVG_SIZE_BOUND = 0.1
 
+# Number of work units per worker that the input of a transform is split into with `dynamic_scheduling`
+TRANSFORM_WORK_UNITS_PER_WORKER = 8
+
 TIME_INTERVAL_FOR_CUDA_MEMORY_CLEANING = 10 * 60
 
 MAX_TENSORS_IN_SHUFFLE_BUFFER = 32000
 
+# Maximum number of objects fetched concurrently from storage while prefetching
+PREFETCH_CONCURRENCY = 16
+
+# Size of the chunk cache of each tensor while streaming, which also bounds the chunks prefetched ahead of the reads
+STREAMING_CACHE_SIZE = 32 * MB
+
+# Maximum number of linked samples that are fetched ahead of their reads
+LINK_PREFETCH_SIZE = 32
+
+# Byte ranges of a partially read chunk that are at most this many bytes apart are fetched with a single request
+PARTIAL_READ_COALESCE_GAP = 64 * KB
+
+# Samples read together are fetched partially from their chunk only if they are at most this fraction of its samples,
+# otherwise the whole chunk is fetched with a single request
+PARTIAL_READ_MAX_FRACTION = 0.25
+
+# Number of nearest clusters of an IVF vector index that are searched by default
+VECTOR_SEARCH_NPROBE = 8
+
+# Number of vectors sampled per cluster to train the centroids of an IVF vector index
+VECTOR_INDEX_TRAINING_SAMPLES_PER_CLUSTER = 256
+
+# Maximum number of images decoded concurrently by `decompress_images`
+IMAGE_DECODE_CONCURRENCY = 8
+
+# Number of samples of the same chunk that are decoded together while streaming
+IMAGE_DECODE_BATCH_SIZE = 64
+
 # Transform cache sizes
 DEFAULT_TRANSFORM_SAMPLE_CACHE_SIZE = 16
 TRANSFORM_CHUNK_CACHE_SIZE = 64 * MB
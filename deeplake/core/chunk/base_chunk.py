@@ -1,7 +1,7 @@
 from abc import abstractmethod
 import struct
 import numpy as np
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 import warnings
 
 import deeplake
@@ -153,6 +153,20 @@ class BaseChunk(DeepLakeMemoryObject):
     def is_partially_read_chunk(self):
         return isinstance(self.data_bytes, PartialReader)
 
+    def prefetch_samples(self, local_indices: Sequence[int]):
+        """Fetches the bytes of the samples at `local_indices` of a partially read chunk with as few requests as possible,
+        so that reading them afterwards doesn't go to the storage. Does nothing if the chunk is fully read."""
+        if not isinstance(self.data_bytes, PartialReader):
+            return
+        bps = self.byte_positions_encoder
+        if not bps.is_empty():
+            ranges = [tuple(map(int, bps[i])) for i in local_indices]
+        elif self.is_fixed_shape:
+            ranges = [self.get_byte_positions(int(i)) for i in local_indices]
+        else:
+            return
+        self.data_bytes.prefetch(ranges)
+
     @property
     def data_bytes(self) -> Union[bytearray, bytes, memoryview, PartialReader]:
         return self._data_bytes
@@ -355,6 +369,7 @@ class BaseChunk(DeepLakeMemoryObject):
                 tiling_threshold,
                 break_into_tiles,
                 store_uncompressed_tiles,
+                getattr(self.tensor_meta, "compression_args", None),
             )
         elif isinstance(incoming_sample, PartialSample):
             incoming_sample, shape = serialize_partial_sample_object(
@@ -364,6 +379,7 @@ class BaseChunk(DeepLakeMemoryObject):
                 dt,
                 ht,
                 min_chunk_size,
+                getattr(self.tensor_meta, "compression_args", None),
             )
         elif isinstance(incoming_sample, deeplake.core.tensor.Tensor):
             incoming_sample, shape = serialize_tensor(
@@ -375,6 +391,7 @@ class BaseChunk(DeepLakeMemoryObject):
                 tiling_threshold,
                 break_into_tiles,
                 store_uncompressed_tiles,
+                getattr(self.tensor_meta, "compression_args", None),
             )
         elif isinstance(
             incoming_sample,
@@ -389,6 +406,7 @@ class BaseChunk(DeepLakeMemoryObject):
                 tiling_threshold,
                 break_into_tiles,
                 store_uncompressed_tiles,
+                getattr(self.tensor_meta, "compression_args", None),
             )
         elif isinstance(incoming_sample, SampleTiles):
             shape = incoming_sample.sample_shape
@@ -29,13 +29,29 @@ class ChunkCompressedChunk(BaseChunk):
                 decompress_bytes(self._data_bytes, self.compression)
             )
         else:
-            shapes = [
-                self.shapes_encoder[i] for i in range(self.shapes_encoder.num_samples)
-            ]
+            shapes = list(
+                map(
+                    tuple,
+                    self.shapes_encoder.get_shapes(
+                        np.arange(self.shapes_encoder.num_samples)
+                    ),
+                )
+            )
             self.decompressed_samples = decompress_multiple(self._data_bytes, shapes)
         self._changed = False
         self._compression_ratio = 0.5
 
+    def _compress_bytes(self, buffer) -> bytes:
+        itemsize = (
+            1 if self.is_text_like or not self.dtype else np.dtype(self.dtype).itemsize
+        )
+        return compress_bytes(
+            buffer,
+            self.compression,
+            getattr(self.tensor_meta, "compression_args", None),
+            itemsize,
+        )
+
     def extend_if_has_space(self, incoming_samples: List[InputSample], update_tensor_meta: bool = True, lengths: Optional[List[int]] = None) -> float:  # type: ignore
         self.prepare_for_write()
         if lengths is not None:  # this is triggered only for htype == "text"
@@ -84,9 +100,7 @@ class ChunkCompressedChunk(BaseChunk):
                 # Check if compression ratio is actually better
                 s = self._text_sample_to_byte_string(incoming_samples[0])
                 new_decompressed = decompressed_bytes + s
-                compressed_bytes = compress_bytes(
-                    new_decompressed, compression=self.compression
-                )
+                compressed_bytes = self._compress_bytes(new_decompressed)
 
                 if len(compressed_bytes) <= min_chunk_size:
                     self._compression_ratio /= 2
@@ -188,9 +202,7 @@ class ChunkCompressedChunk(BaseChunk):
                     samples_to_chunk = samples_to_chunk.astype(chunk_dtype)
 
                 new_decompressed = decompressed_bytes + samples_to_chunk.tobytes()  # type: ignore
-                compressed_bytes = compress_bytes(
-                    new_decompressed, compression=self.compression
-                )
+                compressed_bytes = self._compress_bytes(new_decompressed)
 
                 if len(compressed_bytes) <= min_chunk_size:
                     self._compression_ratio /= 2
@@ -260,9 +272,7 @@ class ChunkCompressedChunk(BaseChunk):
                 decompressed_bytes = self.decompressed_bytes
                 new_decompressed = self.decompressed_bytes + serialized_sample  # type: ignore
 
-                compressed_bytes = compress_bytes(
-                    new_decompressed, compression=self.compression
-                )
+                compressed_bytes = self._compress_bytes(new_decompressed)
                 num_compressed_bytes = len(compressed_bytes)
                 tiling_threshold = self.tiling_threshold
                 if num_compressed_bytes > self.min_chunk_size and not (
@@ -489,6 +499,9 @@ class ChunkCompressedChunk(BaseChunk):
                     sample_shape=sample.sample_shape,
                     tile_shape=sample.tile_shape,
                     dtype=sample.dtype,
+                    compression_args=getattr(
+                        self.tensor_meta, "compression_args", None
+                    ),
                 ),
                 sample.sample_shape,
             )
@@ -513,6 +526,7 @@ class ChunkCompressedChunk(BaseChunk):
                 self.compression,
                 self.tiling_threshold,
                 store_uncompressed_tiles=True,
+                compression_args=getattr(self.tensor_meta, "compression_args", None),
             )
 
         return sample, shape
@@ -524,7 +538,7 @@ class ChunkCompressedChunk(BaseChunk):
             self.decompressed_bytes = (
                 self.decompressed_bytes[:sb] + self.decompressed_bytes[eb:]
             )
-            self._data_bytes = compress_bytes(self.decompressed_bytes, self.compression)
+            self._data_bytes = self._compress_bytes(self.decompressed_bytes)
         else:
             self.decompressed_samples.pop(index)
             self._data_bytes = compress_multiple(
@@ -542,7 +556,7 @@ class ChunkCompressedChunk(BaseChunk):
             self.decompressed_bytes = self.decompressed_bytes[
                 : self.byte_positions_encoder[total_samples - num_samples][0]
             ]
-            self._data_bytes = compress_bytes(self.decompressed_bytes, self.compression)
+            self._data_bytes = self._compress_bytes(self.decompressed_bytes)
         else:
             for _ in range(num_samples):
                 self.decompressed_samples.pop()
@@ -559,7 +573,7 @@ class ChunkCompressedChunk(BaseChunk):
 
     def _compress(self):
         if self.is_byte_compression:
-            self._data_bytes = compress_bytes(self.decompressed_bytes, self.compression)
+            self._data_bytes = self._compress_bytes(self.decompressed_bytes)
         else:
             self._data_bytes = compress_multiple(
                 self.decompressed_samples, self.compression
@@ -1,7 +1,12 @@
 import os
 import struct
-from typing import List, Optional, Union
-from deeplake.core.compression import decompress_array, decompress_bytes
+from typing import List, Optional, Sequence, Tuple, Union
+import numpy as np
+from deeplake.core.compression import (
+    decompress_array,
+    decompress_bytes,
+    decompress_images,
+)
 from deeplake.core.sample import Sample  # type: ignore
 from deeplake.core.serialize import (
     check_sample_shape,
@@ -92,17 +97,7 @@ class SampleCompressedChunk(BaseChunk):
                 buffer = buffer[sb:eb]
         if not decompress:
             return bytes(buffer) if copy else buffer
-        if not is_tile and self.is_fixed_shape:
-            shape = tuple(self.tensor_meta.min_shape)
-        else:
-            try:
-                shape = self.shapes_encoder[local_index]
-            except IndexError as e:
-                if not bps_empty:
-                    self.num_dims = self.num_dims or len(self.tensor_meta.max_shape)
-                    shape = (0,) * self.num_dims
-                else:
-                    raise e
+        shape = self._get_sample_shape(local_index, is_tile, bps_empty)
 
         nframes = shape[0]
         if self.is_text_like:
@@ -148,6 +143,39 @@ class SampleCompressedChunk(BaseChunk):
             sample = sample.copy()
         return sample
 
+    def _get_sample_shape(
+        self, local_index: int, is_tile: bool = False, bps_empty: bool = False
+    ) -> Tuple[int, ...]:
+        if not is_tile and self.is_fixed_shape:
+            return tuple(self.tensor_meta.min_shape)
+        try:
+            return self.shapes_encoder[local_index]
+        except IndexError as e:
+            if not bps_empty:
+                self.num_dims = self.num_dims or len(self.tensor_meta.max_shape)
+                return (0,) * self.num_dims
+            raise e
+
+    @catch_chunk_read_error
+    def read_samples(
+        self, local_indices: Sequence[int], cast: bool = True
+    ) -> List[np.ndarray]:
+        """Reads the samples at `local_indices`. Images are decoded together with `decompress_images`, other samples
+        are read one by one."""
+        if not self.is_image_compression or self._get_partial_sample_tile() is not None:
+            return [self.read_sample(i, cast=cast) for i in local_indices]
+        self.check_empty_before_read()
+        bps_empty = self.byte_positions_encoder.is_empty()
+        buffers = [self.read_sample(i, decompress=False) for i in local_indices]
+        shapes = [self._get_sample_shape(i, bps_empty=bps_empty) for i in local_indices]
+        samples = decompress_images(buffers, shapes, self.dtype, self.compression)
+        if cast:
+            samples = [
+                sample if sample.dtype == self.dtype else sample.astype(self.dtype)
+                for sample in samples
+            ]
+        return samples
+
     def update_sample(self, local_index: int, sample: InputSample):
         self.prepare_for_write()
         serialized_sample, shape = self.serialize_sample(
@@ -1,4 +1,4 @@
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from deeplake.client.log import logger
 import deeplake
 import numpy as np
@@ -52,6 +52,7 @@ from deeplake.constants import (
     FIRST_COMMIT_ID,
     PARTIAL_NUM_SAMPLES,
     DEFAULT_TILING_THRESHOLD,
+    PARTIAL_READ_MAX_FRACTION,
 )
 from deeplake.core.chunk.base_chunk import BaseChunk, InputSample
 from deeplake.core.chunk.chunk_compressed_chunk import ChunkCompressedChunk
@@ -62,6 +63,8 @@ from deeplake.core.index.index import Index, IndexEntry
 from deeplake.core.meta.encode.chunk_id import CHUNK_ID_COLUMN, ChunkIdEncoder
 from deeplake.core.meta.encode.sequence import SequenceEncoder
 from deeplake.core.meta.encode.pad import PadEncoder
+from deeplake.core.meta.encode.shape_index import ShapeIndex
+from deeplake.core.vector_index import VectorIndex
 from deeplake.core.meta.tensor_meta import TensorMeta
 from deeplake.core.storage.lru_cache import LRUCache
 from deeplake.util.casting import get_dtype, get_htype
@@ -76,6 +79,8 @@ from deeplake.util.keys import (
     get_chunk_id_encoder_key,
     get_sequence_encoder_key,
     get_pad_encoder_key,
+    get_shape_index_key,
+    get_vector_index_key,
     get_tensor_commit_diff_key,
     get_tensor_meta_key,
     get_chunk_key,
@@ -98,7 +103,7 @@ from deeplake.util.exceptions import (
 )
 from deeplake.util.remove_cache import get_base_storage
 from deeplake.util.image import convert_sample, convert_img_arr
-from deeplake.util.class_label import convert_to_idx, convert_to_hash
+from deeplake.util.class_label import convert_to_idx
 from deeplake.compression import (
     BYTE_COMPRESSION,
     VIDEO_COMPRESSIONS,
@@ -196,10 +201,19 @@ class ChunkEngine:
         self._pad_encoder: Optional[PadEncoder] = None
         self._pad_encoder_commit_id: Optional[str] = None
 
+        self._shape_index: Optional[ShapeIndex] = None
+        self._shape_index_commit_id: Optional[str] = None
+
+        self._vector_index: Optional[VectorIndex] = None
+        self._vector_index_commit_id: Optional[str] = None
+
         self._tile_encoder: Optional[TileEncoder] = None
         self._tile_encoder_commit_id: Optional[str] = None
 
         self._commit_chunk_map: Optional[CommitChunkMap] = None
+
+        self._resolved_chunk_map: Optional[CommitChunkMap] = None
+        self._resolved_chunk_map_commit_id: Optional[str] = None
         self._commit_chunk_map_commit_id: Optional[str] = None
 
         self._commit_diff: Optional[CommitDiff] = None
@@ -212,8 +226,8 @@ class ChunkEngine:
         self._info_commit_id: Optional[str] = None
 
         self._all_chunk_engines: Optional[Dict[str, ChunkEngine]] = None
-        self._is_temp_label_tensor: bool = False
-        self._hash_label_map: Dict[int, str] = OrderedDict()
+        # class names of a transform worker, labels are converted against these instead of the tensor info
+        self._transform_class_names: Optional[List[str]] = None
         self._sample_compression = None
         self._chunk_compression = None
 
@@ -633,35 +647,77 @@ class ChunkEngine:
         """Returns the commit id and tensor key that contains the chunk_name."""
         cur_node: Optional[CommitNode] = self.version_state["commit_node"]
         key = self.key
-        while cur_node is not None:
-            commit_id = cur_node.commit_id
-            chunk_map_key = get_tensor_commit_chunk_map_key(key, commit_id)
-            try:
-                # the first commit doesn't contain a chunk map, don't repeatedly try to fetch from storage
-                if commit_id == FIRST_COMMIT_ID:
-                    chunk_map = dict()
-                else:
-                    chunk_map = self.meta_cache.get_deeplake_object(
-                        chunk_map_key, CommitChunkMap
-                    ).chunks
-            except Exception:
-                commit_chunk_map = CommitChunkMap()
-                try:
-                    self.meta_cache[chunk_map_key] = commit_chunk_map
-                except ReadOnlyModeError:
-                    # put CommitChunkMap in deeplake_objects to keep in cache temporarily, but won't write to storage
-                    # this shouldn't happen in latest version of deeplake, chunk map would always be present
-                    self.meta_cache.deeplake_objects[chunk_map_key] = commit_chunk_map
-                chunk_map = dict()
-            v = chunk_map.get(chunk_name)
+        if cur_node is None:
+            return FIRST_COMMIT_ID, key
+        v = self._get_commit_chunk_map(cur_node.commit_id).get(chunk_name)
+        if v is not None:
+            return v.get("commit_id", cur_node.commit_id), v.get("key", key)
+        if cur_node.parent is not None:
+            v = self._get_resolved_chunk_map(cur_node.parent).chunks.get(chunk_name)
             if v is not None:
-                commit_id = v.get("commit_id", commit_id)
-                key = v.get("key", key)
-                return commit_id, key
-            cur_node = cur_node.parent  # type: ignore
+                return v["commit_id"], v.get("key", key)
         # the first commit doesn't have a commit chunk map, so any chunk that wasn't found belongs to the first commit
         return FIRST_COMMIT_ID, key
 
+    def _get_commit_chunk_map(self, commit_id: str) -> Dict[str, Dict]:
+        """Returns the chunks stored for the tensor in the commit `commit_id`."""
+        # the first commit doesn't contain a chunk map, don't repeatedly try to fetch from storage
+        if commit_id == FIRST_COMMIT_ID:
+            return {}
+        chunk_map_key = get_tensor_commit_chunk_map_key(self.key, commit_id)
+        try:
+            return self.meta_cache.get_deeplake_object(
+                chunk_map_key, CommitChunkMap
+            ).chunks
+        except Exception:
+            commit_chunk_map = CommitChunkMap()
+            try:
+                self.meta_cache[chunk_map_key] = commit_chunk_map
+            except ReadOnlyModeError:
+                # put CommitChunkMap in deeplake_objects to keep in cache temporarily, but won't write to storage
+                # this shouldn't happen in latest version of deeplake, chunk map would always be present
+                self.meta_cache.register_deeplake_object(
+                    chunk_map_key, commit_chunk_map
+                )
+            return {}
+
+    def _get_resolved_chunk_map(self, commit_node: CommitNode) -> CommitChunkMap:
+        """Returns the chunks of the tensor stored in `commit_node` and all its ancestors, each with the commit id (and
+        key, if it is different) it is read from, so that a chunk is resolved with a single lookup however deep the history.
+
+        Only called for committed nodes, which don't change anymore. The map is only kept in memory. It is derived from the
+        previously resolved map if that belongs to an ancestor, for example after a commit, and the chunk maps of the
+        commits in between.
+        """
+        commit_id = commit_node.commit_id
+        cached = self._resolved_chunk_map
+        if cached is not None and self._resolved_chunk_map_commit_id == commit_id:
+            return cached
+        nodes: List[CommitNode] = []
+        node: Optional[CommitNode] = commit_node
+        while (
+            node is not None
+            and node.commit_id != FIRST_COMMIT_ID
+            and node.commit_id != self._resolved_chunk_map_commit_id
+        ):
+            nodes.append(node)
+            node = node.parent  # type: ignore
+        resolved = CommitChunkMap()
+        if (
+            cached is not None
+            and node is not None
+            and node.commit_id == self._resolved_chunk_map_commit_id
+        ):
+            resolved.chunks = dict(cached.chunks)
+        for node in reversed(nodes):
+            for chunk_name, v in self._get_commit_chunk_map(node.commit_id).items():
+                resolved.add(
+                    chunk_name, v.get("commit_id", node.commit_id), v.get("key")
+                )
+        self._resolved_chunk_map = resolved
+        self._resolved_chunk_map_commit_id = commit_id
+        return resolved
+
     def _write_initialization(self):
         ffw_chunk_id_encoder(self.chunk_id_encoder)
 
@@ -694,9 +750,7 @@ class ChunkEngine:
             tensor_meta.set_dtype(get_dtype(samples[0]))
         if self._convert_to_list(samples):
             samples = list(samples)
-        if self._is_temp_label_tensor:
-            samples = verified_samples = convert_to_hash(samples, self._hash_label_map)
-        elif tensor_meta.htype in ("image.gray", "image.rgb"):
+        if tensor_meta.htype in ("image.gray", "image.rgb"):
             mode = "L" if tensor_meta.htype == "image.gray" else "RGB"
             converted = []
             for sample in samples:
@@ -717,6 +771,10 @@ class ChunkEngine:
         return samples, verified_samples
 
     def _convert_class_labels(self, samples):
+        if self._transform_class_names is not None:
+            labels, additions = convert_to_idx(samples, self._transform_class_names)
+            self._transform_class_names.extend(new[0] for new in additions)
+            return labels
         tensor_info_path = get_tensor_info_key(self.key, self.commit_id)
         try:
             tensor_info = self.cache.get_deeplake_object(tensor_info_path, Info)
@@ -1148,6 +1206,9 @@ class ChunkEngine:
         except KeyError:
             pass
 
+        self.shape_index = None
+        self._invalidate_vector_index()
+
         self.tensor_meta.length = 0
         self.tensor_meta.min_shape = []
         self.tensor_meta.max_shape = []
@@ -1532,6 +1593,206 @@ class ChunkEngine:
         ):
             self.__rechunk(chunk, chunk_row)
 
+    def _plan_rechunk(self, sizes: np.ndarray) -> List[Tuple[int, int]]:
+        """Plans the chunk rows to rewrite, given the sizes of the chunks in bytes.
+
+        Consecutive chunks smaller than half of `min_chunk_size` or larger than `max_chunk_size` are rewritten together.
+        A run of undersized chunks that would still be undersized once merged is also merged with its next or previous
+        chunk if they fit in a single chunk. Chunks holding tiles are never rewritten.
+
+        Args:
+            sizes (np.ndarray): The size of each chunk, in the order of the chunk id encoder.
+
+        Returns:
+            List[Tuple[int, int]]: Sorted, disjoint ``[start, end)`` ranges of chunk rows.
+        """
+        num_chunks = len(sizes)
+        last_index = self.chunk_id_encoder.array[:, LAST_SEEN_INDEX_COLUMN]
+        tiled = np.zeros(num_chunks, dtype=bool)
+        same_as_next = last_index[1:] == last_index[:-1]
+        tiled[1:] |= same_as_next
+        tiled[:-1] |= same_as_next
+        undersized = sizes < self.min_chunk_size // 2
+        # chunk compressed chunks are filled based on an estimate of the compression ratio, so they may exceed max_chunk_size a little
+        slack = (
+            self.min_chunk_size // 2 if self.chunk_class == ChunkCompressedChunk else 0
+        )
+        oversized = sizes > self.max_chunk_size + slack
+        bad = (undersized | oversized) & ~tiled
+
+        ranges: List[Tuple[int, int]] = []
+        row = 0
+        while row < num_chunks:
+            if not bad[row]:
+                row += 1
+                continue
+            start = row
+            while row < num_chunks and bad[row]:
+                row += 1
+            end = row
+            total = sizes[start:end].sum()
+            if undersized[start:end].all() and total < self.min_chunk_size // 2:
+                # the run would still be undersized after merging, try to merge it with a neighbour
+                if (
+                    end < num_chunks
+                    and not tiled[end]
+                    and total + sizes[end] <= self.min_chunk_size
+                ):
+                    end += 1
+                    row += 1
+                elif (
+                    start > 0
+                    and not tiled[start - 1]
+                    and (not ranges or ranges[-1][1] < start)
+                    and sizes[start - 1] + total <= self.min_chunk_size
+                ):
+                    start -= 1
+                elif end - start == 1:
+                    continue
+            ranges.append((start, end))
+        return ranges
+
+    def _repack_chunks(
+        self, chunks: List[BaseChunk]
+    ) -> Optional[List[Tuple[bytes, int]]]:
+        """Packs the samples of `chunks` into new chunks, filled up to `min_chunk_size` as when they are appended.
+
+        Args:
+            chunks (List[BaseChunk]): Consecutive chunks of the tensor.
+
+        Returns:
+            Optional[List[Tuple[bytes, int]]]: The serialized new chunks with their number of samples, or None if a sample
+                would have to be tiled, in which case the chunks are left as they are.
+        """
+        samples: List[Any] = []
+        for chunk in chunks:
+            if self.is_text_like:
+                samples.extend(map(chunk.read_sample, range(chunk.num_samples)))
+            else:
+                samples.extend(self._get_chunk_samples(chunk))
+        samples, _ = self._sanitize_samples(samples, verify=False)
+        new_chunks: List[List] = []
+        while len(samples) > 0:
+            num_samples_added = (
+                new_chunks[-1][0].extend_if_has_space(samples, update_tensor_meta=False)
+                if new_chunks
+                else 0
+            )
+            if num_samples_added == 0:
+                if new_chunks and new_chunks[-1][1] == 0:
+                    return None  # doesn't fit in an empty chunk
+                chunk = self.chunk_class(*self.chunk_args)  # type: ignore
+                chunk._update_tensor_meta_length = False
+                new_chunks.append([chunk, 0])
+            elif num_samples_added < 0 or num_samples_added == PARTIAL_NUM_SAMPLES:
+                return None
+            else:
+                new_chunks[-1][1] += int(num_samples_added)
+                samples = samples[int(num_samples_added) :]
+        return [(chunk.tobytes(), num_samples) for chunk, num_samples in new_chunks]
+
+    def rechunk(self, num_workers: int = 0) -> int:
+        """Rewrites only the chunks of the tensor that are too small or too large, see `_plan_rechunk`. Link and video tensors
+        are left as they are.
+
+        Chunks are read, repacked and serialized by `num_workers` threads, a few ranges at a time. The new chunks are written to
+        the current commit and the chunk id encoder is updated once, after all of them are written. The chunks that were replaced
+        are then deleted, unless they belong to a previous commit.
+
+        Args:
+            num_workers (int): Number of threads used to rewrite chunks. 0 rewrites them in the current thread.
+
+        Returns:
+            int: The number of bytes of the chunks that were rewritten.
+        """
+        self._write_initialization()
+        enc = self.chunk_id_encoder
+        if enc.num_chunks < 2 or self.tensor_meta.is_link or self.is_video:
+            return 0
+        self.cached_data = None
+        initial_autoflush = self.cache.autoflush
+        self.cache.autoflush = False
+        for chunk in (self.active_appended_chunk, self.active_updated_chunk):
+            self.write_chunk_to_storage(chunk)
+        self.active_appended_chunk = None
+        self.active_updated_chunk = None
+
+        arr = enc.array
+        chunk_ids = [int(chunk_id) for chunk_id in arr[:, CHUNK_ID_COLUMN]]
+        keys = [self.get_chunk_key_for_id(chunk_id) for chunk_id in chunk_ids]
+        executor = ThreadPoolExecutor(num_workers) if num_workers > 0 else None
+        try:
+            sizes = np.array(
+                list((executor.map if executor else map)(self.cache.get_object_size, keys)),  # type: ignore
+                dtype=np.int64,
+            )
+            plan = self._plan_rechunk(sizes)
+            new_rows: Dict[int, Tuple[int, np.ndarray]] = {}
+            batch_size = max(num_workers, 1)
+            for i in range(0, len(plan), batch_size):
+                batch = plan[i : i + batch_size]
+                self.cache.prefetch(
+                    [key for start, end in batch for key in keys[start:end]],
+                    [int(size) for start, end in batch for size in sizes[start:end]],
+                )
+                chunk_lists = [
+                    [
+                        self.get_chunk_from_chunk_id(chunk_ids[row])
+                        for row in range(start, end)
+                    ]
+                    for start, end in batch
+                ]
+                results = (executor.map if executor else map)(self._repack_chunks, chunk_lists)  # type: ignore
+                for (start, end), result in zip(batch, results):
+                    if result is None:
+                        continue
+                    first_index = (
+                        arr[start - 1, LAST_SEEN_INDEX_COLUMN] + 1 if start else 0
+                    )
+                    encoded = np.zeros((len(result), 2), dtype=arr.dtype)
+                    for row, (chunk_bytes, num_samples) in enumerate(result):
+                        chunk_id = enc.generate_chunk_id(register=False)
+                        chunk_name = ChunkIdEncoder.name_from_id(chunk_id)  # type: ignore
+                        self.cache[
+                            get_chunk_key(self.key, chunk_name, self.commit_id)
+                        ] = chunk_bytes
+                        if self.commit_chunk_map is not None:
+                            self.commit_chunk_map.add(chunk_name)
+                        encoded[row, CHUNK_ID_COLUMN] = chunk_id
+                        encoded[row, LAST_SEEN_INDEX_COLUMN] = num_samples
+                    encoded[:, LAST_SEEN_INDEX_COLUMN] = (
+                        first_index + np.cumsum(encoded[:, LAST_SEEN_INDEX_COLUMN]) - 1
+                    )
+                    new_rows[start] = (end, encoded)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        if not new_rows:
+            self.cache.autoflush = initial_autoflush
+            return 0
+        parts = []
+        removed = []
+        row = 0
+        for start in sorted(new_rows):
+            end, encoded = new_rows[start]
+            parts.extend((arr[row:start], encoded))
+            removed.extend(range(start, end))
+            row = end
+        parts.append(arr[row:])
+        enc._encoded = np.concatenate(parts)
+        enc.is_dirty = True
+        for row in removed:
+            key = keys[row]
+            if key.startswith(get_chunk_key(self.key, "", self.commit_id)):
+                try:
+                    del self.cache[key]
+                except KeyError:
+                    pass
+        self.cache.autoflush = initial_autoflush
+        self.cache.maybe_flush()
+        return int(sizes[removed].sum())
+
     def _update(
         self,
         index: Index,
@@ -1543,6 +1804,7 @@ class ChunkEngine:
         """Update data at `index` with `samples`."""
         self._write_initialization()
         self.cached_data = None
+        self._invalidate_vector_index()
         initial_autoflush = self.cache.autoflush
         self.cache.autoflush = False
 
@@ -1714,6 +1976,20 @@ class ChunkEngine:
             local_sample_index, cast=cast, copy=copy, decompress=decompress
         )
 
+    def read_samples_from_chunk(
+        self, global_sample_indices: Sequence[int], chunk: BaseChunk, cast: bool = True
+    ) -> List[np.ndarray]:
+        """Reads the samples at ``global_sample_indices`` from ``chunk``. Images of sample compressed chunks are decoded together."""
+        if not isinstance(chunk, SampleCompressedChunk):
+            return [
+                self.read_sample_from_chunk(i, chunk, cast=cast)
+                for i in global_sample_indices
+            ]
+        local_indices = self.chunk_id_encoder.translate_indices_relative_to_chunks(
+            np.asarray(global_sample_indices, dtype=np.int64)
+        )[2]
+        return chunk.read_samples(local_indices.tolist(), cast=cast)
+
     def _get_full_chunk(self, index) -> bool:
         """Reads samples from chunks and returns as a boolean that says whether we need to fetch full chunks or only specified subset of it.
         Args:
@@ -1789,6 +2065,13 @@ class ChunkEngine:
             return sample[tuple(entry.value for entry in index.values[2:])]
         return sample
 
+    @property
+    def _supports_partial_reads(self) -> bool:
+        """Whether the chunks of this tensor can be read partially, by fetching the header and then only the required bytes."""
+        return self.chunk_class != ChunkCompressedChunk and isinstance(
+            self.base_storage, (S3Provider, GCSProvider)
+        )
+
     def get_chunk_info(self, global_sample_index, fetch_chunks):
         """Returns the chunk_id, row and worst case header size of chunk containing the given sample."""
         enc = self.chunk_id_encoder
@@ -1797,11 +2080,7 @@ class ChunkEngine:
 
         worst_case_header_size = 0
         num_samples_in_chunk = -1
-        if (
-            not fetch_chunks
-            and self.chunk_class != ChunkCompressedChunk
-            and isinstance(self.base_storage, (S3Provider, GCSProvider))
-        ):
+        if not fetch_chunks and self._supports_partial_reads:
             prev = int(enc.array[row - 1][LAST_SEEN_INDEX_COLUMN]) if row > 0 else -1
             num_samples_in_chunk = int(enc.array[row][LAST_SEEN_INDEX_COLUMN]) - prev
             worst_case_header_size += HEADER_SIZE_BYTES + 10  # 10 for version
@@ -1904,6 +2183,175 @@ class ChunkEngine:
 
         return sample
 
+    def _can_read_batched(self, index: Index, length: int, pad_tensor: bool) -> bool:
+        """Whether the samples of ``index`` can be read chunk by chunk with :meth:`_read_samples_batched`."""
+        entry = index.values[0]
+        if self.is_video or not entry.subscriptable():
+            return False
+        if isinstance(entry.value, slice):
+            return entry.length(length) > 1
+        indices = entry.value
+        if not isinstance(indices, (list, tuple, np.ndarray)) or len(indices) < 2:
+            return False
+        # out of bounds indices are handled (or reported) by `get_single_sample`
+        return pad_tensor or all(-length <= i < length for i in indices)
+
+    def _prefetch_chunks(self, chunk_ids: Sequence[int]):
+        """Fetches the chunks with ``chunk_ids`` that are missing from the cache concurrently."""
+        if len(chunk_ids) < 2:
+            return
+        keys = []
+        for chunk_id in chunk_ids:
+            chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
+            commit_id, tkey = self.get_chunk_commit(chunk_name)
+            keys.append(get_chunk_key(tkey, chunk_name, commit_id))
+        self.cache.prefetch(keys, [self.max_chunk_size] * len(keys))
+
+    def _read_samples_batched(
+        self,
+        global_sample_indices: List[int],
+        index: Index,
+        fetch_chunks: bool = False,
+        pad_tensor: bool = False,
+    ) -> Union[np.ndarray, List[np.ndarray]]:
+        """Reads the samples at ``global_sample_indices``, fetching and decoding each chunk only once.
+
+        Args:
+            global_sample_indices (List[int]): Indices of the samples to read, in output order.
+            index (Index): Index used to subscript each sample.
+            fetch_chunks (bool): If True, full chunks will be retrieved from the storage, otherwise only required bytes will be retrieved
+                if the storage supports it. The byte ranges of the samples read from the same chunk are coalesced and fetched
+                concurrently.
+            pad_tensor (bool): If True, any index out of bounds will return an empty sample.
+
+        Returns:
+            Union[np.ndarray, List[np.ndarray]]: A single array if all samples are fixed shape and uncompressed, list of samples otherwise.
+
+        Raises:
+            GetChunkError: If a chunk cannot be retrieved from the storage.
+            ReadSampleFromChunkError: If a sample cannot be read from a chunk.
+        """
+        n = len(global_sample_indices)
+        samples: List[Any] = [None] * n
+        sub_index = tuple(entry.value for entry in index.values[1:])
+        idx = np.array(global_sample_indices, dtype=np.int64)
+        idx[idx < 0] += self.num_samples
+
+        positions = np.arange(n)
+        if pad_tensor:
+            padded = idx >= self.tensor_length
+            for pos in positions[padded]:
+                samples[pos] = self.get_single_sample(
+                    int(idx[pos]), index, pad_tensor=True
+                )
+            positions = positions[~padded]
+
+        enc = self.chunk_id_encoder
+        start_rows, stop_rows = enc.get_row_ranges(idx[positions])
+        # tiled samples span multiple rows
+        tiled = stop_rows - start_rows > 1
+        for pos in positions[tiled]:
+            samples[pos] = self.get_single_sample(
+                int(idx[pos]), index, fetch_chunks=fetch_chunks
+            )
+        positions = positions[~tiled]
+        chunk_ids, rows, local_indices = enc.translate_indices_relative_to_chunks(
+            idx[positions]
+        )
+
+        order = np.argsort(rows, kind="stable")
+        positions, rows = positions[order], rows[order]
+        chunk_ids, local_indices = chunk_ids[order], local_indices[order]
+        unique_rows, starts = np.unique(rows, return_index=True)
+        split = starts[1:]
+        groups = np.split(positions, split) if len(positions) else []
+        local_groups = np.split(local_indices, split) if len(positions) else []
+        partial = not fetch_chunks and self._supports_partial_reads
+        # reading the header and then the samples takes two requests, so only a small part of a chunk is read partially
+        full_fetch = [
+            (fetch_chunks or len(group) > 1)
+            and not (
+                partial
+                and len(group) <= PARTIAL_READ_MAX_FRACTION * enc.num_samples_at(row)
+            )
+            for row, group in zip(unique_rows, groups)
+        ]
+        self._prefetch_chunks(
+            [chunk_ids[start] for start, full in zip(starts, full_fetch) if full]
+        )
+
+        fast = (
+            self.chunk_class == UncompressedChunk
+            and self.is_fixed_shape
+            and self.tensor_meta.htype not in ("polygon", "json", "list")
+            and not self.tensor_meta.is_link
+            and bool(np.prod(self.tensor_meta.max_shape))
+            and len(unique_rows) > 0
+        )
+        out: Optional[np.ndarray] = None
+        cast = self.tensor_meta.htype != "dicom"
+        for row, start, group, group_local_indices, full in zip(
+            unique_rows, starts, groups, local_groups, full_fetch
+        ):
+            try:
+                worst_case_header_size = (
+                    0
+                    if full
+                    else self.get_chunk_info(int(idx[group[0]]), fetch_chunks)[2]
+                )
+                chunk = self.get_chunk_from_chunk_id(
+                    chunk_ids[start],
+                    partial_chunk_bytes=worst_case_header_size,
+                )
+            except GetChunkError as e:
+                raise GetChunkError(e.chunk_key, int(idx[group[0]]), self.name) from e
+            if len(group) > 1:
+                chunk.prefetch_samples(group_local_indices)
+            fast = fast and not chunk.is_partially_read_chunk
+            if fast:
+                shape = tuple(self.tensor_meta.max_shape)
+                data = np.frombuffer(chunk.memoryview_data, dtype=chunk.dtype)
+                num_samples_in_chunk = enc.num_samples_at(row)
+                # chunks with empty samples are read sample by sample
+                fast = data.size == num_samples_in_chunk * int(np.prod(shape))
+            if fast:
+                block = data.reshape((-1,) + shape)[group_local_indices]
+                if sub_index:
+                    block = block[(slice(None),) + sub_index]
+                if out is None:
+                    out = np.empty((n,) + block.shape[1:], dtype=block.dtype)
+                out[group] = block
+                continue
+            if (
+                len(group) > 1
+                and isinstance(chunk, SampleCompressedChunk)
+                and chunk.is_image_compression
+            ):
+                try:
+                    batch = chunk.read_samples(group_local_indices.tolist(), cast=cast)
+                except ReadSampleFromChunkError:
+                    pass  # read sample by sample below to report the corrupt sample
+                else:
+                    for pos, sample in zip(group, batch):
+                        samples[pos] = sample[sub_index] if sub_index else sample
+                    continue
+            for pos, local_sample_index in zip(group, group_local_indices):
+                try:
+                    sample = chunk.read_sample(int(local_sample_index), cast=cast)
+                except ReadSampleFromChunkError as e:
+                    raise ReadSampleFromChunkError(
+                        e.chunk_key, int(idx[pos]), self.name
+                    ) from e
+                samples[pos] = sample[sub_index] if sub_index else sample
+
+        if fast and len(positions) == n:
+            return out  # type: ignore
+        if out is not None:
+            for pos in range(n):
+                if samples[pos] is None:
+                    samples[pos] = out[pos]
+        return samples
+
     def _numpy(
         self,
         index: Index,
@@ -1938,7 +2386,23 @@ class ChunkEngine:
         ispolygon = self.tensor_meta.htype == "polygon"
         if ispolygon:
             aslist = True
-        if use_data_cache and self.is_data_cachable:
+        if self._can_read_batched(index, length, pad_tensor):
+            samples = self._read_samples_batched(
+                list(index.values[0].indices(length)), index, fetch_chunks, pad_tensor
+            )
+            if isinstance(samples, np.ndarray):
+                if not aslist:
+                    return samples
+                samples = list(samples)
+            else:
+                for i, sample in enumerate(samples):
+                    check_sample_shape(
+                        sample.shape, last_shape, self.key, index, aslist
+                    )
+                    last_shape = sample.shape
+                    if ispolygon:
+                        samples[i] = [p.__array__() for p in sample]
+        elif use_data_cache and self.is_data_cachable:
             samples = self.numpy_from_data_cache(index, length, aslist, pad_tensor)
         else:
             samples = []
@@ -2006,7 +2470,13 @@ class ChunkEngine:
                     full_shape = (num_samples,) + tuple(self.tensor_meta.max_shape)
                     dtype = self.tensor_meta.dtype
 
-                    data_bytes = bytearray(chunk.data_bytes)
+                    data_bytes = chunk.data_bytes
+                    if not (
+                        isinstance(data_bytes, bytes)
+                        or (isinstance(data_bytes, memoryview) and data_bytes.readonly)
+                    ):
+                        # mutable buffers are copied as the chunk may be resized while cached_data is alive
+                        data_bytes = bytearray(data_bytes)
                     self.cached_data = np.frombuffer(data_bytes, dtype).reshape(
                         full_shape
                     )
@@ -2128,6 +2598,7 @@ class ChunkEngine:
             )
 
         self.cached_data = None
+        self._invalidate_vector_index()
         initial_autoflush = self.cache.autoflush
         self.cache.autoflush = False
 
@@ -2285,6 +2756,87 @@ class ChunkEngine:
             self.meta_cache.register_deeplake_object(key, enc)
         return self._pad_encoder
 
+    @property
+    def shape_index(self) -> Optional[ShapeIndex]:
+        """Gets the shape index of the tensor from cache, None if the tensor doesn't have one.
+
+        The index is built and kept up to date by `Tensor`, from the values of the hidden sample shape tensor.
+        """
+        commit_id = self.commit_id
+        if self._shape_index_commit_id != commit_id:
+            key = get_shape_index_key(self.key, commit_id)
+            try:
+                enc = self.meta_cache.get_deeplake_object(key, ShapeIndex)
+                self.meta_cache.register_deeplake_object(key, enc)
+            except KeyError:
+                enc = None
+            self._shape_index = enc
+            self._shape_index_commit_id = commit_id
+        return self._shape_index
+
+    @shape_index.setter
+    def shape_index(self, shape_index: Optional[ShapeIndex]):
+        """Replaces the shape index of the tensor. Setting it to None removes it."""
+        commit_id = self.commit_id
+        key = get_shape_index_key(self.key, commit_id)
+        self._shape_index = shape_index
+        self._shape_index_commit_id = commit_id
+        try:
+            if shape_index is None:
+                self.meta_cache.remove_deeplake_object(key)
+                try:
+                    del self.meta_cache[key]
+                except KeyError:
+                    pass
+            else:
+                self.meta_cache[key] = shape_index
+                self.meta_cache.register_deeplake_object(key, shape_index)
+        except ReadOnlyModeError:
+            pass  # the index is only kept in memory
+
+    @property
+    def vector_index(self) -> Optional[VectorIndex]:
+        """Gets the vector index of the tensor from cache, None if the tensor doesn't have one.
+
+        The index is built and searched by `Tensor.search`, and removed whenever samples are updated or popped.
+        """
+        commit_id = self.commit_id
+        if self._vector_index_commit_id != commit_id:
+            key = get_vector_index_key(self.key, commit_id)
+            try:
+                index = self.meta_cache.get_deeplake_object(key, VectorIndex)
+                self.meta_cache.register_deeplake_object(key, index)
+            except KeyError:
+                index = None
+            self._vector_index = index
+            self._vector_index_commit_id = commit_id
+        return self._vector_index
+
+    @vector_index.setter
+    def vector_index(self, vector_index: Optional[VectorIndex]):
+        """Replaces the vector index of the tensor. Setting it to None removes it."""
+        commit_id = self.commit_id
+        key = get_vector_index_key(self.key, commit_id)
+        self._vector_index = vector_index
+        self._vector_index_commit_id = commit_id
+        try:
+            if vector_index is None:
+                self.meta_cache.remove_deeplake_object(key)
+                try:
+                    del self.meta_cache[key]
+                except KeyError:
+                    pass
+            else:
+                self.meta_cache[key] = vector_index
+                self.meta_cache.register_deeplake_object(key, vector_index)
+        except ReadOnlyModeError:
+            pass  # the index is only kept in memory
+
+    def _invalidate_vector_index(self):
+        """Removes the vector index, as the vectors it holds no longer match the samples."""
+        if not self.tensor_meta.hidden and self.vector_index is not None:
+            self.vector_index = None
+
     def _sequence_numpy(
         self,
         index: Index,
@@ -2500,7 +3052,21 @@ class ChunkEngine:
         index: Index,
         sample_shape_provider: Optional[Callable] = None,
         pad_tensor: bool = False,
+        shape_index: Optional[ShapeIndex] = None,
     ) -> Tuple[Optional[int], ...]:
+        """Returns the shape of the samples at ``index``, with ``None`` for the dimensions that are dynamic.
+
+        Args:
+            index (Index): Index to use for shape calculation.
+            sample_shape_provider (Callable, Optional): Function returning the shape of the sample at a global index,
+                used for tensors with dynamic shapes and link tensors. If not given, shapes are read from the chunks.
+            pad_tensor (bool): If True, indices out of bounds have the shape of an empty sample.
+            shape_index (ShapeIndex, Optional): Shape index of the tensor. If given, the shapes of the samples are looked
+                up in it instead of using ``sample_shape_provider``.
+
+        Returns:
+            Tuple[Optional[int], ...]: The shape.
+        """
         index_0, sample_index = index.values[0], index.values[1:]
         if (
             not index_0.subscriptable()
@@ -2525,7 +3091,15 @@ class ChunkEngine:
                 f"Too many indices for tensor. Tensor is rank {sample_ndim + 1} but {len(sample_index) + 1} indices were provided."
             )
 
-        if None in shape or self.tensor_meta.is_link:
+        if (
+            (None in shape or self.tensor_meta.is_link)
+            and shape_index is not None
+            and not self.is_sequence
+            and shape_index.ndim == sample_ndim
+            and max(sample_indices) < shape_index.num_samples
+        ):
+            sample_shapes[:] = shape_index.get_shapes(sample_indices)
+        elif None in shape or self.tensor_meta.is_link:
             for i, idx in enumerate(sample_indices):
                 if self.tensor_meta.htype in ("text", "json"):
                     shape = (1,)
@@ -2601,11 +3175,15 @@ class ChunkEngine:
                     ndim -= 1
         return ndim
 
-    def shape_interval(self, index: Index) -> ShapeInterval:
+    def shape_interval(
+        self, index: Index, shape_index: Optional[ShapeIndex] = None
+    ) -> ShapeInterval:
         """Returns a `ShapeInterval` object that describes this tensor's shape more accurately. Length is included.
 
         Args:
             index (Index): Index to use for shape calculation.
+            shape_index (ShapeIndex, Optional): Shape index of the tensor. If given, the bounds are computed from the
+                shapes of the samples at ``index`` rather than from all the samples of the tensor.
 
         Note:
             If you are expecting a `tuple`, use `tensor.shape` instead.
@@ -2631,6 +3209,18 @@ class ChunkEngine:
             min_length = max_length = [index.length(meta.length)]
         min_shape = min_length + list(meta.min_shape)
         max_shape = max_length + list(meta.max_shape)
+        if (
+            shape_index is not None
+            and not self.is_sequence
+            and len(index.values) == 1
+            and not index.is_trivial()
+            and shape_index.ndim == len(meta.min_shape)
+        ):
+            indices = list(index.values[0].indices(meta.length))
+            if indices and max(indices) < shape_index.num_samples:
+                shapes = shape_index.get_shapes(indices)
+                min_shape = min_length + shapes.min(axis=0).tolist()
+                max_shape = max_length + shapes.max(axis=0).tolist()
 
         return ShapeInterval(min_shape, max_shape)
 
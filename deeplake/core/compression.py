@@ -10,9 +10,11 @@ from deeplake.util.exceptions import (
 from deeplake.util.object_3d.read_3d_data import (
     read_3d_data,
 )
+from deeplake.constants import DEFAULT_ZSTD_LEVEL, IMAGE_DECODE_CONCURRENCY
 from deeplake.compression import (
     get_compression_type,
     BYTE_COMPRESSION,
+    IMAGE_COMPRESSION,
     VIDEO_COMPRESSION,
     AUDIO_COMPRESSION,
     POINT_CLOUD_COMPRESSION,
@@ -24,12 +26,17 @@ import numpy as np
 from pathlib import Path
 from PIL import Image  # type: ignore
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
 import mmap
+import os
 import struct
 import sys
+import threading
 import re
 import numcodecs.lz4  # type: ignore
+import numcodecs.zstd  # type: ignore
+import numcodecs  # type: ignore
 from numpy.core.fromnumeric import compress  # type: ignore
 import math
 from pathlib import Path
@@ -151,15 +158,103 @@ def _decompress_apng(buffer: Union[bytes, memoryview]) -> np.ndarray:
     return ret
 
 
+_SHUFFLE_FILTER_IDS = {None: 0, "byte": 1, "bit": 2}
+_SHUFFLE_FILTERS = {v: k for k, v in _SHUFFLE_FILTER_IDS.items()}
+
+
+def _shuffle(
+    buffer: Union[bytes, memoryview],
+    itemsize: int,
+    shuffle: str,
+    inverse: bool = False,
+) -> bytes:
+    """Groups the bytes (``shuffle="byte"``) or bits (``shuffle="bit"``) of the items in ``buffer`` by their significance,
+    which makes numeric data more compressible. Trailing bytes that don't fill an item, or a group of 8 items for
+    bit shuffle, are left in place.
+    """
+    arr = np.frombuffer(buffer, dtype=np.uint8)
+    n = len(arr) // itemsize
+    if shuffle == "bit":
+        n -= n % 8
+    if n == 0:
+        return arr.tobytes()
+    head, tail = arr[: n * itemsize], arr[n * itemsize :]
+    if shuffle == "byte":
+        codec = numcodecs.Shuffle(itemsize)
+        return bytes(codec.decode(head) if inverse else codec.encode(head)) + bytes(
+            tail
+        )
+    # bit planes are ordered by byte and then by bit, starting from the least significant bit of the first byte
+    if inverse:
+        items = np.zeros((itemsize, n), dtype=np.uint8)
+        for i, plane in enumerate(head.reshape(8 * itemsize, n // 8)):
+            items[i // 8] |= np.unpackbits(plane, bitorder="little") << (i % 8)
+        head = items.T
+    else:
+        items = np.ascontiguousarray(head.reshape(n, itemsize).T)
+        head = np.empty((8 * itemsize, n // 8), dtype=np.uint8)
+        for i in range(8 * itemsize):
+            head[i] = np.packbits((items[i // 8] >> (i % 8)) & 1, bitorder="little")
+    return np.ascontiguousarray(head).tobytes() + bytes(tail)
+
+
+def _compress_zstd(
+    buffer: Union[bytes, memoryview], compression_args: dict, itemsize: int
+) -> bytes:
+    level = compression_args.get("level")
+    shuffle = compression_args.get("shuffle")
+    if shuffle == "byte" and itemsize <= 1 or not 0 < itemsize < 256:
+        shuffle = None
+    if shuffle:
+        buffer = _shuffle(buffer, itemsize, shuffle)
+    # the filter is stored in a 2 byte header, so that buffers can be decompressed without the tensor meta
+    header = struct.pack(
+        "<BB", _SHUFFLE_FILTER_IDS[shuffle], itemsize if shuffle else 0
+    )
+    return header + numcodecs.zstd.compress(
+        buffer, DEFAULT_ZSTD_LEVEL if level is None else level
+    )
+
+
+def _decompress_zstd(buffer: Union[bytes, memoryview]) -> bytes:
+    filter_id, itemsize = struct.unpack("<BB", buffer[:2])
+    decompressed = numcodecs.zstd.decompress(buffer[2:])
+    if filter_id:
+        decompressed = _shuffle(
+            decompressed, itemsize, _SHUFFLE_FILTERS[filter_id], inverse=True
+        )
+    return decompressed
+
+
 def compress_bytes(
-    buffer: Union[bytes, memoryview], compression: Optional[str]
+    buffer: Union[bytes, memoryview],
+    compression: Optional[str],
+    compression_args: Optional[dict] = None,
+    itemsize: int = 1,
 ) -> bytes:
+    """Compresses ``buffer`` with a byte compression.
+
+    Args:
+        buffer (bytes, memoryview): Buffer to be compressed.
+        compression (str, optional): One of ``deeplake.compression.BYTE_COMPRESSIONS``.
+        compression_args (dict, optional): Arguments of the compression. For ``zstd``, ``level`` is the compression level
+            and ``shuffle`` is ``"byte"`` or ``"bit"`` to shuffle the items of the buffer before compressing it.
+        itemsize (int): Size of the items in ``buffer`` in bytes, used by the shuffle filters.
+
+    Returns:
+        bytes: Compressed buffer.
+
+    Raises:
+        SampleCompressionError: If ``compression`` is not a byte compression.
+    """
     if not buffer:
         return b""
     if compression == "lz4":
         if not buffer:
             return b""
         return numcodecs.lz4.compress(buffer)
+    elif compression == "zstd":
+        return _compress_zstd(buffer, compression_args or {}, itemsize)
     else:
         raise SampleCompressionError(
             (len(buffer),), compression, f"Not a byte compression: {compression}"
@@ -184,11 +279,17 @@ def decompress_bytes(
                 )
             return lz4.frame.decompress(buffer)
         return numcodecs.lz4.decompress(buffer)
+    elif compression == "zstd":
+        return _decompress_zstd(buffer)
     else:
         raise SampleDecompressionError()
 
 
-def compress_array(array: np.ndarray, compression: Optional[str]) -> bytes:
+def compress_array(
+    array: np.ndarray,
+    compression: Optional[str],
+    compression_args: Optional[dict] = None,
+) -> bytes:
     """Compress some numpy array using `compression`. All meta information will be contained in the returned buffer.
 
     Note:
@@ -197,6 +298,7 @@ def compress_array(array: np.ndarray, compression: Optional[str]) -> bytes:
     Args:
         array (np.ndarray): Array to be compressed.
         compression (str, optional): `array` will be compressed with this compression into bytes. Right now only arrays compatible with `PIL` will be compressed.
+        compression_args (dict, optional): Arguments of byte compressions. See `compress_bytes`.
 
     Raises:
         UnsupportedCompressionError: If `compression` is unsupported. See `deeplake.compressions`.
@@ -221,7 +323,9 @@ def compress_array(array: np.ndarray, compression: Optional[str]) -> bytes:
     compr_type = get_compression_type(compression)
 
     if compr_type == BYTE_COMPRESSION:
-        return compress_bytes(array.tobytes(), compression)
+        return compress_bytes(
+            array.tobytes(), compression, compression_args, array.dtype.itemsize
+        )
     elif compr_type == AUDIO_COMPRESSION:
         raise NotImplementedError(
             "In order to store audio data, you should use `deeplake.read(path_to_file)` or specify sample_compression=None. "
@@ -354,6 +458,134 @@ def decompress_array(
         raise SampleDecompressionError(path)
 
 
+def _is_pil_decodable(compression: Optional[str]) -> bool:
+    """Whether samples with `compression` are decoded by PIL in `decompress_array`."""
+    return get_compression_type(
+        compression
+    ) == IMAGE_COMPRESSION and compression not in (
+        "apng",
+        "dcm",
+    )
+
+
+def _scaled_shape(shape: Tuple[int, ...], scale: int) -> Tuple[int, ...]:
+    return tuple(-(-int(dim) // scale) for dim in shape[:2]) + tuple(shape[2:])
+
+
+def _decompress_image(
+    buffer: Union[bytes, memoryview],
+    shape: Optional[Tuple[int, ...]],
+    dtype: Optional[str],
+    scale: int,
+) -> np.ndarray:
+    """Decodes an image with PIL, with its height and width reduced by `scale`."""
+    try:
+        if shape is not None and 0 in shape:
+            return np.zeros(_scaled_shape(shape, scale), dtype=dtype)
+        img = Image.open(BytesIO(buffer))
+        if scale > 1:
+            width, height = img.size
+            size = (-(-width // scale), -(-height // scale))
+            # JPEGs are decoded at the smallest DCT scale whose output is at least the requested size
+            img.draft(img.mode, (max(1, width // scale), max(1, height // scale)))
+            if img.size != size:
+                img = img.resize(size, Image.BOX)
+        arr = np.array(img)
+        if shape is not None:
+            arr = arr.reshape(_scaled_shape(shape, scale))
+        return arr
+    except Exception:
+        raise SampleDecompressionError()
+
+
+_decode_pool: Optional[ThreadPoolExecutor] = None
+_decode_pool_pid: Optional[int] = None
+_decode_pool_lock = threading.Lock()
+_decode_thread = threading.local()
+
+
+def _get_decode_pool() -> ThreadPoolExecutor:
+    """Returns the pool of `IMAGE_DECODE_CONCURRENCY` threads shared by all the calls to `decompress_images`."""
+    global _decode_pool, _decode_pool_pid
+    with _decode_pool_lock:
+        # threads don't survive a fork, so each process creates its own pool
+        if _decode_pool is None or _decode_pool_pid != os.getpid():
+            _decode_pool = ThreadPoolExecutor(
+                IMAGE_DECODE_CONCURRENCY, thread_name_prefix="deeplake-decode"
+            )
+            _decode_pool_pid = os.getpid()
+        return _decode_pool
+
+
+def mark_decode_thread():
+    """Marks the current thread as one of a pool that decodes samples concurrently. `decompress_images` decodes the
+    images sequentially on such threads, instead of nesting another level of concurrency."""
+    _decode_thread.active = True
+
+
+def decompress_images(
+    buffers: Sequence[Union[bytes, memoryview]],
+    shapes: Optional[Sequence[Optional[Tuple[int, ...]]]] = None,
+    dtype: Optional[str] = None,
+    compression: Optional[str] = None,
+    scale: int = 1,
+    num_workers: int = IMAGE_DECODE_CONCURRENCY,
+) -> List[np.ndarray]:
+    """Decompresses multiple image buffers into numpy arrays.
+
+    The images are decoded concurrently by a pool of threads shared by the process, as PIL releases the GIL while
+    decoding, unless the current thread was marked with `mark_decode_thread`. Buffers with other compressions, like apng
+    or dicom, are decompressed one by one with `decompress_array`.
+
+    Args:
+        buffers (Sequence[bytes, memoryview]): Buffers to be decompressed.
+        shapes (Sequence[Tuple[int]], Optional): Shapes of the decompressed images, the decompressed arrays are reshaped to them.
+        dtype (str, Optional): Dtype of the images, used for empty images.
+        compression (str, Optional): Compression of the buffers.
+        scale (int): Factor by which the height and width of the images are reduced. JPEGs are decoded directly at a reduced
+            size, which is much faster than decoding them at full size. Defaults to 1.
+        num_workers (int): Maximum number of images of `buffers` decoded concurrently, by a pool of at most
+            `IMAGE_DECODE_CONCURRENCY` threads. Defaults to `IMAGE_DECODE_CONCURRENCY`.
+
+    Raises:
+        SampleDecompressionError: If any of the buffers can't be decompressed.
+        ValueError: If `scale` is not a positive integer, or if it is greater than 1 for a compression not decoded by PIL.
+
+    Returns:
+        List[np.ndarray]: Decompressed arrays, in the same order as `buffers`.
+    """
+    if not isinstance(scale, int) or scale < 1:
+        raise ValueError(f"`scale` should be a positive integer. Got: {scale}")
+    if shapes is None:
+        shapes = [None] * len(buffers)
+    if not _is_pil_decodable(compression):
+        if scale > 1:
+            raise ValueError(
+                f"Reduced size decoding is not supported for {compression}."
+            )
+        return [
+            decompress_array(buffer, shape, dtype, compression)  # type: ignore
+            for buffer, shape in zip(buffers, shapes)
+        ]
+
+    def decode(buffers, shapes):
+        return [
+            _decompress_image(buffer, shape, dtype, scale)
+            for buffer, shape in zip(buffers, shapes)
+        ]
+
+    if num_workers <= 1 or len(buffers) < 2 or getattr(_decode_thread, "active", False):
+        return decode(buffers, shapes)
+    # at most `num_workers` images are decoded concurrently, each worker decodes a contiguous batch of them
+    batch_size = -(-len(buffers) // num_workers)
+    pool = _get_decode_pool()
+    futures = [
+        pool.submit(decode, buffers[i : i + batch_size], shapes[i : i + batch_size])
+        for i in range(0, len(buffers), batch_size)
+    ]
+    return [image for future in futures for image in future.result()]
+
+
 def _get_bounding_shape(shapes: Sequence[Tuple[int, ...]]) -> Tuple[int, int, int]:
     """Gets the shape of a bounding box that can contain the given the shapes tiled horizontally."""
     if len(shapes) == 0:
@@ -374,7 +606,9 @@ def _get_bounding_shape(shapes: Sequence[Tuple[int, ...]]) -> Tuple[int, int, in
 
 
 def compress_multiple(
-    arrays: Sequence[np.ndarray], compression: Optional[str]
+    arrays: Sequence[np.ndarray],
+    compression: Optional[str],
+    compression_args: Optional[dict] = None,
 ) -> bytes:
     """Compress multiple arrays of different shapes into a single buffer. Used for chunk wise compression.
     The arrays are tiled horizontally and padded with zeros to fit in a bounding box, which is then compressed.
@@ -396,7 +630,10 @@ def compress_multiple(
     compr_type = get_compression_type(compression)
     if compr_type == BYTE_COMPRESSION:
         return compress_bytes(
-            b"".join(arr.tobytes() for arr in arrays), compression
+            b"".join(arr.tobytes() for arr in arrays),
+            compression,
+            compression_args,
+            dtype.itemsize if dtype is not None else 1,
         )  # Note: shape and dtype info not included
     elif compr_type == AUDIO_COMPRESSION:
         raise NotImplementedError("compress_multiple does not support audio samples.")
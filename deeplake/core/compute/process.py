@@ -12,7 +12,11 @@ class ProcessProvider(ComputeProvider):
         self._closed = False
 
     def map(self, func, iterable):
-        return self.pool.map(func, iterable)
+        # one item at a time, so that idle workers pick up the remaining items
+        return self.pool.map(func, iterable, chunksize=1)
+
+    def imap(self, func, iterable):
+        return self.pool.imap(func, iterable, chunksize=1)
 
     def create_queue(self):
         return self.manager.Queue()
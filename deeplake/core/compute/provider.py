@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import Optional
 import threading
 import warnings
@@ -38,15 +39,16 @@ class ComputeProvider(ABC):
     def __init__(self, workers):
         self.workers = workers
 
-    def map_with_progress_bar(
+    @contextmanager
+    def _with_progress_bar(
         self,
         func,
-        iterable,
         total_length: int,
         desc: Optional[str] = None,
         pbar=None,
         pqueue=None,
     ):
+        """Wraps `func` to report its progress to a progress bar for the duration of the context."""
         progress_bar = pbar or get_progress_bar(total_length, desc)
         progress_queue = pqueue or self.create_queue()
 
@@ -59,7 +61,7 @@ class ComputeProvider(ABC):
         progress_thread = get_progress_thread(progress_bar, progress_queue)
 
         try:
-            result = self.map(sub_func, iterable)
+            yield sub_func
         finally:
             progress_queue.put(None)  # type: ignore[trust]
             if pqueue is None and hasattr(progress_queue, "close"):
@@ -68,7 +70,30 @@ class ComputeProvider(ABC):
             if pbar is None:
                 progress_bar.close()
 
-        return result
+    def map_with_progress_bar(
+        self,
+        func,
+        iterable,
+        total_length: int,
+        desc: Optional[str] = None,
+        pbar=None,
+        pqueue=None,
+    ):
+        with self._with_progress_bar(func, total_length, desc, pbar, pqueue) as f:
+            return self.map(f, iterable)
+
+    def imap_with_progress_bar(
+        self,
+        func,
+        iterable,
+        total_length: int,
+        desc: Optional[str] = None,
+        pbar=None,
+        pqueue=None,
+    ):
+        """Same as `map_with_progress_bar`, but yields the results in order as they become available."""
+        with self._with_progress_bar(func, total_length, desc, pbar, pqueue) as f:
+            yield from self.imap(f, iterable)
 
     @abstractmethod
     def create_queue(self):
@@ -80,6 +105,12 @@ class ComputeProvider(ABC):
         in a list that is returned.
         """
 
+    def imap(self, func, iterable):
+        """Applies 'func' to each element in 'iterable', yielding the results
+        in order as they become available.
+        """
+        yield from self.map(func, iterable)
+
     @abstractmethod
     def close(self):
         """Closes the provider."""
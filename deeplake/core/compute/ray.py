@@ -14,7 +14,11 @@ class RayProvider(ComputeProvider):
         self.pool = Pool(processes=workers)
 
     def map(self, func, iterable):
-        return self.pool.map(func, iterable)
+        # one item at a time, so that idle workers pick up the remaining items
+        return self.pool.map(func, iterable, chunksize=1)
+
+    def imap(self, func, iterable):
+        return self.pool.imap(func, iterable, chunksize=1)
 
     def close(self):
         self.pool.close()
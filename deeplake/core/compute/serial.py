@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from deeplake.core.compute.provider import ComputeProvider, get_progress_bar
 
 
@@ -8,10 +9,13 @@ class SerialProvider(ComputeProvider):
     def map(self, func, iterable):
         return list(map(func, iterable))
 
-    def map_with_progress_bar(
+    def imap(self, func, iterable):
+        return map(func, iterable)
+
+    @contextmanager
+    def _with_progress_bar(
         self,
         func,
-        iterable,
         total_length: int,
         desc=None,
         pbar=None,
@@ -25,9 +29,7 @@ class SerialProvider(ComputeProvider):
 
             return func(pg_callback, *args, **kwargs)
 
-        result = self.map(sub_func, iterable)
-
-        return result
+        yield sub_func
 
     def create_queue(self):
         return None
@@ -46,6 +46,7 @@ from deeplake.core.fast_forwarding import ffw_dataset_meta
 from deeplake.core.index import Index
 from deeplake.core.lock import lock_dataset, unlock_dataset, Lock
 from deeplake.core.meta.dataset_meta import DatasetMeta
+from deeplake.core.meta.encode.base_encoder import LAST_SEEN_INDEX_COLUMN
 from deeplake.core.storage import (
     LRUCache,
     S3Provider,
@@ -126,6 +127,7 @@ from deeplake.util.version_control import (
     warn_node_checkout,
     load_version_info,
     save_version_info,
+    register_committed_nodes,
     replace_head,
     reset_and_checkout,
 )
@@ -1345,6 +1347,7 @@ class Dataset:
             version_state["commit_node"] = commit_node
             version_state["branch_commit_map"][branch] = commit_id
             version_state["commit_node_map"][commit_id] = commit_node
+        register_committed_nodes(self.storage, version_state)
         # keeps track of the full unindexed tensors
         version_state["full_tensors"] = {}
         version_state["tensor_names"] = {}
@@ -1862,6 +1865,8 @@ class Dataset:
         pad_tensors: bool = False,
         transform_kwargs: Optional[Dict[str, Any]] = None,
         decode_method: Optional[Dict[str, str]] = None,
+        decode_threads: int = 0,
+        native_batching: bool = False,
         *args,
         **kwargs,
     ):
@@ -1896,6 +1901,11 @@ class Dataset:
                     :'tobytes': Returns raw bytes of the samples.
                     :'pil': Returns samples as PIL images. Especially useful when transformation use torchvision transforms, that
                             require PIL images as input. Only supported for tensors with ``sample_compression='jpeg'`` or ``'png'``.
+            decode_threads (int): Number of threads used by each worker to decompress samples, while the chunks of the next samples are fetched.
+                Useful when decoding compressed images is the bottleneck. Samples are returned in the same order. Defaults to 0, which decodes samples in the worker itself.
+            native_batching (bool): If ``True``, the workers assemble whole batches, slicing the samples of fixed shape tensors out of the chunks at once
+                instead of building and collating them one by one. Tensors with dynamic shapes are still read sample by sample. Can't be used with ``transform`` or ``collate_fn``,
+                and ``shuffle`` only shuffles the order in which chunks and samples are read, ``buffer_size`` is ignored. Defaults to ``False``.
 
         Returns:
             A torch.utils.data.DataLoader object.
@@ -1924,6 +1934,8 @@ class Dataset:
                 "return_index": return_index,
                 "pad_tensors": pad_tensors,
                 "decode_method": decode_method,
+                "decode_threads": decode_threads,
+                "native_batching": native_batching,
             },
         )
 
@@ -1946,6 +1958,8 @@ class Dataset:
             return_index=return_index,
             pad_tensors=pad_tensors,
             decode_method=decode_method,
+            decode_threads=decode_threads,
+            native_batching=native_batching,
             **kwargs,
         )
 
@@ -2688,17 +2702,25 @@ class Dataset:
         num_workers: int = 0,
         scheduler: str = "threaded",
         progressbar: bool = True,
-    ):
+        full: bool = False,
+    ) -> Optional[Dict[str, int]]:
         """Rewrites the underlying chunks to make their sizes optimal.
         This is usually needed in cases where a lot of updates have been made to the data.
 
+        By default, only the chunks that are too small or too large are rewritten: runs of such chunks are merged or split, the
+        other chunks are left untouched.
+
         Args:
             tensors (str, List[str], Optional): Name/names of the tensors to rechunk.
                 If None, all tensors in the dataset are rechunked.
             num_workers (int): The number of workers to use for rechunking. Defaults to 0. When set to 0, it will always use serial processing, irrespective of the scheduler.
-            scheduler (str): The scheduler to be used for rechunking. Supported values include: 'serial', 'threaded', 'processed' and 'ray'.
-                Defaults to 'threaded'.
-            progressbar (bool): Displays a progress bar If ``True`` (default).
+            scheduler (str): The scheduler to be used for rechunking when ``full`` is ``True``. Supported values include: 'serial', 'threaded', 'processed' and 'ray'.
+                Defaults to 'threaded'. Otherwise, chunks are always rewritten by ``num_workers`` threads.
+            progressbar (bool): Displays a progress bar If ``True`` (default). Only used when ``full`` is ``True``.
+            full (bool): If ``True``, all the samples of the tensors are rewritten to new chunks. Defaults to ``False``.
+
+        Returns:
+            Optional[Dict[str, int]]: If ``full`` is ``False``, the number of bytes of the chunks that were rewritten, for each tensor.
         """
 
         if tensors is None:
@@ -2706,6 +2728,18 @@ class Dataset:
         elif isinstance(tensors, str):
             tensors = [tensors]
 
+        if not full:
+            bytes_moved = {}
+            with self:
+                for tensor_name in tensors:
+                    tensor = self[tensor_name]
+                    tensor._write_initialization()
+                    bytes_moved[tensor_name] = tensor.chunk_engine.rechunk(
+                        num_workers=num_workers
+                    )
+                    tensor.invalidate_libdeeplake_dataset()
+            return bytes_moved
+
         # identity function that rechunks
         @deeplake.compute
         def rechunking(sample_in, samples_out):
@@ -2722,6 +2756,7 @@ class Dataset:
             disable_label_sync=True,
             disable_rechunk=True,
         )
+        return None
 
     # the below methods are used by cloudpickle dumps
     def __origin__(self):
@@ -2748,9 +2783,13 @@ class Dataset:
     def __bool__(self):
         return True
 
+    @invalid_view_op
     def extend(self, samples: Dict[str, Any], skip_ok: bool = False):
         """Appends multiple rows of samples to mutliple tensors at once. This method expects all tensors being updated to be of the same length.
 
+        Each tensor is extended with its whole column at once. If any tensor fails to be extended, the samples added to all the tensors
+        (including their linked tensors) are removed, so that either all the rows or none of them are appended.
+
         Args:
             samples (Dict[str, Any]): Dictionary with tensor names as keys and samples as values.
             skip_ok (bool): Skip tensors not in ``samples`` if set to True.
@@ -2759,7 +2798,6 @@ class Dataset:
             KeyError: If any tensor in the dataset is not a key in ``samples`` and ``skip_ok`` is ``False``.
             TensorDoesNotExistError: If tensor in ``samples`` does not exist.
             ValueError: If all tensors being updated are not of the same length.
-            NotImplementedError: If an error occurs while writing tiles.
             Exception: Error while attempting to rollback appends.
         """
         if isinstance(samples, Dataset):
@@ -2773,10 +2811,64 @@ class Dataset:
                 raise ValueError(
                     f"Incoming samples are not of equal lengths. Incoming sample sizes: {sizes}"
                 )
+        tensors = self.tensors
+        skipped_tensors = [k for k in tensors if k not in samples]
+        if skipped_tensors and not skip_ok:
+            raise KeyError(
+                f"Required tensors not provided: {skipped_tensors}. Pass `skip_ok=True` to skip tensors."
+            )
+        for k in samples:
+            if k not in tensors:
+                raise TensorDoesNotExistError(k)
+        if len(set(map(len, (tensors[k] for k in samples)))) != 1:
+            raise ValueError(
+                "When appending using Dataset.extend, all tensors being updated are expected to have the same length."
+            )
+        if n == 0:
+            return
         [f() for f in list(self._update_hooks.values())]
+        # linked tensors are hidden, their lengths are recorded as well to roll them back
+        all_tensors = self._tensors(include_hidden=True)
+        initial_state = {
+            k: (t.num_samples, t.chunk_engine.chunk_id_encoder.num_chunks)
+            for k, t in all_tensors.items()
+        }
         with self:
-            for i in range(n):
-                self.append({k: v[i] for k, v in samples.items()}, skip_ok=skip_ok)
+            try:
+                for k in tensors:
+                    if k in samples:
+                        tensors[k].extend(samples[k])
+            except Exception as e:
+                try:
+                    self._rollback_extend(all_tensors, initial_state)
+                except Exception as e2:
+                    raise Exception(
+                        "Error while attempting to rollback appends"
+                    ) from e2
+                raise e
+
+    def _rollback_extend(
+        self, tensors: Dict[str, Tensor], initial_state: Dict[str, Tuple[int, int]]
+    ):
+        """Pops the samples added to ``tensors`` since ``initial_state`` was recorded."""
+        for k, tensor in tensors.items():
+            # links are rolled back along with their tensors
+            if not tensor.meta.hidden:
+                tensor._rollback(initial_state[k][0])
+        for k, tensor in tensors.items():
+            num_samples, num_chunks = initial_state[k]
+            chunk_engine = tensor.chunk_engine
+            for _ in range(tensor.num_samples - num_samples):
+                chunk_engine.pop()
+            enc = chunk_engine.chunk_id_encoder
+            while enc.num_chunks > num_chunks and (
+                enc.num_chunks == 1
+                or enc._encoded[-1, LAST_SEEN_INDEX_COLUMN]
+                == enc._encoded[-2, LAST_SEEN_INDEX_COLUMN]
+            ):
+                # a chunk was registered, but no sample could be written to it
+                enc._encoded = enc._encoded[:-1]
+            tensor.invalidate_libdeeplake_dataset()
 
     @invalid_view_op
     def append(
@@ -3466,6 +3558,8 @@ class Dataset:
                 sub_storage,
                 memory_cache_size * MB,
                 local_cache_size * MB,
+                num_shards=getattr(self.storage, "num_shards", 0),
+                use_mmap=getattr(sub_storage, "use_mmap", False),
             ),
             path=path,
             token=token,
@@ -3752,6 +3846,7 @@ class Dataset:
         version_info = rebuild_version_info(self.storage)
         self.version_state["commit_node_map"] = version_info["commit_node_map"]
         self.version_state["branch_commit_map"] = version_info["branch_commit_map"]
+        register_committed_nodes(self.storage, self.version_state)
 
     def connect(
         self,
@@ -1,17 +1,32 @@
 from abc import abstractmethod, ABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from random import shuffle
 from typing import Dict, Iterator, List, Optional, Sequence, Union
-from itertools import cycle
+from itertools import cycle, islice
 from copy import copy
 from warnings import warn
+import queue
+import threading
+import bisect
 from numpy import nditer, argmin
 from numpy import array as nparray
 from math import floor
 import numpy as np
 
-from deeplake.constants import MB
+from deeplake.compression import IMAGE_COMPRESSION, get_compression_type
+from deeplake.constants import (
+    DEFAULT_CACHE_NUM_SHARDS,
+    IMAGE_DECODE_BATCH_SIZE,
+    LINK_PREFETCH_SIZE,
+    PREFETCH_CONCURRENCY,
+    STREAMING_CACHE_SIZE,
+)
 from deeplake.core.chunk.base_chunk import BaseChunk
+from deeplake.core.chunk.chunk_compressed_chunk import ChunkCompressedChunk
+from deeplake.core.chunk.sample_compressed_chunk import SampleCompressedChunk
+from deeplake.core.chunk.uncompressed_chunk import UncompressedChunk
 from deeplake.core.chunk_engine import ChunkEngine
+from deeplake.core.compression import mark_decode_thread
 from deeplake.core.linked_chunk_engine import LinkedChunkEngine
 from deeplake.core.meta.encode.base_encoder import LAST_SEEN_INDEX_COLUMN
 from deeplake.core.meta.encode.chunk_id import CHUNK_ID_COLUMN, ChunkIdEncoder
@@ -19,6 +34,7 @@ from deeplake.core.meta.tensor_meta import TensorMeta
 from deeplake.core.storage import (
     LRUCache,
     MemoryProvider,
+    ShardedLRUCache,
     StorageProvider,
     LocalProvider,
 )
@@ -41,6 +57,83 @@ ChunkEngineMap = Dict[str, ChunkEngine]
 CachesMap = Dict[str, LRUCache]
 
 
+def _is_columnar(engine: ChunkEngine) -> bool:
+    """Whether the samples of the tensor all have the same shape and can be sliced out of its decompressed chunks."""
+    meta = engine.tensor_meta
+    return (
+        not isinstance(engine, LinkedChunkEngine)
+        and engine.chunk_class in (UncompressedChunk, ChunkCompressedChunk)
+        and meta.htype not in ("text", "json", "list", "polygon")
+        and meta.max_shape is not None
+        and meta.min_shape == meta.max_shape
+    )
+
+
+def _is_image_batch_decodable(engine: ChunkEngine) -> bool:
+    """Whether the samples of the tensor are compressed images that can be decoded together with `decompress_images`."""
+    meta = engine.tensor_meta
+    return (
+        not isinstance(engine, LinkedChunkEngine)
+        and engine.chunk_class == SampleCompressedChunk
+        and get_compression_type(meta.sample_compression) == IMAGE_COMPRESSION
+        and not meta.is_sequence
+    )
+
+
+def _read_fixed_shape_column(
+    engine: ChunkEngine, chunk: BaseChunk, indices: np.ndarray
+) -> Optional[np.ndarray]:
+    """Reads the samples at `indices` of a fixed shape tensor from `chunk` as one array, without copying them if they are
+    contiguous. Returns None if the chunk can't be read this way."""
+    if isinstance(chunk, UncompressedChunk):
+        buffer = chunk.memoryview_data
+    elif isinstance(chunk, ChunkCompressedChunk) and chunk.is_byte_compression:
+        buffer = chunk.decompressed_bytes
+    else:
+        return None
+    meta = engine.tensor_meta
+    shape = tuple(meta.max_shape)
+    dtype = np.dtype(meta.dtype)
+    num_samples = chunk.num_samples
+    if len(buffer) != num_samples * int(np.prod(shape)) * dtype.itemsize:
+        return None
+    data = np.frombuffer(buffer, dtype=dtype).reshape((num_samples,) + shape)
+    local_indices = engine.chunk_id_encoder.translate_indices_relative_to_chunks(
+        indices
+    )[2]
+    start = local_indices[0]
+    if np.array_equal(local_indices, np.arange(start, start + len(local_indices))):
+        return data[start : start + len(local_indices)]
+    return data[local_indices]
+
+
+def _pop_rows(
+    parts: List[Dict[str, Union[np.ndarray, list]]], num_rows: int
+) -> Dict[str, Union[np.ndarray, list]]:
+    """Removes the first `num_rows` rows from `parts`, a list of column dicts, and returns them as one column dict."""
+    taken = []
+    while num_rows:
+        part = parts[0]
+        part_rows = len(part["index"])
+        if part_rows <= num_rows:
+            taken.append(parts.pop(0))
+            num_rows -= part_rows
+        else:
+            taken.append({key: column[:num_rows] for key, column in part.items()})
+            parts[0] = {key: column[num_rows:] for key, column in part.items()}
+            num_rows = 0
+    if len(taken) == 1:
+        return taken[0]
+    batch: Dict[str, Union[np.ndarray, list]] = {}
+    for key in taken[0]:
+        columns = [part[key] for part in taken]
+        if all(isinstance(column, np.ndarray) for column in columns):
+            batch[key] = np.concatenate(columns)
+        else:
+            batch[key] = [data for column in columns for data in column]
+    return batch
+
+
 class IOBlock:
     """
     Represents ordered sequential read of samples from corresponding tensor chunks.
@@ -274,6 +367,7 @@ class SampleStreaming(Streaming):
         decode_method: Optional[Dict[str, str]] = None,
         tobytes: Union[bool, Sequence[str]] = False,
         verbose: bool = True,
+        decode_threads: int = 0,
     ) -> None:
         super().__init__()
 
@@ -292,6 +386,7 @@ class SampleStreaming(Streaming):
         self.tensors = tensors
         self.pad_tensors = pad_tensors
         self.decode_method = decode_method
+        self.decode_threads = decode_threads
         jpeg_png_compressed_tensors, json_tensors, list_tensors = check_tensors(
             self.dataset, tensors, verbose
         )
@@ -322,6 +417,26 @@ class SampleStreaming(Streaming):
         self.data_tensors = set(data_tensors)
 
         self.chunk_engines: ChunkEngineMap = self._map_chunk_engines(self.tensors)
+        # tensors whose samples can be read as one array per chunk in read_batches
+        self._columnar_tensors = {
+            key
+            for key, engine in self.chunk_engines.items()
+            if _is_columnar(engine)
+            and key not in self.raw_tensors
+            and key not in self.pil_compressed_tensors
+        }
+        # tensors whose images are decoded together for all the samples of a chunk
+        self._image_tensors = {
+            key
+            for key, engine in self.chunk_engines.items()
+            if _is_image_batch_decodable(engine)
+            and key not in self.raw_tensors
+            and key not in self.pil_compressed_tensors
+        }
+        self._has_links = any(
+            isinstance(engine, LinkedChunkEngine)
+            for engine in self.chunk_engines.values()
+        )
 
         self.local_caches: Optional[CachesMap] = (
             ({tensor: self._use_cache(self.local_storage) for tensor in self.tensors})
@@ -334,95 +449,342 @@ class SampleStreaming(Streaming):
         self._group_index_length = group_index_length
 
     def read(self, schedule: Schedule) -> Iterator:
-        for block in schedule._blocks:
-            yield from self.stream(block)
-
-    def stream(self, block: IOBlock):
-        htype_dict, ndim_dict, tensor_info_dict = (
-            self.htype_dict,
-            self.ndim_dict,
-            self.tensor_info_dict,
-        )
-        for idx in block.indices():
-            sample = dict()
-            valid_sample_flag = True
-
-            for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
-                rel_key = key[self._group_index_length :]
-                decompress = key not in self.raw_tensors
-                to_pil = key in self.pil_compressed_tensors
-                chunk_class = engine.chunk_class
+        if self.decode_threads > 0:
+            yield from self._read_with_decode_pool(schedule)
+            return
+        for block, chunks in self._fetch(schedule):
+            yield from self._read_block(block, chunks)
+
+    def _fetch(self, schedule: Schedule):
+        """Yields the blocks of `schedule` along with their chunks, prefetching the chunks of upcoming blocks."""
+        blocks = schedule._blocks
+        prefetched = 0
+        for i, block in enumerate(blocks):
+            if i == prefetched:
+                prefetched = i + self._prefetch(blocks[i : i + PREFETCH_CONCURRENCY])
+            yield block, self._get_block_chunks(block)
+
+    def _read_with_decode_pool(self, schedule: Schedule):
+        """Reads `schedule` in a pipeline. A background thread fetches the chunks and submits the samples to a pool of
+        `decode_threads` threads, which decompress them and convert them to data. Samples are yielded in the same order
+        as `read` without a pool, and at most `2 * decode_threads` of them are in flight at any time.
+        """
+        pending: queue.Queue = queue.Queue(maxsize=2 * self.decode_threads)
+        stop = threading.Event()
+        # the images of a sample are decoded on its decode thread, without another pool
+        pool = ThreadPoolExecutor(self.decode_threads, initializer=mark_decode_thread)
+
+        def put(item) -> bool:
+            # blocks while the queue is full, unless the reader stopped
+            while not stop.is_set():
                 try:
-                    chunks: List[BaseChunk] = []
-                    c_names = block.chunk_names(keyid)
-                    if c_names == [None]:
-                        sample[rel_key] = engine.get_empty_sample()
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch():
+            try:
+                for block, chunks in self._fetch(schedule):
+                    for idx in block.indices():
+                        if not put(pool.submit(self._read_sample, idx, chunks)):
+                            return
+            except BaseException as e:
+                failed: Future = Future()
+                failed.set_exception(e)
+                put(failed)
+            put(None)
+
+        fetcher = threading.Thread(target=fetch, daemon=True)
+        fetcher.start()
+        try:
+            while True:
+                future = pending.get()
+                if future is None:
+                    break
+                sample = future.result()
+                if sample is not None:
+                    yield sample
+        finally:
+            stop.set()
+            fetcher.join()
+            while not pending.empty():
+                future = pending.get()
+                if future is not None:
+                    future.cancel()
+            pool.shutdown()
+
+    def _prefetch(self, blocks: List[IOBlock]) -> int:
+        """Fetches the chunks of the upcoming `blocks` concurrently into the chunk engine caches, as far as they fit in the
+        caches. Chunks are admitted by the maximum chunk size of their tensors.
+
+        Returns:
+            int: The number of leading `blocks` whose chunks were all admitted, at least 1.
+        """
+        num_blocks = len(blocks)
+        for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
+            local_cache = self.local_caches[key] if self.local_caches else None
+            keys: Dict[str, None] = {}
+            # number of keys up to the end of each block
+            ends = []
+            for block in blocks:
+                for c_name in block.chunk_names(keyid):
+                    if c_name is None:
                         continue
-                    for c_name in c_names:
-                        commit_id, tkey = engine.get_chunk_commit(c_name)
-                        c_key = get_chunk_key(
-                            tkey,
-                            c_name,  # type: ignore
-                            commit_id,
-                        )
-                        if self.local_caches is not None:
-                            local_cache = self.local_caches[key]
-
-                            if c_key in local_cache:
-                                chunk = local_cache.get_deeplake_object(c_key, chunk_class, meta=engine.chunk_args)  # type: ignore
-                            else:
-                                chunk = engine.get_chunk(c_key)
-                                local_cache[c_key] = chunk
-
-                                # send data to actual storage
-                                local_cache._forward(c_key)
-                        else:
-                            chunk = engine.get_chunk(c_key)
-                        chunks.append(chunk)
-                    if len(chunks) == 1:
-                        data = engine.read_sample_from_chunk(
-                            idx, chunk, decompress=decompress, to_pil=to_pil
+                    commit_id, tkey = engine.get_chunk_commit(c_name)
+                    c_key = get_chunk_key(tkey, c_name, commit_id)
+                    # chunks in the local cache are not read from the storage
+                    if local_cache is None or c_key not in local_cache:
+                        keys[c_key] = None
+                ends.append(len(keys))
+            admitted = engine.cache.prefetch(
+                list(keys), [engine.max_chunk_size] * len(keys)
+            )
+            num_blocks = min(num_blocks, bisect.bisect_right(ends, admitted))
+        return max(num_blocks, 1)
+
+    def _prefetch_links(
+        self,
+        engine: ChunkEngine,
+        chunks: Optional[List[BaseChunk]],
+        indices: Sequence[int],
+    ):
+        """Fetches the linked samples at `indices` of a linked tensor concurrently, ahead of their reads."""
+        if isinstance(engine, LinkedChunkEngine) and chunks and len(chunks) == 1:
+            engine.prefetch_links(indices, chunks[0])
+
+    def stream(self, block: IOBlock):
+        yield from self._read_block(block, self._get_block_chunks(block))
+
+    def _read_block(self, block: IOBlock, chunks: List[Optional[List[BaseChunk]]]):
+        indices = block.indices()
+        for i in range(0, len(indices), IMAGE_DECODE_BATCH_SIZE):
+            batch = indices[i : i + IMAGE_DECODE_BATCH_SIZE]
+            decoded = self._decode_images(batch, chunks)
+            for j, idx in enumerate(batch):
+                if self._has_links and j % LINK_PREFETCH_SIZE == 0:
+                    for engine, tensor_chunks in zip(
+                        self.chunk_engines.values(), chunks
+                    ):
+                        self._prefetch_links(
+                            engine, tensor_chunks, batch[j : j + LINK_PREFETCH_SIZE]
                         )
+                sample = self._read_sample(idx, chunks, decoded)
+                if sample is not None:
+                    yield sample
+
+    def _decode_images(
+        self, indices: Sequence[int], block_chunks: List[Optional[List[BaseChunk]]]
+    ) -> Dict[str, Dict[int, np.ndarray]]:
+        """Decodes the images at `indices` of the image tensors together, for the tensors where they are all in one chunk.
+
+        Returns:
+            Dict[str, Dict[int, np.ndarray]]: The decoded images of each tensor, by index. Tensors whose images can't be
+                decoded together, for example because one of them is corrupt, are left out and read sample by sample.
+        """
+        decoded: Dict[str, Dict[int, np.ndarray]] = {}
+        for (key, engine), chunks in zip(self.chunk_engines.items(), block_chunks):
+            images = self._decode_tensor_images(key, engine, chunks, indices)
+            if images is not None:
+                decoded[key] = dict(zip(indices, images))
+        return decoded
+
+    def _decode_tensor_images(
+        self,
+        key: str,
+        engine: ChunkEngine,
+        chunks: Optional[List[BaseChunk]],
+        indices: Sequence[int],
+    ) -> Optional[List[np.ndarray]]:
+        """Decodes the images at `indices` of a tensor together. Returns None if they can't be decoded together."""
+        if (
+            len(indices) < 2
+            or key not in self._image_tensors
+            or not chunks
+            or len(chunks) != 1
+        ):
+            return None
+        try:
+            return engine.read_samples_from_chunk(indices, chunks[0])
+        except ReadSampleFromChunkError:
+            return None
+
+    def _get_block_chunks(self, block: IOBlock) -> List[Optional[List[BaseChunk]]]:
+        """Returns the chunks of `block` for each tensor, None for tensors that have no chunks in the block."""
+        block_chunks: List[Optional[List[BaseChunk]]] = []
+        for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
+            chunk_class = engine.chunk_class
+            c_names = block.chunk_names(keyid)
+            if c_names == [None]:
+                block_chunks.append(None)
+                continue
+            chunks: List[BaseChunk] = []
+            for c_name in c_names:
+                commit_id, tkey = engine.get_chunk_commit(c_name)
+                c_key = get_chunk_key(
+                    tkey,
+                    c_name,  # type: ignore
+                    commit_id,
+                )
+                if self.local_caches is not None:
+                    local_cache = self.local_caches[key]
+
+                    if c_key in local_cache:
+                        chunk = local_cache.get_deeplake_object(c_key, chunk_class, meta=engine.chunk_args)  # type: ignore
                     else:
-                        if not decompress:
-                            raise NotImplementedError(
-                                "`tobytes=True` is not supported by tiled samples as it can cause recompression."
-                            )
-                        data = combine_chunks(chunks, idx, engine.tile_encoder)
-                        if to_pil:
-                            data = Image.fromarray(data)  # type: ignore
-
-                    if data is not None:
-                        sample[rel_key] = data
-                    else:
-                        valid_sample_flag = False
-                        break
-                except ReadSampleFromChunkError:
-                    warn(
-                        f"Skipping corrupt {engine.tensor_meta.sample_compression} sample at dataset.{key}[{idx}]"
-                    )
-                    valid_sample_flag = False
-                    break
+                        chunk = engine.get_chunk(c_key)
+                        local_cache[c_key] = chunk
+
+                        # send data to actual storage
+                        local_cache._forward(c_key)
+                else:
+                    chunk = engine.get_chunk(c_key)
+                chunks.append(chunk)
+            block_chunks.append(chunks)
+        return block_chunks
+
+    def _read_sample(
+        self,
+        idx: int,
+        block_chunks: List[Optional[List[BaseChunk]]],
+        decoded: Optional[Dict[str, Dict[int, np.ndarray]]] = None,
+    ) -> Optional[dict]:
+        """Reads the sample at `idx` from the chunks of its block. Returns None if the sample should be skipped.
 
-            if valid_sample_flag:
-                sample["index"] = np.array([idx])
-                if self.data_tensors:
-                    convert_sample_to_data(
-                        sample, htype_dict, ndim_dict, tensor_info_dict
-                    )
-                yield sample
+        Images already decoded by `_decode_images` are taken from `decoded`.
+        """
+        sample = dict()
+        for (key, engine), chunks in zip(self.chunk_engines.items(), block_chunks):
+            if decoded and key in decoded:
+                data = decoded[key][idx]
+            else:
+                data = self._read_tensor_sample(key, engine, chunks, idx)
+            if data is None:
+                return None
+            sample[key[self._group_index_length :]] = data
+
+        sample["index"] = np.array([idx])
+        if self.data_tensors:
+            convert_sample_to_data(
+                sample, self.htype_dict, self.ndim_dict, self.tensor_info_dict
+            )
+        return sample
 
-    def _get_block_for_single_sample(self, idx):
-        chunks = []
-        for engine in self.chunk_engines.values():
-            enc = engine.chunk_id_encoder
-            try:
-                cids = enc[idx]
-                cnames = list(map(enc.name_from_id, cids))
-                chunks.append(cnames)
-            except Exception:
-                chunks.append([None])
-        return IOBlock(chunks, [idx])
+    def _read_tensor_sample(
+        self,
+        key: str,
+        engine: ChunkEngine,
+        chunks: Optional[List[BaseChunk]],
+        idx: int,
+    ):
+        """Reads the sample at `idx` of a tensor from its chunks. Returns None if the sample should be skipped."""
+        if chunks is None:
+            return engine.get_empty_sample()
+        decompress = key not in self.raw_tensors
+        to_pil = key in self.pil_compressed_tensors
+        try:
+            if len(chunks) == 1:
+                return engine.read_sample_from_chunk(
+                    idx, chunks[0], decompress=decompress, to_pil=to_pil
+                )
+            if not decompress:
+                raise NotImplementedError(
+                    "`tobytes=True` is not supported by tiled samples as it can cause recompression."
+                )
+            data = combine_chunks(chunks, idx, engine.tile_encoder)
+            if to_pil:
+                data = Image.fromarray(data)  # type: ignore
+            return data
+        except ReadSampleFromChunkError:
+            warn(
+                f"Skipping corrupt {engine.tensor_meta.sample_compression} sample at dataset.{key}[{idx}]"
+            )
+            return None
+
+    def read_batches(
+        self, schedule: Schedule, batch_size: int, drop_last: bool = False
+    ) -> Iterator[Dict[str, Union[np.ndarray, list]]]:
+        """Reads `schedule` in batches, without building a dict per sample.
+
+        Each batch maps the tensors to the stacked samples of the batch, and "index" to an array of shape `(batch_size, 1)`.
+        Samples of fixed shape tensors are sliced out of the decompressed chunks as one array, which is a view over the
+        chunk if the samples are contiguous within it. Other tensors, like tensors with dynamic shapes, are read sample by
+        sample into a list.
+
+        Args:
+            schedule (Schedule): Schedule of IOBlocks to read.
+            batch_size (int): Number of samples per batch.
+            drop_last (bool): If True, the last batch is dropped if it is smaller than `batch_size`.
+
+        Yields:
+            Dict[str, Union[np.ndarray, list]]: The batches.
+        """
+        if self.data_tensors:
+            # samples have to be converted to data one by one
+            samples = self.read(schedule)
+            while True:
+                batch = list(islice(samples, batch_size))
+                if not batch or (drop_last and len(batch) < batch_size):
+                    return
+                yield {
+                    key: (
+                        np.concatenate([sample[key] for sample in batch])[:, None]
+                        if key == "index"
+                        else [sample[key] for sample in batch]
+                    )
+                    for key in batch[0]
+                }
+
+        pending: List[Dict[str, Union[np.ndarray, list]]] = []
+        num_pending = 0
+        for block, chunks in self._fetch(schedule):
+            columns = self._read_block_columns(block, chunks)
+            pending.append(columns)
+            num_pending += len(columns["index"])
+            while num_pending >= batch_size:
+                yield _pop_rows(pending, batch_size)
+                num_pending -= batch_size
+        if num_pending and not drop_last:
+            yield _pop_rows(pending, num_pending)
+
+    def _read_block_columns(
+        self, block: IOBlock, block_chunks: List[Optional[List[BaseChunk]]]
+    ) -> Dict[str, Union[np.ndarray, list]]:
+        """Reads all the samples of `block`, as one column per tensor."""
+        indices = np.asarray(block.indices(), dtype=np.int64)
+        valid = np.ones(len(indices), dtype=bool)
+        columns: Dict[str, Union[np.ndarray, list]] = {}
+        for (key, engine), chunks in zip(self.chunk_engines.items(), block_chunks):
+            column: Union[np.ndarray, list, None] = None
+            if key in self._columnar_tensors and chunks and len(chunks) == 1:
+                column = _read_fixed_shape_column(engine, chunks[0], indices)
+            elif valid.all():
+                column = self._decode_tensor_images(
+                    key, engine, chunks, indices.tolist()
+                )
+            if column is None:
+                column = []
+                for i, idx in enumerate(indices.tolist()):
+                    if i % LINK_PREFETCH_SIZE == 0:
+                        self._prefetch_links(
+                            engine, chunks, indices[i : i + LINK_PREFETCH_SIZE].tolist()
+                        )
+                    data = None
+                    if valid[i]:
+                        data = self._read_tensor_sample(key, engine, chunks, idx)
+                        valid[i] = data is not None
+                    column.append(data)
+            columns[key[self._group_index_length :]] = column
+        columns["index"] = indices[:, None]
+        if not valid.all():
+            columns = {
+                key: column[valid]
+                if isinstance(column, np.ndarray)
+                else [data for data, ok in zip(column, valid) if ok]
+                for key, column in columns.items()
+            }
+        return columns
 
     def _is_continuious(self):
         idx_entry = self.dataset.index.values[0]
@@ -444,8 +806,31 @@ class SampleStreaming(Streaming):
             return self.list_blocks_continuous()
         return self.list_blocks_random()
 
+    def _get_chunk_names_for_samples(
+        self, engine: ChunkEngine, indices: np.ndarray
+    ) -> List[List[Optional[str]]]:
+        """Returns the names of the chunks containing each of `indices`, using a single lookup in the chunk id encoder."""
+        enc = engine.chunk_id_encoder
+        names: List[List[Optional[str]]] = [[None] for _ in range(len(indices))]
+        positions = np.flatnonzero((indices >= 0) & (indices < enc.num_samples))
+        if len(positions) == 0:
+            return names
+        start_rows, stop_rows = enc.get_row_ranges(indices[positions])
+        chunk_ids = enc.array[:, CHUNK_ID_COLUMN]
+        for pos, start, stop in zip(positions, start_rows, stop_rows):
+            names[pos] = [enc.name_from_id(cid) for cid in chunk_ids[start:stop]]
+        return names
+
     def list_blocks_random(self) -> List[IOBlock]:
-        return list(map(self._get_block_for_single_sample, self._get_dataset_indices()))
+        indices = np.fromiter(self._get_dataset_indices(), dtype=np.int64)
+        chunk_names = [
+            self._get_chunk_names_for_samples(engine, indices)
+            for engine in self.chunk_engines.values()
+        ]
+        return [
+            IOBlock([names[i] for names in chunk_names], [int(idx)])
+            for i, idx in enumerate(indices)
+        ]
 
     def _intersection(self, index, low, high):
         if isinstance(index, slice):
@@ -522,7 +907,17 @@ class SampleStreaming(Streaming):
         return blocks
 
     def _use_cache(self, storage: Union[StorageProvider, LRUCache]) -> LRUCache:
-        cache = LRUCache(MemoryProvider(), copy(storage), 32 * MB)
+        # caches are shared with the decode threads, and are sharded like the caches of the dataset
+        num_shards = getattr(self.dataset.storage, "num_shards", 0)
+        if self.decode_threads > 0:
+            num_shards = num_shards or DEFAULT_CACHE_NUM_SHARDS
+        cache: LRUCache
+        if num_shards > 0:
+            cache = ShardedLRUCache(
+                MemoryProvider(), copy(storage), STREAMING_CACHE_SIZE, num_shards
+            )
+        else:
+            cache = LRUCache(MemoryProvider(), copy(storage), STREAMING_CACHE_SIZE)
         cache.read_only = storage.read_only
         return cache
 
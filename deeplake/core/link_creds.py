@@ -26,6 +26,16 @@ class LinkCreds(DeepLakeMemoryObject):
         self.default_gcs_provider = None
         self.client = None
         self.org_id = None
+        self._fetcher = None
+
+    @property
+    def fetcher(self):
+        """The :class:`~deeplake.core.linked_sample.LinkFetcher` that reads the linked samples of the dataset."""
+        if self._fetcher is None:
+            from deeplake.core.linked_sample import LinkFetcher
+
+            self._fetcher = LinkFetcher(self)
+        return self._fetcher
 
     def get_creds(self, key: Optional[str]):
         if key is None:
@@ -216,6 +226,7 @@ class LinkCreds(DeepLakeMemoryObject):
         self.default_gcs_provider = None
         self.client = None
         self.org_id = None
+        self._fetcher = None
 
     def __len__(self):
         return len(self.creds_keys)
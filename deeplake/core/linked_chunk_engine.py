@@ -1,4 +1,5 @@
 import deeplake
+from deeplake.constants import LINK_PREFETCH_SIZE
 from deeplake.core.chunk.base_chunk import BaseChunk
 from deeplake.core.chunk_engine import ChunkEngine
 from deeplake.core.chunk.uncompressed_chunk import UncompressedChunk
@@ -15,7 +16,7 @@ from deeplake.core.tiling.deserialize import (
     np_list_to_sample,
     translate_slices,
 )
-from deeplake.core.linked_sample import read_linked_sample
+from deeplake.core.linked_sample import LinkFetcher, read_linked_sample
 from deeplake.util.exceptions import (
     BadLinkError,
     GetDataFromLinkError,
@@ -25,7 +26,7 @@ from deeplake.util.keys import get_creds_encoder_key
 from deeplake.util.link import get_path_creds_key, save_link_creds
 from deeplake.util.video import normalize_index
 import numpy as np
-from typing import Optional, Dict, Any, Tuple, Union
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union
 from PIL import Image  # type: ignore
 from deeplake.core.linked_tiled_sample import LinkedTiledSample
 from math import ceil
@@ -93,6 +94,75 @@ class LinkedChunkEngine(ChunkEngine):
     def is_data_cachable(self):
         return False
 
+    @property
+    def link_fetcher(self) -> LinkFetcher:
+        return self.link_creds.fetcher
+
+    def prefetch_links(
+        self,
+        global_sample_indices: Sequence[int],
+        chunk: Optional[BaseChunk] = None,
+        fetch_chunks: bool = False,
+    ):
+        """Fetches the linked samples at ``global_sample_indices`` concurrently, so that their next reads are served from memory.
+
+        Args:
+            global_sample_indices (Sequence[int]): Indices of the samples, in the order they will be read.
+            chunk (BaseChunk, Optional): The chunk of all the samples, if it was already fetched. Otherwise their paths are
+                read from the chunks of the tensor.
+            fetch_chunks (bool): Whether full chunks are retrieved to read the paths of the samples.
+        """
+        length = self.tensor_length
+        links = []
+        for global_sample_index in global_sample_indices:
+            if global_sample_index >= length or self._is_tiled_sample(
+                global_sample_index
+            ):
+                continue
+            if chunk is None:
+                sample_path = self.get_path(global_sample_index, fetch_chunks)
+            else:
+                local_sample_index = (
+                    self.chunk_id_encoder.translate_index_relative_to_chunks(
+                        global_sample_index
+                    )
+                )
+                sample_path = chunk.read_sample(local_sample_index)[0]
+            links.append((sample_path, self.creds_key(global_sample_index)))
+        self.link_fetcher.prefetch(links)
+
+    def _read_samples_batched(
+        self,
+        global_sample_indices: List[int],
+        index: Index,
+        fetch_chunks: bool = False,
+        pad_tensor: bool = False,
+    ) -> List[np.ndarray]:
+        """Reads the linked samples at ``global_sample_indices``, prefetching the links of the next ``LINK_PREFETCH_SIZE``
+        samples concurrently before they are read.
+
+        Raises:
+            GetDataFromLinkError: If data cannot be retrieved from a link.
+        """
+        samples = []
+        for start in range(0, len(global_sample_indices), LINK_PREFETCH_SIZE):
+            window = global_sample_indices[start : start + LINK_PREFETCH_SIZE]
+            self.prefetch_links(window, fetch_chunks=fetch_chunks)
+            for global_sample_index in window:
+                try:
+                    sample = self.get_single_sample(
+                        global_sample_index,
+                        index,
+                        fetch_chunks=fetch_chunks,
+                        pad_tensor=pad_tensor,
+                    )
+                except GetDataFromLinkError as e:
+                    raise GetDataFromLinkError(
+                        e.link, global_sample_index, self.name
+                    ) from e
+                samples.append(sample)
+        return samples
+
     def linked_sample(
         self, global_sample_index: int
     ) -> Union[LinkedSample, LinkedTiledSample]:
@@ -169,10 +239,10 @@ class LinkedChunkEngine(ChunkEngine):
         )
 
         sample_creds_key = self.creds_key(global_sample_index)
-        tiled_arrays = [
-            read_linked_sample(path, sample_creds_key, self.link_creds, False).array
-            for path in iter(path_array.flat)
-        ]
+        fetcher = self.link_fetcher
+        links = [(path, sample_creds_key) for path in path_array.flat]
+        fetcher.prefetch(links)
+        tiled_arrays = [fetcher.read(*link).array for link in links]
         return np_list_to_sample(tiled_arrays, shape, tile_shape, layout_shape)
 
     def get_partial_tiled_sample(self, global_sample_index, index, fetch_chunks=False):
@@ -195,11 +265,13 @@ class LinkedChunkEngine(ChunkEngine):
         required_tile_paths = ordered_tile_paths[tiles_index]
 
         sample_creds_key = self.creds_key(global_sample_index)
+        fetcher = self.link_fetcher
+        fetcher.prefetch(
+            [(path, sample_creds_key) for path in np.ravel(required_tile_paths)]
+        )
 
         tiles = np.vectorize(
-            lambda path: read_linked_sample(
-                path, sample_creds_key, self.link_creds, False
-            ).array,
+            lambda path: fetcher.read(path, sample_creds_key).array,
             otypes=[object],
         )(required_tile_paths)
         sample = coalesce_tiles(tiles, tile_shape, None)
@@ -227,7 +299,7 @@ class LinkedChunkEngine(ChunkEngine):
         if not sample_path:
             return None
         sample_creds_key = self.creds_key(global_sample_index)
-        return read_linked_sample(sample_path, sample_creds_key, self.link_creds, False)
+        return self.link_fetcher.read(sample_path, sample_creds_key)
 
     @property
     def verify(self):
@@ -328,9 +400,7 @@ class LinkedChunkEngine(ChunkEngine):
         if not sample_path:
             return self.get_empty_sample()
         sample_creds_key = self.creds_key(global_sample_index)
-        read_sample = read_linked_sample(
-            sample_path, sample_creds_key, self.link_creds, False
-        )
+        read_sample = self.link_fetcher.read(sample_path, sample_creds_key)
         if to_pil:
             return read_sample.pil
         return read_sample.array
@@ -1,7 +1,12 @@
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+from typing import Optional, Sequence, Tuple
+from deeplake.constants import LINK_PREFETCH_SIZE, PREFETCH_CONCURRENCY
 from deeplake.util.exceptions import GetDataFromLinkError
 from deeplake.util.exceptions import MissingCredsError
-from deeplake.util.path import get_path_type
+from deeplake.util.path import get_path_type, is_remote_path
 import deeplake
 import numpy as np
 
@@ -70,3 +75,77 @@ def _read_http_linked_sample(
 ):
     creds = link_creds.get_creds(sample_creds_key)
     return deeplake.read(sample_path, verify=verify, creds=creds)
+
+
+class LinkFetcher:
+    """Reads the linked samples of a dataset.
+
+    The bytes of upcoming linked samples can be fetched concurrently with `prefetch`, the next `read` of each of them is
+    then served from memory. Fetches run in a pool of threads that lives as long as the fetcher, so that the HTTP
+    sessions and storage providers of its threads are reused across batches.
+    """
+
+    def __init__(self, link_creds, max_prefetched: int = LINK_PREFETCH_SIZE):
+        self.link_creds = link_creds
+        self.max_prefetched = max_prefetched
+        self._prefetched: OrderedDict = OrderedDict()  # (path, creds key) -> Sample
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # threads of the pool don't survive a fork, forked processes get a pool of their own
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = ThreadPoolExecutor(PREFETCH_CONCURRENCY)
+            self._pid = os.getpid()
+        return self._executor
+
+    def read(
+        self, sample_path: str, sample_creds_key: Optional[str], verify: bool = False
+    ):
+        """Returns the linked sample at `sample_path`, from memory if it was prefetched.
+
+        Raises:
+            GetDataFromLinkError: If the sample can't be read from the link.
+        """
+        if not verify:
+            with self._lock:
+                sample = self._prefetched.pop((sample_path, sample_creds_key), None)
+            if sample is not None:
+                return sample
+        return read_linked_sample(
+            sample_path, sample_creds_key, self.link_creds, verify
+        )
+
+    def _fetch(self, link: Tuple[str, Optional[str]]):
+        sample = read_linked_sample(link[0], link[1], self.link_creds, False)
+        sample.buffer
+        return sample
+
+    def prefetch(self, links: Sequence[Tuple[str, Optional[str]]]):
+        """Fetches the bytes of up to `max_prefetched` of the remote linked samples concurrently, in order.
+
+        Samples that can't be fetched are skipped, the error is raised by their `read` instead. The oldest prefetched
+        samples are dropped if more than `max_prefetched` samples were prefetched and not read.
+
+        Args:
+            links (Sequence[Tuple[str, Optional[str]]]): The (path, creds key) of the samples.
+        """
+        with self._lock:
+            links = [
+                link
+                for link in dict.fromkeys(links)
+                if link[0] and is_remote_path(link[0]) and link not in self._prefetched
+            ][: self.max_prefetched]
+        if len(links) < 2:
+            # a single sample isn't fetched any faster ahead of its read
+            return
+        futures = [self.executor.submit(self._fetch, link) for link in links]
+        for link, future in zip(links, futures):
+            if future.exception() is not None:
+                continue
+            with self._lock:
+                self._prefetched[link] = future.result()
+                while len(self._prefetched) > self.max_prefetched:
+                    self._prefetched.popitem(last=False)
@@ -148,6 +148,42 @@ class Encoder(ABC):
 
         return row_index  # type: ignore
 
+    def _normalize_index_array(self, local_sample_indices) -> np.ndarray:
+        """Converts `local_sample_indices` to a 1D int64 array, wrapping negative indices and checking bounds."""
+        indices = np.asarray(local_sample_indices, dtype=np.int64).reshape(-1)
+        num_samples = self.num_samples
+        if len(self._encoded) == 0:
+            if indices.size:
+                raise IndexError(
+                    f"Index {indices[0]} is out of bounds for an empty encoder."
+                )
+            return indices
+        indices = np.where(indices < 0, indices + num_samples, indices)
+        out_of_bounds = (indices < 0) | (indices >= num_samples)
+        if out_of_bounds.any():
+            raise IndexError(
+                f"Index {indices[out_of_bounds][0]} is out of bounds for an encoder with {num_samples} samples."
+            )
+        return indices
+
+    def translate_index_array(self, local_sample_indices) -> np.ndarray:
+        """Vectorized version of `translate_index`. Finds the rows for all of `local_sample_indices` with a single binary search.
+
+        Args:
+            local_sample_indices (Sequence[int]): Indices representing samples. Localized to `self._encoded`.
+
+        Returns:
+            np.ndarray: The indices of the corresponding rows inside the encoded state.
+        """
+        indices = self._normalize_index_array(local_sample_indices)
+        return np.searchsorted(self._encoded[:, LAST_SEEN_INDEX_COLUMN], indices)
+
+    def _first_index_of_rows(self, row_indices: np.ndarray) -> np.ndarray:
+        """Returns the index of the first sample represented by each of `row_indices`."""
+        row_indices = np.asarray(row_indices, dtype=np.int64)
+        last_seen = self._encoded[:, LAST_SEEN_INDEX_COLUMN].astype(np.int64)
+        return np.where(row_indices > 0, last_seen[row_indices - 1] + 1, 0)
+
     def register_samples(self, item: Any, num_samples: int, row: Optional[int] = None):
         """Register `num_samples` as `item`. Combines when the `self._combine_condition` returns True.
         This method adds data to `self._encoded` without decoding.
@@ -1,6 +1,6 @@
 from deeplake.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
 
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Tuple, Union
 import numpy as np
 
 
@@ -84,6 +84,35 @@ class BytePositionsEncoder(Encoder):
         end_byte = start_byte + row_num_bytes
         return int(start_byte), int(end_byte)
 
+    def get_byte_ranges(
+        self, local_sample_indices, return_row_index: bool = False
+    ) -> Union[
+        Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, np.ndarray]
+    ]:
+        """Vectorized version of `__getitem__`. Derives the byte ranges of all of `local_sample_indices` with a single binary search.
+
+        Args:
+            local_sample_indices (Sequence[int]): Indices of the samples for the desired byte ranges.
+            return_row_index (bool): If True, the indices of the rows that the values were derived from are returned as well.
+                Defaults to False.
+
+        Returns:
+            Union[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, np.ndarray]]: Start and end bytes of the samples,
+                followed by the row indices if `return_row_index` is True.
+        """
+        indices = self._normalize_index_array(local_sample_indices)
+        rows = np.searchsorted(self._encoded[:, LAST_SEEN_INDEX_COLUMN], indices)
+        encoded = self._encoded[rows].astype(np.int64)
+        num_bytes = encoded[:, NUM_BYTES_COLUMN]
+        start_bytes = (
+            encoded[:, START_BYTE_COLUMN]
+            + (indices - self._first_index_of_rows(rows)) * num_bytes
+        )
+        end_bytes = start_bytes + num_bytes
+        if return_row_index:
+            return start_bytes, end_bytes, rows
+        return start_bytes, end_bytes
+
     def pop(self, index: Optional[int] = None):
         if index is None:
             index = self.get_last_index_for_pop()
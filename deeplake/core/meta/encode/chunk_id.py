@@ -196,6 +196,47 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
 
         return int(global_sample_index - last_num_samples)
 
+    def translate_indices_relative_to_chunks(
+        self, global_sample_indices
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized version of `translate_index_relative_to_chunks`. Maps all of `global_sample_indices` to
+        their chunks with a single binary search.
+
+        Example:
+            Given: 2 samples in chunk 0, 2 samples in chunk 1, and 3 samples in chunk 2.
+            >>> chunk_ids, rows, local_indices = self.translate_indices_relative_to_chunks([6, 0, 3])
+            >>> rows
+            array([2, 0, 1])
+            >>> local_indices
+            array([2, 0, 1])
+
+        Args:
+            global_sample_indices (Sequence[int]): Indices of the samples relative to the containing tensor.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Chunk ids, encoder rows and indices relative to the chunks.
+                For tiled samples, the first chunk of the sample is returned.
+        """
+        indices = self._normalize_index_array(global_sample_indices)
+        rows = np.searchsorted(self._encoded[:, LAST_SEEN_INDEX_COLUMN], indices)
+        chunk_ids = self._encoded[rows, CHUNK_ID_COLUMN]
+        return chunk_ids, rows, indices - self._first_index_of_rows(rows)
+
+    def get_row_ranges(self, global_sample_indices) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds the range of rows each of `global_sample_indices` is stored in. Tiled samples span more than one row.
+
+        Args:
+            global_sample_indices (Sequence[int]): Indices of the samples relative to the containing tensor.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Start (inclusive) and stop (exclusive) rows for each sample.
+        """
+        indices = self._normalize_index_array(global_sample_indices)
+        last_seen = self._encoded[:, LAST_SEEN_INDEX_COLUMN]
+        start_rows = np.searchsorted(last_seen, indices)
+        stop_rows = np.searchsorted(last_seen, indices, side="right")
+        return start_rows, np.maximum(stop_rows, start_rows + 1)
+
     def _validate_incoming_item(self, _, num_samples: int):
         if num_samples < 0:
             raise ValueError(
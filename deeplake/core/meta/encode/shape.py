@@ -9,6 +9,18 @@ class ShapeEncoder(Encoder):
     def _derive_value(self, row: np.ndarray, *_) -> Tuple:  # type: ignore
         return tuple(row[:LAST_SEEN_INDEX_COLUMN])
 
+    def get_shapes(self, local_sample_indices) -> np.ndarray:
+        """Vectorized version of `__getitem__`. Derives the shapes of all of `local_sample_indices` with a single binary search.
+
+        Args:
+            local_sample_indices (Sequence[int]): Indices of the samples for the desired shapes.
+
+        Returns:
+            np.ndarray: 2D array with one shape per row.
+        """
+        rows = self.translate_index_array(local_sample_indices)
+        return self._encoded[rows, :LAST_SEEN_INDEX_COLUMN]
+
     @property
     def dimensionality(self) -> int:
         return len(self[0])
@@ -0,0 +1,101 @@
+from typing import Sequence
+
+import numpy as np
+
+from deeplake.core.meta.encode.base_encoder import LAST_SEEN_INDEX_COLUMN
+from deeplake.core.meta.encode.shape import ShapeEncoder
+from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.serialize import serialize_shape_index, deserialize_shape_index
+
+
+class ShapeIndex(ShapeEncoder, DeepLakeMemoryObject):
+    """Shapes of all the samples of a tensor, encoded the same way as the shapes of the samples of a chunk in `ShapeEncoder`.
+
+    It mirrors the hidden sample shape tensor of the tensor, so that the shapes of any samples can be looked up with
+    `get_shapes` without reading any chunks.
+    """
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the shapes, -1 if the index is empty."""
+        if self.is_empty():
+            return -1
+        return self._encoded.shape[1] - 1
+
+    def _stack(self, shapes: Sequence) -> np.ndarray:
+        """Stacks `shapes` into a 2D array. Empty samples may have a shape with a different number of dimensions, like
+        `(0,)`, they get a shape of zeros."""
+        if isinstance(shapes, np.ndarray) and shapes.ndim == 2:
+            rows = shapes
+        else:
+            rows = [np.asarray(shape).reshape(-1) for shape in shapes]
+        ndim = self.ndim if not self.is_empty() else max(map(len, rows), default=0)
+        if isinstance(rows, np.ndarray):
+            if rows.shape[1] != ndim and not rows.any():
+                return np.zeros((len(rows), ndim), dtype=rows.dtype)
+            return rows
+        return np.stack(
+            [
+                np.zeros(ndim, dtype=row.dtype)
+                if len(row) != ndim and not row.any()
+                else row
+                for row in rows
+            ]
+        )
+
+    def extend(self, shapes: Sequence):
+        """Registers the shapes of new samples. Consecutive samples with the same shape are stored in a single row.
+
+        Args:
+            shapes (Sequence): 2D array with one shape per row, or sequence of shapes.
+
+        Raises:
+            ValueError: If the shapes don't have the same number of dimensions as the shapes in the index.
+        """
+        if len(shapes) == 0:
+            return
+        shapes = self._stack(shapes)
+        if not self.is_empty() and shapes.shape[1] != self.ndim:
+            raise ValueError(
+                f"Expected shapes with {self.ndim} dimensions, got an array of shape {shapes.shape}."
+            )
+        # index of the last sample of each run of equal shapes
+        ends = np.flatnonzero(np.any(shapes[1:] != shapes[:-1], axis=1))
+        ends = np.append(ends, len(shapes) - 1)
+        rows = np.concatenate(
+            [shapes[ends], (ends + self.num_samples)[:, None]], axis=1
+        ).astype(self.dtype)
+        if self.is_empty():
+            self._encoded = rows
+        else:
+            if np.array_equal(
+                self._encoded[-1, :LAST_SEEN_INDEX_COLUMN],
+                rows[0, :LAST_SEEN_INDEX_COLUMN],
+            ):
+                self._encoded = self._encoded[:-1]
+            self._encoded = np.concatenate([self._encoded, rows])
+        self.is_dirty = True
+
+    def __setitem__(self, local_sample_index: int, shape):
+        shape = tuple(self._stack([shape])[0])
+        if len(shape) != self.ndim:
+            raise ValueError(
+                f"Expected a shape with {self.ndim} dimensions, got {shape}."
+            )
+        super().__setitem__(local_sample_index, shape)
+        self.is_dirty = True
+
+    def tobytes(self) -> memoryview:
+        return memoryview(serialize_shape_index(self.version, self._encoded))
+
+    @classmethod
+    def frombuffer(cls, buffer: bytes):
+        instance = cls()
+        if not buffer:
+            return instance
+        version, encoded = deserialize_shape_index(buffer)
+        if encoded.nbytes:
+            instance._encoded = encoded
+        instance.version = version
+        instance.is_dirty = False
+        return instance
@@ -82,3 +82,23 @@ def test_alternate():
     np.testing.assert_array_equal(enc._encoded[:, 0], [7, 3] * 50)
     np.testing.assert_array_equal(np.diff(enc._encoded[:, 1]), [7, 3] * 49 + [7])
     np.testing.assert_array_equal(enc._encoded[:, 2], np.arange(100))
+
+
+def test_get_byte_ranges():
+    enc = BytePositionsEncoder()
+    enc.register_samples(8, 100)
+    enc.register_samples(1, 1000)
+    enc.register_samples(4960, 1)
+    enc.register_samples(41, 3)
+
+    indices = [1103, 0, 99, 100, 1099, 1100, 1101]
+    start_bytes, end_bytes, rows = enc.get_byte_ranges(indices, return_row_index=True)
+    for idx, sb, eb, row in zip(indices, start_bytes, end_bytes, rows):
+        assert (sb, eb) == enc[idx]
+        assert row == enc.translate_index(idx)
+
+    start_bytes, end_bytes = enc.get_byte_ranges([-1])
+    assert (start_bytes[0], end_bytes[0]) == enc[1103]
+
+    with pytest.raises(IndexError):
+        enc.get_byte_ranges([1104])
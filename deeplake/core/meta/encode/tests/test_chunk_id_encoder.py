@@ -1,6 +1,7 @@
 from deeplake.constants import ENCODING_DTYPE
 from deeplake.util.exceptions import ChunkIdEncoderError
 import pytest
+import numpy as np
 from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
 
 
@@ -87,3 +88,44 @@ def test_ids():
     out_id = ChunkIdEncoder.id_from_name(name)
 
     assert id == out_id
+
+
+def test_translate_indices():
+    enc = ChunkIdEncoder()
+    ids = []
+    for num_samples in (2, 2, 3):
+        ids.append(enc.generate_chunk_id())
+        enc.register_samples(num_samples)
+
+    # tiled sample spanning 3 chunks
+    ids.append(enc.generate_chunk_id())
+    enc.register_samples(1)
+    for _ in range(2):
+        ids.append(enc.generate_chunk_id())
+        enc.register_samples(0)
+
+    ids.append(enc.generate_chunk_id())
+    enc.register_samples(4)
+
+    indices = np.arange(enc.num_samples)
+    np.random.shuffle(indices)
+    chunk_ids, rows, local_indices = enc.translate_indices_relative_to_chunks(indices)
+    for idx, chunk_id, row, local_index in zip(indices, chunk_ids, rows, local_indices):
+        (expected_id, expected_row) = enc.__getitem__(idx, return_row_index=True)[0]
+        assert chunk_id == expected_id
+        assert row == expected_row
+        if idx != 7:
+            assert local_index == enc.translate_index_relative_to_chunks(idx)
+
+    start_rows, stop_rows = enc.get_row_ranges([0, 6, 7, 8, -1])
+    np.testing.assert_array_equal(start_rows, [0, 2, 3, 6, 6])
+    np.testing.assert_array_equal(stop_rows, [1, 3, 6, 7, 7])
+
+    _, rows, local_indices = enc.translate_indices_relative_to_chunks([-1, -4])
+    np.testing.assert_array_equal(rows, [6, 6])
+    np.testing.assert_array_equal(local_indices, [3, 0])
+
+    with pytest.raises(IndexError):
+        enc.translate_indices_relative_to_chunks([0, enc.num_samples])
+    with pytest.raises(IndexError):
+        ChunkIdEncoder().translate_index_array([0])
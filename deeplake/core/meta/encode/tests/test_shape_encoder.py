@@ -150,3 +150,19 @@ def test_failures():
         enc[101] = (1, 1)
 
     assert enc.num_samples == 100
+
+
+def test_get_shapes():
+    enc = ShapeEncoder()
+    enc.register_samples((28, 28, 3), 10)
+    enc.register_samples((30, 28, 3), 5)
+    enc.register_samples((28, 28, 4), 1)
+
+    indices = [15, 0, 9, 10, 14, -1, 3]
+    shapes = enc.get_shapes(indices)
+    assert shapes.shape == (len(indices), 3)
+    assert list(map(tuple, shapes)) == [enc[i] for i in indices]
+
+    assert enc.get_shapes([]).shape == (0, 3)
+    with pytest.raises(IndexError):
+        enc.get_shapes([16])
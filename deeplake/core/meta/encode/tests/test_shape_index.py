@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from deeplake.core.meta.encode.shape_index import ShapeIndex
+
+
+def test_extend():
+    enc = ShapeIndex()
+    enc.extend(np.array([[10, 10], [10, 10], [5, 10]]))
+    enc.extend([(5, 10), (0,), (3, 3)])
+    assert enc.num_samples == 6
+    assert enc.ndim == 2
+    assert len(enc._encoded) == 4
+    np.testing.assert_array_equal(
+        enc.get_shapes([5, 0, 3, 4]), [[3, 3], [10, 10], [5, 10], [0, 0]]
+    )
+
+    with pytest.raises(ValueError):
+        enc.extend(np.array([[1, 2, 3]]))
+
+
+def test_update_and_pop():
+    enc = ShapeIndex()
+    enc.extend(np.tile([28, 28, 3], (10, 1)))
+    enc[4] = (14, 14, 3)
+    enc[5] = (0,)
+    assert enc[4] == (14, 14, 3)
+    assert enc[5] == (0, 0, 0)
+    assert enc[6] == (28, 28, 3)
+    enc.pop(4)
+    enc.pop()
+    assert enc.num_samples == 8
+    np.testing.assert_array_equal(
+        enc.get_shapes([3, 4, 5]), [[28] * 2 + [3], [0] * 3, [28] * 2 + [3]]
+    )
+
+    with pytest.raises(ValueError):
+        enc[0] = (1, 2)
+
+
+def test_serialize():
+    enc = ShapeIndex()
+    enc.extend(np.array([[1, 2, 3, 4]] * 3 + [[5, 6, 7, 8]]))
+    decoded = ShapeIndex.frombuffer(bytes(enc.tobytes()))
+    np.testing.assert_array_equal(decoded.array, enc.array)
+    assert not decoded.is_dirty
+    assert ShapeIndex.frombuffer(b"").is_empty()
@@ -18,7 +18,11 @@ from deeplake.constants import (
     REQUIRE_USER_SPECIFICATION,
     UNSPECIFIED,
 )
-from deeplake.compression import COMPRESSION_ALIASES
+from deeplake.compression import (
+    BYTE_COMPRESSION_ARGS,
+    COMPRESSION_ALIASES,
+    SHUFFLE_FILTERS,
+)
 from deeplake.htype import (
     HTYPE_CONFIGURATIONS,
     HTYPE_SUPPORTED_COMPRESSIONS,
@@ -45,6 +49,7 @@ class TensorMeta(Meta):
     is_sequence: bool
     is_link: bool
     verify: bool
+    compression_args: Optional[Dict[str, Any]]
 
     def __init__(
         self,
@@ -314,6 +319,11 @@ def _validate_required_htype_overwrites(htype: str, htype_overwrite: dict):
             custom_message="Specifying both sample-wise and chunk-wise compressions for the same tensor is not yet supported."
         )
 
+    if htype_overwrite.get("compression_args") is not None:
+        _validate_compression_args(
+            htype_overwrite["compression_args"], sample_compression or chunk_compression
+        )
+
     if htype_overwrite["dtype"] is not None:
         if htype in ("json", "list"):
             validate_json_schema(htype_overwrite["dtype"])
@@ -334,6 +344,40 @@ def _validate_required_htype_overwrites(htype: str, htype_overwrite: dict):
             )
 
 
+def _validate_compression_args(compression_args: dict, compression: Optional[str]):
+    """Raises errors if ``compression_args`` are not supported by ``compression``."""
+    if not isinstance(compression_args, dict):
+        raise TensorMetaInvalidHtypeOverwriteValue(
+            "compression_args", compression_args, "compression_args should be a dict."
+        )
+    supported_args = BYTE_COMPRESSION_ARGS.get(compression)  # type: ignore
+    if supported_args is None:
+        raise TensorMetaInvalidHtypeOverwriteValue(
+            "compression_args",
+            compression_args,
+            f"compression_args are only supported with the byte compressions {list(BYTE_COMPRESSION_ARGS)}.",
+        )
+    for key in compression_args:
+        if key not in supported_args:
+            raise TensorMetaInvalidHtypeOverwriteValue(
+                "compression_args",
+                compression_args,
+                f"Supported arguments for '{compression}': {supported_args}.",
+            )
+    level = compression_args.get("level")
+    if level is not None and not isinstance(level, int):
+        raise TensorMetaInvalidHtypeOverwriteValue(
+            "compression_args", compression_args, "level should be an int."
+        )
+    shuffle = compression_args.get("shuffle")
+    if shuffle is not None and shuffle not in SHUFFLE_FILTERS:
+        raise TensorMetaInvalidHtypeOverwriteValue(
+            "compression_args",
+            compression_args,
+            f"shuffle should be one of {SHUFFLE_FILTERS} or None.",
+        )
+
+
 def _format_values(htype: str, htype_overwrite: dict):
     """Replaces values in `htype_overwrite` with consistent types/formats."""
 
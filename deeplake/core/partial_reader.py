@@ -1,4 +1,27 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+from deeplake.constants import PARTIAL_READ_COALESCE_GAP
+
+
+def coalesce_ranges(
+    ranges: Sequence[Tuple[int, int]], gap: int = PARTIAL_READ_COALESCE_GAP
+) -> List[Tuple[int, int]]:
+    """Merges overlapping byte ranges and ranges that are at most `gap` bytes apart.
+
+    Args:
+        ranges (Sequence[Tuple[int, int]]): The (start, stop) ranges to merge.
+        gap (int): Ranges separated by at most this many bytes are merged, fetching the bytes in between along with them.
+
+    Returns:
+        List[Tuple[int, int]]: The merged ranges, sorted by their start.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, stop in sorted(ranges):
+        if merged and start - merged[-1][1] <= gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
 
 
 class PartialReader:
@@ -8,18 +31,53 @@ class PartialReader:
         self.data_fetched: Dict[Tuple[int, int], memoryview] = {}
         self.header_offset = header_offset
 
+    def _find(self, start: int, stop: int):
+        """Returns the bytes from `start` to `stop` if they are contained in an already fetched range."""
+        data = self.data_fetched.get((start, stop))
+        if data is not None:
+            return data
+        for (fetched_start, fetched_stop), data in self.data_fetched.items():
+            if fetched_start <= start and stop <= fetched_stop:
+                return data[start - fetched_start : stop - fetched_start]
+        return None
+
     def __getitem__(self, slice_: slice) -> memoryview:
         start = slice_.start + self.header_offset
         stop = slice_.stop + self.header_offset
         step = slice_.step
         assert start is not None and stop is not None
         assert step is None or step == 1
-        slice_tuple = (start, stop)
-        if slice_tuple not in self.data_fetched:
-            self.data_fetched[slice_tuple] = memoryview(
-                self.cache.get_bytes(self.path, start, stop)
-            )
-        return self.data_fetched[slice_tuple]
+        data = self._find(start, stop)
+        if data is None:
+            data = memoryview(self.cache.get_bytes(self.path, start, stop))
+            self.data_fetched[(start, stop)] = data
+        return data
+
+    def prefetch(
+        self, ranges: Sequence[Tuple[int, int]], gap: int = PARTIAL_READ_COALESCE_GAP
+    ):
+        """Fetches the given ranges of the chunk data, so that subsequent reads of them are served from memory.
+
+        Ranges that are at most `gap` bytes apart are merged, and the merged ranges are fetched concurrently.
+
+        Args:
+            ranges (Sequence[Tuple[int, int]]): The (start, stop) ranges to fetch, relative to the start of the chunk data.
+            gap (int): Ranges separated by at most this many bytes are fetched with a single request.
+        """
+        ranges = [
+            (start + self.header_offset, stop + self.header_offset)
+            for start, stop in ranges
+            if stop > start
+            and self._find(start + self.header_offset, stop + self.header_offset)
+            is None
+        ]
+        ranges = coalesce_ranges(ranges, gap)
+        if not ranges:
+            return
+        for byte_range, data in zip(
+            ranges, self.cache.get_byte_ranges(self.path, ranges)
+        ):
+            self.data_fetched[byte_range] = memoryview(data)
 
     def get_all_bytes(self) -> bytes:
         return self.cache.next_storage[self.path]
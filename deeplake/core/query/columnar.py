@@ -0,0 +1,496 @@
+import ast
+import operator
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from deeplake.core.tensor import Tensor
+from deeplake.util.exceptions import DynamicTensorNumpyError
+
+# htypes for which `Tensor.numpy` does not return plain numeric arrays
+UNSUPPORTED_HTYPES = {"text", "json", "list", "polygon", "mesh", "point_cloud"}
+
+COLUMN_VALUES = Union[np.ndarray, List[np.ndarray]]
+
+_COMPARISONS: Dict[type, Callable] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_REFLECTED: Dict[type, type] = {
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+}
+
+# binary operators implemented by `EvalObject`
+_ARITHMETIC: Dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_LITERALS = (ast.List, ast.Tuple, ast.Set, ast.Dict, ast.UnaryOp) + tuple(
+    getattr(ast, name)
+    for name in ("Constant", "Num", "Str", "Bytes", "NameConstant")
+    if hasattr(ast, name)
+)
+
+
+class NotVectorizable(Exception):
+    """Raised when a query expression can not be evaluated column-wise.
+    The query engine falls back to evaluating such expressions row by row."""
+
+
+class QueryColumn:
+    """Column-wise counterpart of :class:`~deeplake.core.query.query.EvalObject`.
+
+    Holds the values of a tensor for every row of an :class:`~deeplake.core.io.IOBlock`,
+    either as a single array (fixed shape samples) or as a list of arrays (dynamic shape samples).
+    """
+
+    def __init__(
+        self, values: COLUMN_VALUES, classes: Optional[Dict[str, int]] = None
+    ) -> None:
+        self.values = values
+        self.classes = classes
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def is_ragged(self) -> bool:
+        return isinstance(self.values, list)
+
+    def _flatten(self):
+        """Returns all values of the column in a flat array, along with the row each value belongs to and the row lengths."""
+        n = len(self)
+        if self.is_ragged:
+            lengths = np.fromiter((v.size for v in self.values), dtype=np.int64, count=n)  # type: ignore
+            flat = (
+                np.concatenate([v.reshape(-1) for v in self.values])  # type: ignore
+                if n
+                else np.zeros((0,))
+            )
+        else:
+            size = int(np.prod(self.values.shape[1:]))  # type: ignore
+            lengths = np.full(n, size, dtype=np.int64)
+            flat = self.values.reshape(-1)  # type: ignore
+        rows = np.repeat(np.arange(n), lengths)
+        return flat, rows, lengths
+
+    def _rows(self) -> np.ndarray:
+        if self.is_ragged:
+            raise NotVectorizable()
+        return self.values  # type: ignore
+
+    def _any(self, predicate: Callable[[np.ndarray], Any]) -> np.ndarray:
+        flat, rows, _ = self._flatten()
+        hits = np.asarray(predicate(flat))
+        if hits.shape != flat.shape:
+            raise NotVectorizable()
+        return np.bincount(rows[hits.astype(bool)], minlength=len(self)) > 0
+
+    def _no_match(self) -> np.ndarray:
+        return np.zeros(len(self), dtype=bool)
+
+    def _is_string_column(self) -> bool:
+        values = self.values
+        dtype = values[0].dtype if self.is_ragged and values else values.dtype  # type: ignore
+        return getattr(dtype, "kind", None) in ("U", "S", "O")
+
+    def _norm_label(self, o: Any) -> Any:
+        if isinstance(o, str):
+            return self.classes[o]  # type: ignore
+        elif isinstance(o, (int, list, tuple)):
+            return o
+        return None
+
+    def equals(self, o: Any) -> np.ndarray:
+        """Row-wise equivalent of ``EvalObject.__eq__``: ``True`` for rows containing ``o``."""
+        if isinstance(o, (QueryColumn, ShapeRows, np.ndarray)):
+            raise NotVectorizable()
+        if self.classes is not None:
+            try:
+                o = self._norm_label(o)
+            except KeyError:
+                return self._no_match()
+        if isinstance(o, (list, tuple, set, dict)):
+            # compares sets of values, see `EvalObject.__eq__`
+            raise NotVectorizable()
+        if o is None or (isinstance(o, str) and not self._is_string_column()):
+            return self._no_match()
+        return self._any(lambda flat: flat == o)
+
+    def contains(self, o: Any) -> np.ndarray:
+        if isinstance(o, (QueryColumn, ShapeRows, np.ndarray, list, tuple)):
+            raise NotVectorizable()
+        if self.classes is not None and isinstance(o, str):
+            o = self.classes[o]
+        if o is None or (isinstance(o, str) and not self._is_string_column()):
+            return self._no_match()
+        return self._any(lambda flat: flat == o)
+
+    def compare(self, op: ast.cmpop, o: Any):
+        if isinstance(op, ast.Eq):
+            return self.equals(o)
+        if isinstance(op, ast.NotEq):
+            return ~self.equals(o)
+        if isinstance(o, (QueryColumn, ShapeRows)) or (
+            self.classes is not None and isinstance(o, str)
+        ):
+            raise NotVectorizable()
+        return _apply(_COMPARISONS[type(op)], self._rows(), o)
+
+    def arithmetic(self, op: ast.operator, o: Any) -> np.ndarray:
+        if type(op) not in _ARITHMETIC or isinstance(o, (QueryColumn, ShapeRows)):
+            raise NotVectorizable()
+        return _apply(_ARITHMETIC[type(op)], self._rows(), o)
+
+    def __getitem__(self, item) -> "QueryColumn":
+        # `EvalObject.__getitem__` drops class label semantics
+        return QueryColumn(self._rows()[(slice(None),) + item])
+
+    def _reduce(self, ufunc: np.ufunc) -> np.ndarray:
+        if self.is_ragged:
+            flat, _, lengths = self._flatten()
+            if not lengths.all():
+                raise NotVectorizable()
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            return ufunc.reduceat(flat, offsets)
+        values = self.values.reshape(len(self), -1)  # type: ignore
+        if len(self) and not values.shape[1]:
+            raise NotVectorizable()
+        return ufunc.reduce(values, axis=1)
+
+    @property
+    def min(self) -> np.ndarray:
+        return self._reduce(np.minimum)
+
+    @property
+    def max(self) -> np.ndarray:
+        return self._reduce(np.maximum)
+
+    @property
+    def mean(self) -> np.ndarray:
+        if self.is_ragged:
+            flat, _, lengths = self._flatten()
+            if not lengths.all():
+                raise NotVectorizable()
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            return np.add.reduceat(flat, offsets) / lengths
+        return self.values.reshape(len(self), -1).mean(axis=1)  # type: ignore
+
+    @property
+    def shape(self) -> "ShapeRows":
+        if self.is_ragged:
+            ndims = {v.ndim for v in self.values}
+            if len(ndims) > 1:
+                raise NotVectorizable()
+            shapes = np.array([v.shape for v in self.values], dtype=np.int64).reshape(
+                len(self), -1
+            )
+        else:
+            shapes = np.tile(
+                np.array(self.values.shape[1:], dtype=np.int64), (len(self), 1)  # type: ignore
+            )
+        if len(shapes) and not shapes.sum(axis=1).all():
+            # `Tensor.shape` special cases empty samples
+            raise NotVectorizable()
+        return ShapeRows(shapes)
+
+
+class ShapeRows:
+    """Sample shapes of a :class:`QueryColumn`, one row per sample."""
+
+    def __init__(self, shapes: np.ndarray) -> None:
+        self.shapes = shapes
+
+    def equals(self, o: Any) -> np.ndarray:
+        if not isinstance(o, tuple) or len(o) != self.shapes.shape[1]:
+            # tuples never compare equal to lists or tuples of other lengths
+            return np.zeros(len(self.shapes), dtype=bool)
+        return (self.shapes == np.array(o)).all(axis=1)
+
+    def compare(self, op: ast.cmpop, o: Any) -> np.ndarray:
+        if isinstance(op, ast.Eq):
+            return self.equals(o)
+        if isinstance(op, ast.NotEq):
+            return ~self.equals(o)
+        raise NotVectorizable()
+
+    def __getitem__(self, item) -> np.ndarray:
+        if len(item) != 1 or not isinstance(item[0], int):
+            raise NotVectorizable()
+        return self.shapes[:, item[0]]
+
+
+class _Group:
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+
+
+def _align(a: Any, b: Any):
+    """Pads the lower rank per-row array with trailing axes, so that per-row values broadcast against each other."""
+    if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+        if a.ndim < b.ndim:
+            a = a.reshape(a.shape + (1,) * (b.ndim - a.ndim))
+        elif b.ndim < a.ndim:
+            b = b.reshape(b.shape + (1,) * (a.ndim - b.ndim))
+    return a, b
+
+
+def _apply(op: Callable, a: Any, b: Any) -> Any:
+    if isinstance(b, np.ndarray) and b.ndim == 0:
+        raise NotVectorizable()
+    return op(*_align(a, b))
+
+
+def to_mask(value: Any, n: int) -> np.ndarray:
+    """Converts the result of a column-wise expression to a boolean mask with one entry per row."""
+    if isinstance(value, (QueryColumn, ShapeRows, _Group)):
+        raise NotVectorizable()
+    if isinstance(value, np.ndarray):
+        if value.ndim == 0 or value.shape[0] != n:
+            raise NotVectorizable()
+        if value.ndim > 1:
+            if int(np.prod(value.shape[1:])) != 1:
+                # truth value of a multi element array is ambiguous
+                raise NotVectorizable()
+            value = value.reshape(n)
+        return value.astype(bool)
+    return np.full(n, bool(value))
+
+
+class ColumnarQuery:
+    """Evaluates a query over all rows of an :class:`~deeplake.core.io.IOBlock` at once, using numpy operations on whole columns.
+
+    Args:
+        tree (ast.Expression): Parsed query.
+        tensors (Dict[str, Tensor]): Tensors of the dataset, by key.
+    """
+
+    def __init__(self, tree: ast.Expression, tensors: Dict[str, Tensor]) -> None:
+        self._tree = tree
+        self._classes: Dict[str, Optional[Dict[str, int]]] = {}
+        self._groups = set()
+        for key, tensor in tensors.items():
+            if tensor.htype == "class_label":
+                class_names = tensor.info["class_names"]  # type: ignore
+                self._classes[key] = {v: idx for idx, v in enumerate(class_names)}
+            else:
+                self._classes[key] = None
+            parts = key.split("/")
+            for i in range(1, len(parts)):
+                self._groups.add("/".join(parts[:i]))
+        self._supported = {
+            key
+            for key, tensor in tensors.items()
+            if not (
+                tensor.is_link
+                or tensor.is_sequence
+                or tensor.base_htype in UNSUPPORTED_HTYPES
+            )
+        }
+
+    def execute(self, get_tensor: Callable[[str], Tensor], n: int) -> np.ndarray:
+        """Evaluates the query for a block of ``n`` rows.
+
+        Args:
+            get_tensor (Callable): Returns a view of the tensor with the given key over the rows of the block.
+            n (int): Number of rows in the block.
+
+        Returns:
+            np.ndarray: Boolean mask of the rows matching the query.
+
+        Raises:
+            NotVectorizable: If the query can not be evaluated column-wise.
+        """
+        self._get_tensor = get_tensor
+        self._columns: Dict[str, QueryColumn] = {}
+        self._n = n
+        try:
+            return to_mask(self._eval(self._tree.body), n)
+        finally:
+            self._columns = {}
+
+    def _column(self, key: str) -> QueryColumn:
+        if key not in self._supported:
+            raise NotVectorizable()
+        column = self._columns.get(key)
+        if column is None:
+            column = QueryColumn(load_column(self._get_tensor(key)), self._classes[key])
+            if len(column) != self._n:
+                raise NotVectorizable()
+            self._columns[key] = column
+        return column
+
+    def _resolve(self, key: str):
+        if key in self._classes:
+            return self._column(key)
+        if key in self._groups:
+            return _Group(key)
+        raise NotVectorizable()
+
+    def _eval(self, node: ast.AST):
+        if isinstance(node, _LITERALS):
+            try:
+                return ast.literal_eval(node)
+            except ValueError:
+                if not isinstance(node, ast.UnaryOp):
+                    raise NotVectorizable()
+        method = getattr(self, "_eval_" + node.__class__.__name__, None)
+        if method is None:
+            raise NotVectorizable()
+        return method(node)
+
+    def _eval_Name(self, node: ast.Name):
+        return self._resolve(node.id)
+
+    def _eval_Attribute(self, node: ast.Attribute):
+        value = self._eval(node.value)
+        if isinstance(value, _Group):
+            return self._resolve(value.prefix + "/" + node.attr)
+        if isinstance(value, QueryColumn) and node.attr in (
+            "min",
+            "max",
+            "mean",
+            "shape",
+        ):
+            return getattr(value, node.attr)
+        raise NotVectorizable()
+
+    def _eval_Call(self, node: ast.Call):
+        func = node.func
+        if (
+            not isinstance(func, ast.Attribute)
+            or func.attr != "contains"
+            or len(node.args) != 1
+            or node.keywords
+        ):
+            raise NotVectorizable()
+        column = self._eval(func.value)
+        if not isinstance(column, QueryColumn):
+            raise NotVectorizable()
+        return column.contains(self._eval(node.args[0]))
+
+    def _eval_Subscript(self, node: ast.Subscript):
+        value = self._eval(node.value)
+        item = self._eval_slice(node.slice)
+        if isinstance(value, (QueryColumn, ShapeRows)):
+            return value[item if isinstance(item, tuple) else (item,)]
+        if isinstance(value, np.ndarray):
+            return value[
+                (slice(None),) + (item if isinstance(item, tuple) else (item,))
+            ]
+        return value[item]
+
+    def _eval_slice(self, node: ast.AST):
+        if node.__class__.__name__ == "Index":  # python < 3.9
+            return self._eval_slice(node.value)  # type: ignore
+        if node.__class__.__name__ == "ExtSlice":  # python < 3.9
+            return tuple(self._eval_slice(dim) for dim in node.dims)  # type: ignore
+        if isinstance(node, ast.Slice):
+            return slice(
+                *(
+                    None if part is None else self._eval_slice(part)
+                    for part in (node.lower, node.upper, node.step)
+                )
+            )
+        if isinstance(node, ast.Tuple):
+            return tuple(self._eval_slice(elt) for elt in node.elts)
+        item = self._eval(node)
+        if not isinstance(item, (int, slice, tuple)):
+            raise NotVectorizable()
+        return item
+
+    def _eval_UnaryOp(self, node: ast.UnaryOp):
+        operand = self._eval(node.operand)
+        if isinstance(node.op, ast.Not):
+            return ~to_mask(operand, self._n)
+        if isinstance(node.op, ast.USub) and isinstance(operand, np.ndarray):
+            return -operand
+        raise NotVectorizable()
+
+    def _eval_BoolOp(self, node: ast.BoolOp):
+        masks = [to_mask(self._eval(value), self._n) for value in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return combine.reduce(masks)
+
+    def _eval_BinOp(self, node: ast.BinOp):
+        left = self._eval(node.left)
+        right = self._eval(node.right)
+        if isinstance(left, QueryColumn):
+            return left.arithmetic(node.op, right)
+        if isinstance(right, (QueryColumn, ShapeRows, _Group)) or isinstance(
+            left, (ShapeRows, _Group)
+        ):
+            raise NotVectorizable()
+        if isinstance(node.op, ast.Div):
+            return _apply(operator.truediv, left, right)
+        if type(node.op) not in _ARITHMETIC:
+            raise NotVectorizable()
+        return _apply(_ARITHMETIC[type(node.op)], left, right)
+
+    def _eval_Compare(self, node: ast.Compare):
+        result = None
+        left = self._eval(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self._eval(comparator)
+            mask = to_mask(self._compare(op, left, right), self._n)
+            result = mask if result is None else result & mask
+            left = right
+        return result
+
+    def _compare(self, op: ast.cmpop, left: Any, right: Any):
+        if isinstance(op, (ast.In, ast.NotIn)):
+            mask = self._membership(left, right)
+            return ~mask if isinstance(op, ast.NotIn) else mask
+        if type(op) not in _COMPARISONS:
+            raise NotVectorizable()
+        columns = (QueryColumn, ShapeRows)
+        if isinstance(right, columns) and not isinstance(left, columns):
+            left, right, op = right, left, _REFLECTED[type(op)]()
+        if isinstance(left, columns):
+            return left.compare(op, right)
+        if isinstance(left, _Group) or isinstance(right, _Group):
+            raise NotVectorizable()
+        return _apply(_COMPARISONS[type(op)], left, right)
+
+    def _membership(self, left: Any, right: Any) -> np.ndarray:
+        if isinstance(right, QueryColumn):
+            return right.contains(left)
+        if isinstance(left, QueryColumn) and isinstance(right, (list, tuple)):
+            mask = np.zeros(self._n, dtype=bool)
+            for value in right:
+                mask |= left.equals(value)
+            return mask
+        if isinstance(left, (QueryColumn, ShapeRows, _Group, np.ndarray)) or isinstance(
+            right, (ShapeRows, _Group, np.ndarray)
+        ):
+            raise NotVectorizable()
+        return np.full(self._n, left in right)
+
+
+def load_column(tensor: Tensor) -> COLUMN_VALUES:
+    """Reads all samples of a tensor view, as a single array if they have the same shape and as a list of arrays otherwise."""
+    meta = tensor.meta
+    if meta.min_shape == meta.max_shape:
+        try:
+            return tensor.numpy(fetch_chunks=True)
+        except DynamicTensorNumpyError:
+            pass
+    values = tensor.numpy(aslist=True, fetch_chunks=True)
+    if values and all(v.shape == values[0].shape for v in values):
+        return np.stack(values)
+    return values
@@ -2,9 +2,11 @@ from typing import Any, Callable, List, Union, Optional
 from deeplake.core.dataset import Dataset
 from deeplake.core.io import IOBlock, SampleStreaming
 from deeplake.core.index import Index
+from deeplake.core.query.columnar import ColumnarQuery, NotVectorizable
 from deeplake.core.tensor import Tensor
 
 
+import ast
 import numpy as np
 
 
@@ -34,24 +36,44 @@ class DatasetQuery:
         ]
         self._wrappers = self._export_tensors()
         self._groups = self._export_groups(self._wrappers)
+        self._columnar = ColumnarQuery(ast.parse(query, mode="eval"), dataset.tensors)
 
     def execute(self) -> List[int]:
         idx_map: List[int] = list()
+        vectorized = True
 
         for f, blk in zip(self._np_access, self._blocks):
-            cache = {tensor: f(tensor) for tensor in self._tensors}
-            for local_idx in range(len(blk)):
-                p = {
-                    tensor: self._wrap_value(tensor, cache[tensor][local_idx])
-                    for tensor in self._tensors
-                }
-                p.update(self._groups)
-                if eval(self._cquery, p):
-                    global_index = blk.indices()[local_idx]
-                    idx_map.append(global_index)
-                    self._pg_callback(local_idx, True)
-                else:
-                    self._pg_callback(local_idx, False)
+            if vectorized:
+                try:
+                    mask = self._columnar.execute(f, len(blk))
+                except NotVectorizable:
+                    # the query is evaluated row by row from the first block that can not be vectorized on
+                    vectorized = False
+            if not vectorized:
+                idx_map.extend(self._execute_rows(f, blk))
+                continue
+            indices = blk.indices()
+            for local_idx, include in enumerate(mask.tolist()):
+                if include:
+                    idx_map.append(indices[local_idx])
+                self._pg_callback(local_idx, include)
+        return idx_map
+
+    def _execute_rows(self, f: NP_ACCESS, blk: IOBlock) -> List[int]:
+        idx_map: List[int] = list()
+        cache = {tensor: f(tensor) for tensor in self._tensors}
+        for local_idx in range(len(blk)):
+            p = {
+                tensor: self._wrap_value(tensor, cache[tensor][local_idx])
+                for tensor in self._tensors
+            }
+            p.update(self._groups)
+            if eval(self._cquery, p):
+                global_index = blk.indices()[local_idx]
+                idx_map.append(global_index)
+                self._pg_callback(local_idx, True)
+            else:
+                self._pg_callback(local_idx, False)
         return idx_map
 
     def _wrap_value(self, tensor, val):
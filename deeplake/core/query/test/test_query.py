@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 
 from deeplake.core.query import DatasetQuery
+from deeplake.core.query.columnar import NotVectorizable
 from deeplake.util.exceptions import (
     DatasetViewSavingError,
     InvalidOperationError,
@@ -11,7 +12,6 @@ from deeplake.util.exceptions import (
 import deeplake
 from uuid import uuid4
 
-
 first_row = {"images": [1, 2, 3], "labels": [0]}
 second_row = {"images": [6, 7, 5], "labels": [1]}
 rows = [first_row, second_row]
@@ -81,6 +81,110 @@ def test_query(sample_ds, query, results):
             assert i not in r
 
 
+def _row_wise_query(ds, query):
+    dq = DatasetQuery(ds, query)
+    idx_map = []
+    for f, blk in zip(dq._np_access, dq._blocks):
+        idx_map.extend(dq._execute_rows(f, blk))
+    return idx_map
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "labels == 'cat' and score > 0.5",
+        "labels == 'cat' or not score > 0.5",
+        "labels != 'fish'",
+        "labels in ['cat', 'fish']",
+        "'dog' in labels",
+        "labels.contains('fish')",
+        "multi == 'cat'",
+        "multi.contains(2)",
+        "boxes.max > 0.9",
+        "boxes.min < 0.1 and boxes.mean > 0.4",
+        "boxes[0] > 0.5",
+        "boxes[1:3].max > 0.8",
+        "boxes.shape == (4,)",
+        "multi.shape[0] == 2",
+        "multi.max == 2",
+        "idx % 3 == 0",
+        "idx * 2 + 1 > 41",
+        "0 < idx < 10",
+        "-boxes.max < -0.5",
+        "score > boxes.mean",
+        "group.nums >= 50",
+    ],
+)
+def test_columnar_query(local_ds, query):
+    n = 100
+    with local_ds as ds:
+        ds.create_tensor("labels", htype="class_label", class_names=class_names)
+        ds.create_tensor("multi", htype="class_label", class_names=class_names)
+        ds.create_tensor("score")
+        ds.create_tensor("boxes")
+        ds.create_tensor("idx")
+        ds.create_tensor("group/nums")
+        ds.labels.extend(np.random.randint(0, 3, (n,)))
+        ds.multi.extend(
+            [np.random.randint(0, 3, (i % 3 + 1,), dtype=np.uint32) for i in range(n)]
+        )
+        ds.score.extend(np.random.random((n,)))
+        ds.boxes.extend(np.random.random((n, 4)))
+        ds.idx.extend(np.arange(n))
+        ds.group.nums.extend(np.arange(n))
+
+    dq = DatasetQuery(ds, query)
+    for f, blk in zip(dq._np_access, dq._blocks):
+        dq._columnar.execute(f, len(blk))  # should not fall back to row-wise eval
+
+    assert dq.execute() == _row_wise_query(ds, query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "labels == [0, 1]",
+        "images == [1, 2, 3]",
+        "images.size == 3",
+    ],
+)
+def test_columnar_query_fallback(sample_ds, query):
+    dq = DatasetQuery(sample_ds, query)
+    with pytest.raises(NotVectorizable):
+        for f, blk in zip(dq._np_access, dq._blocks):
+            dq._columnar.execute(f, len(blk))
+    assert dq.execute() == _row_wise_query(sample_ds, query)
+
+
+def test_columnar_query_fallback_once(local_ds, monkeypatch):
+    with local_ds as ds:
+        ds.create_tensor("x", dtype="int64", max_chunk_size=800)
+        ds.x.extend(np.arange(1000))
+
+    dq = DatasetQuery(ds, "x == [3]")
+    assert len(dq._blocks) > 1
+    calls = []
+    execute = dq._columnar.execute
+
+    def counting_execute(f, n):
+        calls.append(n)
+        return execute(f, n)
+
+    monkeypatch.setattr(dq._columnar, "execute", counting_execute)
+    assert dq.execute() == _row_wise_query(ds, "x == [3]")
+    assert len(calls) == 1
+
+    def failing_load_column(tensor):
+        raise ValueError("read failed")
+
+    # errors other than NotVectorizable are not hidden by the row-wise fallback
+    monkeypatch.setattr(
+        deeplake.core.query.columnar, "load_column", failing_load_column
+    )
+    with pytest.raises(ValueError):
+        DatasetQuery(ds, "x > 5").execute()
+
+
 def test_different_size_ds_query(local_ds):
     with local_ds as ds:
         ds.create_tensor("images")
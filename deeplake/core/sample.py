@@ -1,3 +1,4 @@
+import threading
 import requests
 from deeplake.core.compression import (
     compress_array,
@@ -43,6 +44,17 @@ except ImportError:
 import warnings
 
 
+_HTTP_SESSIONS = threading.local()
+
+
+def get_http_session() -> requests.Session:
+    """Returns the HTTP session of the current thread, which keeps the connections to the hosts it reads from open."""
+    session = getattr(_HTTP_SESSIONS, "session", None)
+    if session is None:
+        session = _HTTP_SESSIONS.session = requests.Session()
+    return session
+
+
 class Sample:
     path: Optional[str]
 
@@ -68,6 +80,7 @@ class Sample:
                 Implicitly makes ``self.is_lazy == True``.
             array (np.ndarray): Array that represents a single sample. If ``array`` is provided, ``path`` should not be. Implicitly makes ``self.is_lazy == False``.
             buffer: (bytes): Byte buffer that represents a single sample. If compressed, ``compression`` argument should be provided.
+                Can be given along with ``path`` if the file was already read, in which case it is not read again.
             compression (str): Specify in case of byte buffer.
             verify (bool): If a path is provided, verifies the sample if ``True``.
             shape (Tuple[int]): Shape of the sample.
@@ -189,15 +202,15 @@ class Sample:
         if self._compression is None and self.path:
             self._compression = get_compression(path=self.path)
         if f is None:
-            if self.path:
+            if self._buffer is not None:
+                f = self._buffer
+            elif self.path:
                 if is_remote_path(self.path):
                     f = self._read_from_path()
                     self._buffer = f
                     store = True
                 else:
                     f = self.path
-            else:
-                f = self._buffer
         self._compression, self._shape, self._typestr = read_meta_from_compressed_file(
             f, compression=self._compression
         )
@@ -304,7 +317,14 @@ class Sample:
 
         compressed_bytes = self._compressed_bytes.get(compression)
         if compressed_bytes is None:
-            if self.path is not None:
+            if self._buffer is not None:
+                if self._compression is None:
+                    self._compression = get_compression(header=self._buffer[:32])
+                if self._compression == compression:
+                    compressed_bytes = self._buffer
+                else:
+                    compressed_bytes = self._recompress(self._buffer, compression)
+            elif self.path is not None:
                 if self._compression is None:
                     self._compression = get_compression(path=self.path)
                 compressed_bytes = self._read_from_path()
@@ -317,13 +337,6 @@ class Sample:
                         )
                 else:
                     compressed_bytes = self._recompress(compressed_bytes, compression)
-            elif self._buffer is not None:
-                if self._compression is None:
-                    self._compression = get_compression(header=self._buffer[:32])
-                if self._compression == compression:
-                    compressed_bytes = self._buffer
-                else:
-                    compressed_bytes = self._recompress(self._buffer, compression)
             else:
                 compressed_bytes = compress_array(self.array, compression)
             self._compressed_bytes[compression] = compressed_bytes
@@ -347,7 +360,11 @@ class Sample:
                 )
 
         else:
-            if self.path and get_path_type(self.path) == "local":
+            if (
+                self._buffer is None
+                and self.path
+                and get_path_type(self.path) == "local"
+            ):
                 compressed = self.path
             else:
                 compressed = self.buffer
@@ -465,10 +482,10 @@ class Sample:
         if self.storage is not None:
             assert isinstance(self.storage, S3Provider)
             return self.storage.get_object_from_full_url(self.path)
-        path = self.path.replace("s3://", "")  # type: ignore
-        root, key = self._get_root_and_key(path)
-        s3 = storage_factory(S3Provider, root, **self._creds)
-        return s3[key]
+        # one provider per bucket, shared by the reads of all its objects
+        bucket = self.path.replace("s3://", "").split("/", 1)[0]
+        s3 = storage_factory(S3Provider, f"s3://{bucket}", **self._creds)
+        return s3.get_object_from_full_url(self.path)
 
     def _read_from_gcs(self) -> bytes:
         assert self.path is not None
@@ -497,13 +514,13 @@ class Sample:
             headers = {"Authorization": self._creds["Authorization"]}
         else:
             headers = {}
-        result = requests.get(self.path, headers=headers)
+        result = get_http_session().get(self.path, headers=headers)
         if result.status_code != 200:
             raise UnableToReadFromUrlError(self.path, result.status_code)
         return result.content
 
     def _getexif(self) -> dict:
-        if self.path and get_path_type(self.path) == "local":
+        if self._buffer is None and self.path and get_path_type(self.path) == "local":
             img = Image.open(self.path)
         else:
             img = Image.open(BytesIO(self.buffer))
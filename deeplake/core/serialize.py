@@ -17,7 +17,7 @@ from deeplake.util.casting import intelligent_cast
 from deeplake.util.json import HubJsonDecoder, HubJsonEncoder, validate_json_object
 from deeplake.core.sample import Sample, SampleValue  # type: ignore
 from deeplake.core.compression import compress_array, compress_bytes
-from typing import Optional, Sequence, Union, Tuple
+from typing import Dict, Optional, Sequence, Union, Tuple
 import deeplake
 import numpy as np
 import struct
@@ -197,7 +197,8 @@ def deserialize_chunk(
 
     Args:
         byts: (bytes) Serialized chunk.
-        copy: (bool) If true, this function copies the byts while deserializing incase byts was a memoryview.
+        copy: (bool) If true, this function copies the byts while deserializing incase byts was a writable memoryview.
+            Read-only memoryviews (for example, memory mapped files) are never copied.
         partial: (bool) If true, the byts are only a part of the chunk.
 
     Returns:
@@ -253,7 +254,7 @@ def deserialize_chunk(
 
     # Read data
     data = byts[offset:]
-    if incoming_mview and copy:
+    if incoming_mview and copy and not data.readonly:
         data = memoryview(bytes(data))
     return version, shape_info, byte_positions, data  # type: ignore
 
@@ -406,6 +407,89 @@ def serialize_pad_encoder(version: str, enc: np.ndarray) -> bytes:
     return len(version).to_bytes(1, "little") + version.encode("ascii") + enc.tobytes()
 
 
+def serialize_shape_index(version: str, enc: np.ndarray) -> bytes:
+    return (
+        len(version).to_bytes(1, "little")
+        + version.encode("ascii")
+        + enc.shape[1].to_bytes(1, "little")
+        + enc.tobytes()
+    )
+
+
+def deserialize_shape_index(byts: Union[bytes, memoryview]) -> Tuple[str, np.ndarray]:
+    byts = memoryview(byts)
+    len_version = byts[0]
+    version = str(byts[1 : 1 + len_version], "ascii")
+    num_columns = byts[1 + len_version]
+    enc = (
+        np.frombuffer(byts[2 + len_version :], dtype=deeplake.constants.ENCODING_DTYPE)
+        .reshape(-1, num_columns)
+        .copy()
+    )
+    return version, enc
+
+
+def serialize_vector_index(
+    version: str, meta: dict, arrays: Dict[str, np.ndarray]
+) -> bytes:
+    """Serializes a vector index.
+
+    Args:
+        version: (str) Version of deeplake library.
+        meta: (dict) Json serializable properties of the index.
+        arrays: (dict) Arrays of the index by name.
+
+    Returns:
+        Serialized vector index as bytes.
+    """
+    header = dict(meta)
+    header["arrays"] = [
+        (name, arr.dtype.str, list(arr.shape)) for name, arr in arrays.items()
+    ]
+    header_bytes = json.dumps(header).encode("utf-8")
+    return b"".join(
+        [
+            len(version).to_bytes(1, "little"),
+            version.encode("ascii"),
+            len(header_bytes).to_bytes(4, "little"),
+            header_bytes,
+        ]
+        + [np.ascontiguousarray(arr).tobytes() for arr in arrays.values()]
+    )
+
+
+def deserialize_vector_index(
+    byts: Union[bytes, memoryview]
+) -> Tuple[str, dict, Dict[str, np.ndarray]]:
+    """Deserializes a vector index serialized with `serialize_vector_index`.
+
+    Args:
+        byts: (bytes) Serialized vector index.
+
+    Returns:
+        Tuple of the version of deeplake library, the properties of the index and its arrays by name.
+    """
+    byts = memoryview(byts)
+    len_version = byts[0]
+    version = str(byts[1 : 1 + len_version], "ascii")
+    offset = 1 + len_version
+    len_header = int.from_bytes(byts[offset : offset + 4], "little")
+    offset += 4
+    meta = json.loads(bytes(byts[offset : offset + len_header]))
+    offset += len_header
+    arrays = {}
+    for name, dtype, shape in meta.pop("arrays"):
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        arrays[name] = (
+            np.frombuffer(byts[offset : offset + nbytes], dtype=dtype)
+            .reshape(shape)
+            .copy()
+        )
+        offset += nbytes
+    return version, meta, arrays
+
+
 def deserialize_pad_encoder(byts: Union[bytes, memoryview]) -> Tuple[str, np.ndarray]:
     byts = memoryview(byts)
     len_version = byts[0]
@@ -520,6 +604,7 @@ def serialize_numpy_and_base_types(
     min_chunk_size: int,
     break_into_tiles: bool = True,
     store_tiles: bool = False,
+    compression_args: Optional[dict] = None,
 ):
     """Converts the sample into bytes"""
     out = intelligent_cast(incoming_sample, dtype, htype)
@@ -528,7 +613,14 @@ def serialize_numpy_and_base_types(
 
     if sample_compression is None:
         if out.nbytes > min_chunk_size and break_into_tiles:
-            out = SampleTiles(out, tile_compression, min_chunk_size, store_tiles, htype)  # type: ignore
+            out = SampleTiles(  # type: ignore
+                out,
+                tile_compression,
+                min_chunk_size,
+                store_tiles,
+                htype,
+                compression_args=compression_args,
+            )
         else:
             out = out.tobytes()  # type: ignore
     else:
@@ -536,9 +628,16 @@ def serialize_numpy_and_base_types(
         approx_compressed_size = out.nbytes * ratio
 
         if approx_compressed_size > min_chunk_size and break_into_tiles:
-            out = SampleTiles(out, tile_compression, min_chunk_size, store_tiles, htype)  # type: ignore
+            out = SampleTiles(  # type: ignore
+                out,
+                tile_compression,
+                min_chunk_size,
+                store_tiles,
+                htype,
+                compression_args=compression_args,
+            )
         else:
-            compressed_bytes = compress_array(out, sample_compression)
+            compressed_bytes = compress_array(out, sample_compression, compression_args)
             out = compressed_bytes  # type: ignore
 
     return out, shape
@@ -551,6 +650,7 @@ def serialize_partial_sample_object(
     dtype: str,
     htype: str,
     min_chunk_size: int,
+    compression_args: Optional[dict] = None,
 ):
     shape = incoming_sample.shape
     tiles = SampleTiles(
@@ -571,6 +671,7 @@ def serialize_partial_sample_object(
             min_chunk_size=min_chunk_size,
             break_into_tiles=False,
             store_tiles=False,
+            compression_args=compression_args,
         )
     return tiles, shape
 
@@ -593,6 +694,7 @@ def serialize_sample_object(
     min_chunk_size: int,
     break_into_tiles: bool = True,
     store_tiles: bool = False,
+    compression_args: Optional[dict] = None,
 ):
     shape = incoming_sample.shape
     tile_compression = chunk_compression or sample_compression
@@ -621,7 +723,12 @@ def serialize_sample_object(
             and break_into_tiles
         ):
             out = SampleTiles(  # type: ignore
-                out.array, tile_compression, min_chunk_size, store_tiles, htype
+                out.array,
+                tile_compression,
+                min_chunk_size,
+                store_tiles,
+                htype,
+                compression_args=compression_args,
             )
         else:
             out = compressed_bytes  # type: ignore
@@ -629,7 +736,14 @@ def serialize_sample_object(
         out = intelligent_cast(out.array, dtype, htype)  # type: ignore
 
         if out.nbytes > min_chunk_size and break_into_tiles:  # type: ignore
-            out = SampleTiles(out, tile_compression, min_chunk_size, store_tiles, htype)  # type: ignore
+            out = SampleTiles(  # type: ignore
+                out,
+                tile_compression,
+                min_chunk_size,
+                store_tiles,
+                htype,
+                compression_args=compression_args,
+            )
         else:
             out = out.tobytes()  # type: ignore
     return out, shape
@@ -644,6 +758,7 @@ def serialize_tensor(
     min_chunk_size: int,
     break_into_tiles: bool = True,
     store_tiles: bool = False,
+    compression_args: Optional[dict] = None,
 ):
     def _return_numpy():
         return serialize_numpy_and_base_types(
@@ -655,6 +770,7 @@ def serialize_tensor(
             min_chunk_size,
             break_into_tiles,
             store_tiles,
+            compression_args,
         )
 
     if incoming_sample.meta.chunk_compression or chunk_compression:
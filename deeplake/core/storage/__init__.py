@@ -4,5 +4,6 @@ from deeplake.core.storage.s3 import S3Provider
 from deeplake.core.storage.google_drive import GDriveProvider
 from deeplake.core.storage.memory import MemoryProvider
 from deeplake.core.storage.local import LocalProvider
-from deeplake.core.storage.lru_cache import LRUCache
+from deeplake.core.storage.lru_cache import LRUCache, ShardedLRUCache
+from deeplake.core.storage.persistent_cache import PersistentLRUCache
 from deeplake.core.storage.gcs import GCSProvider
@@ -1,10 +1,14 @@
+import mmap
 import os
 import pathlib
 import posixpath
 import shutil
+import sys
+import uuid
 from typing import Optional, Set
 
 from deeplake.core.storage.provider import StorageProvider
+from deeplake.util.keys import is_chunk_key
 from deeplake.util.exceptions import (
     DirectoryAtPathException,
     FileAtPathException,
@@ -15,15 +19,19 @@ from deeplake.util.exceptions import (
 class LocalProvider(StorageProvider):
     """Provider class for using the local filesystem."""
 
-    def __init__(self, root: str):
+    def __init__(self, root: str, use_mmap: bool = False):
         """Initializes the LocalProvider.
 
         Example:
 
             >>> local_provider = LocalProvider("/home/ubuntu/Documents/")
+            >>> mmap_provider = LocalProvider("/home/ubuntu/Documents/", use_mmap=True)
 
         Args:
             root (str): The root of the provider. All read/write request keys will be appended to root."
+            use_mmap (bool): If True, chunks are memory mapped instead of being read into memory. Reading a chunk then returns
+                a read-only memoryview backed by the mapping, so that chunk data is only copied when it is modified.
+                Files are replaced atomically on write so that existing mappings stay valid. Defaults to False.
 
         Raises:
             FileAtPathException: If the root is a file instead of a directory.
@@ -31,11 +39,12 @@ class LocalProvider(StorageProvider):
         if os.path.isfile(root):
             raise FileAtPathException(root)
         self.root = root
+        self.use_mmap = use_mmap
         self.files: Optional[Set[str]] = None
         self._all_keys()
 
     def subdir(self, path: str, read_only: bool = False):
-        sd = self.__class__(os.path.join(self.root, path))
+        sd = self.__class__(os.path.join(self.root, path), use_mmap=self.use_mmap)
         sd.read_only = read_only
         return sd
 
@@ -51,7 +60,8 @@ class LocalProvider(StorageProvider):
             path (str): The path relative to the root of the provider.
 
         Returns:
-            bytes: The bytes of the object present at the path.
+            bytes: The bytes of the object present at the path. If `use_mmap` is True and the path is a chunk,
+            a read-only memoryview over the memory mapped file is returned instead.
 
         Raises:
             KeyError: If an object is not found at the path.
@@ -61,6 +71,8 @@ class LocalProvider(StorageProvider):
         try:
             full_path = self._check_is_file(path)
             with open(full_path, "rb") as file:
+                if self.use_mmap and is_chunk_key(path):
+                    return _mmap_file(file)
                 return file.read()
         except DirectoryAtPathException:
             raise
@@ -84,6 +96,21 @@ class LocalProvider(StorageProvider):
             FileAtPathException: If the directory to the path is a file instead of a directory.
             ReadOnlyError: If the provider is in read-only mode.
         """
+        # truncating a file in place would invalidate the views over its existing mappings,
+        # metas and encoders are also replaced atomically as they can be read by other processes while they are written
+        self._write(path, value, atomic=self.use_mmap or not is_chunk_key(path))
+
+    def write_atomic(self, path: str, value: bytes):
+        """Sets the object present at the path with the value like `__setitem__`, but always replaces the file atomically,
+        so that other processes never read a partially written object.
+
+        Args:
+            path (str): the path relative to the root of the provider.
+            value (bytes): the value to be assigned at the path.
+        """
+        self._write(path, value, atomic=True)
+
+    def _write(self, path: str, value: bytes, atomic: bool):
         self.check_readonly()
         full_path = self._check_is_file(path)
         directory = os.path.dirname(full_path)
@@ -91,8 +118,11 @@ class LocalProvider(StorageProvider):
             raise FileAtPathException(directory)
         if not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-        with open(full_path, "wb") as file:
-            file.write(value)
+        if atomic:
+            _atomic_write(full_path, value)
+        else:
+            with open(full_path, "wb") as file:
+                file.write(value)
         if self.files is not None:
             self.files.add(path)
 
@@ -217,10 +247,12 @@ class LocalProvider(StorageProvider):
         return os.path.exists(full_path)
 
     def __getstate__(self):
-        return self.root
+        return self.root, self.use_mmap
 
     def __setstate__(self, state):
-        self.__init__(state)
+        if isinstance(state, str):
+            state = (state,)
+        self.__init__(*state)
 
     def get_presigned_url(self, key: str) -> str:
         return os.path.join(self.root, key)
@@ -247,3 +279,26 @@ class LocalProvider(StorageProvider):
             raise
         except FileNotFoundError:
             raise KeyError(path)
+
+
+def _mmap_file(file) -> memoryview:
+    """Returns a read-only memoryview over a memory mapping of `file`."""
+    if os.fstat(file.fileno()).st_size == 0:
+        # empty files can not be mapped
+        return memoryview(b"")
+    kwargs = {"trackfd": False} if sys.version_info >= (3, 13) else {}
+    # without trackfd, every live mapping keeps a duplicate file descriptor open
+    return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ, **kwargs))
+
+
+def _atomic_write(full_path: str, value: bytes):
+    """Writes `value` to a temporary file next to `full_path` and moves it in place."""
+    tmp_path = f"{full_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(value)
+        os.replace(tmp_path, full_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
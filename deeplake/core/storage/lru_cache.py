@@ -1,9 +1,11 @@
 import sys
+import threading
 from collections import OrderedDict
+from deeplake.constants import DEFAULT_CACHE_NUM_SHARDS, PREFETCH_CONCURRENCY
 from deeplake.core.partial_reader import PartialReader
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
 from deeplake.core.chunk.base_chunk import BaseChunk
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from deeplake.core.storage.provider import StorageProvider
 
@@ -57,6 +59,10 @@ class LRUCache(StorageProvider):
 
         self.cache_used = 0
         self.deeplake_objects: Dict[str, DeepLakeMemoryObject] = {}
+
+        # keys being prefetched from next_storage, readers of these keys wait for the prefetch to finish
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._in_flight_lock = threading.Lock()
         # TODO: BRING THIS BACK AFTER ASYNC IS FIXED
         # self.use_async = (
         #     next_storage.async_supported()
@@ -206,15 +212,181 @@ class LRUCache(StorageProvider):
             self.lru_sizes.move_to_end(path)  # refresh position for LRU
             return self.cache_storage[path]
         else:
+            in_flight = self._in_flight.get(path)
+            if in_flight is not None:
+                in_flight.wait()
+                if self._is_cached(path):
+                    return self[path]
             if self.next_storage is not None:
                 # fetch from storage, may throw KeyError
                 result = self.next_storage[path]
 
                 if _get_nbytes(result) <= self.cache_size:  # insert in cache if it fits
-                    self._insert_in_cache(path, result)
+                    self._insert_fetched(path, result)
                 return result
             raise KeyError(path)
 
+    def get_items(self, paths: Sequence[str], ignore_errors: bool = False) -> Dict:
+        """Gets the objects present at multiple paths. Paths missing from the cache are fetched concurrently from next_storage
+        and stored in cache_storage (if possible).
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the underlying storage.
+            ignore_errors (bool): If True, paths that could not be fetched are left out of the result instead of raising.
+
+        Raises:
+            KeyError: If an object is not found at one of the paths and `ignore_errors` is False.
+
+        Returns:
+            Dict: Mapping from each fetched path to the object present at it.
+        """
+        paths = list(dict.fromkeys(paths))
+        items = {}
+        missing = []
+        for path in paths:
+            if self._is_cached(path):
+                items[path] = self[path]
+            else:
+                missing.append(path)
+        if missing:
+            if self.next_storage is not None:
+                fetched = self.next_storage.get_items(missing, ignore_errors)
+                for path, value in fetched.items():
+                    if _get_nbytes(value) <= self.cache_size:
+                        self._insert_fetched(path, value)
+                items.update(fetched)
+            elif not ignore_errors:
+                raise KeyError(missing[0])
+        return {path: items[path] for path in paths if path in items}
+
+    def set_items(self, items: Dict[str, Union[bytes, DeepLakeMemoryObject]]):
+        """Sets the objects at multiple paths in the cache. They are written to next_storage when the cache is flushed."""
+        for path, value in items.items():
+            self[path] = value
+
+    def copy_items(
+        self, paths: Dict[str, str], ignore_errors: bool = False
+    ) -> List[str]:
+        """Copies the objects at multiple paths to new paths.
+
+        Objects fully present in the cache are written to next_storage from the cache with a single concurrent batch, and
+        their copies are kept in the cache. The other objects are copied by next_storage, which copies them without reading
+        them when it can, so the cost of a copy doesn't grow with the number of objects.
+
+        Args:
+            paths (Dict[str, str]): Mapping from each source path to the path it is copied to, relative to the root of the underlying storage.
+            ignore_errors (bool): If True, source paths that are not found are skipped instead of raising.
+
+        Returns:
+            List[str]: The source paths that were copied.
+
+        Raises:
+            KeyError: If a source path is not found and `ignore_errors` is False.
+        """
+        self.check_readonly()
+        cached = {}
+        remote = {}
+        for src, dest in paths.items():
+            if self._has_all_bytes(src):
+                cached[dest] = obj_to_bytes(self[src])
+            else:
+                remote[src] = dest
+        if self.next_storage is None:
+            self.set_items(cached)
+            if remote and not ignore_errors:
+                raise KeyError(next(iter(remote)))
+            copied = set()
+        else:
+            self.next_storage.set_items(cached)
+            for dest, value in cached.items():
+                self.remove_from_cache(dest)
+                if _get_nbytes(value) <= self.cache_size:
+                    self._insert_fetched(dest, value)
+            copied = set(self.next_storage.copy_items(remote, ignore_errors))
+            for src in copied:
+                self.remove_from_cache(remote[src])
+        return [src for src in paths if paths[src] in cached or src in copied]
+
+    def prefetch(
+        self, paths: Sequence[str], sizes: Optional[Sequence[int]] = None
+    ) -> int:
+        """Fetches the objects at `paths` that are missing from the cache concurrently from next_storage and stores them in
+        cache_storage, so that subsequent reads are served from the cache.
+
+        Each path is admitted before it is fetched, and prefetching stops at the first path that doesn't fit in the cache
+        along with the paths admitted before it, whether these are fetched or already cached, as it would evict them before
+        they are read. Paths are admitted by their `sizes` if these are given, otherwise by the size of the largest object
+        fetched so far, the first object being fetched on its own. Paths already being fetched by another prefetch are
+        admitted but not fetched again. Errors are ignored here, they are raised when the object is read.
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the underlying storage, in the order they will be read.
+            sizes (Sequence[int], optional): The sizes of the objects at `paths`, or upper bounds of them.
+
+        Returns:
+            int: The number of distinct leading `paths` that were admitted.
+        """
+        if self.next_storage is None:
+            return 0
+        expected = dict(zip(paths, sizes)) if sizes is not None else {}
+        paths = list(dict.fromkeys(paths))
+        # bytes admitted to each part of the cache, estimated until the objects are fetched
+        used: Dict[int, int] = {}
+        estimates: Dict[str, int] = {}
+        largest = 0
+        admitted = 0
+        while admitted < len(paths):
+            batch: List[str] = []
+            end = admitted
+            with self._in_flight_lock:
+                while end < len(paths) and len(batch) < PREFETCH_CONCURRENCY:
+                    path = paths[end]
+                    size = expected.get(path)
+                    if size is None:
+                        if batch and not largest:
+                            break
+                        size = largest
+                    part, capacity = self._prefetch_budget(path)
+                    if used.get(part, 0) + size > capacity:
+                        break
+                    used[part] = used.get(part, 0) + size
+                    end += 1
+                    if not self._is_cached(path) and path not in self._in_flight:
+                        self._in_flight[path] = threading.Event()
+                        estimates[path] = size
+                        batch.append(path)
+            if end == admitted:
+                break
+            try:
+                if batch:
+                    fetched = self.next_storage.get_items(batch, ignore_errors=True)
+                    for path, value in fetched.items():
+                        nbytes = _get_nbytes(value)
+                        largest = max(largest, nbytes)
+                        part, capacity = self._prefetch_budget(path)
+                        used[part] += nbytes - estimates[path]
+                        if used[part] <= capacity:
+                            self._insert_fetched(path, value)
+            finally:
+                self._finish_prefetch(batch)
+            admitted = end
+        return admitted
+
+    def _prefetch_budget(self, path: str) -> Tuple[int, int]:
+        """Returns the part of the cache that `path` is stored in and its size, against which prefetched objects are admitted."""
+        return 0, self.cache_size
+
+    def _is_cached(self, path: str) -> bool:
+        return path in self.lru_sizes or path in self.deeplake_objects
+
+    def _finish_prefetch(self, paths: Sequence[str]):
+        """Marks `paths` as no longer in flight and wakes up the readers waiting for them."""
+        with self._in_flight_lock:
+            for path in paths:
+                in_flight = self._in_flight.pop(path, None)
+                if in_flight is not None:
+                    in_flight.set()
+
     def get_bytes(
         self,
         path: str,
@@ -239,11 +411,7 @@ class LRUCache(StorageProvider):
             if path in self.lru_sizes:
                 self.lru_sizes.move_to_end(path)  # refresh position for LRU
             return self.deeplake_objects[path].tobytes()[start_byte:end_byte]
-        # if it is a partially read chunk in the cache, to get new bytes, we need to look at actual storage and not the cache
-        elif path in self.lru_sizes and not (
-            isinstance(self.cache_storage[path], BaseChunk)
-            and self.cache_storage[path].is_partially_read_chunk
-        ):
+        elif self._has_all_bytes(path):
             self.lru_sizes.move_to_end(path)  # refresh position for LRU
             return self.cache_storage[path][start_byte:end_byte]
         else:
@@ -251,6 +419,38 @@ class LRUCache(StorageProvider):
                 return self.next_storage.get_bytes(path, start_byte, end_byte)
             raise KeyError(path)
 
+    def _has_all_bytes(self, path: str) -> bool:
+        """Whether all the bytes of the object at `path` are in the cache."""
+        if path in self.deeplake_objects:
+            return True
+        # if it is a partially read chunk in the cache, to get new bytes, we need to look at actual storage and not the cache
+        return path in self.lru_sizes and not (
+            isinstance(self.cache_storage[path], BaseChunk)
+            and self.cache_storage[path].is_partially_read_chunk
+        )
+
+    def get_byte_ranges(
+        self, path: str, ranges: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        """Gets multiple byte ranges of the object present at the path. Ranges of objects that are not fully cached are
+        fetched concurrently from next_storage.
+
+        Args:
+            path (str): The path relative to the root of the provider.
+            ranges (Sequence[Tuple[int, int]]): The (start_byte, end_byte) ranges to get.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the same order as `ranges`.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+        """
+        if self._has_all_bytes(path):
+            return [self.get_bytes(path, start, end) for start, end in ranges]
+        if self.next_storage is not None:
+            return self.next_storage.get_byte_ranges(path, ranges)
+        raise KeyError(path)
+
     def __setitem__(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
         """Puts the item in the cache_storage (if possible), else writes to next_storage.
 
@@ -318,11 +518,8 @@ class LRUCache(StorageProvider):
         self.clear_cache_without_flush()
 
     def clear_cache_without_flush(self):
-        self.cache_used = 0
-        self.lru_sizes.clear()
-        self.dirty_keys.clear()
+        self._clear_state()
         self.cache_storage.clear()
-        self.deeplake_objects.clear()
         if self.next_storage is not None and hasattr(self.next_storage, "clear_cache"):
             self.next_storage.clear_cache()
 
@@ -331,6 +528,13 @@ class LRUCache(StorageProvider):
         This is an IRREVERSIBLE operation. Data once deleted can not be recovered.
         """
         self.check_readonly()
+        self._clear_state(prefix)
+        self.cache_storage.clear(prefix=prefix)
+        if self.next_storage is not None:
+            self.next_storage.clear(prefix=prefix)
+
+    def _clear_state(self, prefix=""):
+        """Forgets the keys starting with `prefix` (all keys if empty) without touching cache_storage or next_storage."""
         if prefix:
             rm = [path for path in self.deeplake_objects if path.startswith(prefix)]
             for path in rm:
@@ -347,9 +551,16 @@ class LRUCache(StorageProvider):
             self.dirty_keys.clear()
             self.deeplake_objects.clear()
 
-        self.cache_storage.clear(prefix=prefix)
-        if self.next_storage is not None:
-            self.next_storage.clear(prefix=prefix)
+    def remove_from_cache(self, path: str):
+        """Removes `path` from cache_storage without writing it to next_storage, discarding any unflushed changes."""
+        self.dirty_keys.pop(path, None)
+        if path in self.lru_sizes:
+            size = self.lru_sizes.pop(path)
+            self.cache_used -= size
+        try:
+            del self.cache_storage[path]
+        except KeyError:
+            pass
 
     def __len__(self):
         """Returns the number of files present in the cache and the underlying storage.
@@ -421,6 +632,10 @@ class LRUCache(StorageProvider):
 
         self.update_used_cache_for_path(path, _get_nbytes(value))
 
+    def _insert_fetched(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
+        """Helper function that adds a key value pair read from next_storage to the cache."""
+        self._insert_in_cache(path, value)
+
     def _all_keys(self):
         """Helper function that lists all the objects present in the cache and the underlying storage.
 
@@ -473,6 +688,8 @@ class LRUCache(StorageProvider):
         self.dirty_keys = OrderedDict()
         self.cache_used = 0
         self.deeplake_objects = {}
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
 
     def get_object_size(self, key: str) -> int:
         if key in self.deeplake_objects:
@@ -484,3 +701,283 @@ class LRUCache(StorageProvider):
             if self.next_storage is not None:
                 return self.next_storage.get_object_size(key)
             raise
+
+
+class ShardedLRUCache(LRUCache):
+    """LRU Cache that can be shared between threads.
+
+    Keys are split between shards by hash. Each shard is an `LRUCache` with its own lock, LRU order and a `1 / num_shards` share
+    of `cache_size`, so threads reading keys in different shards don't contend with each other. All shards use the same
+    cache_storage and next_storage, and keep the flush and dirty key semantics of `LRUCache`.
+    """
+
+    def __init__(
+        self,
+        cache_storage: StorageProvider,
+        next_storage: Optional[StorageProvider],
+        cache_size: int,
+        num_shards: int = DEFAULT_CACHE_NUM_SHARDS,
+    ):
+        """Initializes the ShardedLRUCache.
+
+        Args:
+            cache_storage (StorageProvider): The storage being used as the caching layer of the cache.
+                This should be a base provider such as MemoryProvider, LocalProvider or S3Provider but not another LRUCache.
+            next_storage (StorageProvider): The next storage layer of the cache. If it is a cache, it should be thread safe as well.
+            cache_size (int): The total space that can be used from the cache_storage in bytes, split evenly between the shards.
+            num_shards (int): Number of shards. Defaults to `DEFAULT_CACHE_NUM_SHARDS`.
+
+        Raises:
+            ValueError: If `num_shards` is not positive.
+        """
+        if num_shards <= 0:
+            raise ValueError(f"`num_shards` should be > 0. Got: {num_shards}")
+        self.next_storage = next_storage
+        self.cache_storage = cache_storage
+        self.cache_size = cache_size
+        self.num_shards = num_shards
+        self.shards = [
+            LRUCache(cache_storage, next_storage, cache_size // num_shards)
+            for _ in range(num_shards)
+        ]
+        self._locks = [threading.RLock() for _ in range(num_shards)]
+        self._read_only = False
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self.use_async = False
+
+    @property
+    def read_only(self):  # type: ignore
+        return self._read_only
+
+    @read_only.setter
+    def read_only(self, value: bool):
+        self._read_only = value
+        for shard in self.shards:
+            shard.read_only = value
+
+    def _shard(self, path: str):
+        i = hash(path) % self.num_shards
+        return self.shards[i], self._locks[i]
+
+    @property
+    def lru_sizes(self) -> Dict[str, int]:  # type: ignore
+        """Snapshot of the sizes of the keys in all shards."""
+        return {k: v for shard in self.shards for k, v in shard.lru_sizes.items()}
+
+    @property
+    def dirty_keys(self) -> Dict[str, None]:  # type: ignore
+        """Snapshot of the dirty keys of all shards."""
+        return {k: None for shard in self.shards for k in shard.dirty_keys}
+
+    @property
+    def deeplake_objects(self) -> Dict[str, DeepLakeMemoryObject]:  # type: ignore
+        """Snapshot of the DeepLakeMemoryObjects of all shards."""
+        return {
+            k: v for shard in self.shards for k, v in shard.deeplake_objects.items()
+        }
+
+    @property
+    def cache_used(self) -> int:  # type: ignore
+        return sum(shard.cache_used for shard in self.shards)
+
+    def _is_cached(self, path: str) -> bool:
+        shard, _ = self._shard(path)
+        return path in shard.lru_sizes or path in shard.deeplake_objects
+
+    def register_deeplake_object(self, path: str, obj: DeepLakeMemoryObject):
+        shard, lock = self._shard(path)
+        with lock:
+            shard.register_deeplake_object(path, obj)
+
+    def clear_deeplake_objects(self):
+        for shard, lock in zip(self.shards, self._locks):
+            with lock:
+                shard.clear_deeplake_objects()
+
+    def remove_deeplake_object(self, path: str):
+        shard, lock = self._shard(path)
+        with lock:
+            shard.remove_deeplake_object(path)
+
+    def update_used_cache_for_path(self, path: str, new_size: int):
+        shard, lock = self._shard(path)
+        with lock:
+            shard.update_used_cache_for_path(path, new_size)
+
+    def flush(self):
+        """Writes the dirty keys of all shards from cache_storage to next_storage."""
+        self.check_readonly()
+        for shard, lock in zip(self.shards, self._locks):
+            with lock:
+                shard.flush()
+
+    def get_deeplake_object(
+        self,
+        path: str,
+        expected_class,
+        meta: Optional[Dict] = None,
+        url=False,
+        partial_bytes: int = 0,
+    ):
+        self._wait_for_prefetch(path)
+        shard, lock = self._shard(path)
+        with lock:
+            return shard.get_deeplake_object(
+                path, expected_class, meta, url=url, partial_bytes=partial_bytes
+            )
+
+    def _wait_for_prefetch(self, path: str):
+        # waiting has to happen outside the shard lock, which the prefetching thread needs to insert the data
+        in_flight = self._in_flight.get(path)
+        if in_flight is not None:
+            in_flight.wait()
+
+    def __getitem__(self, path: str):
+        self._wait_for_prefetch(path)
+        shard, lock = self._shard(path)
+        with lock:
+            if (
+                path in shard.lru_sizes
+                or path in shard.deeplake_objects
+                or self.next_storage is None
+            ):
+                return shard[path]
+        # the shard isn't locked while the object is fetched, so that other threads can use it
+        result = self.next_storage[path]
+        self._insert_if_fits(path, result)
+        return result
+
+    def get_items(self, paths: Sequence[str], ignore_errors: bool = False) -> Dict:
+        paths = list(dict.fromkeys(paths))
+        items = {}
+        missing = []
+        for path in paths:
+            shard, lock = self._shard(path)
+            with lock:
+                if path in shard.lru_sizes or path in shard.deeplake_objects:
+                    items[path] = shard[path]
+                    continue
+            missing.append(path)
+        if missing:
+            if self.next_storage is not None:
+                fetched = self.next_storage.get_items(missing, ignore_errors)
+                for path, value in fetched.items():
+                    self._insert_if_fits(path, value)
+                items.update(fetched)
+            elif not ignore_errors:
+                raise KeyError(missing[0])
+        return {path: items[path] for path in paths if path in items}
+
+    def _prefetch_budget(self, path: str) -> Tuple[int, int]:
+        i = hash(path) % self.num_shards
+        return i, self.shards[i].cache_size
+
+    def _insert_fetched(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
+        self._insert_if_fits(path, value)
+
+    def _insert_if_fits(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
+        shard, lock = self._shard(path)
+        with lock:
+            if (
+                path not in shard.lru_sizes
+                and path not in shard.deeplake_objects
+                and _get_nbytes(value) <= shard.cache_size
+            ):
+                shard._insert_in_cache(path, value)
+
+    def get_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        self._wait_for_prefetch(path)
+        shard, lock = self._shard(path)
+        with lock:
+            return shard.get_bytes(path, start_byte, end_byte)
+
+    def get_byte_ranges(
+        self, path: str, ranges: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        self._wait_for_prefetch(path)
+        shard, lock = self._shard(path)
+        with lock:
+            if shard._has_all_bytes(path):
+                return [shard.get_bytes(path, start, end) for start, end in ranges]
+        # the shard isn't locked while the ranges are fetched, so that other threads can use it
+        if self.next_storage is not None:
+            return self.next_storage.get_byte_ranges(path, ranges)
+        raise KeyError(path)
+
+    def __setitem__(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
+        self.check_readonly()
+        shard, lock = self._shard(path)
+        with lock:
+            shard[path] = value
+        self.maybe_flush()
+
+    def __delitem__(self, path: str):
+        self.check_readonly()
+        shard, lock = self._shard(path)
+        with lock:
+            del shard[path]
+
+    def remove_from_cache(self, path: str):
+        shard, lock = self._shard(path)
+        with lock:
+            shard.remove_from_cache(path)
+
+    def clear_cache_without_flush(self):
+        self._clear_state()
+        self.cache_storage.clear()
+        if self.next_storage is not None and hasattr(self.next_storage, "clear_cache"):
+            self.next_storage.clear_cache()
+
+    def _clear_state(self, prefix=""):
+        for shard, lock in zip(self.shards, self._locks):
+            with lock:
+                shard._clear_state(prefix)
+
+    def _forward(self, path):
+        shard, lock = self._shard(path)
+        with lock:
+            shard._forward(path)
+
+    def _forward_value(self, path, value):
+        shard, lock = self._shard(path)
+        with lock:
+            shard._forward_value(path, value)
+
+    def _insert_in_cache(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
+        shard, lock = self._shard(path)
+        with lock:
+            shard._insert_in_cache(path, value)
+
+    def _all_keys(self):
+        key_set = set()
+        if self.next_storage is not None:
+            key_set = self.next_storage._all_keys()  # type: ignore
+        key_set = set().union(key_set, self.cache_storage._all_keys())
+        for path, obj in self.deeplake_objects.items():
+            if obj.is_dirty:
+                key_set.add(path)
+        return key_set
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["num_shards"] = self.num_shards
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(  # type: ignore
+            state["cache_storage"],
+            state["next_storage"],
+            state["cache_size"],
+            state["num_shards"],
+        )
+
+    def get_object_size(self, key: str) -> int:
+        shard, lock = self._shard(key)
+        with lock:
+            return shard.get_object_size(key)
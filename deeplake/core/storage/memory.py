@@ -33,6 +33,22 @@ class MemoryProvider(StorageProvider):
         """
         return self.dict[path]
 
+    def get_items(self, paths, ignore_errors: bool = False) -> Dict[str, Any]:
+        """Gets the objects present at multiple paths. Objects are already in memory, so no threads are used."""
+        items = {}
+        for path in paths:
+            try:
+                items[path] = self.dict[path]
+            except KeyError:
+                if not ignore_errors:
+                    raise
+        return items
+
+    def set_items(self, items: Dict[str, Any]):
+        """Sets the objects at multiple paths. Objects are stored in memory, so no threads are used."""
+        self.check_readonly()
+        self.dict.update(items)
+
     def __setitem__(
         self,
         path: str,
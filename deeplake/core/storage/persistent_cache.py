@@ -0,0 +1,334 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from deeplake.constants import (
+    DEFAULT_CACHE_EVICTION_POLICY,
+    PERSISTENT_CACHE_ACCESS_BATCH_SIZE,
+)
+from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.storage.local import LocalProvider
+from deeplake.core.storage.lru_cache import LRUCache, _get_nbytes
+from deeplake.core.storage.provider import StorageProvider
+from deeplake.util.keys import get_chunk_commit_id, is_chunk_key
+
+
+# order in which the entries are evicted for each eviction policy
+EVICTION_POLICIES = {
+    "lru": "last_access",
+    "lfu": "hits, last_access",
+}
+
+
+class PersistentLRUCache(LRUCache):
+    """Cache over a local directory whose chunks persist across processes and restarts.
+
+    Chunks read from next_storage are written atomically to cache_storage and recorded in an sqlite index next to it, which
+    keeps their sizes, their total size and access statistics, so that the eviction order survives restarts. Several
+    processes can share the same directory: the index is only updated in transactions, and a chunk whose file was evicted
+    by another process is simply read from next_storage again.
+
+    Only chunks of the commits in `committed` are persisted, as chunks of a head node can still be changed by other
+    sessions. The dataset adds the ids of its committed nodes to `committed` as it loads and commits them.
+
+    Cache hits are recorded in memory and written to the index in batches, so that reads don't contend for its write lock.
+
+    Other keys, as well as chunks of head nodes and chunks written through the cache, are cached for the lifetime of the
+    cache like in `LRUCache`.
+    """
+
+    def __init__(
+        self,
+        cache_storage: LocalProvider,
+        next_storage: Optional[StorageProvider],
+        cache_size: int,
+        eviction_policy: str = DEFAULT_CACHE_EVICTION_POLICY,
+    ):
+        """Initializes the PersistentLRUCache.
+
+        Args:
+            cache_storage (LocalProvider): The directory used as the caching layer.
+            next_storage (StorageProvider): The next storage layer of the cache.
+            cache_size (int): The total space that can be used from the cache_storage in bytes, shared by all the processes
+                using the same directory.
+            eviction_policy (str): "lru" to evict the least recently used chunks first or "lfu" to evict the least frequently
+                used chunks first. Defaults to `DEFAULT_CACHE_EVICTION_POLICY`.
+
+        Raises:
+            ValueError: If `cache_storage` is not a LocalProvider or `eviction_policy` is invalid.
+        """
+        if not isinstance(cache_storage, LocalProvider):
+            raise ValueError("`cache_storage` should be a LocalProvider.")
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"`eviction_policy` should be one of {list(EVICTION_POLICIES)}. Got: {eviction_policy}"
+            )
+        super().__init__(cache_storage, next_storage, cache_size)
+        self.eviction_policy = eviction_policy
+        root = os.path.normpath(os.path.expanduser(cache_storage.root))
+        self.index_path = f"{root}.index"
+        self._index_lock = threading.Lock()
+        self._index: Optional[sqlite3.Connection] = None
+        self._index_pid: Optional[int] = None
+        # accesses not yet written to the index, key -> (last access time, number of hits)
+        self._accesses: Dict[str, Tuple[float, int]] = {}
+        # ids of the commits whose chunks can no longer change
+        self.committed: Set[str] = set()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the connection to the index, should be called with `_index_lock` held."""
+        # sqlite connections can't be used by forked processes (e.g. dataloader workers), so each process opens its own
+        if self._index is None or self._index_pid != os.getpid():
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            index = sqlite3.connect(
+                self.index_path,
+                timeout=60,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            index.execute("PRAGMA journal_mode=WAL")
+            index.execute("PRAGMA synchronous=NORMAL")
+            index.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL, hits INTEGER NOT NULL)"
+            )
+            # running total of the sizes in entries, updated in the same transactions as entries
+            index.execute(
+                "CREATE TABLE IF NOT EXISTS usage "
+                "(id INTEGER PRIMARY KEY CHECK (id = 0), used INTEGER NOT NULL)"
+            )
+            index.execute(
+                "INSERT OR IGNORE INTO usage VALUES "
+                "(0, (SELECT COALESCE(SUM(size), 0) FROM entries))"
+            )
+            self._index = index
+            self._index_pid = os.getpid()
+            self._accesses = {}
+        return self._index
+
+    @contextmanager
+    def _transaction(self):
+        """Yields the connection to the index within a write transaction, should be used with `_index_lock` held."""
+        index = self._connection()
+        index.execute("BEGIN IMMEDIATE")
+        try:
+            yield index
+            index.execute("COMMIT")
+        except BaseException:
+            index.execute("ROLLBACK")
+            raise
+
+    def _write_accesses(self, index: sqlite3.Connection):
+        """Writes the pending accesses to the index, should be called within a transaction."""
+        if self._accesses:
+            index.executemany(
+                "UPDATE entries SET last_access = MAX(last_access, ?), hits = hits + ? WHERE key = ?",
+                [(t, hits, key) for key, (t, hits) in self._accesses.items()],
+            )
+            self._accesses = {}
+
+    def _flush_accesses(self):
+        """Writes the pending accesses to the index."""
+        with self._index_lock:
+            if self._accesses:
+                with self._transaction() as index:
+                    self._write_accesses(index)
+
+    def _is_persistent(self, path: str) -> bool:
+        """Whether `path` is handled by the persistent index rather than the in-memory LRU state."""
+        return (
+            is_chunk_key(path)
+            and get_chunk_commit_id(path) in self.committed
+            and not super()._is_cached(path)
+        )
+
+    def _is_cached(self, path: str) -> bool:
+        if not self._is_persistent(path):
+            return super()._is_cached(path)
+        with self._index_lock:
+            row = (
+                self._connection()
+                .execute("SELECT 1 FROM entries WHERE key = ?", (path,))
+                .fetchone()
+            )
+        return row is not None
+
+    def _touch(self, path: str) -> bool:
+        """Records an access to `path`, which is written to the index with the next batch of accesses.
+        Returns False if `path` is not in the index."""
+        with self._index_lock:
+            row = (
+                self._connection()
+                .execute("SELECT 1 FROM entries WHERE key = ?", (path,))
+                .fetchone()
+            )
+            if row is None:
+                return False
+            _, hits = self._accesses.get(path, (0.0, 0))
+            self._accesses[path] = (time.time(), hits + 1)
+            if len(self._accesses) >= PERSISTENT_CACHE_ACCESS_BATCH_SIZE:
+                with self._transaction() as index:
+                    self._write_accesses(index)
+        return True
+
+    def _forget(self, paths: Sequence[str]):
+        """Removes `paths` from the index."""
+        with self._index_lock:
+            with self._transaction() as index:
+                for path in paths:
+                    self._accesses.pop(path, None)
+                    index.execute(
+                        "UPDATE usage SET used = used - "
+                        "COALESCE((SELECT size FROM entries WHERE key = ?), 0)",
+                        (path,),
+                    )
+                    index.execute("DELETE FROM entries WHERE key = ?", (path,))
+
+    def _remove_files(self, paths: Sequence[str]):
+        for path in paths:
+            try:
+                del self.cache_storage[path]
+            except KeyError:
+                pass
+
+    def _persist(self, path: str, value: Union[bytes, memoryview]):
+        """Writes a chunk to cache_storage and records it in the index, evicting other chunks if the cache is full."""
+        size = _get_nbytes(value)
+        if size > self.cache_size:
+            return
+        # the file is written atomically before it is indexed, so that indexed chunks are always complete
+        self.cache_storage.write_atomic(path, value)
+        evicted = []
+        with self._index_lock:
+            with self._transaction() as index:
+                # the eviction order takes the pending accesses into account
+                self._write_accesses(index)
+                index.execute(
+                    "UPDATE usage SET used = used + ? - "
+                    "COALESCE((SELECT size FROM entries WHERE key = ?), 0)",
+                    (size, path),
+                )
+                index.execute(
+                    "INSERT OR REPLACE INTO entries VALUES "
+                    "(?, ?, ?, COALESCE((SELECT hits FROM entries WHERE key = ?), 0) + 1)",
+                    (path, size, time.time(), path),
+                )
+                used = index.execute("SELECT used FROM usage").fetchone()[0]
+                if used > self.cache_size:
+                    order = EVICTION_POLICIES[self.eviction_policy]
+                    freed = 0
+                    for key, entry_size in index.execute(
+                        f"SELECT key, size FROM entries WHERE key != ? ORDER BY {order}",
+                        (path,),
+                    ):
+                        if used - freed <= self.cache_size:
+                            break
+                        evicted.append(key)
+                        freed += entry_size
+                    index.executemany(
+                        "DELETE FROM entries WHERE key = ?", [(key,) for key in evicted]
+                    )
+                    index.execute("UPDATE usage SET used = used - ?", (freed,))
+        # files are removed after they are unindexed, readers that still find them in the index treat them as misses
+        self._remove_files(evicted)
+
+    def _insert_fetched(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
+        if self._is_persistent(path) and not isinstance(value, DeepLakeMemoryObject):
+            self._persist(path, value)
+        else:
+            super()._insert_fetched(path, value)
+
+    def __getitem__(self, path: str):
+        if self._is_persistent(path) and self._touch(path):
+            try:
+                return self.cache_storage[path]
+            except KeyError:  # evicted by another process
+                self._forget([path])
+        return super().__getitem__(path)
+
+    def get_bytes(
+        self,
+        path: str,
+        start_byte: Optional[int] = None,
+        end_byte: Optional[int] = None,
+    ):
+        if self._is_persistent(path) and self._touch(path):
+            try:
+                return self.cache_storage.get_bytes(path, start_byte, end_byte)
+            except KeyError:  # evicted by another process
+                self._forget([path])
+        return super().get_bytes(path, start_byte, end_byte)
+
+    def get_byte_ranges(
+        self, path: str, ranges: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        if self._is_persistent(path) and self._touch(path):
+            try:
+                return [
+                    self.cache_storage.get_bytes(path, start, end)
+                    for start, end in ranges
+                ]
+            except KeyError:  # evicted by another process
+                self._forget([path])
+        return super().get_byte_ranges(path, ranges)
+
+    def __setitem__(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
+        self.check_readonly()
+        if self._is_persistent(path):
+            # the chunk is tracked in memory from now on, as the cached file will be overwritten
+            self._forget([path])
+        super().__setitem__(path, value)
+
+    def __delitem__(self, path: str):
+        self.check_readonly()
+        if self._is_persistent(path):
+            self._forget([path])
+            self._remove_files([path])
+        super().__delitem__(path)
+
+    def remove_from_cache(self, path: str):
+        if is_chunk_key(path):
+            self._forget([path])
+        super().remove_from_cache(path)
+
+    def _clear_state(self, prefix=""):
+        super()._clear_state(prefix)
+        with self._index_lock:
+            self._accesses = {
+                key: access
+                for key, access in self._accesses.items()
+                if not key.startswith(prefix)
+            }
+            with self._transaction() as index:
+                index.execute(
+                    "UPDATE usage SET used = used - (SELECT COALESCE(SUM(size), 0) "
+                    "FROM entries WHERE substr(key, 1, ?) = ?)",
+                    (len(prefix), prefix),
+                )
+                index.execute(
+                    "DELETE FROM entries WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+
+    def flush(self):
+        self._flush_accesses()
+        super().flush()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._flush_accesses()
+        state = super().__getstate__()
+        state["eviction_policy"] = self.eviction_policy
+        state["committed"] = self.committed
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(  # type: ignore
+            state["cache_storage"],
+            state["next_storage"],
+            state["cache_size"],
+            state["eviction_policy"],
+        )
+        self.committed = state["committed"]
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
-from typing import Optional, Set, Sequence, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Sequence, Dict, Tuple
 
-from deeplake.constants import BYTE_PADDING
+from deeplake.constants import BYTE_PADDING, PREFETCH_CONCURRENCY
 from deeplake.util.assert_byte_indexes import assert_byte_indexes
 from deeplake.util.exceptions import ReadOnlyModeError
 from deeplake.util.keys import get_dataset_lock_key
@@ -72,6 +73,104 @@ class StorageProvider(ABC, MutableMapping):
         assert_byte_indexes(start_byte, end_byte)
         return self[path][start_byte:end_byte]
 
+    def get_items(self, paths: Sequence[str], ignore_errors: bool = False) -> Dict:
+        """Gets the objects present at multiple paths, fetching them concurrently using a thread pool.
+        Providers with an async client should override this method.
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the provider.
+            ignore_errors (bool): If True, paths that could not be fetched are left out of the result instead of raising.
+
+        Returns:
+            Dict: Mapping from each fetched path to the bytes of the object present at it.
+        """
+        paths = list(dict.fromkeys(paths))
+        missing = object()
+
+        def get(path):
+            try:
+                return self[path]
+            except Exception:
+                if ignore_errors:
+                    return missing
+                raise
+
+        if len(paths) <= 1:
+            values = list(map(get, paths))
+        else:
+            with ThreadPoolExecutor(min(len(paths), PREFETCH_CONCURRENCY)) as executor:
+                values = list(executor.map(get, paths))
+        return {
+            path: value for path, value in zip(paths, values) if value is not missing
+        }
+
+    def set_items(self, items: Dict[str, bytes]):
+        """Sets the objects at multiple paths, writing them concurrently using a thread pool.
+        Providers with an async client should override this method.
+
+        Args:
+            items (Dict[str, bytes]): Mapping from each path relative to the root of the provider to the value to set at it.
+        """
+
+        def set_item(item):
+            self[item[0]] = item[1]
+
+        items_list = list(items.items())
+        if len(items_list) <= 1:
+            list(map(set_item, items_list))
+        else:
+            with ThreadPoolExecutor(
+                min(len(items_list), PREFETCH_CONCURRENCY)
+            ) as executor:
+                list(executor.map(set_item, items_list))
+
+    def copy_items(
+        self, paths: Dict[str, str], ignore_errors: bool = False
+    ) -> List[str]:
+        """Copies the objects at multiple paths to new paths, with a concurrent read of all the objects followed by a
+        concurrent write of all the copies. Providers that can copy objects without reading them should override this method.
+
+        Args:
+            paths (Dict[str, str]): Mapping from each source path to the path it is copied to, relative to the root of the provider.
+            ignore_errors (bool): If True, source paths that could not be read are skipped instead of raising.
+
+        Returns:
+            List[str]: The source paths that were copied.
+        """
+        self.check_readonly()
+        values = self.get_items(list(paths), ignore_errors)
+        self.set_items({paths[path]: value for path, value in values.items()})
+        return list(values)
+
+    def get_byte_ranges(
+        self, path: str, ranges: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        """Gets multiple byte ranges of the object present at the path, fetching them concurrently using a thread pool.
+
+        Args:
+            path (str): The path relative to the root of the provider.
+            ranges (Sequence[Tuple[int, int]]): The (start_byte, end_byte) ranges to get.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the same order as `ranges`.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+        """
+
+        def get(byte_range):
+            return self.get_bytes(path, *byte_range)
+
+        if len(ranges) <= 1:
+            return list(map(get, ranges))
+        with ThreadPoolExecutor(min(len(ranges), PREFETCH_CONCURRENCY)) as executor:
+            return list(executor.map(get, ranges))
+
+    def prefetch(self, paths: Sequence[str]):
+        """Only needs to be implemented for caches. Fetches the objects at `paths` ahead of time so that subsequent reads are served from the cache.
+        Should be a no op for Base Storage Providers like local, s3, azure, gcs, etc.
+        """
+
     @abstractmethod
     def __setitem__(self, path: str, value: bytes):
         """Sets the object present at the path with the value
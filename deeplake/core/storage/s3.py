@@ -4,10 +4,12 @@ import time
 import boto3
 import botocore  # type: ignore
 import posixpath
-from typing import Dict, Optional, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 from datetime import datetime
 from botocore.session import ComponentLocator
 from deeplake.client.client import DeepLakeBackendClient
+from deeplake.constants import PREFETCH_CONCURRENCY
 from deeplake.core.storage.provider import StorageProvider
 from deeplake.util.exceptions import (
     S3GetAccessError,
@@ -641,6 +643,56 @@ class S3Provider(StorageProvider):
         except Exception as err:
             raise S3GetError(err) from err
 
+    def _get_items(self, paths: Sequence[str], ignore_errors: bool) -> Dict:
+        async def get_item_async(client, semaphore, path):
+            async with semaphore:
+                resp = await client.get_object(Bucket=self.bucket, Key=self.path + path)
+                async with resp["Body"] as stream:
+                    return await stream.read()
+
+        async def get_items_async(paths):
+            semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+            async with self.async_session.client("s3", **self.s3_kwargs) as client:
+                return await asyncio.gather(
+                    *(get_item_async(client, semaphore, path) for path in paths),
+                    return_exceptions=True,
+                )
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            values = loop.run_until_complete(get_items_async(paths))
+        finally:
+            loop.close()
+        items = {}
+        for path, value in zip(paths, values):
+            if isinstance(value, Exception):
+                if not ignore_errors:
+                    raise value
+            else:
+                items[path] = value
+        return items
+
+    def get_items(self, paths: Sequence[str], ignore_errors: bool = False) -> Dict:
+        """Gets the objects present at multiple paths, fetching them concurrently using the async client if available.
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the S3Provider.
+            ignore_errors (bool): If True, paths that could not be fetched are left out of the result instead of raising.
+
+        Returns:
+            Dict: Mapping from each fetched path to the bytes of the object present at it.
+        """
+        paths = list(dict.fromkeys(paths))
+        if len(paths) <= 1 or not self.async_supported():
+            return super().get_items(paths, ignore_errors)
+        self._check_update_creds()
+        try:
+            return self._get_items(paths, ignore_errors)
+        except Exception:
+            # fall back to synchronous reads, which reload credentials, retry and raise the appropriate errors
+            return super().get_items(paths, ignore_errors)
+
     def _set_items(self, items: dict):
         async def set_items_async(items):
             async with self.async_session.client("s3", **self.s3_kwargs) as client:
@@ -660,6 +712,18 @@ class S3Provider(StorageProvider):
         loop.run_until_complete(set_items_async(items))
 
     def set_items(self, items: dict):
+        """Sets the objects at multiple paths, writing them concurrently using the async client if available.
+
+        Args:
+            items (dict): Mapping from each path relative to the root of the S3Provider to the value to set at it.
+
+        Raises:
+            S3SetError: Any S3 error encountered while setting the values.
+        """
+        self.check_readonly()
+        if len(items) <= 1 or not self.async_supported():
+            return super().set_items(items)
+        self._check_update_creds()
         try:
             self._set_items(items)
         except botocore.exceptions.ClientError as err:
@@ -680,3 +744,50 @@ class S3Provider(StorageProvider):
             raise S3SetError(err) from err
         except Exception as err:
             raise S3SetError(err) from err
+
+    def _copy(self, src: str, dest: str):
+        self.client.copy_object(
+            CopySource={"Bucket": self.bucket, "Key": self.path + src},
+            Bucket=self.bucket,
+            Key=self.path + dest,
+        )
+
+    def copy_items(
+        self, paths: Dict[str, str], ignore_errors: bool = False
+    ) -> List[str]:
+        """Copies the objects at multiple paths to new paths with concurrent server side copies, without downloading them.
+
+        Args:
+            paths (Dict[str, str]): Mapping from each source path to the path it is copied to, relative to the root of the S3Provider.
+            ignore_errors (bool): If True, source paths that are not found are skipped instead of raising.
+
+        Returns:
+            List[str]: The source paths that were copied.
+
+        Raises:
+            KeyError: If a source path is not found and `ignore_errors` is False.
+        """
+        self.check_readonly()
+        if not paths:
+            return []
+        self._check_update_creds()
+
+        def copy(item):
+            try:
+                self._copy(*item)
+                return True
+            except botocore.exceptions.ClientError as err:
+                if err.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                    return False
+                raise
+
+        try:
+            with ThreadPoolExecutor(min(len(paths), PREFETCH_CONCURRENCY)) as executor:
+                copied = list(executor.map(copy, paths.items()))
+        except Exception:
+            # fall back to reading and writing the objects, which reload credentials, retry and raise the appropriate errors
+            return super().copy_items(paths, ignore_errors)
+        missing = [path for path, ok in zip(paths, copied) if not ok]
+        if missing and not ignore_errors:
+            raise KeyError(missing[0])
+        return [path for path, ok in zip(paths, copied) if ok]
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from deeplake.constants import KB, MB
+from deeplake.core.storage import LRUCache, MemoryProvider, ShardedLRUCache
+import threading
+import random
+import time
+import pytest
+
+
+NUM_CHUNKS = 64
+LATENCY = 0.001
+
+
+class SlowMemoryProvider(MemoryProvider):
+    """Memory provider with a fixed read latency, standing in for remote storage."""
+
+    def __getitem__(self, path):
+        time.sleep(LATENCY)
+        return super().__getitem__(path)
+
+
+class LockedLRUCache(LRUCache):
+    """Shares a plain LRUCache between threads with a single lock, for comparison. Like the shards of a ShardedLRUCache,
+    the lock is released while objects are read from the next storage."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+
+    def __getitem__(self, path):
+        with self.lock:
+            if path in self.lru_sizes:
+                return super().__getitem__(path)
+        result = self.next_storage[path]
+        with self.lock:
+            if path not in self.lru_sizes:
+                self._insert_fetched(path, result)
+        return result
+
+
+def _read_chunks(cache, keys, num_readers):
+    def read(seed):
+        order = list(keys)
+        random.Random(seed).shuffle(order)
+        for key in order:
+            cache[key]
+
+    with ThreadPoolExecutor(num_readers) as executor:
+        list(executor.map(read, range(num_readers)))
+
+
+@pytest.mark.benchmark(group="cache_contention")
+@pytest.mark.parametrize("num_readers", [1, 4, 16])
+@pytest.mark.parametrize("cache_class", [LockedLRUCache, ShardedLRUCache])
+def test_cache_contention(benchmark, cache_class, num_readers):
+    next_storage = SlowMemoryProvider()
+    keys = [f"chunks/{i}" for i in range(NUM_CHUNKS)]
+    for key in keys:
+        next_storage[key] = b"0" * (64 * KB)
+
+    def setup():
+        # every round starts with a cold cache, all readers read the same chunks
+        cache = cache_class(MemoryProvider(), next_storage, 32 * MB)
+        return (cache, keys, num_readers), {}
+
+    benchmark.pedantic(_read_chunks, setup=setup, rounds=5)
@@ -0,0 +1,256 @@
+import os
+import pickle
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+import deeplake
+from deeplake.constants import (
+    FIRST_COMMIT_ID,
+    KB,
+    MB,
+    PERSISTENT_CACHE_ACCESS_BATCH_SIZE,
+)
+from deeplake.core.storage import LocalProvider, MemoryProvider, PersistentLRUCache
+from deeplake.util.keys import get_chunk_commit_id
+
+
+class CountingProvider(MemoryProvider):
+    """MemoryProvider that counts reads."""
+
+    def __init__(self, root=""):
+        super().__init__(root)
+        self.reads = 0
+
+    def __getitem__(self, path):
+        self.reads += 1
+        return super().__getitem__(path)
+
+
+def chunk_key(i):
+    return f"tensor/chunks/{i:04x}"
+
+
+def _get_cache(path, base, cache_size, eviction_policy="lru", use_mmap=False):
+    cache = PersistentLRUCache(
+        LocalProvider(path, use_mmap=use_mmap), base, cache_size, eviction_policy
+    )
+    cache.committed.add(FIRST_COMMIT_ID)
+    return cache
+
+
+def _get_index(cache):
+    index = sqlite3.connect(cache.index_path)
+    used = index.execute("SELECT used FROM usage").fetchone()[0]
+    entries = dict(index.execute("SELECT key, hits FROM entries").fetchall())
+    total = index.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    index.close()
+    assert used == total
+    return used, entries
+
+
+def _read_chunks(path, base_path, keys):
+    cache = _get_cache(path, LocalProvider(base_path), 10 * KB)
+    for _ in range(3):
+        for key in keys:
+            assert cache[key] == key.encode() * 100
+    return cache.index_path
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_persistence(local_path, use_mmap):
+    base = CountingProvider()
+    for i in range(4):
+        base[chunk_key(i)] = bytes([i]) * KB
+    base["tensor/tensor_meta.json"] = b"{}"
+
+    cache = _get_cache(local_path, base, 10 * KB, use_mmap=use_mmap)
+    for i in range(4):
+        assert cache[chunk_key(i)] == bytes([i]) * KB
+    assert cache["tensor/tensor_meta.json"] == b"{}"
+    assert base.reads == 5
+    assert cache.get_bytes(chunk_key(1), 10, 20) == bytes([1]) * 10
+    assert base.reads == 5
+
+    # a new cache, as in another process or after a restart, reads the chunks from disk but not the other keys
+    cache = _get_cache(local_path, base, 10 * KB)
+    for i in range(4):
+        assert cache[chunk_key(i)] == bytes([i]) * KB
+    cache.prefetch([chunk_key(i) for i in range(4)])
+    assert base.reads == 5
+    assert cache["tensor/tensor_meta.json"] == b"{}"
+    assert base.reads == 6
+
+    # the data of MemoryProvider is not pickled, so this is read from disk
+    assert pickle.loads(pickle.dumps(cache))[chunk_key(0)] == bytes([0]) * KB
+
+    # chunks written through the cache replace the persisted ones
+    cache[chunk_key(0)] = b"new"
+    cache.flush()
+    assert _get_cache(local_path, base, 10 * KB)[chunk_key(0)] == b"new"
+
+    cache.clear_cache()
+    cache = _get_cache(local_path, base, 10 * KB)
+    assert cache[chunk_key(1)] == bytes([1]) * KB
+    assert base.reads == 8
+
+
+@pytest.mark.parametrize("eviction_policy", ["lru", "lfu"])
+def test_eviction(local_path, eviction_policy):
+    base = CountingProvider()
+    for i in range(4):
+        base[chunk_key(i)] = bytes([i]) * KB
+
+    cache = _get_cache(local_path, base, 3 * KB, eviction_policy)
+    for i in [0, 0, 0, 1, 1, 2]:
+        cache[chunk_key(i)]
+    cache = _get_cache(local_path, base, 3 * KB, eviction_policy)
+    cache[chunk_key(0)]
+    cache[chunk_key(3)]
+    assert base.reads == 4
+
+    cached = set(os.listdir(os.path.join(local_path, "tensor", "chunks")))
+    evicted = "0001" if eviction_policy == "lru" else "0002"
+    assert cached == {"0000", "0001", "0002", "0003"} - {evicted}
+    assert cache._is_cached(chunk_key(0))
+    assert not cache._is_cached(chunk_key(int(evicted, 16)))
+    assert _get_index(cache)[0] == 3 * KB
+
+
+def test_usage_and_accesses(local_path):
+    base = CountingProvider()
+    for i in range(8):
+        base[chunk_key(i)] = bytes([i]) * (i + 1) * 100
+
+    cache = _get_cache(local_path, base, 2 * KB)
+    for i in range(8):
+        cache[chunk_key(i)]
+    used, entries = _get_index(cache)
+    assert 0 < used <= 2 * KB
+    assert all(hits == 1 for hits in entries.values())
+
+    # hits are written to the index in batches
+    key = chunk_key(7)
+    for _ in range(PERSISTENT_CACHE_ACCESS_BATCH_SIZE - 1):
+        cache[key]
+    assert _get_index(cache)[1][key] == 1
+    cache.flush()
+    assert _get_index(cache)[1][key] == PERSISTENT_CACHE_ACCESS_BATCH_SIZE
+
+    cache.remove_from_cache(key)
+    used, entries = _get_index(cache)
+    assert key not in entries and used == sum(len(base[k]) for k in entries)
+    cache.clear_cache()
+    assert _get_index(cache) == (0, {})
+
+
+def test_missing_file(local_path):
+    base = CountingProvider()
+    base[chunk_key(0)] = b"abcd"
+
+    cache = _get_cache(local_path, base, 10 * KB)
+    cache[chunk_key(0)]
+    # a file removed by another process is read again from next_storage
+    os.remove(os.path.join(local_path, "tensor", "chunks", "0000"))
+    assert cache[chunk_key(0)] == b"abcd"
+    assert base.reads == 2
+
+
+def test_multiprocess(local_path):
+    base_path = os.path.join(local_path, "base")
+    cache_path = os.path.join(local_path, "cache")
+    base = LocalProvider(base_path)
+    keys = [chunk_key(i) for i in range(40)]
+    for key in keys:
+        base[key] = key.encode() * 100
+
+    with ProcessPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(_read_chunks, cache_path, base_path, keys[i::2])
+            for i in range(8)
+        ]
+        for future in futures:
+            future.result()
+
+    cache = _get_cache(cache_path, base, 10 * KB)
+    files = [
+        os.path.join(cache_path, "tensor", "chunks", f)
+        for f in os.listdir(os.path.join(cache_path, "tensor", "chunks"))
+    ]
+    assert sum(map(os.path.getsize, files)) <= 10 * KB
+    assert all(not f.endswith(".tmp") for f in files)
+    for key in keys:
+        assert cache[key] == key.encode() * 100
+
+
+def test_invalid_args(local_path):
+    with pytest.raises(ValueError):
+        PersistentLRUCache(MemoryProvider(), MemoryProvider(), MB)
+    with pytest.raises(ValueError):
+        _get_cache(local_path, MemoryProvider(), MB, "fifo")
+
+
+def test_dataset_local_cache(local_path, monkeypatch):
+    monkeypatch.setenv("LOCAL_CACHE_PREFIX", os.path.join(local_path, "cache"))
+    path = os.path.join(local_path, "ds")
+    data = np.arange(1000 * 1000, dtype=np.int32).reshape(1000, -1)
+    with deeplake.empty(path) as ds:
+        ds.create_tensor("x", max_chunk_size=MB)
+        ds.x.extend(data)
+        ds.commit()
+
+    ds = deeplake.load(path, read_only=True, local_cache_size=16)
+    cache = ds.storage.next_storage
+    assert isinstance(cache, PersistentLRUCache)
+    assert not cache.cache_storage.use_mmap
+    np.testing.assert_array_equal(ds.x.numpy(), data)
+    chunk_keys = [
+        key for key in cache.cache_storage._all_keys(True) if "/chunks/" in key
+    ]
+    assert len(chunk_keys) == len(ds.x.chunk_engine.chunk_id_encoder.array) > 1
+
+    ds = deeplake.load(path, read_only=True, local_cache_size=16, use_mmap=True)
+    assert ds.storage.next_storage.cache_storage.use_mmap
+    assert all(ds.storage.next_storage._is_cached(key) for key in chunk_keys)
+    np.testing.assert_array_equal(ds.x.numpy(), data)
+
+
+def test_dataset_local_cache_head(local_path, monkeypatch):
+    monkeypatch.setenv("LOCAL_CACHE_PREFIX", os.path.join(local_path, "cache"))
+    path = os.path.join(local_path, "ds")
+    with deeplake.empty(path) as ds:
+        ds.create_tensor("x")
+        ds.x.extend(np.arange(10))
+
+    ds = deeplake.load(path, read_only=True, local_cache_size=100)
+    np.testing.assert_array_equal(ds.x.numpy()[:, 0], np.arange(10))
+    # chunks of the head node can still change, so they are not persisted
+    cache = ds.storage.next_storage
+    cache._flush_accesses()
+    assert not os.path.exists(cache.index_path) or _get_index(cache) == (0, {})
+
+    # written outside the cache
+    with deeplake.load(path) as ds:
+        ds.x[3] = 333
+        ds.x.append(10)
+
+    expected = [0, 1, 2, 333, *range(4, 11)]
+    ds = deeplake.load(path, read_only=True, local_cache_size=100)
+    np.testing.assert_array_equal(ds.x.numpy()[:, 0], expected)
+
+    with deeplake.load(path) as ds:
+        commit_id = ds.commit()
+
+    for _ in range(2):
+        ds = deeplake.load(path, read_only=True, local_cache_size=100)
+        np.testing.assert_array_equal(ds.x.numpy()[:, 0], expected)
+    # the chunk of the committed node is persisted and read from the cache the second time
+    cache = ds.storage.next_storage
+    cache._flush_accesses()
+    _, entries = _get_index(cache)
+    [(key, hits)] = entries.items()
+    assert hits == 2
+    assert get_chunk_commit_id(key) == commit_id != ds.pending_commit_id
+    assert commit_id in cache.committed
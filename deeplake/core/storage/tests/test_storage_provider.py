@@ -8,10 +8,19 @@ from deeplake.tests.storage_fixtures import (
 from deeplake.tests.cache_fixtures import enabled_cache_chains
 from deeplake.core.storage.gcs import GCloudCredentials
 from deeplake.core.storage.google_drive import GDriveProvider
+from deeplake.core.storage import (
+    LocalProvider,
+    LRUCache,
+    MemoryProvider,
+    ShardedLRUCache,
+)
+from concurrent.futures import ThreadPoolExecutor
 from deeplake.util.exceptions import GCSDefaultCredsNotFoundError
 from google.oauth2.credentials import Credentials  # type: ignore
 import os
+import numpy as np
 import pytest
+import deeplake
 from deeplake.constants import MB, GCS_OPT, GDRIVE_OPT
 import pickle
 
@@ -137,6 +146,166 @@ def test_cache(cache_chain):
     check_cache(cache_chain)
 
 
+@enabled_storages
+def test_get_items(storage):
+    FILES = [f"{KEY}_{i}" for i in range(5)]
+    for i, file in enumerate(FILES):
+        storage[file] = bytes([i]) * 10
+
+    assert storage.get_items([]) == {}
+    items = storage.get_items([FILES[3], FILES[1], FILES[4], FILES[1]])
+    assert list(items) == [FILES[3], FILES[1], FILES[4]]
+    assert items[FILES[4]] == bytes([4]) * 10
+
+    with pytest.raises(KeyError):
+        storage.get_items([FILES[0], f"{KEY}_missing"])
+    items = storage.get_items([f"{KEY}_missing", FILES[0]], ignore_errors=True)
+    assert list(items) == [FILES[0]]
+
+    for file in FILES:
+        del storage[file]
+
+
+@enabled_storages
+def test_set_and_copy_items(storage):
+    FILES = [f"{KEY}_{i}" for i in range(5)]
+    storage.set_items({file: bytes([i]) * 10 for i, file in enumerate(FILES)})
+    assert storage.get_items(FILES)[FILES[2]] == bytes([2]) * 10
+
+    copies = {file: f"{file}_copy" for file in FILES}
+    assert storage.copy_items(copies) == FILES
+    for i, file in enumerate(FILES):
+        assert storage[copies[file]] == bytes([i]) * 10
+
+    with pytest.raises(KeyError):
+        storage.copy_items({f"{KEY}_missing": f"{KEY}_missing_copy"})
+    assert storage.copy_items(
+        {f"{KEY}_missing": f"{KEY}_missing_copy", FILES[0]: f"{KEY}_other_copy"},
+        ignore_errors=True,
+    ) == [FILES[0]]
+    assert storage[f"{KEY}_other_copy"] == bytes([0]) * 10
+
+    for file in FILES + list(copies.values()) + [f"{KEY}_other_copy"]:
+        del storage[file]
+
+
+def test_cache_copy_items():
+    next_storage = MemoryProvider()
+    next_storage["clean"] = b"clean"
+    next_storage["uncached"] = b"uncached"
+    cache = LRUCache(MemoryProvider(), next_storage, 100)
+    cache["clean"]
+    cache["dirty"] = b"dirty"
+
+    copied = cache.copy_items(
+        {
+            "clean": "clean_copy",
+            "dirty": "dirty_copy",
+            "uncached": "uncached_copy",
+            "missing": "missing_copy",
+        },
+        ignore_errors=True,
+    )
+    assert copied == ["clean", "dirty", "uncached"]
+    # copies of cached objects are written right away and kept in the cache
+    assert next_storage["clean_copy"] == b"clean"
+    assert next_storage["dirty_copy"] == b"dirty"
+    assert next_storage["uncached_copy"] == b"uncached"
+    assert {"clean_copy", "dirty_copy"} <= set(cache.lru_sizes)
+    assert "uncached_copy" not in cache.lru_sizes
+    assert set(cache.dirty_keys) == {"dirty"}
+    with pytest.raises(KeyError):
+        cache.copy_items({"missing": "missing_copy"})
+
+
+def test_cache_prefetch():
+    next_storage = MemoryProvider()
+    FILES = [f"{KEY}_{i}" for i in range(5)]
+    for file in FILES:
+        next_storage[file] = b"0123456789"
+    cache = LRUCache(MemoryProvider(), next_storage, 25)
+
+    assert cache.prefetch(FILES + [f"{KEY}_missing"]) == 2
+    # only the chunks that fit in the cache are admitted
+    check_cache_state(cache, expected_state=[set(), set(FILES[:2]), 2, 5, 20, 5])
+    assert not cache._in_flight
+
+    items = cache.get_items([FILES[1], FILES[2]])
+    assert list(items) == [FILES[1], FILES[2]]
+    assert list(cache.lru_sizes) == [FILES[1], FILES[2]]
+
+    assert cache.prefetch(FILES[1:3]) == 2
+    assert list(cache.lru_sizes) == [FILES[1], FILES[2]]
+    assert cache[FILES[4]] == b"0123456789"
+
+    # chunks are admitted by their sizes before they are fetched, along with the cached ones
+    reads = []
+    get_items = next_storage.get_items
+
+    def counting_get_items(paths, ignore_errors=False):
+        reads.extend(paths)
+        return get_items(paths, ignore_errors)
+
+    next_storage.get_items = counting_get_items
+    cache = LRUCache(MemoryProvider(), next_storage, 25)
+    cache[FILES[0]]
+    assert cache.prefetch(FILES, [10] * 5) == 2
+    assert reads == [FILES[1]]
+    reads.clear()
+    # upper bounds of the sizes are corrected once the chunks are fetched
+    cache = LRUCache(MemoryProvider(), next_storage, 25)
+    assert cache.prefetch(FILES, [15] * 5) == 2
+    assert reads == FILES[:2]
+    assert set(cache.lru_sizes) == set(FILES[:2])
+
+    # each shard admits the chunks that fit in it
+    cache = ShardedLRUCache(MemoryProvider(), next_storage, 40, num_shards=2)
+    admitted = cache.prefetch(FILES, [10] * 5)
+    shards = [hash(file) % 2 for file in FILES]
+    assert admitted == next(
+        i for i in range(1, 6) if i == 5 or shards[: i + 1].count(shards[i]) > 2
+    )
+    assert set(cache.lru_sizes) == set(FILES[:admitted])
+
+
+def test_sharded_cache():
+    next_storage = MemoryProvider()
+    cache = ShardedLRUCache(MemoryProvider(), next_storage, 4 * 100, num_shards=4)
+    check_storage_provider(cache)
+
+    FILES = [f"{KEY}_{i}" for i in range(20)]
+    for file in FILES:
+        cache[file] = b"0" * 30
+    assert cache.cache_used == sum(cache.lru_sizes.values())
+    for shard in cache.shards:
+        assert shard.cache_used <= 100
+    # evicted keys are written to the next storage, the rest are dirty
+    assert set(cache.dirty_keys) == set(cache.lru_sizes)
+    assert set(next_storage) == set(FILES) - set(cache.dirty_keys)
+
+    cache.flush()
+    assert not cache.dirty_keys
+    assert set(next_storage) == set(FILES)
+
+    def read(i):
+        file = FILES[i % len(FILES)]
+        if i % 3 == 0:
+            cache[file] = bytes([i % 256]) * 30
+        return len(cache[file])
+
+    with ThreadPoolExecutor(8) as executor:
+        assert set(executor.map(read, range(1000))) == {30}
+    assert cache.cache_used == sum(cache.lru_sizes.values())
+    cache.flush()
+    assert set(next_storage) == set(FILES)
+
+    cache.clear_cache()
+    assert cache.cache_used == 0
+    assert len(next_storage) == len(FILES)
+    cache.clear()
+    assert len(next_storage) == 0
+
+
 @enabled_persistent_storages
 def test_pickling(storage):
     FILE_1 = f"{KEY}_1"
@@ -195,3 +364,54 @@ def test_read_from_full_url(storage, color_image_paths):
     storage["sample/samplejpg.jpg"] = byts
     data = storage.get_object_from_full_url(f"{storage.root}/sample/samplejpg.jpg")
     assert byts == data
+
+
+def test_local_mmap(local_path):
+    storage = LocalProvider(local_path, use_mmap=True)
+    chunk_key = "tensor/chunks/abcd"
+    meta_key = "tensor/tensor_meta.json"
+
+    storage[chunk_key] = b"hello world"
+    storage[meta_key] = b"{}"
+    view = storage[chunk_key]
+    assert isinstance(view, memoryview) and view.readonly
+    assert view == b"hello world"
+    assert storage[meta_key] == b"{}"
+    assert storage.get_bytes(chunk_key, 2, 5) == b"llo"
+
+    # existing mappings stay valid when the chunk is rewritten
+    storage[chunk_key] = b"new"
+    assert view == b"hello world"
+    assert storage[chunk_key] == b"new"
+    assert set(storage._all_keys(refresh=True)) == {chunk_key, meta_key}
+
+    storage["tensor/chunks/empty"] = b""
+    assert storage["tensor/chunks/empty"] == b""
+
+    assert pickle.loads(pickle.dumps(storage)).use_mmap
+    assert storage.subdir("tensor").use_mmap
+
+
+def test_local_mmap_dataset(local_path):
+    ds = deeplake.empty(local_path, overwrite=True)
+    assert not ds.base_storage.use_mmap
+    with ds:
+        ds.create_tensor("x", max_chunk_size=2 * MB)
+        ds.x.extend(np.arange(1000 * 16, dtype=np.int32).reshape(-1, 4, 4))
+
+    ds = deeplake.load(local_path, use_mmap=True)
+    assert ds.base_storage.use_mmap
+    engine = ds.x.chunk_engine
+    chunk = engine.get_chunks_for_sample(0)[0]
+    assert chunk.data_bytes.readonly
+    np.testing.assert_array_equal(
+        ds.x[10:20].numpy(), np.arange(160, 320, dtype=np.int32).reshape(-1, 4, 4)
+    )
+
+    ds.x[10] = np.ones((4, 4), dtype=np.int32)
+    ds.flush()
+    ds = deeplake.load(local_path, use_mmap=True)
+    np.testing.assert_array_equal(ds.x[10].numpy(), np.ones((4, 4), dtype=np.int32))
+    np.testing.assert_array_equal(
+        ds.x[11].numpy(), np.arange(176, 192, dtype=np.int32).reshape(4, 4)
+    )
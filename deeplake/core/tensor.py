@@ -10,6 +10,8 @@ import numpy as np
 from typing import Dict, List, Sequence, Union, Optional, Tuple, Any, Callable
 from functools import reduce, partial
 from deeplake.core.index import Index, IndexEntry, replace_ellipsis_with_slices
+from deeplake.core.meta.encode.shape_index import ShapeIndex
+from deeplake.core.vector_index import VectorIndex
 from deeplake.core.meta.tensor_meta import TensorMeta
 from deeplake.core.storage import StorageProvider
 from deeplake.core.chunk_engine import ChunkEngine
@@ -29,6 +31,8 @@ from deeplake.util.keys import (
     get_tensor_meta_key,
     get_tensor_tile_encoder_key,
     get_sequence_encoder_key,
+    get_shape_index_key,
+    get_vector_index_key,
     tensor_exists,
     get_tensor_info_key,
     get_sample_id_tensor_key,
@@ -42,11 +46,19 @@ from deeplake.util.exceptions import (
     TensorDoesNotExistError,
     InvalidKeyTypeError,
     TensorAlreadyExistsError,
+    DynamicTensorNumpyError,
+    EmptyTensorError,
+    VectorSearchError,
 )
 from deeplake.util.iteration_warning import check_if_iteration
 from deeplake.hooks import dataset_read, dataset_written
 from deeplake.util.pretty_print import summary_tensor
-from deeplake.constants import FIRST_COMMIT_ID, _NO_LINK_UPDATE, UNSPECIFIED
+from deeplake.constants import (
+    FIRST_COMMIT_ID,
+    _NO_LINK_UPDATE,
+    UNSPECIFIED,
+    VECTOR_SEARCH_NPROBE,
+)
 
 
 from deeplake.util.version_control import auto_checkout
@@ -181,6 +193,18 @@ def delete_tensor(key: str, dataset):
     except KeyError:
         pass
 
+    shape_index_key = get_shape_index_key(key, commit_id)
+    try:
+        del storage[shape_index_key]
+    except KeyError:
+        pass
+
+    vector_index_key = get_vector_index_key(key, commit_id)
+    try:
+        del storage[vector_index_key]
+    except KeyError:
+        pass
+
 
 def _inplace_op(f):
     op = f.__name__
@@ -467,8 +491,11 @@ class Tensor:
             use :attr:`shape_interval` instead.
         """
         sample_shape_tensor = self._sample_shape_tensor
+        shape_index = None
+        if not self.chunk_engine.is_fixed_shape or self.is_link:
+            shape_index = self._shape_index()
         sample_shape_provider = (
-            self._sample_shape_provider(sample_shape_tensor)
+            self._sample_shape_provider(sample_shape_tensor, shape_index)
             if sample_shape_tensor
             else None
         )
@@ -477,6 +504,7 @@ class Tensor:
             self.index,
             sample_shape_provider=sample_shape_provider,
             pad_tensor=self.pad_tensor,
+            shape_index=shape_index,
         )
 
         if len(self.index.values) == 1 and not self.index.values[0].subscriptable():
@@ -572,7 +600,10 @@ class Tensor:
         Note:
             If you are expecting a tuple, use :attr:`shape` instead.
         """
-        return self.chunk_engine.shape_interval(self.index)
+        shape_index = None
+        if not self.index.is_trivial() and not self.chunk_engine.is_fixed_shape:
+            shape_index = self._shape_index()
+        return self.chunk_engine.shape_interval(self.index, shape_index)
 
     @property
     def is_dynamic(self) -> bool:
@@ -1002,6 +1033,10 @@ class Tensor:
                     else:
                         vs = [cast_to_type(v, dtype) for v in vs]
                 tensor.extend(vs)
+                if func_name == "extend_shape":
+                    self._sync_shape_index(
+                        lambda shape_index: shape_index.extend(np.asarray(vs))
+                    )
         # if self.meta.is_link and not has_shape_tensor:
         #     func = get_link_transform("extend_shape")
         #     func(samples, tensor_meta=self.meta)
@@ -1043,6 +1078,13 @@ class Tensor:
                     else:
                         val = cast_to_type(val, tensor.dtype)
                         tensor[global_sample_index] = val
+                        if fname == "update_shape":
+                            new_shape = np.asarray(val).reshape(-1)
+                            self._sync_shape_index(
+                                lambda shape_index: shape_index.__setitem__(
+                                    global_sample_index, new_shape
+                                )
+                            )
 
     @invalid_view_op
     def pop(self, index: Optional[int] = None):
@@ -1068,19 +1110,63 @@ class Tensor:
             for link, props in self.meta.links.items():
                 (flat_links if props["flatten_sequence"] else links).append(link)
 
-            if flat_links:
-                seq_enc = self.chunk_engine.sequence_encoder
-                for link in flat_links:
-                    link_tensor = self.dataset[rev_tensor_names.get(link)]
-                    for idx in reversed(range(*seq_enc[global_sample_index])):
-                        link_tensor.pop(idx)
+            seq_enc = self.chunk_engine.sequence_encoder
+            popped = list(reversed(range(*seq_enc[global_sample_index])))
+            for link in flat_links:
+                link_tensor = self.dataset[rev_tensor_names.get(link)]
+                for idx in popped:
+                    link_tensor.pop(idx)
         else:
             links = list(self.meta.links.keys())
+            popped = [global_sample_index]
         [
             self.dataset[rev_tensor_names.get(link)].pop(global_sample_index)
             for link in links
         ]
 
+        if any(props["extend"] == "extend_shape" for props in self.meta.links.values()):
+
+            def pop_shapes(shape_index: ShapeIndex):
+                for idx in popped:
+                    shape_index.pop(idx)
+
+            self._sync_shape_index(pop_shapes)
+
+    def _rollback(self, num_samples: int):
+        """Pops the samples after the first ``num_samples`` with :meth:`pop`, so that links, shape and vector indices
+        are updated as well. Links are extended after their tensor, so samples whose links are missing because extending
+        the tensor failed are popped along with their partial links first."""
+        engine = self.chunk_engine
+        full_tensors = self.version_state["full_tensors"]
+        links = [
+            (full_tensors[k], self.meta.is_sequence and props["flatten_sequence"])
+            for k, props in self.meta.links.items()
+        ]
+
+        def link_length(num_linked: int, flat: bool) -> int:
+            if not flat:
+                return num_linked
+            return engine.sequence_encoder[num_linked - 1][1] if num_linked else 0
+
+        num_linked = self.num_samples
+        for link, flat in links:
+            while num_linked and link.num_samples < link_length(num_linked, flat):
+                num_linked -= 1
+        num_linked = max(num_linked, num_samples)
+        for link, flat in links:
+            is_shape = self.meta.links[link.key]["extend"] == "extend_shape"
+            length = link_length(num_linked, flat)
+            while link.num_samples > length:
+                idx = link.num_samples - 1
+                link.pop()
+                if is_shape:
+                    self._sync_shape_index(lambda shape_index: shape_index.pop(idx))
+        while self.num_samples > num_linked:
+            engine.pop()
+        while self.num_samples > num_samples:
+            self.pop()
+        self.invalidate_libdeeplake_dataset()
+
     def _all_tensor_links(self):
         ds = self.dataset
         return [
@@ -1113,13 +1199,19 @@ class Tensor:
         tensor_name = self.meta.name or self.key
         return self.dataset._tensors().get(get_sample_id_tensor_key(tensor_name))
 
-    def _sample_shape_provider(self, sample_shape_tensor) -> Callable:
+    def _sample_shape_provider(
+        self, sample_shape_tensor, shape_index: Optional[ShapeIndex] = None
+    ) -> Callable:
         if self.is_sequence:
 
             def get_sample_shape(global_sample_index: int):
                 seq_pos = slice(
                     *self.chunk_engine.sequence_encoder[global_sample_index]
                 )
+                if shape_index is not None:
+                    return shape_index.get_shapes(
+                        np.arange(seq_pos.start, seq_pos.stop)
+                    ).astype(np.int64)
                 idx = Index([IndexEntry(seq_pos)])
                 shapes = sample_shape_tensor[idx].numpy()
                 return shapes
@@ -1127,10 +1219,57 @@ class Tensor:
         else:
 
             def get_sample_shape(global_sample_index: int):
+                if shape_index is not None:
+                    return tuple(map(int, shape_index[global_sample_index]))
                 return tuple(sample_shape_tensor[global_sample_index].numpy().tolist())
 
         return get_sample_shape
 
+    def _shape_index(self) -> Optional[ShapeIndex]:
+        """Returns the shape index of the tensor, building it from the sample shape tensor if it is missing or out of
+        date. Returns None if the tensor has no sample shape tensor, or if its samples don't all have the same number of
+        dimensions."""
+        sample_shape_tensor = self._sample_shape_tensor
+        if (
+            sample_shape_tensor is None
+            or self.meta.links[sample_shape_tensor.key]["extend"] != "extend_shape"
+        ):
+            return None
+        engine = self.chunk_engine
+        shape_index = engine.shape_index
+        num_samples = sample_shape_tensor.num_samples
+        if shape_index is not None and shape_index.num_samples == num_samples:
+            return shape_index
+        shape_index = ShapeIndex()
+        if num_samples:
+            shape_engine = sample_shape_tensor.chunk_engine
+            try:
+                try:
+                    shapes = shape_engine.numpy(Index())
+                except DynamicTensorNumpyError:
+                    shapes = shape_engine.numpy(Index(), aslist=True)
+                shape_index.extend(shapes)
+            except ValueError:
+                return None
+        engine.shape_index = shape_index
+        return shape_index
+
+    def _sync_shape_index(self, update: Callable[[ShapeIndex], None]):
+        """Applies ``update`` to the shape index, after the same change was made to the sample shape tensor. The index is
+        removed, to be rebuilt the next time it is needed, if it can't be updated or doesn't match the sample shape tensor.
+        """
+        engine = self.chunk_engine
+        shape_index = engine.shape_index
+        if shape_index is None:
+            return
+        try:
+            update(shape_index)
+        except (ValueError, IndexError):
+            engine.shape_index = None
+            return
+        if shape_index.num_samples != self._sample_shape_tensor.num_samples:
+            engine.shape_index = None
+
     def _get_sample_info_at_index(self, global_sample_index: int, sample_info_tensor):
         if self.is_sequence:
             return [
@@ -1330,6 +1469,154 @@ class Tensor:
         assert isinstance(self.chunk_engine, LinkedChunkEngine)
         return self.chunk_engine.creds_key(self.index.values[0].value)
 
+    def create_vector_index(
+        self, metric: str = "l2", index_type: str = "flat", nlist: Optional[int] = None
+    ):
+        """Builds the index used by :meth:`search` from the samples of the tensor, replacing any existing one.
+
+        The index is stored with the tensor in the current commit. It is extended with new samples the next time the tensor
+        is searched, and removed when samples are updated or popped.
+
+        Examples:
+            >>> ds.embeddings.create_vector_index(metric="cosine", index_type="ivf", nlist=100)
+            >>> view = ds.embeddings.search(query, k=10)
+
+        Args:
+            metric (str): Distance used to compare vectors, "l2", "cosine" or "ip" (inner product). Defaults to "l2".
+            index_type (str): "flat" to search all the vectors exhaustively, or "ivf" to cluster the vectors and only search
+                the clusters nearest to the query. Defaults to "flat".
+            nlist (int, Optional): Number of clusters of an "ivf" index. Defaults to the square root of the number of samples.
+
+        Raises:
+            ValueError: If `metric` or `index_type` are invalid.
+            EmptyTensorError: If the tensor has no samples.
+            VectorSearchError: If the samples of the tensor are not vectors of the same length.
+        """
+        self._check_vectors()
+        engine = self.chunk_engine
+        index = VectorIndex(metric, index_type)
+        if index_type == "ivf":
+            index.train(self._read_vectors, engine.num_samples, nlist)
+        self._extend_vector_index(index)
+
+    def _extend_vector_index(self, index: VectorIndex):
+        """Adds the samples of the tensor that are not in `index` yet to it, and stores it."""
+        try:
+            index.extend_from(self._read_vectors, self.chunk_engine.num_samples)
+        except ValueError:  # slabs with different vector lengths
+            raise VectorSearchError(
+                f"Tensor '{self.key}' can't be searched, all its samples should be vectors of the same length."
+            )
+        self.chunk_engine.vector_index = index
+
+    def _check_vectors(self):
+        """Raises an error if the samples of the tensor can't be indexed as vectors."""
+        meta = self.meta
+        if self.chunk_engine.num_samples == 0:
+            raise EmptyTensorError(
+                f"Tensor '{self.key}' can't be searched as it has no samples."
+            )
+        if (
+            self.is_sequence
+            or len(meta.max_shape) != 1
+            or meta.htype in ("text", "json", "list")
+        ):
+            raise VectorSearchError(
+                f"Tensor '{self.key}' can't be searched, its samples should be 1D vectors."
+            )
+
+    def _read_vectors(self, ids: np.ndarray) -> np.ndarray:
+        """Reads the samples of the tensor with the given sorted ids as a 2D array of vectors."""
+        if len(ids) and ids[-1] - ids[0] + 1 == len(ids):
+            entry = IndexEntry(slice(int(ids[0]), int(ids[-1]) + 1))
+        else:
+            entry = IndexEntry([int(i) for i in ids])
+        try:
+            vectors = self.chunk_engine.numpy(Index([entry]))
+        except DynamicTensorNumpyError:
+            raise VectorSearchError(
+                f"Tensor '{self.key}' can't be searched, all its samples should be vectors of the same length."
+            )
+        return vectors.reshape(len(ids), -1)
+
+    def _vector_index(self, metric: Optional[str]) -> VectorIndex:
+        """Returns the vector index of the tensor, built or brought up to date with the samples of the tensor if needed."""
+        engine = self.chunk_engine
+        index = engine.vector_index
+        if index is None or (metric is not None and index.metric != metric):
+            if index is None:
+                self.create_vector_index(metric or "l2")
+            else:
+                self.create_vector_index(metric, index.index_type, index.nlist)  # type: ignore
+            return engine.vector_index  # type: ignore
+        num_samples = engine.num_samples
+        if index.num_samples > num_samples:
+            self.create_vector_index(index.metric, index.index_type, index.nlist)
+            return engine.vector_index  # type: ignore
+        if index.num_samples < num_samples:
+            # samples appended since the index was last used
+            self._check_vectors()
+            self._extend_vector_index(index)
+        return index
+
+    def search(
+        self,
+        query_vectors,
+        k: int = 10,
+        metric: Optional[str] = None,
+        nprobe: int = VECTOR_SEARCH_NPROBE,
+    ):
+        """Finds the samples of the tensor nearest to the query vectors.
+
+        The search uses the vector index of the tensor, see :meth:`create_vector_index`. A "flat" index with the given
+        metric is built the first time a tensor without index is searched. Samples appended since the index was built
+        are added to it first. If the tensor is a view, only the samples in the view are searched.
+
+        Examples:
+            >>> view = ds.embeddings.search(np.random.rand(128), k=5)
+            >>> view.labels.numpy()
+            >>> dataloader = view.pytorch()
+
+        Args:
+            query_vectors: A query vector, or a 2D array with a query vector per row.
+            k (int): Number of samples to return per query. Defaults to 10.
+            metric (str, Optional): Distance used to compare vectors, "l2", "cosine" or "ip" (inner product). Defaults to
+                the metric of the existing index, or "l2". If it is different from the metric of the index, the index is
+                rebuilt.
+            nprobe (int): Number of clusters searched per query if the index is an "ivf" index. Defaults to
+                `VECTOR_SEARCH_NPROBE`.
+
+        Returns:
+            Dataset: For a single query vector, a view of the dataset with the nearest samples, nearest first.
+            List[Dataset]: For multiple query vectors, a view per query vector.
+
+        Raises:
+            ValueError: If `k` is not positive, `metric` is invalid or the query vectors don't have the same length as the
+                samples.
+            EmptyTensorError: If the tensor has no samples.
+            VectorSearchError: If the samples of the tensor are not vectors of the same length.
+        """
+        if k <= 0:
+            raise ValueError(f"`k` should be positive. Got: {k}")
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        single = queries.ndim == 1
+        queries = queries.reshape(1, -1) if single else queries
+        index = self._vector_index(metric)
+        if queries.ndim != 2 or queries.shape[1] != index.dim:
+            raise ValueError(
+                f"Query vectors should have {index.dim} dimensions, got an array of shape {np.shape(query_vectors)}."
+            )
+        candidates = None
+        if not self.index.is_trivial():
+            candidates = np.fromiter(
+                self.index.values[0].indices(self.num_samples), dtype=np.int64
+            )
+        ids, _ = index.search(
+            queries, k, self._read_vectors, nprobe=nprobe, candidates=candidates
+        )
+        views = [self.dataset[[int(i) for i in row if i >= 0]] for row in ids]
+        return views[0] if single else views
+
     def invalidate_libdeeplake_dataset(self):
         """Invalidates the libdeeplake dataset object."""
         self.dataset.libdeeplake_dataset = None
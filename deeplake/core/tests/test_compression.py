@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 from deeplake.tests.common import (
     get_actual_compression_from_buffer,
     assert_images_close,
@@ -14,7 +15,9 @@ from deeplake.core.compression import (
     compress_multiple,
     decompress_multiple,
     verify_compressed_file,
+    compress_bytes,
     decompress_bytes,
+    decompress_images,
 )
 from deeplake.compression import (
     get_compression_type,
@@ -28,7 +31,7 @@ from deeplake.compression import (
     SUPPORTED_COMPRESSIONS,
     POINT_CLOUD_COMPRESSIONS,
 )
-from deeplake.util.exceptions import CorruptedSampleError
+from deeplake.util.exceptions import CorruptedSampleError, SampleDecompressionError
 from PIL import Image  # type: ignore
 
 
@@ -145,6 +148,91 @@ def test_lz4_empty():
     assert decompress_bytes(b"", "lz4") == b""
 
 
+@pytest.mark.parametrize("shuffle", [None, "byte", "bit"])
+@pytest.mark.parametrize("dtype", ["uint8", "int16", "float32", "float64"])
+def test_zstd(shuffle, dtype):
+    arr = (np.random.randn(1003) * 100).astype(dtype)
+    # trailing bytes that don't fill an item are not shuffled
+    inp = arr.tobytes() + b"abc"
+    for level in [None, 1, 19]:
+        compressed = compress_bytes(
+            inp, "zstd", {"level": level, "shuffle": shuffle}, arr.itemsize
+        )
+        assert decompress_bytes(compressed, "zstd") == inp
+        assert decompress_bytes(memoryview(compressed), "zstd") == inp
+    assert compress_bytes(b"", "zstd") == decompress_bytes(b"", "zstd") == b""
+
+    compressed = compress_array(arr, "zstd", {"shuffle": shuffle})
+    decompressed = decompress_array(compressed, arr.shape, arr.dtype, "zstd")
+    np.testing.assert_array_equal(decompressed, arr)
+
+
+@pytest.mark.parametrize("compression", ["jpeg", "png"])
+@pytest.mark.parametrize("num_workers", [1, 4])
+def test_decompress_images(compression, num_workers):
+    shapes = [(100, 75, 3), (33, 47, 3), (0, 0, 0), (61, 80, 1), (5, 9, 3)]
+    arrays = [np.random.randint(0, 256, shape, dtype="uint8") for shape in shapes]
+    buffers = [compress_array(arr, compression) for arr in arrays]
+
+    images = decompress_images(
+        buffers, shapes, "uint8", compression, num_workers=num_workers
+    )
+    for image, buffer, shape in zip(images, buffers, shapes):
+        np.testing.assert_array_equal(
+            image, decompress_array(buffer, shape, "uint8", compression)
+        )
+
+    for scale in [2, 3, 8]:
+        images = decompress_images(
+            buffers, shapes, "uint8", compression, scale, num_workers
+        )
+        for image, shape in zip(images, shapes):
+            assert image.shape == (
+                -(-shape[0] // scale),
+                -(-shape[1] // scale),
+                shape[2],
+            )
+
+    with pytest.raises(SampleDecompressionError):
+        decompress_images(buffers + [b"abcd"], compression=compression)
+    with pytest.raises(ValueError):
+        decompress_images(buffers, compression=compression, scale=0)
+
+
+def test_decompress_images_pool(monkeypatch):
+    import deeplake.core.compression as compression_module
+    from concurrent.futures import ThreadPoolExecutor
+
+    decode = compression_module._decompress_image
+    threads = []
+
+    def record(*args):
+        threads.append(threading.current_thread().name)
+        return decode(*args)
+
+    monkeypatch.setattr(compression_module, "_decompress_image", record)
+    buffers = [compress_array(np.ones((4, 4, 3), dtype="uint8"), "png")] * 8
+
+    # the images are decoded by the pool of the process, which is reused
+    decompress_images(buffers, compression="png", num_workers=4)
+    pool = compression_module._get_decode_pool()
+    decompress_images(buffers, compression="png", num_workers=4)
+    assert compression_module._get_decode_pool() is pool
+    assert len(threads) == 16
+    assert all(name.startswith("deeplake-decode") for name in threads)
+
+    # decode threads don't use the pool
+    threads.clear()
+    with ThreadPoolExecutor(
+        1, initializer=compression_module.mark_decode_thread
+    ) as executor:
+        name = executor.submit(lambda: threading.current_thread().name).result()
+        executor.submit(
+            decompress_images, buffers, compression="png", num_workers=4
+        ).result()
+    assert threads == [name] * 8
+
+
 @pytest.mark.skipif(
     os.name == "nt" and sys.version_info < (3, 7), reason="requires python 3.7 or above"
 )
@@ -0,0 +1,34 @@
+from deeplake.core.compression import compress_bytes, decompress_bytes
+import numpy as np
+import pytest
+
+
+# float32 embeddings, whose exponent bytes are similar across items
+ARRAY = (np.random.RandomState(0).randn(64 * 1024, 16) * 0.1).astype("float32")
+
+COMPRESSIONS = [
+    ("lz4", None),
+    ("zstd", None),
+    ("zstd", {"shuffle": "byte"}),
+    ("zstd", {"shuffle": "bit"}),
+    ("zstd", {"level": 9, "shuffle": "byte"}),
+]
+IDS = ["lz4", "zstd", "zstd-byteshuffle", "zstd-bitshuffle", "zstd-9-byteshuffle"]
+
+
+@pytest.mark.benchmark(group="byte_compression")
+@pytest.mark.parametrize("compression,compression_args", COMPRESSIONS, ids=IDS)
+def test_compress(benchmark, compression, compression_args):
+    buffer = ARRAY.tobytes()
+    compressed = benchmark(
+        compress_bytes, buffer, compression, compression_args, ARRAY.itemsize
+    )
+    benchmark.extra_info["ratio"] = len(compressed) / len(buffer)
+
+
+@pytest.mark.benchmark(group="byte_decompression")
+@pytest.mark.parametrize("compression,compression_args", COMPRESSIONS, ids=IDS)
+def test_decompress(benchmark, compression, compression_args):
+    buffer = ARRAY.tobytes()
+    compressed = compress_bytes(buffer, compression, compression_args, ARRAY.itemsize)
+    assert benchmark(decompress_bytes, compressed, compression) == buffer
@@ -22,3 +22,18 @@ def test_compute_with_progress_bar(scheduler):
 
     finally:
         compute.close()
+
+
+@all_schedulers
+def test_compute_imap_with_progress_bar(scheduler):
+    def f(pg_callback, x):
+        pg_callback(1)
+        return x * 2
+
+    compute = get_compute_provider(scheduler=scheduler, num_workers=2)
+    try:
+        r = compute.imap_with_progress_bar(f, range(1000), 1000)
+        assert not isinstance(r, list)
+        assert list(r) == [x * 2 for x in range(1000)]
+    finally:
+        compute.close()
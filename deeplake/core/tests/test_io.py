@@ -1,8 +1,16 @@
+from collections import Counter
 from typing import Iterator
 
+import numpy as np
+import pytest
+
+import deeplake
+from deeplake.constants import KB
+from deeplake.core.storage import LocalProvider
 from deeplake.util.testing import assert_array_equal
 from deeplake.core.io import (
     IOBlock,
+    SampleStreaming,
     Streaming,
     Schedule,
     SequentialMultithreadScheduler,
@@ -28,3 +36,142 @@ def test_sequential_scheduler():
     assert_array_equal([b.indices() for b in result[1]._blocks], [[2, 6, 10]])
     assert_array_equal([b.indices() for b in result[2]._blocks], [[3, 7], [11]])
     assert_array_equal([b.indices() for b in result[3]._blocks], [[4, 8], [12]])
+
+
+def test_sample_streaming_decode_threads(local_ds, corrupt_image_paths):
+    img_bad = deeplake.read(corrupt_image_paths["jpeg"])
+    with local_ds as ds:
+        ds.create_tensor(
+            "image", htype="image", sample_compression="png", max_chunk_size=5 * KB
+        )
+        ds.create_tensor("label", chunk_compression="lz4")
+        ds.create_tensor("jpeg", htype="image", sample_compression="jpeg")
+        for i in range(40):
+            ds.image.append(i * np.ones((10, 10, 3), dtype=np.uint8))
+            ds.label.append(i)
+            ds.jpeg.append(img_bad if i == 7 else np.ones((4, 4, 3), dtype=np.uint8))
+
+    def read(decode_threads):
+        streaming = SampleStreaming(
+            ds, tensors=["image", "label", "jpeg"], decode_threads=decode_threads
+        )
+        return list(streaming.read(Schedule(streaming.list_blocks())))
+
+    expected = read(0)
+    samples = read(3)
+    assert [s["index"][0] for s in samples] == [i for i in range(40) if i != 7]
+    for sample, expected_sample in zip(samples, expected):
+        index = sample["index"][0]
+        assert sample["label"] == index
+        assert_array_equal(sample["image"], expected_sample["image"])
+        assert_array_equal(
+            sample["image"], index * np.ones((10, 10, 3), dtype=np.uint8)
+        )
+
+    # the pipeline stops when the reader stops early
+    streaming = SampleStreaming(ds, tensors=["image"], decode_threads=2)
+    stream = streaming.read(Schedule(streaming.list_blocks()))
+    assert next(stream)["index"][0] == 0
+    stream.close()
+
+
+def test_sample_streaming_read_batches(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=2 * KB)
+        ds.create_tensor("y", chunk_compression="lz4")
+        ds.create_tensor("image", htype="image", sample_compression="png")
+        for i in range(50):
+            ds.x.append(i * np.ones((4, 4), dtype=np.int32))
+            ds.y.append(i)
+            ds.image.append(np.ones((i % 3 + 1, 2, 3), dtype=np.uint8))
+
+    streaming = SampleStreaming(ds, tensors=["x", "y", "image"])
+    assert streaming._columnar_tensors == {"x", "y"}
+    expected = list(streaming.read(Schedule(streaming.list_blocks())))
+
+    batches = list(streaming.read_batches(Schedule(streaming.list_blocks()), 8))
+    assert [len(batch["index"]) for batch in batches] == [8] * 6 + [2]
+    samples = [
+        {key: batch[key][i] for key in batch}
+        for batch in batches
+        for i in range(len(batch["index"]))
+    ]
+    assert len(samples) == len(expected)
+    for sample, expected_sample in zip(samples, expected):
+        for key in expected_sample:
+            assert_array_equal(sample[key], expected_sample[key])
+
+    # fixed shape columns are sliced out of the chunks
+    assert isinstance(batches[0]["x"], np.ndarray)
+    assert batches[0]["x"].shape == (8, 4, 4)
+    assert not batches[0]["x"].flags["OWNDATA"]
+    assert isinstance(batches[0]["image"], list)
+
+    batches = list(
+        streaming.read_batches(Schedule(streaming.list_blocks()), 8, drop_last=True)
+    )
+    assert [len(batch["index"]) for batch in batches] == [8] * 6
+
+
+def test_sample_streaming_batched_image_decode(local_ds, corrupt_image_paths):
+    with local_ds as ds:
+        ds.create_tensor("jpeg", htype="image", sample_compression="jpeg")
+        ds.create_tensor("png", htype="image", sample_compression="png")
+        for i in range(20):
+            ds.jpeg.append(np.random.randint(0, 256, (i + 1, 7, 3), dtype=np.uint8))
+            ds.png.append(i * np.ones((3, i % 4 + 1, 3), dtype=np.uint8))
+
+    expected = {key: [ds[key][i].numpy() for i in range(20)] for key in ("jpeg", "png")}
+    for key in expected:
+        for sample, expected_sample in zip(ds[key].numpy(aslist=True), expected[key]):
+            assert_array_equal(sample, expected_sample)
+
+    streaming = SampleStreaming(ds, tensors=["jpeg", "png"])
+    assert streaming._image_tensors == {"jpeg", "png"}
+    samples = list(streaming.read(Schedule(streaming.list_blocks())))
+    batches = list(streaming.read_batches(Schedule(streaming.list_blocks()), 8))
+    assert len(samples) == sum(len(batch["index"]) for batch in batches) == 20
+    for i, sample in enumerate(samples):
+        batch = batches[i // 8]
+        for key in expected:
+            assert_array_equal(sample[key], expected[key][i])
+            assert_array_equal(batch[key][i % 8], expected[key][i])
+
+    # a corrupt image makes the other images of its chunk be decoded one by one
+    ds.jpeg[3] = deeplake.read(corrupt_image_paths["jpeg"])
+    streaming = SampleStreaming(ds, tensors=["jpeg", "png"])
+    samples = list(streaming.read(Schedule(streaming.list_blocks())))
+    assert [sample["index"][0] for sample in samples] == [
+        i for i in range(20) if i != 3
+    ]
+    assert_array_equal(samples[5]["jpeg"], expected["jpeg"][6])
+
+
+@pytest.mark.parametrize("decode_threads", [0, 2])
+def test_sample_streaming_prefetch_reads(local_ds, monkeypatch, decode_threads):
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=8 * KB)
+        ds.create_tensor("y", max_chunk_size=4 * KB)
+        ds.x.extend(np.arange(400 * 256, dtype=np.int32).reshape(400, 256))
+        ds.y.extend(np.arange(400 * 64, dtype=np.int32).reshape(400, 64))
+    num_chunks = ds.x.chunk_engine.num_chunks + ds.y.chunk_engine.num_chunks
+    assert num_chunks > 40
+
+    reads: Counter = Counter()
+    getitem = LocalProvider.__getitem__
+
+    def counting_getitem(self, path):
+        if "/chunks/" in path:
+            reads[path] += 1
+        return getitem(self, path)
+
+    monkeypatch.setattr(LocalProvider, "__getitem__", counting_getitem)
+    # the prefetched chunks of several blocks don't fit in the cache together
+    monkeypatch.setattr(deeplake.core.io, "STREAMING_CACHE_SIZE", 64 * KB)
+    streaming = SampleStreaming(ds, tensors=["x", "y"], decode_threads=decode_threads)
+    samples = list(streaming.read(Schedule(streaming.list_blocks())))
+    assert [sample["index"][0] for sample in samples] == list(range(400))
+    assert_array_equal(samples[123]["x"], np.arange(123 * 256, 124 * 256))
+    # each chunk is read once
+    assert len(reads) == num_chunks
+    assert set(reads.values()) == {1}
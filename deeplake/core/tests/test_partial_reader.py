@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from deeplake.core.chunk_engine import ChunkEngine
+from deeplake.core.partial_reader import PartialReader, coalesce_ranges
+from deeplake.core.storage import LocalProvider, MemoryProvider
+
+
+class CountingProvider(MemoryProvider):
+    """MemoryProvider that records the byte ranges read."""
+
+    def __init__(self, root=""):
+        super().__init__(root)
+        self.requests = []
+
+    def get_bytes(self, path, start_byte=None, end_byte=None):
+        self.requests.append((start_byte, end_byte))
+        return super().get_bytes(path, start_byte, end_byte)
+
+
+def test_coalesce_ranges():
+    assert coalesce_ranges([], 10) == []
+    assert coalesce_ranges([(50, 60), (0, 10), (15, 20)], 10) == [(0, 20), (50, 60)]
+    assert coalesce_ranges([(0, 10), (5, 8), (10, 20)], 0) == [(0, 20)]
+    assert coalesce_ranges([(0, 10), (11, 20)], 0) == [(0, 10), (11, 20)]
+
+
+def test_prefetch():
+    storage = CountingProvider()
+    data = bytes(range(256)) * 40
+    storage["chunk"] = data
+    reader = PartialReader(storage, "chunk", header_offset=16)
+
+    reader.prefetch([(0, 10), (40, 50), (2000, 2010), (30, 35)], gap=100)
+    assert sorted(storage.requests) == [(16, 66), (2016, 2026)]
+    assert reader[0:10] == data[16:26]
+    assert reader[42:48] == data[58:64]
+    assert reader[2000:2010] == data[2016:2026]
+    assert len(storage.requests) == 2
+
+    # ranges that were already fetched aren't fetched again
+    reader.prefetch([(0, 10), (3000, 3010)], gap=100)
+    assert storage.requests[2:] == [(3016, 3026)]
+    assert reader[100:110] == data[116:126]
+    assert len(storage.requests) == 4
+
+
+@pytest.mark.parametrize("compression", [None, "png"])
+def test_coalesced_sample_reads(local_ds_generator, monkeypatch, compression):
+    arrays = [
+        np.random.randint(0, 255, (10 + i % 3, 10, 3), dtype=np.uint8)
+        for i in range(30)
+    ]
+    with local_ds_generator() as ds:
+        ds.create_tensor("x", dtype="uint8", sample_compression=compression)
+        ds.x.extend(arrays)
+
+    requests = []
+    get_bytes = LocalProvider.get_bytes
+
+    def counting_get_bytes(self, path, start_byte=None, end_byte=None):
+        if "chunks" in path:
+            requests.append((start_byte, end_byte))
+        return get_bytes(self, path, start_byte, end_byte)
+
+    monkeypatch.setattr(LocalProvider, "get_bytes", counting_get_bytes)
+    monkeypatch.setattr(ChunkEngine, "_supports_partial_reads", True)
+
+    ds = local_ds_generator()
+    indices = [3, 25, 4, 17, 9]
+    samples = ds.x[indices].numpy(aslist=True)
+    for i, sample in zip(indices, samples):
+        np.testing.assert_array_equal(sample, arrays[i])
+    # one request for the header and one for the samples
+    assert len(requests) == 2
+    assert all(start is not None for start, _ in requests)
+
+    # most of the chunk is fetched with a single request
+    requests.clear()
+    ds = local_ds_generator()
+    indices = list(range(5, 25))
+    samples = ds.x[indices].numpy(aslist=True)
+    for i, sample in zip(indices, samples):
+        np.testing.assert_array_equal(sample, arrays[i])
+    assert requests == []
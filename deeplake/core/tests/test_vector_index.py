@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from deeplake.core.vector_index import VectorIndex
+
+
+class Reader:
+    """Reads vectors by id, like `Tensor._read_vectors`, and records the ids read."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.ids = []
+
+    def __call__(self, ids):
+        assert (np.diff(ids) > 0).all()
+        self.ids.extend(ids.tolist())
+        return self.vectors[ids]
+
+
+def _exact(vectors, queries, k, metric):
+    if metric == "l2":
+        distances = ((queries[:, None] - vectors[None]) ** 2).sum(-1)
+    elif metric == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        distances = 1 - queries @ vectors.T
+    else:
+        distances = -(queries @ vectors.T)
+    return np.argsort(distances, axis=1, kind="stable")[:, :k]
+
+
+@pytest.mark.parametrize("metric", ["l2", "cosine", "ip"])
+def test_flat(metric):
+    rng = np.random.default_rng(1)
+    vectors = rng.random((500, 8), dtype=np.float32)
+    queries = rng.random((4, 8), dtype=np.float32)
+    read = Reader(vectors)
+    index = VectorIndex(metric)
+    index.extend(vectors[:300])
+    index.extend_from(read, 500)
+    assert index.num_samples == 500 and read.ids == list(range(300, 500))
+    ids, distances = index.search(queries, 5, read)
+    np.testing.assert_array_equal(ids, _exact(vectors, queries, 5, metric))
+    assert (np.diff(distances, axis=1) >= 0).all()
+
+    read.ids.clear()
+    candidates = np.arange(199, 99, -1)
+    ids, _ = index.search(queries, 5, read, candidates=candidates)
+    np.testing.assert_array_equal(
+        ids, _exact(vectors[100:200], queries, 5, metric) + 100
+    )
+    assert read.ids == list(range(100, 200))
+
+    ids, _ = index.search(queries, 1000, read)
+    assert ids.shape == (4, 500)
+
+
+def test_ivf():
+    rng = np.random.default_rng(2)
+    centers = rng.random((10, 16), dtype=np.float32) * 10
+    vectors = (centers[rng.integers(0, 10, 2000)] + rng.random((2000, 16))).astype(
+        np.float32
+    )
+    queries = vectors[:20] + 0.01
+    read = Reader(vectors)
+    index = VectorIndex("l2", "ivf")
+    index.train(read, len(vectors), nlist=10)
+    index.extend(vectors[:1500])
+    index.extend_from(read, 2000)
+    assert len(index.centroids) == 10 and len(index.assignments) == 2000
+    with pytest.raises(ValueError):
+        index.train(read, len(vectors))
+
+    # searching all the clusters is exact, up to the float32 rounding of near ties
+    ids, _ = index.search(queries, 3, read, nprobe=10)
+    exact = _exact(vectors, queries, 3, "l2")
+    np.testing.assert_allclose(
+        ((queries[:, None] - vectors[ids]) ** 2).sum(-1),
+        ((queries[:, None] - vectors[exact]) ** 2).sum(-1),
+        rtol=1e-3,
+    )
+
+    # only the vectors of the probed clusters are read
+    read.ids.clear()
+    ids, _ = index.search(queries[:1], 3, read, nprobe=2)
+    assert ids[0, 0] == 0
+    probed = np.isin(index.assignments, index.assignments[read.ids])
+    assert read.ids == np.flatnonzero(probed).tolist() and len(read.ids) < 2000
+
+
+def test_serialize():
+    rng = np.random.default_rng(3)
+    vectors = rng.random((100, 4), dtype=np.float32)
+    index = VectorIndex("cosine", "ivf")
+    index.train(Reader(vectors), len(vectors), nlist=4)
+    index.extend(vectors)
+    loaded = VectorIndex.frombuffer(bytes(index.tobytes()))
+    assert (loaded.metric, loaded.index_type, loaded.nlist) == ("cosine", "ivf", 4)
+    assert (loaded.num_samples, loaded.dim) == (100, 4)
+    # the vectors are not stored in the index
+    assert index.nbytes == index.centroids.nbytes + index.assignments.nbytes
+    np.testing.assert_array_equal(loaded.centroids, index.centroids)
+    np.testing.assert_array_equal(loaded.assignments, index.assignments)
+    assert not loaded.is_dirty
+
+
+def test_invalid_args():
+    with pytest.raises(ValueError):
+        VectorIndex("hamming")
+    with pytest.raises(ValueError):
+        VectorIndex("l2", "hnsw")
+    index = VectorIndex()
+    index.extend(np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        index.extend(np.zeros((2, 4)))
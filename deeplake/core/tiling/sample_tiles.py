@@ -26,6 +26,7 @@ class SampleTiles:
         tile_shape: Optional[Tuple[int, ...]] = None,
         sample_shape: Optional[Tuple[int, ...]] = None,
         dtype: Optional[Union[np.dtype, str]] = None,
+        compression_args: Optional[dict] = None,
     ):
         self.tiles_yielded = 0
         if arr is not None:
@@ -36,6 +37,7 @@ class SampleTiles:
                 store_uncompressed_tiles,
                 htype,
                 tile_shape,
+                compression_args,
             )
         else:
             self._init_from_sample_shape(
@@ -56,6 +58,7 @@ class SampleTiles:
         store_uncompressed_tiles: bool = False,
         htype: Optional[str] = None,
         tile_shape: Optional[Tuple[int, ...]] = None,
+        compression_args: Optional[dict] = None,
     ):
         self.arr = arr
         self.sample_shape = arr.shape
@@ -64,7 +67,9 @@ class SampleTiles:
         )
         self.tile_shape = tile_shape
         tiles = break_into_tiles(arr, tile_shape)
-        self.tiles = serialize_tiles(tiles, lambda x: compress_array(x, compression))
+        self.tiles = serialize_tiles(
+            tiles, lambda x: compress_array(x, compression, compression_args)
+        )
         tile_shapes = np.vectorize(lambda x: x.shape, otypes=[object])(tiles)
 
         self.shapes_enumerator = np.ndenumerate(tile_shapes)
@@ -18,10 +18,12 @@ from deeplake.util.exceptions import (
     TransformError,
 )
 from deeplake.tests.common import parametrize_num_workers
-from deeplake.util.transform import get_pbar_description
+from deeplake.util.transform import create_slices, get_pbar_description
+from deeplake.constants import TRANSFORM_WORK_UNITS_PER_WORKER
 import deeplake
 import gc
 import re
+import time
 from deeplake.tests.common import get_dummy_data_path
 
 
@@ -1334,6 +1336,108 @@ def test_transform_checkpointing(local_ds, scheduler):
     assert ds.abc.numpy(aslist=True) == data_in
 
 
+@all_schedulers
+def test_transform_dynamic_scheduling(local_ds, scheduler):
+    slices, offsets = create_slices(list(range(160)), 2, dynamic_scheduling=True)
+    assert len(slices) == 2 * TRANSFORM_WORK_UNITS_PER_WORKER
+    assert offsets == list(range(0, 160, 10))
+
+    # no empty slices when the length doesn't divide evenly
+    slices, offsets = create_slices(list(range(100)), 2, dynamic_scheduling=True)
+    assert all(slices) and sum(map(len, slices)) == 100
+    assert offsets == [sum(map(len, slices[:i])) for i in range(len(slices))]
+
+    # fewer samples than work units
+    slices, _ = create_slices(list(range(5)), 2, dynamic_scheduling=True)
+    assert list(map(len, slices)) == [1] * 5
+
+    @deeplake.compute
+    def upload(i, ds, heavy):
+        if i in heavy:
+            time.sleep(0.05)
+        ds.abc.append(i)
+        ds.xyz.append(np.ones((i % 7, 3)) * i)
+
+    data_in = list(range(150))
+    with local_ds as ds:
+        ds.create_tensor("abc")
+        ds.create_tensor("xyz")
+        upload(heavy=set(range(10))).eval(
+            data_in,
+            ds,
+            num_workers=TRANSFORM_TEST_NUM_WORKERS,
+            scheduler=scheduler,
+            dynamic_scheduling=True,
+        )
+    assert ds.abc.numpy(aslist=True) == data_in
+    for i, arr in enumerate(ds.xyz.numpy(aslist=True)):
+        np.testing.assert_array_equal(arr, np.ones((i % 7, 3)) * i)
+
+
+@pytest.mark.parametrize("scheduler", ["serial"] + schedulers)
+def test_transform_streaming(local_ds, scheduler, monkeypatch):
+    @deeplake.compute
+    def upload(i, ds):
+        if i == 250:
+            raise Exception("test")
+        ds.abc.append(i)
+        ds.labels.append(str(i % 3))
+
+    def check(ds, n):
+        assert ds.abc.numpy(aslist=True) == list(range(n))
+        class_names = ds.labels.info.class_names
+        labels = [class_names[l] for l in ds.labels.numpy().reshape(-1)]
+        assert labels == [str(i % 3) for i in range(n)]
+
+    merge_all_meta_info = deeplake.util.transform.merge_all_meta_info
+
+    def merge_and_check(target_ds, *args, **kwargs):
+        merge_all_meta_info(target_ds, *args, **kwargs)
+        # the labels of the published samples are already remapped
+        reader = deeplake.load(target_ds.path, read_only=True, verbose=False)
+        check(reader, len(reader.abc))
+
+    monkeypatch.setattr(deeplake.util.transform, "merge_all_meta_info", merge_and_check)
+
+    with local_ds as ds:
+        ds.create_tensor("abc")
+        ds.create_tensor("labels", htype="class_label")
+
+    upload().eval(
+        list(range(100)),
+        ds,
+        num_workers=TRANSFORM_TEST_NUM_WORKERS,
+        scheduler=scheduler,
+        streaming=True,
+    )
+    check(ds, 100)
+
+    # the units before the failed sample are kept
+    with pytest.raises(TransformError):
+        upload().eval(
+            list(range(100, 300)),
+            ds,
+            num_workers=TRANSFORM_TEST_NUM_WORKERS,
+            scheduler=scheduler,
+            streaming=True,
+        )
+    check(ds, 250)
+    check(deeplake.load(ds.path, read_only=True), 250)
+    assert not any(key.startswith("__temp") for key in ds._tensors(include_hidden=True))
+
+    with pytest.raises(ValueError):
+        upload().eval(ds, num_workers=2, scheduler=scheduler, streaming=True)
+    with pytest.raises(ValueError):
+        upload().eval(
+            list(range(10)),
+            ds,
+            num_workers=2,
+            scheduler=scheduler,
+            streaming=True,
+            checkpoint_interval=2,
+        )
+
+
 def create_test_ds(path):
     ds = deeplake.empty(path, overwrite=True)
     ds.create_tensor("images", htype="image", sample_compression="jpg")
@@ -1602,3 +1706,33 @@ def test_ds_append_empty(local_ds):
     ds.label2.append(1)
 
     np.testing.assert_array_equal(ds.label2[:20].numpy(), np.array([]).reshape((20, 0)))
+
+
+@pytest.mark.parametrize("scheduler", ["serial"] + schedulers)
+def test_transform_class_labels_merged(local_ds, scheduler):
+    @deeplake.compute
+    def upload(sample_in, samples_out):
+        samples_out.labels.append(sample_in)
+        samples_out.multi.append([sample_in, "common"])
+
+    with local_ds as ds:
+        ds.create_tensor("labels", htype="class_label", class_names=["common"])
+        ds.create_tensor("multi", htype="class_label", chunk_compression="lz4")
+
+    # each worker sees different labels first, so their local indices collide
+    data = ["a", "b", "a", "b", "c", "d", "c", "d"]
+    upload().eval(data, ds, num_workers=2, scheduler=scheduler, progressbar=False)
+
+    assert ds.labels.info.class_names == ["common", "a", "b", "c", "d"]
+    assert ds.multi.info.class_names == ["a", "common", "b", "c", "d"]
+    labels = [ds.labels.info.class_names[l] for l in ds.labels.numpy().reshape(-1)]
+    assert labels == data
+    multi = [[ds.multi.info.class_names[l] for l in m] for m in ds.multi.numpy()]
+    assert multi == [[label, "common"] for label in data]
+    assert not any(key.startswith("__temp") for key in ds._tensors(include_hidden=True))
+
+    # labels added later are appended to the existing class names
+    upload().eval(["e", "a"], ds, num_workers=2, scheduler=scheduler)
+    assert ds.labels.info.class_names == ["common", "a", "b", "c", "d", "e"]
+    assert ds.labels[-2:].numpy().reshape(-1).tolist() == [5, 1]
+    assert ds.multi[-2:].numpy().tolist() == [[5, 1], [0, 1]]
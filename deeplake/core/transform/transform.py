@@ -24,6 +24,7 @@ from deeplake.util.transform import (
     store_data_slice,
     store_data_slice_with_pbar,
     check_checkpoint_interval,
+    merge_streamed_results,
 )
 from deeplake.util.encoder import merge_all_meta_info
 from deeplake.util.exceptions import (
@@ -34,10 +35,10 @@ from deeplake.util.exceptions import (
 )
 from deeplake.hooks import dataset_written, dataset_read
 from deeplake.util.version_control import auto_checkout
-from deeplake.util.class_label import sync_labels
+from deeplake.util.class_label import merge_all_class_names
 from deeplake.constants import DEFAULT_TRANSFORM_SAMPLE_CACHE_SIZE
 
-import posixpath
+import pickle
 
 
 class ComputeFunction:
@@ -62,6 +63,8 @@ class ComputeFunction:
         cache_size: int = DEFAULT_TRANSFORM_SAMPLE_CACHE_SIZE,
         checkpoint_interval: int = 0,
         ignore_errors: bool = False,
+        dynamic_scheduling: bool = False,
+        streaming: bool = False,
         **kwargs,
     ):
         """Evaluates the ComputeFunction on data_in to produce an output dataset ds_out.
@@ -87,6 +90,12 @@ class ComputeFunction:
             checkpoint_interval (int): If > 0, the transform will be checkpointed with a commit every ``checkpoint_interval`` input samples to avoid restarting full transform due to intermitten failures. If the transform is interrupted, the intermediate data is deleted and the dataset is reset to the last commit.
                 If <= 0, no checkpointing is done. Checkpoint interval should be a multiple of num_workers if num_workers > 0. Defaults to 0.
             ignore_errors (bool): If ``True``, input samples that causes transform to fail will be skipped and the errors will be ignored **if possible**.
+            dynamic_scheduling (bool): If ``True``, ``data_in`` is split into several smaller work units per worker, which are handed out to the workers as they become idle,
+                instead of one slice per worker. Useful when the time taken by samples varies a lot. Each work unit writes its own chunks, so more partially filled chunks are created.
+                Defaults to ``False``.
+            streaming (bool): If ``True``, the work units are merged into ``ds_out`` in order as they are completed, instead of after all the workers are done.
+                The samples of the completed units are visible in ``ds_out`` during the transform and a failure only loses the units in progress.
+                Implies ``dynamic_scheduling``. Can't be used with ``checkpoint_interval`` or without ``ds_out``. Defaults to ``False``.
             **kwargs: Additional arguments.
 
         Raises:
@@ -95,6 +104,7 @@ class ComputeFunction:
             TensorMismatchError: If one or more of the outputs generated during transform contain different tensors than the ones present in 'ds_out' provided to transform.
             UnsupportedSchedulerError: If the scheduler passed is not recognized. Supported values include: 'serial', 'threaded', 'processed' and 'ray'.
             ValueError: If ``num_workers`` > 0 and ``checkpoint_interval`` is not a multiple of ``num_workers`` or if ``checkpoint_interval`` > 0 and ds_out is None.
+                Also raised if ``streaming`` is ``True`` and ``checkpoint_interval`` > 0 or ds_out is None.
         """
 
         pipeline = Pipeline([self])
@@ -111,6 +121,8 @@ class ComputeFunction:
             cache_size,
             checkpoint_interval,
             ignore_errors,
+            dynamic_scheduling,
+            streaming,
             **kwargs,
         )
 
@@ -140,6 +152,8 @@ class Pipeline:
         cache_size: int = DEFAULT_TRANSFORM_SAMPLE_CACHE_SIZE,
         checkpoint_interval: int = 0,
         ignore_errors: bool = False,
+        dynamic_scheduling: bool = False,
+        streaming: bool = False,
         **kwargs,
     ):
         """Evaluates the pipeline on ``data_in`` to produce an output dataset ``ds_out``.
@@ -165,6 +179,12 @@ class Pipeline:
             checkpoint_interval (int): If > 0, the transform will be checkpointed with a commit every ``checkpoint_interval`` input samples to avoid restarting full transform due to intermitten failures. If the transform is interrupted, the intermediate data is deleted and the dataset is reset to the last commit.
                 If <= 0, no checkpointing is done. Checkpoint interval should be a multiple of num_workers if num_workers > 0. Defaults to 0.
             ignore_errors (bool): If ``True``, input samples that causes transform to fail will be skipped and the errors will be ignored **if possible**.
+            dynamic_scheduling (bool): If ``True``, ``data_in`` is split into several smaller work units per worker, which are handed out to the workers as they become idle,
+                instead of one slice per worker. Useful when the time taken by samples varies a lot. Each work unit writes its own chunks, so more partially filled chunks are created.
+                Defaults to ``False``.
+            streaming (bool): If ``True``, the work units are merged into ``ds_out`` in order as they are completed, instead of after all the workers are done.
+                The samples of the completed units are visible in ``ds_out`` during the transform and a failure only loses the units in progress.
+                Implies ``dynamic_scheduling``. Can't be used with ``checkpoint_interval`` or without ``ds_out``. Defaults to ``False``.
             **kwargs: Additional arguments.
 
         Raises:
@@ -174,6 +194,7 @@ class Pipeline:
             UnsupportedSchedulerError: If the scheduler passed is not recognized. Supported values include: 'serial', 'threaded', 'processed' and 'ray'.
             TransformError: All other exceptions raised if there are problems while running the pipeline.
             ValueError: If ``num_workers`` > 0 and ``checkpoint_interval`` is not a multiple of ``num_workers`` or if ``checkpoint_interval`` > 0 and ds_out is None.
+                Also raised if ``streaming`` is ``True`` and ``checkpoint_interval`` > 0 or ds_out is None.
 
 
         # noqa: DAR401
@@ -202,8 +223,19 @@ class Pipeline:
         overwrite = ds_out is None
         deeplake_reporter.feature_report(
             feature_name="eval",
-            parameters={"Num_Workers": str(num_workers), "Scheduler": scheduler},
+            parameters={
+                "Num_Workers": str(num_workers),
+                "Scheduler": scheduler,
+                "Dynamic_Scheduling": str(dynamic_scheduling),
+                "Streaming": str(streaming),
+            },
         )
+        if streaming and overwrite:
+            raise ValueError(
+                "streaming=True and ds_out is None. Cannot stream the results of an inplace transform."
+            )
+        if streaming and checkpoint_interval > 0:
+            raise ValueError("checkpoint_interval > 0 is not supported with streaming.")
         check_transform_data_in(data_in, scheduler)
 
         data_in, original_data_in, initial_padding_state = prepare_data_in(
@@ -280,6 +312,8 @@ class Pipeline:
                     pbar,
                     pqueue,
                     ignore_errors,
+                    dynamic_scheduling,
+                    streaming,
                     **kwargs,
                 )
                 target_ds._send_compute_progress(**progress_args, status="success")
@@ -333,6 +367,8 @@ class Pipeline:
         pbar=None,
         pqueue=None,
         ignore_errors: bool = False,
+        dynamic_scheduling: bool = False,
+        streaming: bool = False,
         **kwargs,
     ):
         """Runs the pipeline on the input data to produce output samples and stores in the dataset.
@@ -340,48 +376,32 @@ class Pipeline:
         """
         if isinstance(data_in, deeplake.Dataset):
             dataset_read(data_in)
-        slices, offsets = create_slices(data_in, num_workers)
+        slices, offsets = create_slices(
+            data_in, num_workers, dynamic_scheduling or streaming
+        )
         storage = get_base_storage(target_ds.storage)
-        class_label_tensors = (
-            [
-                tensor.key
+        # labels are converted by the workers against these and merged by merge_all_class_names
+        class_names = (
+            {
+                tensor.key: list(tensor.info.class_names)
                 for tensor in target_ds.tensors.values()
                 if tensor.base_htype == "class_label"
-                and not read_only
-                and not tensor.meta._disable_temp_transform
-            ]
-            if not kwargs.get("disable_label_sync")
-            else []
+            }
+            if not read_only and not kwargs.get("disable_label_sync")
+            else {}
         )
-        label_temp_tensors = {}
 
         visible_tensors = list(target_ds.tensors)
         visible_tensors = [target_ds[t].key for t in visible_tensors]
 
-        if not read_only:
-            for tensor in class_label_tensors:
-                actual_tensor = target_ds[tensor]
-                temp_tensor = f"__temp{posixpath.relpath(tensor, target_ds.group_index)}_{uuid4().hex[:4]}"
-                with target_ds:
-                    temp_tensor_obj = target_ds.create_tensor(
-                        temp_tensor,
-                        htype="class_label",
-                        dtype=actual_tensor.dtype,
-                        hidden=True,
-                        create_sample_info_tensor=False,
-                        create_shape_tensor=False,
-                        create_id_tensor=False,
-                    )
-                    temp_tensor_obj.meta._disable_temp_transform = True
-                    label_temp_tensors[tensor] = temp_tensor_obj.key
-                target_ds.flush()
-
         tensors = list(target_ds._tensors())
         tensors = [target_ds[t].key for t in tensors]
-        tensors = list(set(tensors) - set(class_label_tensors))
 
         group_index = target_ds.group_index
         version_state = target_ds.version_state
+        if streaming and not isinstance(storage, MemoryProvider):
+            # target_ds is updated while the remaining units are being pickled, the workers get a copy of it instead
+            version_state = pickle.loads(pickle.dumps(target_ds)).version_state
         if isinstance(storage, MemoryProvider):
             storages = [storage] * len(slices)
         else:
@@ -391,7 +411,7 @@ class Pipeline:
             group_index,
             tensors,
             visible_tensors,
-            label_temp_tensors,
+            class_names,
             self,
             version_state,
             target_ds.link_creds,
@@ -401,23 +421,32 @@ class Pipeline:
             ignore_errors,
         )
         map_inp = zip(slices, offsets, storages, repeat(args))
-        try:
-            if progressbar:
-                desc = get_pbar_description(self.functions)
-                result = compute.map_with_progress_bar(
-                    store_data_slice_with_pbar,
-                    map_inp,
-                    total_length=len(data_in),
-                    desc=desc,
-                    pbar=pbar,
-                    pqueue=pqueue,
-                )
-            else:
-                result = compute.map(store_data_slice, map_inp)
-        except Exception:
-            for tensor in label_temp_tensors.values():
-                target_ds.delete_tensor(tensor)
-            raise
+        if streaming:
+            self._run_streaming(
+                map_inp,
+                target_ds,
+                compute,
+                storage,
+                tensors,
+                len(data_in),
+                progressbar,
+                skip_ok,
+                pbar,
+                pqueue,
+            )
+            return
+        if progressbar:
+            desc = get_pbar_description(self.functions)
+            result = compute.map_with_progress_bar(
+                store_data_slice_with_pbar,
+                map_inp,
+                total_length=len(data_in),
+                desc=desc,
+                pbar=pbar,
+                pqueue=pqueue,
+            )
+        else:
+            result = compute.map(store_data_slice, map_inp)
 
         if read_only:
             return
@@ -438,23 +467,53 @@ class Pipeline:
         merge_all_meta_info(
             target_ds, storage, generated_tensors, overwrite, all_num_samples, result
         )
+        merge_all_class_names(
+            result["class_names"],
+            result["chunk_id_encoders"],
+            target_ds,
+            storage,
+            progressbar,
+        )
         delete_overwritten_chunks(old_chunk_paths, storage, overwrite)
         dataset_written(target_ds)
 
-        if label_temp_tensors:
-            sync_labels(
-                target_ds,
-                label_temp_tensors,
-                result["hash_label_maps"],
-                num_workers=num_workers,
-                scheduler=scheduler,
-                verbose=progressbar,
-            )
-
         for res in result["error"]:
             if res is not None:
                 raise res
 
+    def _run_streaming(
+        self,
+        map_inp,
+        target_ds: deeplake.Dataset,
+        compute: ComputeProvider,
+        storage,
+        tensors: List[str],
+        total_length: int,
+        progressbar: bool,
+        skip_ok: bool,
+        pbar=None,
+        pqueue=None,
+    ):
+        """Runs the work units in ``map_inp`` and merges each of them into ``target_ds`` as soon as it is done."""
+        if progressbar:
+            results = compute.imap_with_progress_bar(
+                store_data_slice_with_pbar,
+                map_inp,
+                total_length=total_length,
+                desc=get_pbar_description(self.functions),
+                pbar=pbar,
+                pqueue=pqueue,
+            )
+        else:
+            results = compute.imap(store_data_slice, map_inp)
+
+        err = merge_streamed_results(
+            results, target_ds, storage, tensors, skip_ok, progressbar
+        )
+        dataset_written(target_ds)
+        if err is not None:
+            raise err
+
 
 def compose(functions: List[ComputeFunction]):  # noqa: DAR101, DAR102, DAR201, DAR401
     """Takes a list of functions decorated using :func:`deeplake.compute` and creates a pipeline that can be evaluated using .eval
@@ -0,0 +1,318 @@
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+import deeplake
+from deeplake.constants import (
+    DEFAULT_MAX_CHUNK_SIZE,
+    VECTOR_INDEX_TRAINING_SAMPLES_PER_CLUSTER,
+    VECTOR_SEARCH_NPROBE,
+)
+from deeplake.core.serialize import deserialize_vector_index, serialize_vector_index
+from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+
+
+METRICS = ("l2", "cosine", "ip")
+INDEX_TYPES = ("flat", "ivf")
+
+
+def _distances(queries: np.ndarray, vectors: np.ndarray, metric: str) -> np.ndarray:
+    """Distances between each query and each vector, smaller is nearer. Vectors are expected to be normalized for "cosine"."""
+    products = queries @ vectors.T
+    if metric == "l2":
+        distances = (
+            np.einsum("ij,ij->i", queries, queries)[:, None]
+            - 2 * products
+            + np.einsum("ij,ij->i", vectors, vectors)[None]
+        )
+        return np.maximum(distances, 0, out=distances)
+    if metric == "cosine":
+        return 1 - products
+    return -products
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _block_size(dim: int) -> int:
+    """Number of vectors of `dim` dimensions compared at once, about the size of a chunk."""
+    return max(1, DEFAULT_MAX_CHUNK_SIZE // max(1, dim * 4))
+
+
+def _merge_top_k(
+    best: Tuple[np.ndarray, np.ndarray],
+    block_ids: np.ndarray,
+    distances: np.ndarray,
+    k: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merges the distances of a block of vectors into the `k` nearest ids and distances found so far."""
+    best_ids, best_distances = best
+    num_queries = len(distances)
+    distances = np.concatenate([best_distances, distances], axis=1)
+    candidates = np.concatenate(
+        [best_ids, np.broadcast_to(block_ids, (num_queries, len(block_ids)))], axis=1
+    )
+    if distances.shape[1] > k:
+        top = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        distances = np.take_along_axis(distances, top, axis=1)
+        candidates = np.take_along_axis(candidates, top, axis=1)
+    return candidates, distances
+
+
+def _empty_top_k(num_queries: int) -> Tuple[np.ndarray, np.ndarray]:
+    return (
+        np.zeros((num_queries, 0), dtype=np.int64),
+        np.zeros((num_queries, 0), dtype=np.float32),
+    )
+
+
+def _sort_top_k(best: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    best_ids, best_distances = best
+    order = np.argsort(best_distances, axis=1, kind="stable")
+    return (
+        np.take_along_axis(best_ids, order, axis=1),
+        np.take_along_axis(best_distances, order, axis=1),
+    )
+
+
+def _top_k(
+    queries: np.ndarray, vectors: np.ndarray, k: int, metric: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Brute force search of the `k` nearest vectors of each query in memory. Vectors are compared in slabs of about the
+    size of a chunk, so that the distance matrix stays small.
+
+    Returns:
+        Tuple of the positions in `vectors` and distances of the nearest vectors, nearest first.
+    """
+    k = min(k, len(vectors))
+    block_size = _block_size(vectors.shape[1])
+    best = _empty_top_k(len(queries))
+    for start in range(0, len(vectors), block_size):
+        block = vectors[start : start + block_size]
+        block_ids = np.arange(start, start + len(block))
+        best = _merge_top_k(best, block_ids, _distances(queries, block, metric), k)
+    return _sort_top_k(best)
+
+
+class VectorIndex(DeepLakeMemoryObject):
+    """Index of the vectors of a 1D tensor, used by `Tensor.search` to find the nearest neighbours of query vectors.
+
+    The index doesn't keep the vectors, they are read from the chunks of the tensor slab by slab when searching, with a
+    `read_vectors` function that returns the vectors with the given sorted ids. A "flat" index only records the number of
+    vectors and searches them exhaustively. An "ivf" index also clusters the vectors around `nlist` centroids, and keeps
+    the cluster of each vector, so that only the vectors of the `nprobe` clusters nearest to each query are read.
+    Vectors are normalized for the "cosine" metric, so that it is computed with the same matrix products as "ip".
+    """
+
+    def __init__(self, metric: str = "l2", index_type: str = "flat", nlist: int = 0):
+        if metric not in METRICS:
+            raise ValueError(f"`metric` should be one of {METRICS}. Got: {metric}")
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"`index_type` should be one of {INDEX_TYPES}. Got: {index_type}"
+            )
+        self.metric = metric
+        self.index_type = index_type
+        self.nlist = nlist
+        self.num_samples = 0
+        self.dim = 0
+        self.centroids = np.zeros((0, 0), dtype=np.float32)
+        self.assignments = np.zeros(0, dtype=np.int64)
+        self.version = deeplake.__version__
+        self.is_dirty = True
+
+    @property
+    def is_trained(self) -> bool:
+        return self.index_type == "flat" or len(self.centroids) > 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.centroids.nbytes + self.assignments.nbytes
+
+    def _prepare(self, vectors) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError(
+                f"Expected a 2D array of vectors, got an array of shape {vectors.shape}."
+            )
+        if self.dim and vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected vectors with {self.dim} dimensions, got an array of shape {vectors.shape}."
+            )
+        if self.metric == "cosine":
+            vectors = _normalize(vectors)
+        return vectors
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Returns the nearest centroid of each vector."""
+        return _top_k(vectors, self.centroids, 1, "l2")[0][:, 0]
+
+    def train(
+        self,
+        read_vectors: Callable[[np.ndarray], np.ndarray],
+        num_vectors: int,
+        nlist: Optional[int] = None,
+        iterations: int = 10,
+    ):
+        """Computes the centroids of an "ivf" index with k-means over a sample of the vectors. Should be called before
+        vectors are added to the index.
+
+        Args:
+            read_vectors (Callable): Returns the vectors with the given sorted ids as a 2D array.
+            num_vectors (int): Number of vectors to sample from, usually the number of samples of the tensor.
+            nlist (int, Optional): Number of clusters. Defaults to the square root of `num_vectors`.
+            iterations (int): Number of k-means iterations.
+
+        Raises:
+            ValueError: If the index already has vectors.
+        """
+        if self.num_samples:
+            raise ValueError("The index should be trained before vectors are added.")
+        nlist = min(nlist or self.nlist or int(np.sqrt(num_vectors)), num_vectors)
+        nlist = max(nlist, 1)
+        rng = np.random.default_rng(0)
+        num_training = min(
+            num_vectors, nlist * VECTOR_INDEX_TRAINING_SAMPLES_PER_CLUSTER
+        )
+        sample = self._prepare(
+            read_vectors(np.sort(rng.choice(num_vectors, num_training, replace=False)))
+        )
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = _top_k(sample, centroids, 1, "l2")[0][:, 0]
+            counts = np.bincount(assignments, minlength=nlist)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+        self.nlist = nlist
+        self.centroids = centroids
+        self.is_dirty = True
+
+    def extend(self, vectors):
+        """Adds vectors to the index. Their ids are the positions they are added at.
+
+        Args:
+            vectors: 2D array of vectors.
+
+        Raises:
+            ValueError: If the vectors don't have the same number of dimensions as the vectors in the index.
+        """
+        vectors = self._prepare(vectors)
+        if len(vectors) == 0:
+            return
+        self.dim = vectors.shape[1]
+        self.num_samples += len(vectors)
+        if self.index_type == "ivf" and self.is_trained:
+            self.assignments = np.concatenate([self.assignments, self._assign(vectors)])
+        self.is_dirty = True
+
+    def extend_from(self, read_vectors: Callable[[np.ndarray], np.ndarray], stop: int):
+        """Adds the vectors with ids from `num_samples` up to `stop`, reading them slab by slab.
+
+        Args:
+            read_vectors (Callable): Returns the vectors with the given sorted ids as a 2D array.
+            stop (int): Id after the last vector to add.
+        """
+        if not self.dim and self.num_samples < stop:
+            # the first vector gives the size of the slabs
+            self.extend(read_vectors(np.arange(self.num_samples, self.num_samples + 1)))
+        block_size = _block_size(self.dim)
+        for start in range(self.num_samples, stop, block_size):
+            self.extend(read_vectors(np.arange(start, min(start + block_size, stop))))
+
+    def _scan(
+        self,
+        queries: np.ndarray,
+        k: int,
+        read_vectors: Callable[[np.ndarray], np.ndarray],
+        ids: Optional[np.ndarray],
+        probes: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Searches the vectors with `ids`, or all the vectors if None, slab by slab. If `probes` is given, each query only
+        considers the vectors assigned to the clusters in its row of `probes`."""
+        num_vectors = self.num_samples if ids is None else len(ids)
+        k = min(k, num_vectors)
+        block_size = _block_size(self.dim)
+        best = _empty_top_k(len(queries))
+        for start in range(0, num_vectors, block_size):
+            stop = min(start + block_size, num_vectors)
+            block_ids = np.arange(start, stop) if ids is None else ids[start:stop]
+            distances = _distances(
+                queries, self._prepare(read_vectors(block_ids)), self.metric
+            )
+            if probes is not None:
+                probed = (
+                    self.assignments[block_ids][None, :, None] == probes[:, None, :]
+                ).any(axis=2)
+                distances[~probed] = np.inf
+            best = _merge_top_k(best, block_ids, distances, k)
+        out_ids, out_distances = _sort_top_k(best)
+        found = np.isfinite(out_distances)
+        out_ids[~found] = -1
+        width = int(found.sum(axis=1).max()) if found.size else 0
+        return out_ids[:, :width], out_distances[:, :width]
+
+    def search(
+        self,
+        queries,
+        k: int,
+        read_vectors: Callable[[np.ndarray], np.ndarray],
+        nprobe: int = VECTOR_SEARCH_NPROBE,
+        candidates: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds the `k` vectors nearest to each query.
+
+        Args:
+            queries: 2D array of query vectors.
+            k (int): Number of vectors to return per query.
+            read_vectors (Callable): Returns the vectors with the given sorted ids as a 2D array.
+            nprobe (int): Number of clusters searched per query for "ivf" indexes.
+            candidates (np.ndarray, Optional): Ids of the vectors to search. All vectors are searched if not given.
+
+        Returns:
+            Tuple of two arrays with a row per query, the ids and the distances of the nearest vectors, nearest first.
+            Rows have fewer than `k` ids if there are fewer vectors to search, the missing ids are -1.
+        """
+        queries = self._prepare(queries)
+        ids = None if candidates is None else np.unique(candidates)
+        if self.index_type == "flat" or not self.is_trained:
+            return self._scan(queries, k, read_vectors, ids)
+        probes = _top_k(queries, self.centroids, nprobe, self.metric)[0]
+        # only the vectors of the probed clusters are read
+        if ids is None:
+            ids = np.flatnonzero(np.isin(self.assignments, probes))
+        else:
+            ids = ids[np.isin(self.assignments[ids], probes)]
+        return self._scan(queries, k, read_vectors, ids, probes)
+
+    def tobytes(self) -> memoryview:
+        meta = {
+            "metric": self.metric,
+            "index_type": self.index_type,
+            "nlist": self.nlist,
+            "num_samples": self.num_samples,
+            "dim": self.dim,
+        }
+        arrays: Dict[str, np.ndarray] = {
+            "centroids": self.centroids,
+            "assignments": self.assignments,
+        }
+        return memoryview(serialize_vector_index(self.version, meta, arrays))
+
+    @classmethod
+    def frombuffer(cls, buffer: bytes):
+        if not buffer:
+            return cls()
+        version, meta, arrays = deserialize_vector_index(buffer)
+        num_samples, dim = meta.pop("num_samples"), meta.pop("dim")
+        instance = cls(**meta)
+        instance.num_samples, instance.dim = num_samples, dim
+        for name, arr in arrays.items():
+            setattr(instance, name, arr)
+        instance.version = version
+        instance.is_dirty = False
+        return instance
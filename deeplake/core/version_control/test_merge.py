@@ -639,3 +639,63 @@ def test_merge_with_pop(memory_ds):
         ds.checkout("branch1")
         ds.merge("branch2")
         np.testing.assert_array_equal(ds.x.numpy().flatten(), [1, 2, 4, 5, 6])
+
+
+def test_find_updated_and_conflicts():
+    from deeplake.util.merge import find_updated_and_conflicts
+
+    ids = np.array([10, 11, 12, 13, 14, 15], dtype=np.uint64)
+    target_ids = ids[[0, 1, 2, 3, 4, 5]]
+    original_ids = ids[[5, 4, 3, 2, 1, 0]]
+
+    def changes(*pairs):
+        return (
+            np.array([ids[i] for i, _ in pairs], dtype=np.uint64),
+            np.array([commit for _, commit in pairs], dtype=object),
+        )
+
+    target_changes = changes((0, "t2"), (1, "t2"), (2, "t2"), (0, "t1"), (3, "m"))
+    original_changes = changes((1, "o1"), (3, "m"), (4, "o1"))
+    updated, conflicts = find_updated_and_conflicts(
+        original_changes, target_changes, original_ids, target_ids
+    )
+    # samples 0 and 2 were only changed in the target, 3 was last changed by the same merged commit on both branches
+    np.testing.assert_array_equal(updated, [[2, 3], [3, 2], [5, 0]])
+    # sample 1 was changed on both branches
+    np.testing.assert_array_equal(conflicts, [[4, 1]])
+
+    updated, conflicts = find_updated_and_conflicts(
+        original_changes, changes(), original_ids, target_ids
+    )
+    assert updated.shape == conflicts.shape == (0, 2)
+
+
+@pytest.mark.parametrize("conflict_resolution", ["ours", "theirs"])
+def test_merge_updated_runs(memory_ds, conflict_resolution):
+    with memory_ds as ds:
+        ds.create_tensor("abc")
+        ds.create_tensor("labels", htype="class_label")
+        ds.abc.extend(np.arange(20).reshape(20, 1))
+        ds.labels.extend(["a"] * 20)
+        ds.commit()
+
+        ds.checkout("alt", create=True)
+        ds.abc[2:8] = np.arange(100, 106).reshape(6, 1)
+        ds.abc[10] = [110]
+        ds.labels[2:8] = ["b"] * 6
+        ds.commit()
+
+        ds.checkout("main")
+        ds.abc[5] = [50]
+        ds.commit()
+        ds.merge("alt", conflict_resolution=conflict_resolution)
+
+        expected = np.arange(20)
+        expected[2:8] = np.arange(100, 106)
+        expected[10] = 110
+        if conflict_resolution == "ours":
+            expected[5] = 50
+        np.testing.assert_array_equal(ds.abc.numpy().squeeze(), expected)
+        np.testing.assert_array_equal(
+            ds.labels.numpy()[1:9].squeeze(), [0, 1, 1, 1, 1, 1, 1, 0]
+        )
@@ -0,0 +1,45 @@
+from deeplake.util.merge import find_updated_and_conflicts
+import numpy as np
+import pytest
+
+
+NUM_SAMPLES = 5_000_000
+NUM_UPDATED = 1_000_000
+
+
+def _branch_changes(rng, ids, commits):
+    """Changes of `NUM_UPDATED` random samples per commit, as returned by `get_changes_commit_ids_for_node`."""
+    sample_ids = [
+        ids[np.sort(rng.choice(len(ids), NUM_UPDATED, replace=False))] for _ in commits
+    ]
+    commit_ids = [np.full(NUM_UPDATED, commit, dtype=object) for commit in commits]
+    return np.concatenate(sample_ids), np.concatenate(commit_ids)
+
+
+def _plan_merge(original_ids, target_ids, original_changes, target_changes):
+    new_indexes = np.flatnonzero(~np.isin(target_ids, original_ids))
+    updated, conflicts = find_updated_and_conflicts(
+        original_changes, target_changes, original_ids, target_ids
+    )
+    return new_indexes, updated, conflicts
+
+
+@pytest.mark.benchmark(group="merge_planning")
+def test_merge_planning(benchmark):
+    rng = np.random.default_rng(0)
+    ids = rng.permutation(
+        np.unique(rng.integers(2**63, size=2 * NUM_SAMPLES, dtype=np.uint64))
+    )[: NUM_SAMPLES + NUM_UPDATED]
+    # both branches have 5M rows, the target appended 1M rows after deleting as many from the original ones
+    original_ids = ids[:NUM_SAMPLES]
+    target_ids = ids[NUM_UPDATED:]
+    original_changes = _branch_changes(rng, original_ids, ["o1"])
+    target_changes = _branch_changes(rng, target_ids, ["t2", "t1"])
+
+    new_indexes, updated, conflicts = benchmark.pedantic(
+        _plan_merge,
+        args=(original_ids, target_ids, original_changes, target_changes),
+        rounds=1,
+    )
+    assert len(new_indexes) == NUM_UPDATED
+    assert len(updated) + len(conflicts) <= 2 * NUM_UPDATED
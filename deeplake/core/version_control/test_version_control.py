@@ -2436,3 +2436,64 @@ def test_version_in_path(local_path):
 
     with pytest.raises(ValueError):
         deeplake.exists(f"{local_path}@main")
+
+
+def test_chunk_commit_resolution(local_ds_generator, monkeypatch):
+    reads = []
+    writes = []
+    getitem = deeplake.core.storage.LocalProvider.__getitem__
+    setitem = deeplake.core.storage.LocalProvider.__setitem__
+
+    def counting_getitem(self, path):
+        if path.endswith("chunk_set"):
+            reads.append(path)
+        return getitem(self, path)
+
+    def recording_setitem(self, path, value):
+        writes.append(path)
+        return setitem(self, path, value)
+
+    monkeypatch.setattr(
+        deeplake.core.storage.LocalProvider, "__setitem__", recording_setitem
+    )
+
+    with local_ds_generator() as ds:
+        ds.create_tensor("abc", max_chunk_size=100)
+        commit_ids = []
+        for i in range(20):
+            ds.abc.extend(np.full((2, 10), i, dtype=np.int32))
+            commit_ids.append(ds.commit())
+        ds.abc[3] = np.full(10, -1, dtype=np.int32)
+    expected = np.repeat(np.arange(20, dtype=np.int32), 2)[:, None].repeat(10, 1)
+    expected[3] = -1
+
+    monkeypatch.setattr(
+        deeplake.core.storage.LocalProvider, "__getitem__", counting_getitem
+    )
+
+    writes.clear()
+    ds = local_ds_generator()
+    np.testing.assert_array_equal(ds.abc.numpy(), expected)
+    # the chunk map of each commit is read once to build the resolved map, which is only kept in memory
+    assert len(reads) == len(set(reads)) <= 21
+    ds.flush()
+    assert not any("chunk_set" in path for path in writes)
+
+    # a new commit only adds its own chunk map to the resolved map of its parent
+    ds.abc.append(np.full(10, 20, dtype=np.int32))
+    ds.commit()
+    ds.abc.append(np.full(10, 21, dtype=np.int32))
+    reads.clear()
+    np.testing.assert_array_equal(ds.abc[-3:].numpy()[:, 0], [19, 20, 21])
+    assert len(reads) <= 2
+    ds.flush()
+    assert {path.rsplit("/", 1)[-1] for path in writes if "chunk_set" in path} == {
+        "chunk_set"
+    }
+
+    # older commits are resolved the same way
+    ds.checkout(commit_ids[9])
+    np.testing.assert_array_equal(
+        ds.abc.numpy(),
+        np.repeat(np.arange(10, dtype=np.int32), 2)[:, None].repeat(10, 1),
+    )
@@ -61,7 +61,6 @@ HTYPE_CONFIGURATIONS: Dict[str, Dict] = {
         "dtype": "uint32",
         "class_names": [],
         "_info": ["class_names"],  # class_names should be stored in info, not meta
-        "_disable_temp_transform": False,
     },
     htype.BBOX: {"dtype": "float32", "coords": {}, "_info": ["coords"]},
     htype.BBOX_3D: {"dtype": "float32", "coords": {}, "_info": ["coords"]},
@@ -140,6 +139,7 @@ COMMON_CONFIGS = {
     "hidden": False,
     "links": None,
     "verify": False,
+    "compression_args": None,
 }
 
 
@@ -1,6 +1,6 @@
 from typing import Optional, Sequence, List, Dict
 from deeplake.constants import MB
-from deeplake.integrations.pytorch.common import PytorchTransformFunction
+from deeplake.integrations.pytorch.common import PytorchTransformFunction, collate_fn
 from deeplake.util.exceptions import TransformFailedError
 
 from deeplake.util.iterable_ordered_dict import IterableOrderedDict
@@ -24,6 +24,7 @@ import torch.distributed as dist
 from torch.utils.data.dataloader import DataLoader
 from warnings import warn
 
+import math
 import numpy as np
 from PIL import Image  # type: ignore
 
@@ -92,6 +93,22 @@ def _process(sample, transform: Optional[PytorchTransformFunction], return_index
     return sample
 
 
+def _collate_column(column):
+    if isinstance(column, np.ndarray):
+        copy = cast_type(column)
+        if copy is None:
+            # views over the chunks are copied, so that cached chunks can't be modified through the batch
+            copy = column if column.flags["OWNDATA"] else column.copy()
+        return torch.from_numpy(copy)
+    return collate_fn([copy_tensor(x) for x in column])
+
+
+def _process_batch(batch, return_index: bool):
+    if not return_index:
+        del batch["index"]
+    return IterableOrderedDict((k, _collate_column(v)) for k, v in batch.items())
+
+
 class TorchDataset(torch.utils.data.IterableDataset):
     def __init__(
         self,
@@ -106,6 +123,9 @@ class TorchDataset(torch.utils.data.IterableDataset):
         pad_tensors: bool = False,
         decode_method: Optional[Dict[str, str]] = None,
         batch_size: int = 1,
+        decode_threads: int = 0,
+        native_batching: bool = False,
+        drop_last: bool = False,
     ) -> None:
         super().__init__()
 
@@ -118,6 +138,9 @@ class TorchDataset(torch.utils.data.IterableDataset):
         self.pad_tensors = pad_tensors
         self.decode_method = decode_method
         self.batch_size = batch_size
+        self.decode_threads = decode_threads
+        self.native_batching = native_batching
+        self.drop_last = drop_last
 
         self.use_local_cache = use_local_cache
         self.scheduler = use_scheduler(num_workers, shuffle, batch_size)
@@ -154,17 +177,32 @@ class TorchDataset(torch.utils.data.IterableDataset):
             use_local_cache=self.use_local_cache,
             pad_tensors=self.pad_tensors,
             decode_method=self.decode_method,
+            decode_threads=self.decode_threads,
         )
 
         if self.shuffle:
             schedule.shuffle()
 
+        if self.native_batching:
+            batches = streaming.read_batches(
+                schedule, self.batch_size, drop_last=self.drop_last
+            )
+            for batch in batches:
+                yield _process_batch(batch, self.return_index)
+            return
+
         stream = streaming.read(schedule)
 
         for data in stream:
             yield _process(data, self.transform, self.return_index)
 
     def __len__(self):
+        if self.native_batching:
+            # each worker batches the samples of its own schedule
+            round_fn = math.floor if self.drop_last else math.ceil
+            return sum(
+                round_fn(len(schedule) / self.batch_size) for schedule in self.schedules
+            )
         return sum(map(len, self.schedules))
 
 
@@ -181,6 +219,7 @@ class SubIterableDataset(torch.utils.data.IterableDataset):
         return_index: bool = True,
         pad_tensors: bool = False,
         decode_method: Optional[Dict[str, str]] = None,
+        decode_threads: int = 0,
     ) -> None:
         super().__init__()
 
@@ -194,6 +233,7 @@ class SubIterableDataset(torch.utils.data.IterableDataset):
             return_index=return_index,
             pad_tensors=pad_tensors,
             decode_method=decode_method,
+            decode_threads=decode_threads,
         )
         if buffer_size:
             self.transform = transform
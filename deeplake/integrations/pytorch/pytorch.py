@@ -23,6 +23,7 @@ def create_dataloader(
     pad_tensors,
     decode_method,
     persistent_workers,
+    decode_threads=0,
 ):
     import torch
     import torch.utils.data
@@ -42,6 +43,7 @@ def create_dataloader(
             return_index=return_index,
             pad_tensors=pad_tensors,
             decode_method=decode_method,
+            decode_threads=decode_threads,
         ),
         batch_size=batch_size,
         collate_fn=collate_fn,
@@ -68,6 +70,8 @@ def dataset_to_pytorch(
     pad_tensors: bool = True,
     decode_method: Optional[Dict[str, str]] = None,
     persistent_workers: bool = False,
+    decode_threads: int = 0,
+    native_batching: bool = False,
     **kwargs,
 ):
     import torch
@@ -77,6 +81,14 @@ def dataset_to_pytorch(
 
     torch.multiprocessing.set_sharing_strategy("file_system")
 
+    if native_batching:
+        if transform is not None or collate_fn is not None:
+            raise ValueError(
+                "`native_batching` can't be used with `transform` or `collate_fn`, as they are applied to individual samples."
+            )
+        if batch_size is None:
+            raise ValueError("`native_batching` requires a `batch_size`.")
+
     if collate_fn is None:
         collate_fn = default_convert_fn if batch_size is None else default_collate_fn
 
@@ -100,7 +112,29 @@ def dataset_to_pytorch(
 
     tensors = map_tensor_keys(dataset, tensors)
 
-    if shuffle and num_workers > 0:
+    if native_batching:
+        # batches are collated by the dataset, shuffling is done by shuffling the schedules
+        return torch.utils.data.DataLoader(
+            TorchDataset(
+                dataset,
+                tensors=tensors,
+                use_local_cache=use_local_cache,
+                num_workers=num_workers,
+                shuffle=shuffle,
+                return_index=return_index,
+                pad_tensors=pad_tensors,
+                decode_method=decode_method,
+                batch_size=batch_size,
+                decode_threads=decode_threads,
+                native_batching=True,
+                drop_last=drop_last,
+            ),
+            batch_size=None,
+            pin_memory=pin_memory,
+            num_workers=num_workers,
+            persistent_workers=persistent_workers,
+        )
+    elif shuffle and num_workers > 0:
         return create_dataloader(
             dataset,
             tensors,
@@ -116,6 +150,7 @@ def dataset_to_pytorch(
             pad_tensors,
             decode_method,
             persistent_workers,
+            decode_threads,
         )
     else:
         return torch.utils.data.DataLoader(
@@ -131,6 +166,7 @@ def dataset_to_pytorch(
                 pad_tensors=pad_tensors,
                 decode_method=decode_method,
                 batch_size=batch_size,
+                decode_threads=decode_threads,
             ),
             batch_size=batch_size,
             collate_fn=collate_fn,
@@ -1,4 +1,4 @@
-from typing import List, Any, Sequence
+from typing import Dict, List, Any, Optional, Sequence
 from random import randrange
 from functools import reduce
 from operator import mul
@@ -15,12 +15,85 @@ from deeplake.constants import MB
 import deeplake
 
 
+def _torch_tensor_type():
+    if sys.modules.get("torch"):
+        from torch import Tensor as TorchTensor
+
+        return TorchTensor
+    return None
+
+
+class _Slab:
+    """Preallocated rows of a fixed shape and dtype, holding one tensor of a sample per slot."""
+
+    def __init__(self, value, capacity: int) -> None:
+        self.is_torch = not isinstance(value, np.ndarray)
+        self.shape = tuple(value.shape)
+        self.dtype = value.dtype
+        self.row_nbytes = (
+            value.element_size() * value.numel() if self.is_torch else value.nbytes
+        )
+        self.data = self._empty(capacity)
+
+    def _empty(self, capacity: int):
+        if self.is_torch:
+            import torch
+
+            return torch.empty((capacity,) + self.shape, dtype=self.dtype)
+        return np.empty((capacity,) + self.shape, dtype=self.dtype)
+
+    def matches(self, value) -> bool:
+        return (
+            isinstance(value, np.ndarray) != self.is_torch
+            and tuple(value.shape) == self.shape
+            and value.dtype == self.dtype
+        )
+
+    def resize(self, capacity: int):
+        data = self._empty(capacity)
+        num_rows = min(capacity, len(self.data))
+        data[:num_rows] = self.data[:num_rows]
+        self.data = data
+
+    def __setitem__(self, slot: int, value):
+        self.data[slot] = value
+
+    def __getitem__(self, slot: int):
+        row = self.data[slot]
+        return row.clone() if self.is_torch else row.copy()
+
+
+class _Entry:
+    """A sample in the buffer. Tensors stored in slabs are replaced by ``None`` in ``sample`` until the sample is emitted."""
+
+    __slots__ = ("sample", "slot", "slabbed", "size", "num_torch_tensors")
+
+    def __init__(
+        self,
+        sample,
+        slot: Optional[int],
+        slabbed: List[str],
+        size: int,
+        num_torch_tensors: int,
+    ) -> None:
+        self.sample = sample
+        self.slot = slot
+        self.slabbed = slabbed
+        self.size = size
+        self.num_torch_tensors = num_torch_tensors
+
+
 class ShuffleBuffer:
     """Shuffling buffer used to shuffle samples by the rule:
 
     Given new sample if buffer is not full, add sample to the buffer else pick other sample
     randomly and swap it with given sample.
 
+    Tensors of dict samples (numpy arrays or cpu torch tensors) are copied into preallocated slabs, one per key,
+    as long as they have the same shape and dtype as the first tensor of that key, so that the buffer doesn't keep
+    one object (and, for torch tensors received from workers, one shared memory segment) per sample. Other values
+    are kept as they are. The size of each sample is computed once, when it is added.
+
     Args:
         size(int):  size of the buffer in bytes
     Raises:
@@ -32,9 +105,12 @@ class ShuffleBuffer:
             raise ValueError("Buffer size should be positive value more than zero")
 
         self.size = size
-        self.buffer: List[Any] = list()
+        self.buffer: List[_Entry] = list()
         self.buffer_used = 0
         self.num_torch_tensors = 0
+        self.slabs: Dict[str, _Slab] = {}
+        self.num_slots = 0
+        self.free_slots: List[int] = []
         self.pbar = tqdm(
             total=self.size,
             desc="Please wait, filling up the shuffle buffer with samples.",
@@ -57,7 +133,10 @@ class ShuffleBuffer:
         buffer_len = len(self.buffer)
         if sample is not None:
             sample_size = self._sample_size(sample)
-            num_torch_tensors = self._num_torch_tensors(sample)
+            slabbed = self._slabbable_keys(sample)
+            num_torch_tensors = self._num_torch_tensors(sample) - sum(
+                not isinstance(sample[key], np.ndarray) for key in slabbed
+            )
             max_tensors = deeplake.constants.MAX_TENSORS_IN_SHUFFLE_BUFFER
             max_tensors_reached = (
                 self.num_torch_tensors + num_torch_tensors >= max_tensors
@@ -67,7 +146,9 @@ class ShuffleBuffer:
                 self.buffer_used += sample_size
                 self.num_torch_tensors += num_torch_tensors
                 self.pbar.update(sample_size)
-                self.buffer.append(sample)
+                self.buffer.append(
+                    self._store(sample, slabbed, sample_size, num_torch_tensors)
+                )
                 return None
             elif not self.pbar_closed:
                 if max_tensors_reached:
@@ -82,40 +163,96 @@ class ShuffleBuffer:
                 )
                 return sample
 
-            # exchange samples with shuffle buffer
+            # exchange samples with shuffle buffer, the slot of the selected sample is freed before it is reused
             selected = randrange(buffer_len)
-            val = self.buffer[selected]
-            self.buffer[selected] = sample
-
+            val = self._load(self.buffer[selected])
             self.buffer_used += sample_size
-            self.buffer_used -= self._sample_size(val)
             self.num_torch_tensors += num_torch_tensors
-            self.num_torch_tensors -= self._num_torch_tensors(val)
+            self.buffer[selected] = self._store(
+                sample, slabbed, sample_size, num_torch_tensors
+            )
             return val
         else:
             if not self.pbar_closed:
                 self.close_buffer_pbar()
             if buffer_len > 0:
-                # return random selection
+                # return random selection, the last sample takes its place
                 selected = randrange(buffer_len)
-                val = self.buffer.pop(selected)
-                self.buffer_used -= self._sample_size(val)
-
-                return val
+                last = self.buffer.pop()
+                if selected < buffer_len - 1:
+                    last, self.buffer[selected] = self.buffer[selected], last
+                return self._load(last)
             else:
                 return None
 
+    def _slabbable_keys(self, sample) -> List[str]:
+        """Keys of the tensors of `sample` that can be stored in slabs."""
+        if not isinstance(sample, dict):
+            return []
+        TorchTensor = _torch_tensor_type()
+        keys = []
+        for key, value in sample.items():
+            if isinstance(value, np.ndarray):
+                if value.dtype == object:
+                    continue
+            elif TorchTensor is not None and isinstance(value, TorchTensor):
+                if value.device.type != "cpu" or value.requires_grad:
+                    continue
+            else:
+                continue
+            slab = self.slabs.get(key)
+            if slab is None or slab.matches(value):
+                keys.append(key)
+        return keys
+
+    def _allocate_slot(self) -> int:
+        if not self.free_slots:
+            # grow geometrically, but not past the number of rows that can fit in the buffer
+            row_nbytes = sum(slab.row_nbytes for slab in self.slabs.values())
+            max_slots = self.size // max(row_nbytes, 1) + 1
+            num_slots = max(self.num_slots + 1, min(2 * self.num_slots, max_slots))
+            for slab in self.slabs.values():
+                slab.resize(num_slots)
+            self.free_slots.extend(range(num_slots - 1, self.num_slots - 1, -1))
+            self.num_slots = num_slots
+        return self.free_slots.pop()
+
+    def _store(
+        self, sample, slabbed: List[str], size: int, num_torch_tensors: int
+    ) -> _Entry:
+        if not slabbed:
+            return _Entry(sample, None, slabbed, size, num_torch_tensors)
+        for key in slabbed:
+            if key not in self.slabs:
+                self.slabs[key] = _Slab(sample[key], self.num_slots)
+        slot = self._allocate_slot()
+        sample = sample.copy()
+        for key in slabbed:
+            self.slabs[key][slot] = sample[key]
+            sample[key] = None
+        return _Entry(sample, slot, slabbed, size, num_torch_tensors)
+
+    def _load(self, entry: _Entry):
+        """Removes `entry` from the accounting of the buffer and returns its sample."""
+        self.buffer_used -= entry.size
+        self.num_torch_tensors -= entry.num_torch_tensors
+        sample = entry.sample
+        if entry.slot is not None:
+            for key in entry.slabbed:
+                sample[key] = self.slabs[key][entry.slot]
+            self.free_slots.append(entry.slot)
+        return sample
+
     def emtpy(self) -> bool:
         return len(self.buffer) == 0
 
     def _num_torch_tensors(self, sample):
         try:
-            if sys.modules.get("torch"):
-                from torch import Tensor as TorchTensor
-            else:
-                return 0
+            TorchTensor = _torch_tensor_type()
         except ImportError:
             return 0
+        if TorchTensor is None:
+            return 0
         if isinstance(sample, TorchTensor):
             return 1
         elif isinstance(sample, bytes):
@@ -131,10 +268,7 @@ class ShuffleBuffer:
 
     def _sample_size(self, sample):
         try:
-            if sys.modules.get("torch"):
-                from torch import Tensor as TorchTensor
-            else:
-                TorchTensor = None
+            TorchTensor = _torch_tensor_type()
         except ImportError:
             TorchTensor = None  # type: ignore
 
@@ -401,6 +401,53 @@ def test_corrupt_dataset(local_ds, corrupt_image_paths, compressed_image_paths):
     assert num_batches == 15
 
 
+@requires_torch
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_decode_threads(local_ds, corrupt_image_paths, num_workers):
+    img_bad = deeplake.read(corrupt_image_paths["jpeg"])
+    with local_ds as ds:
+        ds.create_tensor(
+            "image",
+            htype="image",
+            sample_compression="png",
+            max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE,
+        )
+        ds.create_tensor("label", chunk_compression="lz4")
+        ds.create_tensor("jpeg", htype="image", sample_compression="jpeg")
+        for i in range(40):
+            ds.image.append(i * np.ones((10, 10, 3), dtype=np.uint8))
+            ds.label.append(i)
+            ds.jpeg.append(img_bad if i == 7 else np.ones((4, 4, 3), dtype=np.uint8))
+
+    indices = []
+    for batch in ds.pytorch(
+        num_workers=num_workers,
+        batch_size=4,
+        decode_threads=3,
+        tensors=["image", "label"],
+    ):
+        indices.extend(batch["index"].view(-1).tolist())
+        for image, label, index in zip(batch["image"], batch["label"], batch["index"]):
+            assert label.item() == index.item()
+            np.testing.assert_array_equal(
+                image.numpy(), index.item() * np.ones((10, 10, 3), dtype=np.uint8)
+            )
+    expected = list(range(40))
+    assert indices == expected if num_workers == 0 else sorted(indices) == expected
+
+    # corrupt samples are skipped in the decode threads as well
+    indices = [
+        batch["index"].item()
+        for batch in ds.pytorch(num_workers=num_workers, decode_threads=2)
+    ]
+    assert sorted(indices) == [i for i in range(40) if i != 7]
+
+    # stopping early doesn't hang the pipeline
+    for i, batch in enumerate(ds.pytorch(decode_threads=2)):
+        if i == 3:
+            break
+
+
 @requires_torch
 @enabled_non_gdrive_datasets
 def test_pytorch_local_cache(ds):
@@ -986,3 +1033,53 @@ def test_pytorch_data_decode(local_ds, cat_path):
         assert sample["class_label"]["text"] == [animals[i]]
         assert sample["image"]["value"].shape == (900, 900, 3)
         assert sample["generic"]["value"] == i
+
+
+@requires_torch
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_native_batching(local_ds, num_workers):
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.create_tensor("image", htype="image", sample_compression="png")
+        for i in range(50):
+            ds.x.append(i * np.ones((4, 4), dtype=np.int32))
+            ds.image.append(i * np.ones((3, 2, 3), dtype=np.uint8))
+
+    loader = ds.pytorch(
+        num_workers=num_workers,
+        batch_size=8,
+        native_batching=True,
+        shuffle=True,
+        return_index=True,
+    )
+    indices = []
+    for batch in loader:
+        assert batch["x"].shape[1:] == (4, 4)
+        for x, image, index in zip(batch["x"], batch["image"], batch["index"]):
+            np.testing.assert_array_equal(x.numpy(), index.item() * np.ones((4, 4)))
+            np.testing.assert_array_equal(
+                image.numpy(), index.item() * np.ones((3, 2, 3))
+            )
+        indices.extend(batch["index"].view(-1).tolist())
+    assert sorted(indices) == list(range(50))
+
+    with pytest.raises(ValueError):
+        ds.pytorch(batch_size=8, native_batching=True, collate_fn=list)
+
+
+@requires_torch
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_cache_shards(local_path, num_workers):
+    with deeplake.empty(local_path, overwrite=True, cache_shards=4) as ds:
+        ds.create_tensor("image", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.image.extend([i * np.ones((10, 10), dtype=np.uint8) for i in range(40)])
+
+    ds = deeplake.load(local_path, read_only=True, cache_shards=4)
+    indices = []
+    for batch in ds.pytorch(num_workers=num_workers, batch_size=4, decode_threads=2):
+        for image, index in zip(batch["image"], batch["index"]):
+            np.testing.assert_array_equal(
+                image.numpy(), index.item() * np.ones((10, 10), dtype=np.uint8)
+            )
+        indices.extend(batch["index"].view(-1).tolist())
+    assert sorted(indices) == list(range(40))
@@ -41,3 +41,32 @@ def test_constant_tensor():
     result = buffer.exchange(tensor)
 
     assert result == tensor
+
+
+def test_slab_storage():
+    buffer = ShuffleBuffer(20 * 137)
+    out = []
+    for i in range(200):
+        sample = {"x": torch.full((4, 4), i), "y": torch.tensor([i]), "name": "a"}
+        if i % 10 == 3:
+            sample["x"] = torch.full((2,), i)
+        result = buffer.exchange(sample)
+        if result is not None:
+            out.append(result)
+        # tensors of the same shape and dtype are copied into the slabs
+        assert buffer.num_torch_tensors == sum(
+            entry.slot is None or "x" not in entry.slabbed for entry in buffer.buffer
+        )
+    assert set(buffer.slabs) == {"x", "y"}
+    assert len(buffer) >= 20
+    assert buffer.num_slots <= 2 * len(buffer)
+    while not buffer.emtpy():
+        out.append(buffer.exchange(None))
+    assert buffer.buffer_used == 0
+
+    assert sorted(sample["y"].item() for sample in out) == list(range(200))
+    for sample in out:
+        i = sample["y"].item()
+        assert list(sample) == ["x", "y", "name"]
+        assert sample["x"].shape == ((2,) if i % 10 == 3 else (4, 4))
+        assert (sample["x"] == i).all()
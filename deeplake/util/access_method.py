@@ -62,6 +62,8 @@ def get_local_dataset(
     num_workers,
     scheduler,
     reset,
+    cache_shards=0,
+    use_mmap=False,
 ):
     local_path = get_local_storage_path(path, os.environ["DEEPLAKE_DOWNLOAD_PATH"])
     download = access_method == "download" or (
@@ -93,6 +95,8 @@ def get_local_dataset(
         token=token,
         org_id=org_id,
         reset=reset,
+        cache_shards=cache_shards,
+        use_mmap=use_mmap,
     )
     if download:
         ds.storage.next_storage[TIMESTAMP_FILENAME] = time.ctime().encode("utf-8")
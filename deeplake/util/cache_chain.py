@@ -7,11 +7,14 @@ from deeplake.core.storage import (
     MemoryProvider,
     LocalProvider,
 )
-from deeplake.core.storage.lru_cache import LRUCache
+from deeplake.core.storage.lru_cache import LRUCache, ShardedLRUCache
+from deeplake.core.storage.persistent_cache import PersistentLRUCache
 from deeplake.util.exceptions import ProviderSizeListMismatch, ProviderListEmptyError
 
 
-def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
+def get_cache_chain(
+    storage_list: List[StorageProvider], size_list: List[int], num_shards: int = 0
+):
     """Returns a chain of storage providers as a cache
 
     Args:
@@ -21,6 +24,7 @@ def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
         size_list (List[int]): The list of sizes of the caches in bytes.
             Should have size 1 less than provider_list and specifies size of cache for all providers except the last
             one. The last one is the primary storage and is assumed to have infinite space.
+        num_shards (int): If positive, thread safe caches with this many shards are created. Defaults to 0.
 
     Returns:
         StorageProvider: Returns a cache containing all the storage providers in cache_list if cache_list has 2 or more
@@ -39,7 +43,10 @@ def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
         raise ProviderSizeListMismatch
     store = storage_list[-1]
     for size, cache in zip(reversed(size_list), reversed(storage_list[:-1])):
-        store = LRUCache(cache, store, size)
+        if num_shards > 0:
+            store = ShardedLRUCache(cache, store, size, num_shards)
+        else:
+            store = LRUCache(cache, store, size)
     return store
 
 
@@ -48,6 +55,8 @@ def generate_chain(
     memory_cache_size: int,
     local_cache_size: int,
     path: Optional[str] = None,
+    num_shards: int = 0,
+    use_mmap: bool = False,
 ) -> StorageProvider:
     """Internal function to be used by Dataset, to generate a cache_chain using a base_storage and sizes of memory and
         local caches.
@@ -58,10 +67,17 @@ def generate_chain(
         local_cache_size (int): The size of the local filesystem cache to be used in bytes.
         path (str, optional): The path to the dataset. If not None, it is used to figure out the folder name where the local
             cache is stored.
+        num_shards (int): If positive, the caches are thread safe and split into this many shards. Defaults to 0.
+        use_mmap (bool): Whether the chunks in the local cache are memory mapped instead of read into memory.
+            Defaults to False.
 
     Returns:
         StorageProvider: Returns a cache containing the base_storage along with memory cache,
             and local cache if a positive size has been specified for it.
+
+    Note:
+        Chunks of committed nodes in the local cache persist across restarts and are shared by all the processes opening
+        the same path.
     """
 
     if path:
@@ -80,9 +96,9 @@ def generate_chain(
 
     if local_cache_size > 0:
         local_cache_prefix = os.getenv("LOCAL_CACHE_PREFIX", default=LOCAL_CACHE_PREFIX)
-        storage_list.append(
-            LocalProvider(f"{local_cache_prefix}/{cached_dataset_name}")
+        local_cache = LocalProvider(
+            f"{local_cache_prefix}/{cached_dataset_name}", use_mmap=use_mmap
         )
-        size_list.append(local_cache_size)
+        base_storage = PersistentLRUCache(local_cache, base_storage, local_cache_size)
     storage_list.append(base_storage)
-    return get_cache_chain(storage_list, size_list)
+    return get_cache_chain(storage_list, size_list, num_shards)
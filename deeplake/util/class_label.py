@@ -1,11 +1,11 @@
-from collections import OrderedDict, defaultdict
-from typing import List
+from typing import Dict, List
 
-from deeplake.util.hash import hash_str_to_int32
-from deeplake.util.exceptions import EmptyTensorError
+from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
+from deeplake.core.storage.provider import StorageProvider
+from deeplake.util.keys import get_chunk_key
 from deeplake.client.log import logger
 import numpy as np
-import deeplake
+import posixpath
 
 
 def convert_to_idx(samples, class_names: List[str]):
@@ -35,30 +35,6 @@ def convert_to_idx(samples, class_names: List[str]):
     return convert(samples)
 
 
-def convert_to_hash(samples, hash_label_map):
-    if isinstance(samples, np.ndarray):
-        samples = samples.tolist()
-    if isinstance(samples, list):
-        return [convert_to_hash(sample, hash_label_map) for sample in samples]
-    else:
-        if isinstance(samples, str):
-            hash_ = hash_str_to_int32(samples)
-            hash_label_map[hash_] = samples
-        else:
-            hash_ = samples
-        return hash_
-
-
-def convert_hash_to_idx(hashes, hash_idx_map):
-    if isinstance(hashes, list):
-        return [convert_hash_to_idx(hash, hash_idx_map) for hash in hashes]
-    else:
-        try:
-            return hash_idx_map[hashes]
-        except KeyError:
-            return hashes
-
-
 def convert_to_text(inp, class_names: List[str], return_original=False):
     if isinstance(inp, np.integer):
         idx = int(inp)
@@ -68,66 +44,76 @@ def convert_to_text(inp, class_names: List[str], return_original=False):
     return [convert_to_text(item, class_names) for item in inp]
 
 
-def sync_labels(
-    ds, label_temp_tensors, hash_label_maps, num_workers, scheduler, verbose=True
-):
-    ds = ds.root
-    hl_maps = defaultdict(OrderedDict)
-    for map in hash_label_maps:
-        for tensor in map:
-            hl_maps[tensor].update(map[tensor])
-    hash_label_maps = hl_maps
-
-    @deeplake.compute
-    def class_label_sync(
-        hash_tensor_sample,
-        samples_out,
-        label_tensor: str,
-        hash_idx_map,
+def merge_all_class_names(
+    all_workers_class_names: List[Dict[str, List[str]]],
+    all_workers_chunk_id_encoders: List[Dict[str, ChunkIdEncoder]],
+    target_ds,
+    storage: StorageProvider,
+    verbose: bool = True,
+) -> None:
+    """Merges the class names collected by the transform workers into the class label tensors of ``target_ds``.
+
+    Each worker converts labels to indices against its own copy of ``class_names``, so labels that were first seen by
+    different workers may have been given the same index. The class names of the workers are appended to the tensor's
+    class names in order, and the chunks of the workers whose indices differ from the merged ones are remapped in place.
+    """
+    commit_id = target_ds.version_state["commit_id"]
+    target_tensors = {}
+    updated = {}
+    for worker_class_names, worker_chunk_id_encoders in zip(
+        all_workers_class_names, all_workers_chunk_id_encoders
     ):
-        try:
-            hashes = hash_tensor_sample.numpy().tolist()
-            idxs = convert_hash_to_idx(hashes, hash_idx_map)
-        except EmptyTensorError:
-            idxs = None
-        samples_out[label_tensor].append(idxs)
-
-    for tensor, temp_tensor in label_temp_tensors.items():
-        if len(ds[temp_tensor]) == 0:
-            ds.delete_tensor(temp_tensor, large_ok=True)
-        else:
-            try:
-                target_tensor = ds[tensor]
-                hash_label_map = hash_label_maps[temp_tensor]
-                class_names = target_tensor.info.class_names
-                new_labels = [
-                    label
-                    for label in hash_label_map.values()
-                    if label not in class_names
-                ]
-                if verbose:
-                    N = len(class_names)
-                    for i in range(len(new_labels)):
+        for tensor, local_names in worker_class_names.items():
+            if tensor not in updated:
+                rel_path = posixpath.relpath(tensor, target_ds.group_index)
+                target_tensors[tensor] = target_ds[rel_path]
+                updated[tensor] = list(target_tensors[tensor].info.class_names)
+            class_names = updated[tensor]
+            class_idx = {name: i for i, name in enumerate(class_names)}
+            lut = np.zeros(len(local_names), dtype=np.int64)
+            for i, name in enumerate(local_names):
+                idx = class_idx.get(name)
+                if idx is None:
+                    idx = class_idx[name] = len(class_names)
+                    class_names.append(name)
+                    if verbose:
                         logger.info(
-                            f"'{new_labels[i]}' added to {tensor}.info.class_names at index {N + i}"
+                            f"'{name}' added to {tensor}.info.class_names at index {idx}"
                         )
-                class_names.extend(new_labels)
-                label_idx_map = {class_names[i]: i for i in range(len(class_names))}
-                hash_idx_map = {
-                    hash: label_idx_map[hash_label_map[hash]] for hash in hash_label_map
-                }
-                target_tensor.info.is_dirty = True
-                target_tensor.meta._disable_temp_transform = True
-                target_tensor.meta.is_dirty = True
-
-                logger.info("Synchronizing class labels...")
-                class_label_sync(label_tensor=tensor, hash_idx_map=hash_idx_map).eval(
-                    ds[temp_tensor],
-                    ds,
-                    progressbar=True,
-                    check_lengths=False,
-                    skip_ok=True,
+                lut[i] = idx
+            if np.any(lut != np.arange(len(lut))):
+                chunk_keys = [
+                    get_chunk_key(tensor, ChunkIdEncoder.name_from_id(id), commit_id)
+                    for id in worker_chunk_id_encoders[tensor]._encoded[:, 0]
+                ]
+                remap_class_labels(
+                    target_tensors[tensor].chunk_engine, storage, chunk_keys, lut
                 )
-                target_tensor.meta._disable_temp_transform = False
-            finally:
-                ds.delete_tensor(temp_tensor, large_ok=True)
+
+    for tensor, class_names in updated.items():
+        info = target_tensors[tensor].info
+        if class_names != info.class_names:
+            info.update(class_names=class_names)
+    if updated:
+        target_ds.flush()
+
+
+def remap_class_labels(chunk_engine, storage, chunk_keys: List[str], lut: np.ndarray):
+    """Replaces the labels ``i < len(lut)`` in the given chunks with ``lut[i]``. Other labels are left as they are."""
+    for key in chunk_keys:
+        chunk = chunk_engine.chunk_class.frombuffer(
+            storage[key], chunk_engine.chunk_args
+        )
+        updated = False
+        for i in range(chunk.num_samples):
+            labels = chunk.read_sample(i, copy=True)
+            mask = labels < len(lut)
+            if not mask.any():
+                continue
+            remapped = labels.copy()
+            remapped[mask] = lut[labels[mask]]
+            if not np.array_equal(remapped, labels):
+                chunk.update_sample(i, remapped)
+                updated = True
+        if updated:
+            storage[key] = chunk.tobytes()
@@ -839,6 +839,11 @@ class EmptyTensorError(Exception):
         super().__init__(message)
 
 
+class VectorSearchError(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+
+
 class DatasetViewSavingError(Exception):
     pass
 
@@ -12,6 +12,8 @@ from deeplake.constants import (
     ENCODED_SEQUENCE_NAMES_FOLDER,
     ENCODED_TILE_NAMES_FOLDER,
     ENCODED_PAD_NAMES_FOLDER,
+    ENCODED_SHAPES_FOLDER,
+    VECTOR_INDEX_FOLDER,
     FIRST_COMMIT_ID,
     DATASET_META_FILENAME,
     TENSOR_INFO_FILENAME,
@@ -39,6 +41,30 @@ def get_chunk_key(key: str, chunk_name: str, commit_id: str) -> str:
     return "/".join(("versions", commit_id, key, CHUNKS_FOLDER, f"{chunk_name}"))
 
 
+def is_chunk_key(key: str) -> bool:
+    """Checks whether `key` is a chunk key, as returned by `get_chunk_key`."""
+    parts = key.split("/")
+    return (
+        len(parts) > 1
+        and parts[-2] == CHUNKS_FOLDER
+        and parts[-1]
+        not in (
+            TENSOR_META_FILENAME,
+            TENSOR_INFO_FILENAME,
+            TENSOR_COMMIT_CHUNK_MAP_FILENAME,
+            TENSOR_COMMIT_DIFF_FILENAME,
+        )
+    )
+
+
+def get_chunk_commit_id(key: str) -> str:
+    """Returns the id of the commit that a chunk key, as returned by `get_chunk_key`, belongs to."""
+    parts = key.split("/", 2)
+    if len(parts) > 2 and parts[0] == "versions":
+        return parts[1]
+    return FIRST_COMMIT_ID
+
+
 def get_dataset_meta_key(commit_id: str) -> str:
     # dataset meta is always relative to the `StorageProvider`'s root
     if commit_id == FIRST_COMMIT_ID:
@@ -259,3 +285,31 @@ def get_pad_encoder_key(key: str, commit_id: str) -> str:
             UNSHARDED_ENCODER_FILENAME,
         )
     )
+
+
+def get_shape_index_key(key: str, commit_id: str) -> str:
+    if commit_id == FIRST_COMMIT_ID:
+        return "/".join((key, ENCODED_SHAPES_FOLDER, UNSHARDED_ENCODER_FILENAME))
+    return "/".join(
+        (
+            "versions",
+            commit_id,
+            key,
+            ENCODED_SHAPES_FOLDER,
+            UNSHARDED_ENCODER_FILENAME,
+        )
+    )
+
+
+def get_vector_index_key(key: str, commit_id: str) -> str:
+    if commit_id == FIRST_COMMIT_ID:
+        return "/".join((key, VECTOR_INDEX_FOLDER, UNSHARDED_ENCODER_FILENAME))
+    return "/".join(
+        (
+            "versions",
+            commit_id,
+            key,
+            VECTOR_INDEX_FOLDER,
+            UNSHARDED_ENCODER_FILENAME,
+        )
+    )
@@ -1,5 +1,4 @@
 from contextlib import contextmanager
-from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple
 from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.version_control.commit_node import CommitNode
@@ -208,30 +207,52 @@ def auto_commit_target_commit(
 
 
 def get_changes_commit_ids_for_node(
-    dataset, tensor_name: str, commit_node: Optional[CommitNode], lca_node: CommitNode
-):
-    changes_commit_map = defaultdict(list)
+    dataset,
+    tensor_name: str,
+    commit_node: Optional[CommitNode],
+    lca_node: CommitNode,
+    ids: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Finds the samples of a tensor that were updated by the commits from `commit_node` up to `lca_node`.
+
+    Args:
+        dataset: The dataset at `commit_node`.
+        tensor_name (str): The name of the tensor.
+        commit_node (CommitNode, Optional): The commit to start from.
+        lca_node (CommitNode): The commit to stop at, its changes are not included.
+        ids (np.ndarray, Optional): The sample ids of the tensor in `dataset`. Read from the id tensor if not given.
+
+    Returns:
+        A tuple of two arrays of the same length, the ids of the updated samples and the ids of the commits that updated them.
+        The changes of each sample are in the order the commits are visited, from the most recent commit to the oldest.
+    """
+    if ids is None:
+        ids = dataset[get_sample_id_tensor_key(tensor_name)].numpy().flatten()
+    sample_ids: List[np.ndarray] = []
+    commit_ids: List[np.ndarray] = []
     current_node = commit_node
     tensor_key = dataset.version_state["tensor_names"][tensor_name]
     while current_node and current_node.commit_id != lca_node.commit_id:
         commit_id = current_node.commit_id
         if current_node.is_merge_node:
             changes = get_changes_commit_ids_for_node(
-                dataset, tensor_name, current_node.merge_parent, lca_node
+                dataset, tensor_name, current_node.merge_parent, lca_node, ids
             )
-            for idx in changes:
-                changes_commit_map[idx].extend(changes[idx])
+            sample_ids.append(changes[0])
+            commit_ids.append(changes[1])
         else:
             diff = get_tensor_commit_diff(dataset, tensor_key, commit_id)
-            if diff is not None:
-                data_updated = sorted(diff.data_updated)
-                id_tensor_key = get_sample_id_tensor_key(tensor_name)
-                id_tensor = dataset[id_tensor_key]
-                for idx in data_updated:
-                    sample_id = id_tensor[idx].numpy()[0]
-                    changes_commit_map[sample_id].append(commit_id)
+            if diff is not None and diff.data_updated:
+                data_updated = np.fromiter(
+                    diff.data_updated, dtype=np.int64, count=len(diff.data_updated)
+                )
+                data_updated.sort()
+                sample_ids.append(ids[data_updated])
+                commit_ids.append(np.full(len(data_updated), commit_id, dtype=object))
         current_node = current_node.parent
-    return changes_commit_map
+    if not sample_ids:
+        return np.zeros(0, dtype=ids.dtype), np.zeros(0, dtype=object)
+    return np.concatenate(sample_ids), np.concatenate(commit_ids)
 
 
 def get_tensor_commit_diff(dataset, tensor_key, commit_id):
@@ -281,9 +302,9 @@ def merge_common_tensors(
     conflict_resolution: Optional[str] = None,
 ):
     check_common_tensor_mismatches(tensor_names, dataset, target_dataset)
-    new_samples_dict: Dict[str, List[int]] = {}
-    updated_samples_dict: Dict[str, List[Tuple[int, int]]] = {}
-    conflict_samples_dict: Dict[str, List[Tuple[int, int]]] = {}
+    new_samples_dict: Dict[str, np.ndarray] = {}
+    updated_samples_dict: Dict[str, np.ndarray] = {}
+    conflict_samples_dict: Dict[str, np.ndarray] = {}
     conflict_tensors = set()
     idxs = {
         tensor_name: find_new_updated_and_conflict_indexes(
@@ -292,10 +313,14 @@ def merge_common_tensors(
         for tensor_name in tensor_names
     }
 
-    all_new_idxs = set()
-    for new_idxs, _, _ in idxs.values():
-        all_new_idxs.update(new_idxs)
-    for idx in all_new_idxs:
+    all_new_idxs = np.unique(
+        np.concatenate(
+            [np.zeros(0, dtype=np.int64)]
+            + [new_idxs for new_idxs, _, _ in idxs.values()]
+        )
+    )
+    padded_idxs = []
+    for idx in all_new_idxs.tolist():
         non_pad_found = False
         for tensor_name in tensor_names:
             target_engine = target_dataset[tensor_name].chunk_engine
@@ -305,20 +330,18 @@ def merge_common_tensors(
                     non_pad_found = True
                     break
         if not non_pad_found:
-            for new_idxs, _, _ in idxs.values():
-                try:
-                    new_idxs.remove(idx)
-                except ValueError:
-                    pass
+            padded_idxs.append(idx)
     for tensor_name in tensor_names:
         (
             new_indexes,
             updated_indexes,
             conflict_indexes,
         ) = idxs[tensor_name]
+        if padded_idxs:
+            new_indexes = new_indexes[~np.isin(new_indexes, padded_idxs)]
         new_samples_dict[tensor_name] = new_indexes
         updated_samples_dict[tensor_name] = updated_indexes
-        if conflict_indexes:
+        if len(conflict_indexes):
             conflict_samples_dict[tensor_name] = conflict_indexes
             conflict_tensors.add(tensor_name)
 
@@ -358,60 +381,113 @@ def check_common_tensor_mismatches(tensor_names: Set[str], dataset, target_datas
                 raise MergeMismatchError(tensor_name, key, value, target_details[key])
 
 
-def get_indexes_from_ids(
-    elements_ids, id_changes_commit_map, id_to_index_map
-) -> List[int]:
-    new_indexes: List[int] = []
-    for id in elements_ids:
-        id_changes_commit_map.pop(id, None)
-        idx = id_to_index_map[id]
-        new_indexes.append(idx)
-    return new_indexes
+def get_indexes_from_ids(ids: np.ndarray, query_ids: np.ndarray) -> np.ndarray:
+    """Finds the indexes of `query_ids` in `ids` with a sorted join. If an id occurs more than once in `ids`, its last index is used.
+
+    Args:
+        ids (np.ndarray): The ids of the samples of a tensor, by index.
+        query_ids (np.ndarray): The ids to look up.
+
+    Returns:
+        np.ndarray: The index of each id of `query_ids` in `ids`, -1 for the ids that are not found.
+    """
+    indexes = np.full(len(query_ids), -1, dtype=np.int64)
+    if not len(ids) or not len(query_ids):
+        return indexes
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+    positions = np.searchsorted(sorted_ids, query_ids, side="right") - 1
+    found = (positions >= 0) & (sorted_ids[np.maximum(positions, 0)] == query_ids)
+    indexes[found] = order[positions[found]]
+    return indexes
 
 
 def find_updated_and_conflicts(
-    original_id_changes_commit_map,
-    target_id_changes_commit_map,
-    original_id_to_index_map,
-    target_id_to_index_map,
-) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    original_changes: Tuple[np.ndarray, np.ndarray],
+    target_changes: Tuple[np.ndarray, np.ndarray],
+    original_ids: np.ndarray,
+    target_ids: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
     """Finds the conflicts between the original commit and target id.
 
+    A sample updated in the target is updated in the original as well if it wasn't changed in the original, or if the most
+    recent change of the original is the first change of the target that both histories have in common. It is a conflict
+    if the histories have no change in common, or if the target made other changes since the first one in common.
+
     Args:
-        original_id_changes_commit_map: A dictionary mapping sample ids to a list of commit ids that modified the sample.
-        target_id_changes_commit_map: A dictionary mapping sample ids to a list of commit ids that modified the sample.
-        original_id_to_index_map: A dictionary mapping sample ids to their index in the original commit.
-        target_id_to_index_map: A dictionary mapping sample ids to their index in the target id.
+        original_changes: Tuple of the sample ids and commit ids of the changes in the original commit, as returned by `get_changes_commit_ids_for_node`.
+        target_changes: Tuple of the sample ids and commit ids of the changes in the target commit.
+        original_ids (np.ndarray): The ids of the samples in the original commit, by index.
+        target_ids (np.ndarray): The ids of the samples in the target commit, by index.
 
     Returns:
-        A tuple of list of tuples of the form (original_idx, target_idx)
+        A tuple of two arrays with rows of the form (original_idx, target_idx), sorted by original_idx
     """
-    updated_indexes: List[Tuple[int, int]] = []
-    conflict_indexes: List[Tuple[int, int]] = []
-    for id in target_id_changes_commit_map:
-        target_commit_ids = target_id_changes_commit_map[id]
-        original_commit_ids = original_id_changes_commit_map[id]
-        set_original_commit_ids = set(original_commit_ids)
-        idx = None
-        for i, item in enumerate(target_commit_ids):
-            if item in set_original_commit_ids:
-                idx = i
-                break
-
-        # this means that the sample was only modified in the target commit, no conflict
-        if not original_commit_ids or (
-            idx is not None and target_commit_ids[idx] == original_commit_ids[0]
-        ):
-            target_idx: int = target_id_to_index_map[id]
-            original_idx: int = original_id_to_index_map[id]
-            updated_indexes.append((original_idx, target_idx))
-
-        # if no id is common or if a commit id other than the most recent commit_id is in common, there's a conflict
-        elif idx is None or idx > 0:
-            target_idx = target_id_to_index_map[id]
-            original_idx = original_id_to_index_map[id]
-            conflict_indexes.append((original_idx, target_idx))
-    return updated_indexes, conflict_indexes
+    original_sample_ids, original_commit_ids = original_changes
+    target_sample_ids, target_commit_ids = target_changes
+    num_target_changes = len(target_sample_ids)
+    if not num_target_changes:
+        return np.zeros((0, 2), dtype=np.int64), np.zeros((0, 2), dtype=np.int64)
+
+    # dense codes for the sample ids and the commit ids of both histories
+    sample_ids, sample_codes = np.unique(
+        np.concatenate([target_sample_ids, original_sample_ids]), return_inverse=True
+    )
+    # there are few distinct commit ids, a dict is much faster than sorting them
+    commit_list = np.concatenate([target_commit_ids, original_commit_ids]).tolist()
+    commit_code_map = {commit: i for i, commit in enumerate(dict.fromkeys(commit_list))}
+    commit_codes = np.fromiter(
+        map(commit_code_map.__getitem__, commit_list),
+        dtype=np.int64,
+        count=len(commit_list),
+    )
+    sample_codes = sample_codes.reshape(-1).astype(np.int64)
+    num_samples = len(sample_ids)
+    num_commits = int(commit_codes.max()) + 1
+    target_samples = sample_codes[:num_target_changes]
+    target_commits = commit_codes[:num_target_changes]
+    original_samples = sample_codes[num_target_changes:]
+    original_commits = commit_codes[num_target_changes:]
+
+    # most recent change of each sample in the original
+    changed_in_original = np.zeros(num_samples, dtype=bool)
+    changed_in_original[original_samples] = True
+    latest_original_commit = np.full(num_samples, -1, dtype=np.int64)
+    samples, first = np.unique(original_samples, return_index=True)
+    latest_original_commit[samples] = original_commits[first]
+
+    # changes of the target that are in the history of the original too
+    common = np.isin(
+        target_samples * num_commits + target_commits,
+        original_samples * num_commits + original_commits,
+    )
+    first_common_commit = np.full(num_samples, -1, dtype=np.int64)
+    common_changes = np.flatnonzero(common)
+    samples, first = np.unique(target_samples[common_changes], return_index=True)
+    first_common_commit[samples] = target_commits[common_changes[first]]
+
+    samples, first = np.unique(target_samples, return_index=True)
+    has_common = first_common_commit[samples] >= 0
+    updated = ~changed_in_original[samples] | (
+        has_common & (first_common_commit[samples] == latest_original_commit[samples])
+    )
+    conflict = ~updated & (~has_common | ~common[first])
+
+    keep = updated | conflict
+    samples, updated = samples[keep], updated[keep]
+    indexes = np.stack(
+        [
+            get_indexes_from_ids(original_ids, sample_ids[samples]),
+            get_indexes_from_ids(target_ids, sample_ids[samples]),
+        ],
+        axis=1,
+    )
+    # samples that are new in the target or deleted in the original are not updated
+    found = (indexes >= 0).all(axis=1)
+    indexes, updated = indexes[found], updated[found]
+    order = np.argsort(indexes[:, 0], kind="stable")
+    indexes, updated = indexes[order], updated[order]
+    return indexes[updated], indexes[~updated]
 
 
 def find_new_updated_and_conflict_indexes(
@@ -419,7 +495,7 @@ def find_new_updated_and_conflict_indexes(
     dataset,
     target_dataset,
     nodes: Dict[str, CommitNode],
-) -> Tuple[List[int], List[Tuple[int, int]], List[Tuple[int, int]]]:
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Finds the new, deleted, updated and conflict indexes between the original commit and target commit.
 
     Args:
@@ -430,9 +506,9 @@ def find_new_updated_and_conflict_indexes(
 
     Returns:
         A tuple of the form (new_indexes, updated_indexes, conflict_indexes)
-        - new_indexes is a list of indexes for new samples
-        - updated_indexes is a list of tuples of the form (original_idx, target_idx)
-        - conflict_indexes is a list of tuples of the form (original_idx, target_idx)
+        - new_indexes is a sorted array of indexes for new samples
+        - updated_indexes is an array with rows of the form (original_idx, target_idx)
+        - conflict_indexes is an array with rows of the form (original_idx, target_idx)
     """
     id_tensor_name = get_sample_id_tensor_key(tensor_name)
     target_id_tensor = target_dataset[id_tensor_name]
@@ -445,42 +521,35 @@ def find_new_updated_and_conflict_indexes(
     target_node = nodes["target"]
     lca_node = nodes["lca"]
 
-    target_id_changes_commit_map = get_changes_commit_ids_for_node(
-        target_dataset, tensor_name, target_node, lca_node
-    )
-
-    original_id_changes_commit_map = get_changes_commit_ids_for_node(
-        dataset, tensor_name, original_node, lca_node
-    )
-
     original_ids = original_id_tensor.numpy().flatten()
-    original_id_to_index_map = {id: idx for idx, id in enumerate(original_ids)}
-
     target_ids = target_id_tensor.numpy().flatten()
-    target_id_to_index_map = {id: idx for idx, id in enumerate(target_ids)}
 
-    new_elements_ids = set(target_ids) - set(original_ids)
-    new_elements_ids = new_elements_ids - deleted_samples
-    new_indexes = get_indexes_from_ids(
-        new_elements_ids, target_id_changes_commit_map, target_id_to_index_map
+    target_changes = get_changes_commit_ids_for_node(
+        target_dataset, tensor_name, target_node, lca_node, target_ids
+    )
+    original_changes = get_changes_commit_ids_for_node(
+        dataset, tensor_name, original_node, lca_node, original_ids
+    )
+
+    deleted_ids = np.fromiter(deleted_samples, dtype=target_ids.dtype)
+    new_indexes = np.flatnonzero(
+        ~np.isin(target_ids, original_ids) & ~np.isin(target_ids, deleted_ids)
     )
-    conflict_indexes: List[Tuple[int, int]] = []
-    updated_indexes: List[Tuple[int, int]] = []
     updated_indexes, conflict_indexes = find_updated_and_conflicts(
-        original_id_changes_commit_map,
-        target_id_changes_commit_map,
-        original_id_to_index_map,
-        target_id_to_index_map,
+        original_changes,
+        target_changes,
+        original_ids,
+        target_ids,
     )
     return new_indexes, updated_indexes, conflict_indexes
 
 
 def get_deleted_ids(original_ids, target_ids, lca_ids):
-    deleted_ids_in_target = set(lca_ids) - set(target_ids)
-    deleted_ids_in_original = set(lca_ids) - set(original_ids)
-    deleted_in_both = deleted_ids_in_target & deleted_ids_in_original
-    deleted_ids_in_original = deleted_ids_in_original - deleted_in_both
-    deleted_ids_in_target = deleted_ids_in_target - deleted_in_both
+    deleted_ids_in_target = np.setdiff1d(lca_ids, target_ids)
+    deleted_ids_in_original = np.setdiff1d(lca_ids, original_ids)
+    deleted_in_both = np.intersect1d(deleted_ids_in_target, deleted_ids_in_original)
+    deleted_ids_in_original = np.setdiff1d(deleted_ids_in_original, deleted_in_both)
+    deleted_ids_in_target = np.setdiff1d(deleted_ids_in_target, deleted_in_both)
     return deleted_ids_in_original, deleted_ids_in_target
 
 
@@ -494,14 +563,16 @@ def merge_tensor_data(
     conflict_resolution,
 ):
     """Merges actual data present in 2 versions of a common tensor."""
+    updated_indexes = updated_samples_dict[tensor_name]
     if conflict_resolution == "theirs" and tensor_name in conflict_samples_dict:
-        updated_samples_dict[tensor_name].extend(conflict_samples_dict[tensor_name])
+        updated_indexes = np.concatenate(
+            [updated_indexes, conflict_samples_dict[tensor_name]]
+        )
 
     original_tensor = dataset[tensor_name]
     target_tensor = target_dataset[tensor_name]
 
-    new_indexes = new_samples_dict[tensor_name]
-    new_indexes.sort()
+    new_indexes = np.sort(new_samples_dict[tensor_name]).tolist()
     is_class_label = target_tensor.meta.htype == "class_label"
     copy_class_labels = is_class_label
     if is_class_label:
@@ -545,15 +616,29 @@ def merge_tensor_data(
         _copy_link_tensors=True,
     )
 
-    updated_indexes = updated_samples_dict[tensor_name]
     remap_class_label = is_class_label and target_class_names
-    for original_idx, target_idx in updated_indexes:
-        sample = target_tensor[target_idx]
-        if remap_class_label:
-            sample = convert_to_text(
-                sample.numpy(), target_class_names, return_original=True
-            )
-        original_tensor[original_idx] = sample
+    num_samples = original_tensor.num_samples
+    with original_tensor.dataset:
+        for original_start, target_start, length in _group_update_ranges(
+            updated_indexes
+        ):
+            if length == 1 or original_start + length > num_samples:
+                # single samples, and samples past the end of the tensor which are assigned one at a time
+                for i in range(length):
+                    sample = target_tensor[target_start + i]
+                    if remap_class_label:
+                        sample = convert_to_text(
+                            sample.numpy(), target_class_names, return_original=True
+                        )
+                    original_tensor[original_start + i] = sample
+                continue
+            samples = target_tensor[target_start : target_start + length]
+            if remap_class_label:
+                samples = [
+                    convert_to_text(sample, target_class_names, return_original=True)
+                    for sample in samples.numpy(aslist=True)
+                ]
+            original_tensor[original_start : original_start + length] = samples
 
 
 def check_id_tensors_exist(visible_tensors: Set[str], all_tensors: Set[str]):
@@ -674,19 +759,34 @@ def copy_tensors(
 
 
 def _group_ranges(x):
-    ret = []
-    s = x[0]
-    e = s + 1
-    for i in range(1, len(x)):
-        xi = x[i]
-        if xi == e:
-            e += 1
-        else:
-            ret.append((s, e))
-            s = xi
-            e = s + 1
-    ret.append((s, e))
-    return ret
+    x = np.asarray(x)
+    breaks = np.flatnonzero(np.diff(x) != 1) + 1
+    starts = x[np.concatenate([[0], breaks])]
+    ends = x[np.concatenate([breaks - 1, [len(x) - 1]])] + 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def _group_update_ranges(updated_indexes: np.ndarray) -> List[Tuple[int, int, int]]:
+    """Groups rows of (original_idx, target_idx) into runs of samples that are consecutive in both tensors, so that each run
+    is updated with a single slice assignment.
+
+    Returns:
+        A list of tuples of the form (original_start, target_start, length)
+    """
+    if not len(updated_indexes):
+        return []
+    updated_indexes = updated_indexes[np.argsort(updated_indexes[:, 0], kind="stable")]
+    steps = np.diff(updated_indexes, axis=0)
+    breaks = np.flatnonzero((steps != 1).any(axis=1)) + 1
+    starts = np.concatenate([[0], breaks])
+    lengths = np.diff(np.concatenate([starts, [len(updated_indexes)]]))
+    return list(
+        zip(
+            updated_indexes[starts, 0].tolist(),
+            updated_indexes[starts, 1].tolist(),
+            lengths.tolist(),
+        )
+    )
 
 
 def _merge_encodings(enc1, enc2, start, end, off1=None, off2=None):
@@ -716,14 +816,9 @@ def _get_required_chunks_for_range(tensor, start, end):
     eng = tensor.chunk_engine
     enc = eng.chunk_id_encoder
     arr = enc._encoded
-    start_row = enc.translate_index(start)
-    end_row = enc.translate_index(end - 1)
-    last_index = arr[end_row, 1]
-    nrows = len(arr)
-    nxt = end_row + 1
-    while nxt < nrows and arr[nxt, 1] == last_index:
-        end_row = nxt
-        nxt += 1
+    start_rows, stop_rows = enc.get_row_ranges([start, end - 1])
+    start_row = int(start_rows[0])
+    end_row = int(stop_rows[1]) - 1
     num_required_chunks = end_row + 1 - start_row
     start_chunk_aligned = False
     end_chunk_aligned = False
@@ -793,8 +888,11 @@ def _copy_link_samples(src_tensor, dest_tensor, start, end):
 def _merge_sequence_encoders(
     src_seq_encoder, dest_seq_encoder, start: int, end: int
 ) -> Tuple[int, int]:
-    (start2, _), start_row = src_seq_encoder.__getitem__(start, return_row_index=True)
-    (_, end2), end_row = src_seq_encoder.__getitem__(end - 1, return_row_index=True)
+    start_bytes, end_bytes, rows = src_seq_encoder.get_byte_ranges(
+        [start, end - 1], return_row_index=True
+    )
+    start2, end2 = int(start_bytes[0]), int(end_bytes[1])
+    start_row, end_row = int(rows[0]), int(rows[1])
 
     nrows = len(dest_seq_encoder._encoded)
     dest_seq_encoder._encoded = _merge_encodings(
@@ -812,8 +910,9 @@ def _merge_sequence_encoders(
 def _merge_creds_encoders(
     src_creds_encoder, dest_creds_encoder, start: int, end: int
 ) -> None:
-    start_row = src_creds_encoder.translate_index(start)
-    end_row = src_creds_encoder.translate_index(end - 1)
+    start_row, end_row = map(
+        int, src_creds_encoder.translate_index_array([start, end - 1])
+    )
     dest_creds_encoder._encoded = _merge_encodings(
         dest_creds_encoder._encoded,
         src_creds_encoder._encoded,
@@ -25,6 +25,7 @@ def storage_provider_from_path(
     token: Optional[str] = None,
     is_hub_path: bool = False,
     db_engine: bool = False,
+    use_mmap: bool = False,
 ):
     """Construct a StorageProvider given a path.
 
@@ -36,6 +37,7 @@ def storage_provider_from_path(
         token (str): token for authentication into activeloop.
         is_hub_path (bool): Whether the path points to a Deep Lake dataset.
         db_engine (bool): Whether to use Activeloop DB Engine. Only applicable for hub:// paths.
+        use_mmap (bool): Whether chunks are memory mapped instead of read into memory. Only applicable for local paths.
 
     Returns:
         If given a path starting with s3:// returns the S3Provider.
@@ -86,7 +88,7 @@ def storage_provider_from_path(
             storage = MemoryProvider(path)
         else:
             if not os.path.exists(path) or os.path.isdir(path):
-                storage = LocalProvider(path)
+                storage = LocalProvider(path, use_mmap=use_mmap)
             else:
                 raise ValueError(
                     f"Local path {path} must be a path to a local directory"
@@ -172,6 +174,8 @@ def get_storage_and_cache_chain(
     memory_cache_size,
     local_cache_size,
     db_engine=False,
+    cache_shards=0,
+    use_mmap=False,
 ):
     """
     Returns storage provider and cache chain for a given path, according to arguments passed.
@@ -185,6 +189,9 @@ def get_storage_and_cache_chain(
         memory_cache_size (int): The size of the in-memory cache to use.
         local_cache_size (int): The size of the local cache to use.
         db_engine (bool): Whether to use Activeloop DB Engine, only applicable for hub:// paths.
+        cache_shards (int): If positive, the caches are thread safe and split into this many shards.
+        use_mmap (bool): Whether the chunks of a local dataset and of the local cache are memory mapped instead of
+            read into memory.
 
     Returns:
         A tuple of the storage provider and the storage chain.
@@ -196,11 +203,17 @@ def get_storage_and_cache_chain(
         creds=creds,
         read_only=read_only,
         token=token,
+        use_mmap=use_mmap,
     )
     memory_cache_size_bytes = memory_cache_size * MB
     local_cache_size_bytes = local_cache_size * MB
     storage_chain = generate_chain(
-        storage, memory_cache_size_bytes, local_cache_size_bytes, path
+        storage,
+        memory_cache_size_bytes,
+        local_cache_size_bytes,
+        path,
+        num_shards=cache_shards,
+        use_mmap=use_mmap,
     )
     if storage.read_only:
         storage_chain.enable_readonly()
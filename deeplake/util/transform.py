@@ -17,8 +17,11 @@ from deeplake.constants import (
     TRANSFORM_PROGRESSBAR_UPDATE_INTERVAL,
     TRANSFORM_RECHUNK_AVG_SIZE_BOUND,
     TRANSFORM_CHUNK_CACHE_SIZE,
+    TRANSFORM_WORK_UNITS_PER_WORKER,
 )
 from deeplake.util.dataset import try_flushing
+from deeplake.util.class_label import merge_all_class_names
+from deeplake.util.encoder import merge_all_meta_info
 from deeplake.util.remove_cache import (
     get_base_storage,
     get_dataset_with_zero_size_cache,
@@ -272,7 +275,7 @@ def _retrieve_memory_objects(all_chunk_engines):
     all_chunk_maps = {}
     all_commit_diffs = {}
     all_creds_encoders = {}
-    all_hash_label_maps = {}
+    all_class_names = {}
     for tensor, chunk_engine in all_chunk_engines.items():
         chunk_engine.cache.flush()
         chunk_engine.meta_cache.flush()
@@ -284,8 +287,8 @@ def _retrieve_memory_objects(all_chunk_engines):
         all_chunk_maps[tensor] = chunk_engine.commit_chunk_map
         all_commit_diffs[tensor] = chunk_engine.commit_diff
         all_creds_encoders[tensor] = chunk_engine.creds_encoder
-        if chunk_engine._is_temp_label_tensor:
-            all_hash_label_maps[tensor] = chunk_engine._hash_label_map
+        if chunk_engine._transform_class_names is not None:
+            all_class_names[tensor] = chunk_engine._transform_class_names
 
     return {
         "tensor_metas": all_tensor_metas,
@@ -296,7 +299,7 @@ def _retrieve_memory_objects(all_chunk_engines):
         "commit_chunk_maps": all_chunk_maps,
         "commit_diffs": all_commit_diffs,
         "creds_encoders": all_creds_encoders,
-        "hash_label_maps": all_hash_label_maps,
+        "class_names": all_class_names,
     }
 
 
@@ -306,7 +309,7 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
         group_index,
         tensors,
         visible_tensors,
-        label_temp_tensors,
+        class_names,
         pipeline,
         version_state,
         link_creds,
@@ -316,7 +319,7 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
         ignore_errors,
     ) = inp
     all_chunk_engines = create_worker_chunk_engines(
-        tensors, label_temp_tensors, output_storage, version_state, link_creds
+        tensors, class_names, output_storage, version_state, link_creds
     )
 
     if isinstance(data_slice, deeplake.Dataset):
@@ -328,7 +331,6 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
         rel_tensors,
         all_chunk_engines,
         group_index,
-        label_temp_tensors,
         cache_size=cache_size,
     )
 
@@ -368,13 +370,15 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
 
 def create_worker_chunk_engines(
     tensors: List[str],
-    label_temp_tensors: Dict[str, str],
+    class_names: Dict[str, List[str]],
     output_storage: StorageProvider,
     version_state,
     link_creds,
 ) -> Dict[str, ChunkEngine]:
     """Creates chunk engines corresponding to each storage for all tensors.
     These are created separately for each worker for parallel uploads.
+    The class label tensors in ``class_names`` convert labels against a copy of the given class names,
+    which are merged by the coordinator.
     """
     all_chunk_engines: Dict[str, ChunkEngine] = {}
     num_tries = 1000
@@ -410,6 +414,7 @@ def create_worker_chunk_engines(
                     is_link=existing_meta.is_link,
                     hidden=existing_meta.hidden,
                     verify=existing_meta.verify,
+                    compression_args=getattr(existing_meta, "compression_args", None),
                 )
                 meta_key = get_tensor_meta_key(tensor, version_state["commit_id"])
                 memory_cache[meta_key] = new_tensor_meta  # type: ignore
@@ -427,11 +432,13 @@ def create_worker_chunk_engines(
                         tensor, storage_cache, version_state, memory_cache
                     )
                 storage_chunk_engine._all_chunk_engines = all_chunk_engines
-                if tensor in label_temp_tensors.values():
-                    storage_chunk_engine._is_temp_label_tensor = True
+                if tensor in class_names:
+                    storage_chunk_engine._transform_class_names = list(
+                        class_names[tensor]
+                    )
                 all_chunk_engines[tensor] = storage_chunk_engine
                 break
-            except (JSONDecodeError, KeyError):
+            except (JSONDecodeError, KeyError, BufferError):
                 if i == num_tries - 1:
                     raise
     return all_chunk_engines
@@ -527,16 +534,26 @@ def get_pbar_description(compute_functions: List):
     return f"Evaluating [{names_desc}]"
 
 
-def create_slices(data_in, num_workers):
-    size = math.ceil(len(data_in) / num_workers)
+def create_slices(data_in, num_workers, dynamic_scheduling: bool = False):
+    num_slices = num_workers
+    if dynamic_scheduling and num_workers > 1:
+        # idle workers pick up the next slice, so that slow samples don't hold up the other workers
+        num_slices = max(
+            min(num_workers * TRANSFORM_WORK_UNITS_PER_WORKER, len(data_in)),
+            num_workers,
+        )
+    size = math.ceil(len(data_in) / num_slices)
+    if dynamic_scheduling and size:
+        # rounding up the size can leave trailing slices empty
+        num_slices = math.ceil(len(data_in) / size)
 
     if isinstance(data_in, Tensor):
         ret = [
             Tensor(data_in.key, data_in.dataset)[i * size : (i + 1) * size]
-            for i in range(num_workers)
+            for i in range(num_slices)
         ]
     else:
-        ret = [data_in[i * size : (i + 1) * size] for i in range(num_workers)]
+        ret = [data_in[i * size : (i + 1) * size] for i in range(num_slices)]
 
     if isinstance(data_in, deeplake.Dataset):
         for ds in ret:
@@ -615,6 +632,51 @@ def process_transform_result(result: List[Dict]):
     return final
 
 
+def merge_streamed_results(results, target_ds, storage, tensors, skip_ok, verbose):
+    """Merges the results of the work units into ``target_ds`` as they are yielded by ``results``.
+
+    The metas and encoders of each unit are written to ``storage`` as soon as the unit and all the units before it are done,
+    so that their samples are visible in the dataset and a failure only loses the units that are still in progress.
+
+    Returns the error raised by a worker, if any. The units after a failed unit are not merged.
+    """
+    all_tensors_generated_length = {tensor: 0 for tensor in tensors}
+    all_samples_skipped = True
+    try:
+        for res in results:
+            all_samples_skipped = all_samples_skipped and res["all_samples_skipped"]
+            result = {key: [value] for key, value in res.items()}
+            all_num_samples, generated_length = get_lengths_generated(
+                result["tensor_metas"], tensors
+            )
+            generated_tensors = [
+                tensor for tensor, l in generated_length.items() if l > 0
+            ]
+            # the labels of the unit are remapped before its samples are published by its metas
+            merge_all_class_names(
+                result["class_names"],
+                result["chunk_id_encoders"],
+                target_ds,
+                storage,
+                verbose,
+            )
+            merge_all_meta_info(
+                target_ds, storage, generated_tensors, False, all_num_samples, result
+            )
+            for tensor, length in generated_length.items():
+                all_tensors_generated_length[tensor] += length
+            if res["error"] is not None:
+                return res["error"]
+    finally:
+        if hasattr(results, "close"):
+            results.close()
+
+    if all_samples_skipped:
+        raise AllSamplesSkippedError
+    check_lengths(all_tensors_generated_length, skip_ok)
+    return None
+
+
 def rechunk_if_necessary(ds):
     with ds:
         for tensor in ds.tensors:
@@ -635,18 +697,7 @@ def rechunk_if_necessary(ds):
                             and avg_chunk_size
                             < TRANSFORM_RECHUNK_AVG_SIZE_BOUND * engine.min_chunk_size
                         ):
-                            enc = tensor.chunk_engine.chunk_id_encoder
-                            row = 0
-                            while row < len(enc._encoded) - 1:
-                                encoded = enc._encoded
-                                chunk_id = encoded[row, 0]
-                                chunk = engine.get_chunk_from_chunk_id(chunk_id)
-                                engine._check_rechunk(chunk, row)
-                                # np.delete will replace enc._encoded with new array
-                                # so this check works
-                                rechunked = len(encoded) != len(enc._encoded)
-                                if not rechunked:
-                                    row += 1
+                            engine.rechunk()
 
 
 def close_states(compute_provider, pbar, pqueue):
@@ -2,26 +2,27 @@ import random
 import time
 import hashlib
 import pickle
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List
 import warnings
 from deeplake.client.log import logger
 from deeplake.constants import FIRST_COMMIT_ID
 from deeplake.core.fast_forwarding import ffw_dataset_meta
 from deeplake.core.meta.dataset_meta import DatasetMeta
-from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
 from deeplake.core.storage.lru_cache import LRUCache
 from deeplake.core.storage.memory import MemoryProvider
 from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.version_control.dataset_diff import DatasetDiff
 from deeplake.core.version_control.commit_node import CommitNode  # type: ignore
 from deeplake.core.version_control.commit_chunk_map import CommitChunkMap  # type: ignore
-from deeplake.core.storage import LRUCache
+from deeplake.core.storage import LRUCache, PersistentLRUCache
 from deeplake.core.lock import Lock
 from deeplake.util.exceptions import CheckoutError, CommitError, DatasetCorruptError
 from deeplake.util.keys import (
     get_chunk_id_encoder_key,
     get_creds_encoder_key,
     get_sequence_encoder_key,
+    get_shape_index_key,
+    get_vector_index_key,
     get_dataset_diff_key,
     get_dataset_info_key,
     get_dataset_meta_key,
@@ -134,6 +135,27 @@ def integrity_check(dataset):
         ) from e
 
 
+def register_committed(storage: LRUCache, commit_ids: Iterable[str]):
+    """Lets the persistent local cache in the cache chain of ``storage``, if any, persist the chunks of ``commit_ids``."""
+    while isinstance(storage, LRUCache):
+        if isinstance(storage, PersistentLRUCache):
+            storage.committed.update(commit_ids)
+            return
+        storage = storage.next_storage
+
+
+def register_committed_nodes(storage: LRUCache, version_state: Dict[str, Any]):
+    """Registers all the nodes of ``version_state`` that are not head nodes, see `register_committed`."""
+    register_committed(
+        storage,
+        [
+            commit_id
+            for commit_id, node in version_state["commit_node_map"].items()
+            if not node.is_head_node
+        ],
+    )
+
+
 def commit(
     dataset,
     message: Optional[str] = None,
@@ -163,6 +185,7 @@ def commit(
         "commit_id"
     ]
     version_state["commit_node_map"][hash] = new_node
+    register_committed(storage, [stored_commit_id])
     copy_metas(stored_commit_id, hash, storage)
     create_commit_chunk_maps(stored_commit_id, hash, storage)
     discard_old_metas(stored_commit_id, storage, version_state["full_tensors"])
@@ -278,79 +301,42 @@ def copy_metas(
     dest_commit_id: str,
     storage: LRUCache,
 ) -> None:
-    """Copies meta data from one commit to another."""
+    """Copies meta data from one commit to another.
+
+    All the metas are copied with a single call to `storage.copy_items`, which writes the metas that are in the cache
+    with one concurrent batch and copies the others without reading them where the underlying storage supports it.
+    """
     initial_autoflush = storage.autoflush
     storage.autoflush = False
 
     src_dataset_meta = _get_dataset_meta_at_commit(storage, src_commit_id)
 
-    dest_dataset_meta_key = get_dataset_meta_key(dest_commit_id)
-    dest_dataset_meta = convert_to_bytes(src_dataset_meta)
-
-    storage[dest_dataset_meta_key] = dest_dataset_meta
-
-    try:
-        src_dataset_info_key = get_dataset_info_key(src_commit_id)
-        dest_dataset_info_key = get_dataset_info_key(dest_commit_id)
-        src_dataset_info = storage[src_dataset_info_key]
-        dest_dataset_info = convert_to_bytes(src_dataset_info)
-        storage[dest_dataset_info_key] = dest_dataset_info
-    except KeyError:
-        pass
+    paths = {
+        get_dataset_meta_key(src_commit_id): get_dataset_meta_key(dest_commit_id),
+        get_dataset_info_key(src_commit_id): get_dataset_info_key(dest_commit_id),
+    }
+    required = [get_dataset_meta_key(src_commit_id)]
 
     tensor_list = src_dataset_meta.tensors
 
     for tensor in tensor_list:
-        src_tensor_meta_key = get_tensor_meta_key(tensor, src_commit_id)
-        dest_tensor_meta_key = get_tensor_meta_key(tensor, dest_commit_id)
-        src_tensor_meta = storage[src_tensor_meta_key]
-        dest_tensor_meta = convert_to_bytes(src_tensor_meta)
-        storage[dest_tensor_meta_key] = dest_tensor_meta
-
-        try:
-            src_chunk_id_encoder_key = get_chunk_id_encoder_key(tensor, src_commit_id)
-            dest_chunk_id_encoder_key = get_chunk_id_encoder_key(tensor, dest_commit_id)
-            src_chunk_id_encoder = storage[src_chunk_id_encoder_key]
-            dest_chunk_id_encoder = convert_to_bytes(src_chunk_id_encoder)
-            storage[dest_chunk_id_encoder_key] = dest_chunk_id_encoder
-        except KeyError:
-            pass
-
-        try:
-            src_tile_encoder_key = get_tensor_tile_encoder_key(tensor, src_commit_id)
-            dest_tile_encoder_key = get_tensor_tile_encoder_key(tensor, dest_commit_id)
-            src_tile_encoder = storage[src_tile_encoder_key]
-            dest_tile_encoder = convert_to_bytes(src_tile_encoder)
-            storage[dest_tile_encoder_key] = dest_tile_encoder
-        except KeyError:
-            pass
-
-        try:
-            src_sequence_encoder_key = get_sequence_encoder_key(tensor, src_commit_id)
-            dest_sequence_encoder_key = get_sequence_encoder_key(tensor, dest_commit_id)
-            src_sequence_encoder = storage[src_sequence_encoder_key]
-            dest_sequence_encoder = convert_to_bytes(src_sequence_encoder)
-            storage[dest_sequence_encoder_key] = dest_sequence_encoder
-        except KeyError:
-            pass
-
-        try:
-            src_creds_encoder_key = get_creds_encoder_key(tensor, src_commit_id)
-            dest_creds_encoder_key = get_creds_encoder_key(tensor, dest_commit_id)
-            src_creds_encoder = storage[src_creds_encoder_key]
-            dest_creds_encoder = convert_to_bytes(src_creds_encoder)
-            storage[dest_creds_encoder_key] = dest_creds_encoder
-        except KeyError:
-            pass
-
-        try:
-            src_tensor_info_key = get_tensor_info_key(tensor, src_commit_id)
-            dest_tensor_info_key = get_tensor_info_key(tensor, dest_commit_id)
-            src_tensor_info = storage[src_tensor_info_key]
-            dest_tensor_info = convert_to_bytes(src_tensor_info)
-            storage[dest_tensor_info_key] = dest_tensor_info
-        except KeyError:
-            pass
+        for get_key in (
+            get_tensor_meta_key,
+            get_chunk_id_encoder_key,
+            get_tensor_tile_encoder_key,
+            get_sequence_encoder_key,
+            get_shape_index_key,
+            get_vector_index_key,
+            get_creds_encoder_key,
+            get_tensor_info_key,
+        ):
+            paths[get_key(tensor, src_commit_id)] = get_key(tensor, dest_commit_id)
+        required.append(get_tensor_meta_key(tensor, src_commit_id))
+
+    copied = set(storage.copy_items(paths, ignore_errors=True))
+    for key in required:
+        if key not in copied:
+            raise KeyError(key)
 
     storage.autoflush = initial_autoflush
     storage.flush()
@@ -397,14 +383,7 @@ def discard_old_metas(
         all_src_keys.append(src_tensor_info_key)
 
     for key in all_src_keys:
-        storage.dirty_keys.pop(key, None)
-        if key in storage.lru_sizes:
-            size = storage.lru_sizes.pop(key)
-            storage.cache_used -= size
-        try:
-            del storage.cache_storage[key]
-        except KeyError:
-            pass
+        storage.remove_from_cache(key)
 
 
 def reset_and_checkout(ds, address, err, verbose=True):
@@ -839,7 +818,3 @@ def warn_node_checkout(commit_node: CommitNode, create: bool):
             warnings.warn(
                 f"The branch ({branch}) that you have checked out to, has no commits."
             )
-
-
-def convert_to_bytes(inp):
-    return inp.tobytes() if isinstance(inp, DeepLakeMemoryObject) else inp